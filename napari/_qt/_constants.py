@@ -20,3 +20,22 @@ class LoopMode(StringEnum):
     ONCE = auto()
     LOOP = auto()
     BACK_AND_FORTH = auto()
+
+
+class PlaybackMode(StringEnum):
+    """Pacing of the frames when animating an axis.
+
+    PlaybackMode.TIMED
+        Frames are requested on a fixed timer. A frame requested before the
+        previous one was drawn is dropped.
+    PlaybackMode.SKIP
+        The next frame is only requested once the previous one was loaded
+        and drawn, skipping frames to hold the requested fps.
+    PlaybackMode.SLOW
+        The next frame is only requested once the previous one was loaded
+        and drawn, showing every frame and slowing down if needed.
+    """
+
+    TIMED = auto()
+    SKIP = auto()
+    SLOW = auto()
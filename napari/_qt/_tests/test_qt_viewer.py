@@ -192,6 +192,83 @@ def test_z_order_adding_removing_images(make_napari_viewer):
     np.testing.assert_almost_equal(order, list(range(len(viewer.layers))))
 
 
+def test_3D_layers_updated_once_camera_settles(make_napari_viewer):
+    """In 3D, camera moves only update the layers once the camera stops."""
+    viewer = make_napari_viewer()
+    view = viewer.window.qt_viewer
+    layer = viewer.add_image(np.zeros((4, 4, 4)))
+    draws = []
+    layer._update_draw = lambda *args, **kwargs: draws.append(args)
+
+    # in 2D every draw updates the layers
+    viewer.camera.zoom = 2
+    view.on_draw(None)
+    assert len(draws) == 1
+    assert not view._camera_settle_timer.isActive()
+
+    viewer.dims.ndisplay = 3
+    viewer.camera.angles = (10, 20, 30)
+    assert view._camera_settle_timer.isActive()
+    view.on_draw(None)
+    assert len(draws) == 1
+
+    # the layers are updated when the timer goes off
+    view._camera_settle_timer.stop()
+    view._camera_settle_timer.timeout.emit()
+    assert len(draws) == 2
+    view.on_draw(None)
+    assert len(draws) == 3
+
+
+def test_3D_update_draw_2D_layers(make_napari_viewer):
+    """Layers with fewer dimensions than displayed are updated in 3D."""
+    viewer = make_napari_viewer()
+    view = viewer.window.qt_viewer
+    layer = viewer.add_image(np.zeros((4, 4)))
+    viewer.dims.ndisplay = 3
+    view._update_layers_draw()
+    assert layer.corner_pixels.shape == (2, 2)
+
+
+def test_close_shuts_slicer_down(make_napari_viewer):
+    """The worker threads of the slicer are shut down on close."""
+    viewer = make_napari_viewer()
+    executor = viewer._slicer.executor
+    viewer.close()
+    assert executor._shutdown
+    assert viewer._slicer._executor is None
+
+
+def test_mouse_moves_coalesced(make_napari_viewer):
+    """Fast mouse moves are processed once per interval, latest first."""
+    viewer = make_napari_viewer()
+    view = viewer.window.qt_viewer
+    positions = []
+
+    @viewer.mouse_move_callbacks.append
+    def move_callback(v, event):
+        positions.append(tuple(event.pos))
+
+    for x in range(5):
+        view.canvas.events.mouse_move(pos=(x, 0), modifiers=())
+    # the first move is processed right away, the others are coalesced
+    assert positions == [(0, 0)]
+    assert view._mouse_move_timer.isActive()
+
+    # the latest move is processed when the timer goes off
+    view._mouse_move_timer.stop()
+    view._on_mouse_move_timer()
+    assert positions == [(0, 0), (4, 0)]
+
+    # moves while dragging are never coalesced
+    for x in range(3):
+        view.canvas.events.mouse_move(
+            pos=(x, 1), modifiers=(), button=0, press_event=True
+        )
+        assert viewer.cursor.position == view._map_canvas2world([x, 1])
+    assert not view._mouse_move_timer.isActive()
+
+
 def test_screenshot(make_napari_viewer):
     "Test taking a screenshot"
     viewer = make_napari_viewer()
@@ -83,7 +83,7 @@ class QtPoll(QObject):
 
         # Listeners will "handle" the event if they need more polling. If
         # no one needs polling, then we can stop the timer.
-        if not event.handled:
+        if event is None or not event.handled:
             self.timer.stop()
             return
 
@@ -1,10 +1,11 @@
 import os.path
 import warnings
 from pathlib import Path
+from time import perf_counter
 from typing import TYPE_CHECKING, Optional
 
 import numpy as np
-from qtpy.QtCore import QCoreApplication, QObject, QSize, Qt
+from qtpy.QtCore import QCoreApplication, QObject, QSize, Qt, QTimer
 from qtpy.QtGui import QCursor, QGuiApplication
 from qtpy.QtWidgets import QFileDialog, QSplitter, QVBoxLayout, QWidget
 
@@ -38,9 +39,21 @@ from .._vispy import (  # isort:skip
     VispyScaleBarVisual,
     VispyWelcomeVisual,
     create_vispy_visual,
+    view_bounds_in_world,
 )
 
 
+# Minimum time between two processed mouse moves without a button pressed, in
+# seconds. Faster moves are coalesced, so that at most one is processed per
+# frame at 60 fps.
+MOUSE_MOVE_INTERVAL = 1 / 60
+
+# Time the camera must stay still in 3D before the layers are updated for the
+# new view, in seconds. Multiscale images load a new volume when they are, so
+# doing it on every camera move would block the interaction.
+CAMERA_SETTLE_INTERVAL = 0.25
+
+
 class QtViewer(QSplitter):
     """Qt view for the napari Viewer model.
 
@@ -193,8 +206,26 @@ class QtViewer(QSplitter):
         self.viewer.layers.events.inserted.connect(self._on_add_layer_change)
         self.viewer.layers.events.removed.connect(self._remove_layer)
 
+        # Mouse moves without a button pressed are coalesced, the latest one
+        # waits for this timer when they come faster than MOUSE_MOVE_INTERVAL
+        self._pending_mouse_move = None
+        self._last_mouse_move = 0
+        self._mouse_move_timer = QTimer(self)
+        self._mouse_move_timer.setSingleShot(True)
+        self._mouse_move_timer.timeout.connect(self._on_mouse_move_timer)
+
+        # In 3D the layers are updated for the view once the camera settles
+        self._camera_settle_timer = QTimer(self)
+        self._camera_settle_timer.setSingleShot(True)
+        self._camera_settle_timer.timeout.connect(self._update_layers_draw)
+        self.viewer.camera.events.center.connect(self._on_camera_move)
+        self.viewer.camera.events.zoom.connect(self._on_camera_move)
+        self.viewer.camera.events.angles.connect(self._on_camera_move)
+
         # stop any animations whenever the layers change
         self.viewer.events.layers_change.connect(lambda x: self.dims.stop())
+        # load the frames an animation requests next ahead
+        self.dims.prefetch_requested.connect(self.viewer._prefetch_steps)
 
         self.setAcceptDrops(True)
 
@@ -215,7 +246,7 @@ class QtViewer(QSplitter):
 
         # Create the experimental RemoteManager for the monitor.
         self._remote_manager = _create_remote_manager(
-            self.viewer.layers, self._qt_poll
+            self.viewer.layers, self._qt_poll, self.canvas
         )
 
     def _create_canvas(self) -> None:
@@ -227,7 +258,7 @@ class QtViewer(QSplitter):
             size=self.viewer._canvas_size[::-1],
         )
         self.canvas.events.ignore_callback_errors = False
-        self.canvas.events.draw.connect(self.dims.enable_play)
+        self.canvas.events.draw.connect(self._on_frame_drawn)
         self.canvas.native.setMinimumSize(QSize(200, 200))
         self.canvas.context.set_depth_func('lequal')
 
@@ -621,7 +652,11 @@ class QtViewer(QSplitter):
         -------
         corners : 2-tuple
             Coordinates of top left and bottom right canvas pixel in the world.
+            In 3D, the bounds of the part of the world in view instead.
         """
+        if self.viewer.dims.ndisplay == 3:
+            return view_bounds_in_world(self.view, self.viewer.dims)
+
         # Find corners of canvas in world coordinates
         top_left = self._map_canvas2world([0, 0])
         bottom_right = self._map_canvas2world(self.canvas.size)
@@ -645,6 +680,7 @@ class QtViewer(QSplitter):
         if event.pos is None:
             return
 
+        self._cancel_mouse_move()
         event = ReadOnlyWrapper(event)
         self.viewer.cursor.position = self._map_canvas2world(list(event.pos))
         mouse_wheel_callbacks(self.viewer, event)
@@ -675,6 +711,10 @@ class QtViewer(QSplitter):
     def on_mouse_move(self, event):
         """Called whenever mouse moves over canvas.
 
+        Moves while dragging are processed right away. Other moves are
+        processed at most once every MOUSE_MOVE_INTERVAL, a move that comes
+        sooner waits and is replaced by any move that comes in the meantime.
+
         Parameters
         ----------
         event : napari.utils.event.Event
@@ -683,6 +723,39 @@ class QtViewer(QSplitter):
         if event.pos is None:
             return
 
+        if event.is_dragging:
+            self._cancel_mouse_move()
+            self._process_mouse_move(event)
+            return
+
+        self._pending_mouse_move = event
+        if not self._mouse_move_timer.isActive():
+            wait = self._last_mouse_move + MOUSE_MOVE_INTERVAL - perf_counter()
+            if wait > 0:
+                self._mouse_move_timer.start(int(np.ceil(wait * 1000)))
+            else:
+                self._on_mouse_move_timer()
+
+    def _on_mouse_move_timer(self):
+        """Process the latest mouse move that was coalesced."""
+        event, self._pending_mouse_move = self._pending_mouse_move, None
+        if event is not None:
+            self._process_mouse_move(event)
+
+    def _cancel_mouse_move(self):
+        """Drop the coalesced mouse move, a newer mouse event replaces it."""
+        self._mouse_move_timer.stop()
+        self._pending_mouse_move = None
+
+    def _process_mouse_move(self, event):
+        """Update the cursor position and call the mouse move callbacks.
+
+        Parameters
+        ----------
+        event : napari.utils.event.Event
+            The napari event that triggered this method.
+        """
+        self._last_mouse_move = perf_counter()
         self.viewer.cursor.position = self._map_canvas2world(list(event.pos))
         mouse_move_callbacks(self.viewer, event)
 
@@ -701,6 +774,7 @@ class QtViewer(QSplitter):
         if event.pos is None:
             return
 
+        self._cancel_mouse_move()
         self.viewer.cursor.position = self._map_canvas2world(list(event.pos))
         mouse_release_callbacks(self.viewer, event)
 
@@ -712,8 +786,24 @@ class QtViewer(QSplitter):
         """Called whenever the canvas is drawn.
 
         This is triggered from vispy whenever new data is sent to the canvas or
-        the camera is moved and is connected in the `QtViewer`.
+        the camera is moved and is connected in the `QtViewer`. In 3D, the
+        layers are only updated once the camera settles, see
+        `_on_camera_move`.
         """
+        if (
+            self.viewer.dims.ndisplay == 3
+            and self._camera_settle_timer.isActive()
+        ):
+            return
+        self._update_layers_draw()
+
+    def _on_camera_move(self, event=None):
+        """Delay updating the layers until the camera settles in 3D."""
+        if self.viewer.dims.ndisplay == 3:
+            self._camera_settle_timer.start(int(CAMERA_SETTLE_INTERVAL * 1000))
+
+    def _update_layers_draw(self):
+        """Update the layers for the current view of the canvas."""
         for layer in self.viewer.layers:
             if layer.ndim <= self.viewer.dims.ndim:
                 layer._update_draw(
@@ -724,6 +814,15 @@ class QtViewer(QSplitter):
                     shape_threshold=self.canvas.size,
                 )
 
+    def _on_frame_drawn(self, event):
+        """Let the animation move on once every layer drew its slice.
+
+        A layer loading its slice asynchronously draws before its data is
+        loaded, so that draw does not count as the frame being ready.
+        """
+        if all(layer.loaded for layer in self.viewer.layers):
+            self.dims.enable_play()
+
     def keyPressEvent(self, event):
         """Called whenever a key is pressed.
 
@@ -795,6 +894,8 @@ class QtViewer(QSplitter):
         # or Abort trap. (calling stop() when no animation is occurring is also
         # not a problem)
         self.dims.stop()
+        # without waiting for the loads in progress, they are discarded
+        self.viewer._slicer.shutdown(wait=False)
         self.canvas.native.deleteLater()
         if self._console is not None:
             self.console.close()
@@ -844,7 +945,7 @@ def _create_qt_poll(parent: QObject, camera: Camera) -> 'Optional[QtPoll]':
 
 
 def _create_remote_manager(
-    layers: LayerList, qt_poll
+    layers: LayerList, qt_poll, canvas=None
 ) -> 'Optional[RemoteManager]':
     """Create and return a RemoteManager instance, if we need one.
 
@@ -854,6 +955,9 @@ def _create_remote_manager(
         The viewer's layers.
     qt_poll : QtPoll
         The viewer's QtPoll instance.
+    canvas : VispyCanvas, optional
+        The viewer's canvas, published in shared memory after each draw if
+        the monitor config asks for it.
     """
     if not config.monitor:
         return None  # Not using the monitor at all
@@ -879,4 +983,20 @@ def _create_remote_manager(
     qt_poll.events.poll.connect(manager.on_poll)
     qt_poll.events.poll.connect(monitor.on_poll)
 
+    if canvas is not None and monitor.share_canvas:
+        canvas.events.draw.connect(_publish_canvas, position='last')
+
     return manager
+
+
+def _publish_canvas(event) -> None:
+    """Publish the canvas that was just drawn in shared memory.
+
+    Connected last to the draw event of the canvas, so the framebuffer
+    holds the frame drawn and the context is current.
+    """
+    from vispy.gloo import read_pixels
+
+    from ..components.experimental.monitor import monitor
+
+    monitor.publish_array('canvas', read_pixels(alpha=True))
@@ -1,7 +1,11 @@
 import numpy as np
 from vispy.color import get_color_dict
 
-from napari._qt.widgets.qt_layerlist import QtDivider, QtLayerList
+from napari._qt.widgets.qt_layerlist import (
+    QtDivider,
+    QtLayerList,
+    QtLayerWidget,
+)
 from napari.components import LayerList
 from napari.layers import Image
 from napari.utils.colormaps.standardize_color import hex_to_name
@@ -241,3 +245,25 @@ def test_hex_to_name_is_updated():
     }
     new_hex_to_name["#00000000"] = 'transparent'
     assert new_hex_to_name == hex_to_name, fail_msg
+
+
+def test_layer_widget_thumbnail(qtbot):
+    """The thumbnail is only computed once the widget is shown."""
+    layer = Image(np.random.random((10, 15)))
+    widget = QtLayerWidget(layer)
+    qtbot.addWidget(widget)
+
+    layer.opacity = 0.5
+    widget._update_thumbnail()
+    assert widget._thumbnail_pending
+    assert layer._thumbnail_outdated
+
+    widget.show()
+    assert not widget._thumbnail_pending
+    assert not layer._thumbnail_outdated
+
+    # changes in a row are coalesced into a single update
+    layer.opacity = 0.2
+    layer.opacity = 0.3
+    assert widget._thumbnail_timer.isActive()
+    qtbot.waitUntil(lambda: not layer._thumbnail_outdated, timeout=1000)
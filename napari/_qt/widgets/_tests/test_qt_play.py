@@ -3,7 +3,7 @@ from contextlib import contextmanager
 import numpy as np
 import pytest
 
-from napari._qt._constants import LoopMode
+from napari._qt._constants import LoopMode, PlaybackMode
 from napari._qt.widgets.qt_dims import QtDims
 from napari._qt.widgets.qt_dims_slider import AnimationWorker
 from napari.components import Dims
@@ -11,13 +11,17 @@ from napari.components import Dims
 
 @contextmanager
 def make_worker(
-    qtbot, nframes=8, fps=20, frame_range=None, loop_mode=LoopMode.LOOP
+    qtbot,
+    nframes=8,
+    fps=20,
+    frame_range=None,
+    loop_mode=LoopMode.LOOP,
+    nz=8,
 ):
     # sets up an AnimationWorker ready for testing, and breaks down when done
     dims = Dims(4)
     qtdims = QtDims(dims)
     qtbot.addWidget(qtdims)
-    nz = 8
     max_index = nz - 1
     step = 1
     dims.set_range(0, (0, max_index, step))
@@ -97,6 +101,63 @@ def test_animation_thread_once(qtbot):
     assert worker.current == worker.nz
 
 
+def test_animation_thread_slow(qtbot):
+    """Paced animation waits for each frame to be ready before the next."""
+    with make_worker(qtbot, nframes=100, fps=100) as worker:
+        worker.set_playback_mode(PlaybackMode.SLOW)
+        frames = []
+        prefetched = []
+        measured = []
+        worker.frame_requested.connect(
+            lambda axis, frame: frames.append(frame)
+        )
+        worker.prefetch_requested.connect(
+            lambda axis, points: prefetched.append(points)
+        )
+        worker.fps_measured.connect(measured.append)
+
+        worker.work()
+        qtbot.wait(100)
+        # the first frame was never drawn, so no other frame was requested
+        assert frames == [1]
+        assert prefetched == [(2, 3)]
+
+        for n in range(2, 5):
+            worker.frame_ready.emit()
+            qtbot.waitUntil(lambda: len(frames) == n, timeout=2000)
+        worker.finish()
+    # every frame is shown
+    assert frames[:4] == [1, 2, 3, 4]
+    assert prefetched[-1] == (5, 6)
+    assert len(measured) == 2
+    assert measured[-1] > 0
+
+
+def test_animation_thread_skip(qtbot):
+    """Paced animation skips the frames that could not be shown in time."""
+    with make_worker(qtbot, nframes=100, fps=100, nz=1000) as worker:
+        worker.set_playback_mode(PlaybackMode.SKIP)
+        frames = []
+        prefetched = []
+        worker.frame_requested.connect(
+            lambda axis, frame: frames.append(frame)
+        )
+        worker.prefetch_requested.connect(
+            lambda axis, points: prefetched.append(points)
+        )
+
+        worker.work()
+        # the first frame takes at least 5 intervals to be ready
+        qtbot.wait(50)
+        worker.frame_ready.emit()
+        qtbot.waitUntil(lambda: len(frames) == 2, timeout=2000)
+        worker.finish()
+    stride = frames[1] - frames[0]
+    assert stride >= 5
+    # the prefetched frames use the same stride
+    assert prefetched[-1] == (frames[1] + stride, frames[1] + 2 * stride)
+
+
 @pytest.fixture()
 def view(make_napari_viewer):
     """basic viewer with data that we will use a few times"""
@@ -136,6 +197,12 @@ def test_play_raises_value_errors(qtbot, view):
         qtbot.wait(20)
         view.dims.stop()
 
+    # that's not a valid playback_mode
+    with pytest.raises(ValueError):
+        view.dims.play(0, 20, playback_mode='fast')
+        qtbot.wait(20)
+        view.dims.stop()
+
 
 @pytest.mark.skip(reason="fails too often... tested indirectly elsewhere")
 def test_play_api(qtbot, view):
@@ -2,11 +2,12 @@ import warnings
 from typing import Optional, Tuple
 
 import numpy as np
+from qtpy.QtCore import Signal
 from qtpy.QtGui import QFont, QFontMetrics
 from qtpy.QtWidgets import QLineEdit, QSizePolicy, QVBoxLayout, QWidget
 
 from ...components.dims import Dims
-from .._constants import LoopMode
+from .._constants import LoopMode, PlaybackMode
 from .qt_dims_slider import QtDimSliderWidget
 
 
@@ -26,8 +27,16 @@ class QtDims(QWidget):
         Dimensions object modeling slicing and displaying.
     slider_widgets : list[QtDimSliderWidget]
         List of slider widgets.
+    achieved_fps : float or None
+        Number of frames per second drawn during the last animation, or None
+        if no animation was played.
     """
 
+    # emitted when a frame requested by the animation was drawn
+    frame_ready = Signal()
+    # emitted with the axis and the frames an animation requests next
+    prefetch_requested = Signal(int, tuple)
+
     def __init__(self, dims: Dims, parent=None):
 
         super().__init__(parent=parent)
@@ -45,6 +54,7 @@ class QtDims(QWidget):
 
         self._play_ready = True  # False if currently awaiting a draw event
         self._animation_thread = None
+        self.achieved_fps = None
 
         # Initialises the layout:
         layout = QVBoxLayout()
@@ -253,6 +263,7 @@ class QtDims(QWidget):
         fps: Optional[float] = None,
         loop_mode: Optional[str] = None,
         frame_range: Optional[Tuple[int, int]] = None,
+        playback_mode: Optional[str] = None,
     ):
         """Animate (play) axis.
 
@@ -275,6 +286,18 @@ class QtDims(QWidget):
                     stopped
         frame_range : tuple | list
             If specified, will constrain animation to loop [first, last] frames
+        playback_mode : str
+            Pacing of the frames.  Must be one of the following options:
+                "timed": Frames are requested on a fixed timer, dropping
+                    the frames requested before the previous one was drawn.
+                "skip": The next frame is only requested once the previous
+                    one was loaded and drawn, skipping frames to hold the
+                    requested fps.
+                "slow": The next frame is only requested once the previous
+                    one was loaded and drawn, showing every frame and
+                    slowing down if needed.
+            In the "skip" and "slow" modes the next frames are loaded ahead
+            while the current one is drawn.
 
         Raises
         ------
@@ -294,6 +317,14 @@ class QtDims(QWidget):
                     f'loop_mode must be one of {_modes}.  Got: {loop_mode}'
                 )
             loop_mode = LoopMode(loop_mode)
+        if playback_mode is not None:
+            _modes = PlaybackMode.keys()
+            if playback_mode not in _modes:
+                raise ValueError(
+                    f'playback_mode must be one of {_modes}.  '
+                    f'Got: {playback_mode}'
+                )
+            playback_mode = PlaybackMode(playback_mode)
 
         if axis >= self.dims.ndim:
             raise IndexError('axis argument out of range')
@@ -301,7 +332,7 @@ class QtDims(QWidget):
         if self.is_playing:
             if self._animation_worker.axis == axis:
                 self.slider_widgets[axis]._update_play_settings(
-                    fps, loop_mode, frame_range
+                    fps, loop_mode, frame_range, playback_mode
                 )
                 return
             else:
@@ -310,7 +341,9 @@ class QtDims(QWidget):
         # we want to avoid playing a dimension that does not have a slider
         # (like X or Y, or a third dimension in volume view.)
         if self._displayed_sliders[axis]:
-            work = self.slider_widgets[axis]._play(fps, loop_mode, frame_range)
+            work = self.slider_widgets[axis]._play(
+                fps, loop_mode, frame_range, playback_mode
+            )
             if work:
                 self._animation_worker, self._animation_thread = work
             else:
@@ -348,7 +381,13 @@ class QtDims(QWidget):
     def enable_play(self, *args):
         # this is mostly here to connect to the main SceneCanvas.events.draw
         # event in the qt_viewer
-        self._play_ready = True
+        if not self._play_ready:
+            self._play_ready = True
+            self.frame_ready.emit()
+
+    def _on_fps_measured(self, fps):
+        """Store the number of frames per second drawn by the animation."""
+        self.achieved_fps = fps
 
     def closeEvent(self, event):
         [w.deleteLater() for w in self.slider_widgets]
@@ -1,3 +1,5 @@
+from collections import deque
+from time import perf_counter
 from typing import Optional, Tuple
 
 import numpy as np
@@ -18,7 +20,7 @@ from qtpy.QtWidgets import (
 )
 
 from ...utils.events import Event
-from .._constants import LoopMode
+from .._constants import LoopMode, PlaybackMode
 from ..dialogs.qt_modal import QtPopup
 from ..qthreading import _new_worker_qthread
 from .qt_scrollbar import ModifiedScrollBar
@@ -34,6 +36,7 @@ class QtDimSliderWidget(QWidget):
     axis_label_changed = Signal(int, str)  # axis, label
     fps_changed = Signal(float)
     mode_changed = Signal(str)
+    playback_mode_changed = Signal(str)
     range_changed = Signal(tuple)
     play_started = Signal()
     play_stopped = Signal()
@@ -69,6 +72,7 @@ class QtDimSliderWidget(QWidget):
         self._minframe = None
         self._maxframe = None
         self._loop_mode = LoopMode.LOOP
+        self._playback_mode = PlaybackMode.TIMED
 
         layout = QHBoxLayout()
         self._create_axis_label_widget()
@@ -151,6 +155,9 @@ class QtDimSliderWidget(QWidget):
                 self, LoopMode(x.replace(' ', '_'))
             )
         )
+        self.play_button.pacing_combo.activated[str].connect(
+            lambda x: self.__class__.playback_mode.fset(self, PlaybackMode(x))
+        )
 
         def fps_listener(*args):
             fps = self.play_button.fpsspin.value()
@@ -277,6 +284,31 @@ class QtDimSliderWidget(QWidget):
         self.play_button.mode_combo.setCurrentText(str(value))
         self.mode_changed.emit(str(value))
 
+    @property
+    def playback_mode(self):
+        """Pacing of the frames for animation.
+
+        Playback mode enumeration napari._qt._constants.PlaybackMode
+        Available options for the playback mode string enumeration are:
+        - PlaybackMode.TIMED
+            Frames are requested on a fixed timer. A frame requested before
+            the previous one was drawn is dropped.
+        - PlaybackMode.SKIP
+            The next frame is only requested once the previous one was
+            loaded and drawn, skipping frames to hold the requested fps.
+        - PlaybackMode.SLOW
+            The next frame is only requested once the previous one was
+            loaded and drawn, showing every frame and slowing down if
+            needed.
+        """
+        return self._playback_mode
+
+    @playback_mode.setter
+    def playback_mode(self, value):
+        self._playback_mode = PlaybackMode(value)
+        self.play_button.pacing_combo.setCurrentText(str(value))
+        self.playback_mode_changed.emit(str(value))
+
     @property
     def frame_range(self):
         """Frame range for animation, as (minimum_frame, maximum_frame)."""
@@ -302,7 +334,9 @@ class QtDimSliderWidget(QWidget):
         self._minframe, self._maxframe = value
         self.range_changed.emit(tuple(value))
 
-    def _update_play_settings(self, fps, loop_mode, frame_range):
+    def _update_play_settings(
+        self, fps, loop_mode, frame_range, playback_mode=None
+    ):
         """Update settings for animation.
 
         Parameters
@@ -324,6 +358,8 @@ class QtDimSliderWidget(QWidget):
                 has been reached.
         frame_range : tuple(int, int)
             Frame range as tuple/list with range (minimum_frame, maximum_frame)
+        playback_mode : napari._qt._constants.PlaybackMode, optional
+            Pacing of the frames for animation.
         """
         if fps is not None:
             self.fps = fps
@@ -331,12 +367,15 @@ class QtDimSliderWidget(QWidget):
             self.loop_mode = loop_mode
         if frame_range is not None:
             self.frame_range = frame_range
+        if playback_mode is not None:
+            self.playback_mode = playback_mode
 
     def _play(
         self,
         fps: Optional[float] = None,
         loop_mode: Optional[str] = None,
         frame_range: Optional[Tuple[int, int]] = None,
+        playback_mode: Optional[str] = None,
     ):
         """Animate (play) axis. Same API as QtDims.play()
 
@@ -363,11 +402,13 @@ class QtDimSliderWidget(QWidget):
                 has been reached.
         frame_range : tuple(int, int)
             Frame range as tuple/list with range (minimum_frame, maximum_frame)
+        playback_mode : napari._qt._constants.PlaybackMode, optional
+            Pacing of the frames for animation.
         """
 
         # having this here makes sure that using the QtDims.play() API
         # keeps the play preferences synchronized with the play_button.popup
-        self._update_play_settings(fps, loop_mode, frame_range)
+        self._update_play_settings(fps, loop_mode, frame_range, playback_mode)
 
         # setting fps to 0 just stops the animation
         if fps == 0:
@@ -377,8 +418,13 @@ class QtDimSliderWidget(QWidget):
             AnimationWorker,
             self,
             _start_thread=True,
-            _connect={'frame_requested': self.qt_dims._set_frame},
+            _connect={
+                'frame_requested': self.qt_dims._set_frame,
+                'prefetch_requested': self.qt_dims.prefetch_requested,
+                'fps_measured': self.qt_dims._on_fps_measured,
+            },
         )
+        self.qt_dims.frame_ready.connect(worker.frame_ready)
         worker.finished.connect(self.qt_dims.stop)
         thread.finished.connect(self.play_stopped.emit)
         self.play_started.emit()
@@ -499,6 +545,18 @@ class QtPlayButton(QPushButton):
         mode_combo.setCurrentText(str(self.mode))
         self.mode_combo = mode_combo
 
+        pacing_combo = QComboBox(self.popup)
+        pacing_combo.addItems([str(i) for i in PlaybackMode])
+        pacing_combo.setToolTip(
+            'timed: request frames on a fixed timer\n'
+            'skip: wait for each frame to load, skip frames to hold the fps\n'
+            'slow: wait for each frame to load, show every frame'
+        )
+        form_layout.insertRow(
+            3, QLabel('pacing:', parent=self.popup), pacing_combo
+        )
+        self.pacing_combo = pacing_combo
+
     def mouseReleaseEvent(self, event):
         """Show popup for right-click, toggle animation for right click.
 
@@ -539,20 +597,39 @@ class AnimationWorker(QObject):
 
     This prevents mouseovers and other events from causing animation lag. See
     QtDims.play() for public-facing docstring.
+
+    In the paced playback modes, the next frame is only requested once the
+    previous one was loaded and drawn, which is signaled with frame_ready.
+    The frames expected next are then requested for prefetching with
+    prefetch_requested, and the number of frames drawn per second is
+    reported with fps_measured.
     """
 
     frame_requested = Signal(int, int)  # axis, point
+    prefetch_requested = Signal(int, tuple)  # axis, points
+    fps_measured = Signal(float)
+    frame_ready = Signal()
     finished = Signal()
     started = Signal()
 
+    # Number of frames requested for prefetching in the paced modes
+    n_prefetch = 2
+    # How often to check if the previous frame is ready, in ms
+    poll_interval = 5
+    # Request the next frame anyway if the previous one is not ready after
+    # this many ms, as frames that do not change the canvas are never drawn
+    stall_timeout = 1000
+
     def __init__(self, slider):
         super().__init__()
         self.slider = slider
         self.dims = slider.dims
         self.axis = slider.axis
         self.loop_mode = slider.loop_mode
+        self.playback_mode = slider.playback_mode
         slider.fps_changed.connect(self.set_fps)
         slider.mode_changed.connect(self.set_loop_mode)
+        slider.playback_mode_changed.connect(self.set_playback_mode)
         slider.range_changed.connect(self.set_frame_range)
         self.set_fps(self.slider.fps)
         self.set_frame_range(slider.frame_range)
@@ -565,6 +642,12 @@ class AnimationWorker(QObject):
         self.current = min(self.current, self.max_point)
         self.timer = QTimer()
 
+        # State of the paced playback modes
+        self._frame_ready = True
+        self._requested_at = None
+        self._ready_times = deque(maxlen=16)
+        self.frame_ready.connect(self._on_frame_ready)
+
     @Slot()
     def work(self):
         """Play the animation."""
@@ -646,12 +729,102 @@ class AnimationWorker(QObject):
         """
         self.loop_mode = LoopMode(mode)
 
+    @Slot(str)
+    def set_playback_mode(self, mode):
+        """Set the playback mode for the animation.
+
+        Parameters
+        ----------
+        mode : str
+            Pacing of the frames for animation.
+            Available options for the playback mode string enumeration are:
+            - PlaybackMode.TIMED
+                Frames are requested on a fixed timer. A frame requested
+                before the previous one was drawn is dropped.
+            - PlaybackMode.SKIP
+                The next frame is only requested once the previous one was
+                loaded and drawn, skipping frames to hold the requested fps.
+            - PlaybackMode.SLOW
+                The next frame is only requested once the previous one was
+                loaded and drawn, showing every frame and slowing down if
+                needed.
+        """
+        self.playback_mode = PlaybackMode(mode)
+        self._frame_ready = True
+
     def advance(self):
         """Advance the current frame in the animation.
 
         Takes dims scale into account and restricts the animation to the
         requested frame_range, if entered.
         """
+        if self.playback_mode == PlaybackMode.TIMED:
+            if not self._step():
+                return self.finish()
+            self._request_frame()
+            return
+
+        elapsed = 0
+        if self._requested_at is not None:
+            elapsed = (perf_counter() - self._requested_at) * 1000
+        if not self._frame_ready and elapsed < self.stall_timeout:
+            # wait for the previous frame to be loaded and drawn
+            self.timer.singleShot(self.poll_interval, self.advance)
+            return
+
+        n_steps = 1
+        if self.playback_mode == PlaybackMode.SKIP:
+            # skip the frames that should have been shown in the meantime
+            n_steps = max(1, int(elapsed // self.interval))
+        for _ in range(n_steps):
+            if not self._step():
+                return self.finish()
+        self._frame_ready = False
+        self._requested_at = perf_counter()
+        self._request_frame()
+        self.prefetch_requested.emit(self.axis, self._next_frames(n_steps))
+
+    def _request_frame(self):
+        """Request the current frame and schedule the next advance."""
+        with self.dims.events.current_step.blocker(self._on_axis_changed):
+            self.frame_requested.emit(self.axis, self.current)
+        # using a singleShot timer here instead of timer.start() because
+        # it makes it easier to update the interval using signals/slots
+        self.timer.singleShot(int(self.interval), self.advance)
+
+    def _next_frames(self, n_steps):
+        """Frames expected to be requested next, to prefetch them.
+
+        Parameters
+        ----------
+        n_steps : int
+            Number of steps between two frames.
+
+        Returns
+        -------
+        tuple of int
+            Up to n_prefetch frames, in the order they will be requested.
+        """
+        state = (self.current, self.step)
+        frames = []
+        try:
+            for _ in range(self.n_prefetch):
+                for _ in range(n_steps):
+                    if not self._step():
+                        return tuple(frames)
+                frames.append(self.current)
+            return tuple(frames)
+        finally:
+            self.current, self.step = state
+
+    def _step(self):
+        """Move the current frame by one step.
+
+        Returns
+        -------
+        bool
+            False if the animation is over, in LoopMode.ONCE.
+        """
         self.current += self.step * self.dimsrange[2]
         if self.current < self.min_point:
             if (
@@ -662,7 +835,7 @@ class AnimationWorker(QObject):
             elif self.loop_mode == LoopMode.LOOP:  # 'loop'
                 self.current = self.max_point + self.current - self.min_point
             else:  # loop_mode == 'once'
-                return self.finish()
+                return False
         elif self.current >= self.max_point:
             if (
                 self.loop_mode == LoopMode.BACK_AND_FORTH
@@ -674,12 +847,18 @@ class AnimationWorker(QObject):
             elif self.loop_mode == LoopMode.LOOP:  # 'loop'
                 self.current = self.min_point + self.current - self.max_point
             else:  # loop_mode == 'once'
-                return self.finish()
-        with self.dims.events.current_step.blocker(self._on_axis_changed):
-            self.frame_requested.emit(self.axis, self.current)
-        # using a singleShot timer here instead of timer.start() because
-        # it makes it easier to update the interval using signals/slots
-        self.timer.singleShot(int(self.interval), self.advance)
+                return False
+        return True
+
+    @Slot()
+    def _on_frame_ready(self):
+        """Record that the requested frame was loaded and drawn."""
+        self._frame_ready = True
+        self._ready_times.append(perf_counter())
+        if len(self._ready_times) > 1:
+            span = self._ready_times[-1] - self._ready_times[0]
+            if span > 0:
+                self.fps_measured.emit((len(self._ready_times) - 1) / span)
 
     def finish(self):
         """Emit the finished event signal."""
@@ -22,6 +22,10 @@ from ...utils.events import disconnect_events
 if TYPE_CHECKING:
     from ..experimental.qt_chunk_receiver import QtChunkReceiver
 
+# Milliseconds to wait before showing a new thumbnail, so that the
+# thumbnails of layers refreshed many times in a row are computed once
+THUMBNAIL_INTERVAL = 100
+
 
 def _create_chunk_receiver(parent: QObject) -> 'Optional[QtChunkReceiver]':
     """Return a QtChunkReceiver or None if not using async.
@@ -525,6 +529,14 @@ class QtLayerWidget(QFrame):
         self.layer.events.visible.connect(self._on_visible_change)
         self.layer.events.thumbnail.connect(self._on_thumbnail_change)
 
+        # Thumbnail changes are coalesced and shown once the timer goes off,
+        # or once the widget is shown if it is hidden
+        self._thumbnail_timer = QTimer(self)
+        self._thumbnail_timer.setSingleShot(True)
+        self._thumbnail_timer.setInterval(THUMBNAIL_INTERVAL)
+        self._thumbnail_timer.timeout.connect(self._update_thumbnail)
+        self._thumbnail_pending = False
+
         self.setAttribute(Qt.WA_DeleteOnClose)
 
         self.setObjectName('layer')
@@ -537,7 +549,7 @@ class QtLayerWidget(QFrame):
         tb.setObjectName('thumbnail')
         tb.setToolTip('Layer thumbnail')
         self.thumbnailLabel = tb
-        self._on_thumbnail_change()
+        self._update_thumbnail()
         self.layout.addWidget(tb)
 
         cb = QCheckBox(self)
@@ -688,13 +700,25 @@ class QtLayerWidget(QFrame):
             self.visibleCheckBox.setChecked(self.layer.visible)
 
     def _on_thumbnail_change(self, event=None):
-        """Update thumbnail image on the layer widget.
+        """Update thumbnail image on the layer widget, after a short delay.
 
         Parameters
         ----------
         event : napari.utils.event.Event, optional
             The napari event that triggered this method.
         """
+        if not self._thumbnail_timer.isActive():
+            self._thumbnail_timer.start()
+
+    def _update_thumbnail(self):
+        """Update thumbnail image on the layer widget, if it is visible."""
+        if not self.isVisible():
+            # The layer computes the thumbnail when it is read, so a hidden
+            # layer list never asks for it
+            self._thumbnail_pending = True
+            return
+        self._thumbnail_pending = False
+
         thumbnail = self.layer.thumbnail
         # Note that QImage expects the image width followed by height
         image = QImage(
@@ -705,7 +729,20 @@ class QtLayerWidget(QFrame):
         )
         self.thumbnailLabel.setPixmap(QPixmap.fromImage(image))
 
+    def showEvent(self, event):
+        """Update the thumbnail if it changed while the widget was hidden.
+
+        Parameters
+        ----------
+        event : qtpy.QtCore.QEvent
+            Event from the Qt context.
+        """
+        super().showEvent(event)
+        if self._thumbnail_pending:
+            self._update_thumbnail()
+
     def close(self):
         """Disconnect events when widget is closing."""
+        self._thumbnail_timer.stop()
         disconnect_events(self.layer.events, self)
         super().close()
@@ -13,7 +13,7 @@ vispy_logger.setLevel(logging.WARNING)
 
 
 from .quaternion import quaternion2euler
-from .utils import create_vispy_visual
+from .utils import create_vispy_visual, view_bounds_in_world
 from .vispy_axes_visual import VispyAxesVisual
 from .vispy_camera import VispyCamera
 from .vispy_canvas import VispyCanvas
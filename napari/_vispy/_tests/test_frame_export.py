@@ -0,0 +1,84 @@
+import os
+
+import dask.array as da
+import imageio
+import numpy as np
+import pytest
+
+from napari._vispy.frame_export import (
+    _BackgroundWriter,
+    iter_frames,
+    write_frames,
+)
+from napari.components import ViewerModel
+
+
+def _render_slice(layer):
+    """Render a frame as the data of the slice of a layer."""
+    return lambda: np.array(layer._slice.image.raw)
+
+
+@pytest.mark.sync_only
+def test_iter_frames():
+    """Each step is rendered and the next steps are loaded ahead."""
+    np.random.seed(0)
+    data = np.random.random((6, 8, 8))
+    viewer = ViewerModel()
+    layer = viewer.add_image(da.from_array(data, chunks=(1, 8, 8)))
+    viewer.dims.set_current_step(0, 1)
+
+    prefetched = []
+
+    def render():
+        prefetched.append(len(viewer._slicer._prefetched))
+        return _render_slice(layer)()
+
+    frames = list(iter_frames(viewer, render, axis=0, steps=[0, 2, 4, 5]))
+    for frame, step in zip(frames, [0, 2, 4, 5]):
+        np.testing.assert_array_equal(frame, data[step])
+    # the two next frames are loaded while a frame renders
+    assert prefetched == [2, 2, 1, 0]
+
+    # the dims are back where they were
+    assert viewer.dims.current_step[0] == 1
+    assert viewer._slicer._prefetched == {}
+    viewer._slicer.shutdown()
+
+
+def test_write_frames_image_sequence(tmp_path):
+    frames = [np.full((4, 6, 4), i * 10, dtype=np.uint8) for i in range(3)]
+    directory = tmp_path / 'frames'
+    assert write_frames(iter(frames), directory) == 3
+    assert sorted(os.listdir(directory)) == [
+        'frame_00000.png',
+        'frame_00001.png',
+        'frame_00002.png',
+    ]
+    np.testing.assert_array_equal(
+        imageio.imread(directory / 'frame_00002.png'), frames[2]
+    )
+
+
+def test_write_frames_movie(tmp_path):
+    frames = [np.full((4, 6, 3), i * 50, dtype=np.uint8) for i in range(3)]
+    path = tmp_path / 'movie.gif'
+    assert write_frames(frames, path, fps=5) == 3
+    assert len(imageio.mimread(path)) == 3
+
+
+def test_background_writer_error():
+    """An error of the writer thread is raised in the caller."""
+    written = []
+
+    def write(frame):
+        if frame == 1:
+            raise ValueError('cannot write')
+        written.append(frame)
+
+    writer = _BackgroundWriter(write)
+    writer.put(0)
+    writer.put(1)
+    writer.put(2)
+    with pytest.raises(ValueError):
+        writer.close()
+    assert written == [0]
@@ -0,0 +1,52 @@
+import os
+import sys
+
+import numpy as np
+import pytest
+
+from napari._vispy.vispy_offscreen_canvas import VispyOffscreenCanvas
+from napari.components import ViewerModel
+
+skip_on_win_ci = pytest.mark.skipif(
+    sys.platform.startswith('win') and os.getenv('CI', '0') != '0',
+    reason='Screenshot tests are not supported on windows CI.',
+)
+skip_local_popups = pytest.mark.skipif(
+    not os.getenv('CI') and os.getenv('NAPARI_POPUP_TESTS', '0') == '0',
+    reason='Tests requiring GUI windows are skipped locally by default.',
+)
+
+
+@skip_on_win_ci
+@skip_local_popups
+def test_render(qapp):
+    """Test a frame shows the layers of the viewer at the requested size."""
+    viewer = ViewerModel()
+    viewer.add_image(np.ones((20, 20)), contrast_limits=[0, 1], colormap='red')
+    viewer.reset_view()
+
+    canvas = VispyOffscreenCanvas(viewer, size=(60, 80))
+    frame = canvas.render()
+    canvas.close()
+    assert frame.shape == (60, 80, 4)
+    assert frame.dtype == np.uint8
+    np.testing.assert_array_equal(frame[30, 40], [255, 0, 0, 255])
+
+
+def test_close_disconnects(qapp):
+    """Test closing the canvas disconnects it from the viewer."""
+    viewer = ViewerModel()
+    viewer.add_image(np.ones((20, 20)))
+    emitters = [
+        viewer.camera.events.center,
+        viewer.camera.events.zoom,
+        viewer.camera.events.angles,
+        viewer.dims.events.ndisplay,
+        viewer.layers[0].events.data,
+    ]
+    n_callbacks = [len(emitter.callbacks) for emitter in emitters]
+
+    canvas = VispyOffscreenCanvas(viewer, size=(60, 80))
+    assert [len(emitter.callbacks) for emitter in emitters] != n_callbacks
+    canvas.close()
+    assert [len(emitter.callbacks) for emitter in emitters] == n_callbacks
@@ -0,0 +1,109 @@
+import numpy as np
+import pytest
+
+from napari._vispy.experimental.slot_allocator import SlotAllocator
+from napari._vispy.experimental.texture_atlas import TextureAtlasPool
+from napari.layers.image.experimental.octree_chunk import (
+    OctreeChunk,
+    OctreeChunkGeom,
+    OctreeLocation,
+)
+
+
+def _create_chunk(row: int, col: int, shape=(8, 8)) -> OctreeChunk:
+    """Return a chunk of random data at this row and column."""
+    location = OctreeLocation(None, 0, 0, row, col)
+    geom = OctreeChunkGeom(np.array([col, row]), np.array([1, 1]))
+    return OctreeChunk(np.random.random(shape), location, geom)
+
+
+def test_allocate_lowest_slot():
+    """Free slots are allocated lowest first, until none is left."""
+    slots = SlotAllocator(3)
+    assert [slots.allocate() for _ in range(3)] == [0, 1, 2]
+    assert slots.allocate() is None
+    assert slots.num_used == 3
+
+    slots.free(1)
+    assert slots.num_free == 1
+    assert slots.allocate() == 1
+
+
+def test_reuse_least_recently_released():
+    """Once no slot is free, idle slots are reused oldest first."""
+    slots = SlotAllocator(3)
+    for _ in range(3):
+        slots.allocate()
+
+    slots.release(2)
+    slots.release(0)
+    assert slots.num_idle == 2
+    assert slots.num_used == 1
+
+    assert slots.peek_evicted() == 2
+    assert slots.allocate() == 2
+    assert slots.is_idle(0)
+
+    # A reused slot is not idle anymore and cannot be evicted
+    slots.reuse(0)
+    assert not slots.is_idle(0)
+    assert slots.peek_evicted() is None
+    assert slots.allocate() is None
+
+
+def test_free_slots_before_idle_slots():
+    """Idle slots are only reused once no slot is free."""
+    slots = SlotAllocator(3)
+    slots.allocate()
+    slots.release(0)
+    assert slots.peek_evicted() is None
+    assert slots.allocate() == 1
+    assert slots.is_idle(0)
+
+
+def test_pool_pages():
+    """Tiles fill one page before the next page is created."""
+    np.random.seed(0)
+    pool = TextureAtlasPool((8, 8), (2, 2), num_pages=3)
+    assert pool.num_pages_created == 0
+
+    tiles = [pool.add_tile(_create_chunk(0, col)) for col in range(6)]
+    assert [tile.page for tile in tiles] == [0, 0, 0, 0, 1, 1]
+    assert [tile.index for tile in tiles] == list(range(6))
+    assert pool.num_pages_created == 2
+    assert pool.num_slots_used == 6
+
+    # Tiles in the same slot of different pages share texture coordinates
+    np.testing.assert_array_equal(tiles[0].tex_coords, tiles[4].tex_coords)
+
+
+def test_pool_reuses_released_tiles():
+    """Released tiles are added again without using another slot."""
+    np.random.seed(0)
+    pool = TextureAtlasPool((8, 8), (1, 2), num_pages=1)
+    chunks = [_create_chunk(0, col) for col in range(3)]
+    tiles = [pool.add_tile(chunk) for chunk in chunks[:2]]
+    assert pool.add_tile(chunks[2]) is None
+
+    # The second tile is in the right half of the page
+    np.testing.assert_allclose(tiles[1].tex_coords.min(axis=0), [0.5, 0])
+
+    pool.release_tile(chunks[0], tiles[0])
+    assert pool.is_cached(chunks[0])
+    assert pool.add_tile(chunks[0]) is tiles[0]
+    assert not pool.is_cached(chunks[0])
+
+    # Once released again, its slot is reused for another chunk
+    pool.release_tile(chunks[0], tiles[0])
+    tile = pool.add_tile(chunks[2])
+    assert tile.index == tiles[0].index
+    assert not pool.is_cached(chunks[0])
+    assert pool.num_slots_idle == 0
+
+
+def test_pool_incompatible_data():
+    """A chunk too big for the tiles raises without using a slot."""
+    pool = TextureAtlasPool((8, 8), (1, 2), num_pages=1)
+    with pytest.raises(ValueError):
+        pool.add_tile(_create_chunk(0, 0, shape=(16, 16)))
+    assert pool.num_slots_used == 0
@@ -0,0 +1,53 @@
+import numpy as np
+
+from napari._vispy.experimental.texture_atlas import AtlasTile
+from napari._vispy.experimental.tile_set import TileSet
+from napari.layers.image.experimental.octree_chunk import (
+    OctreeChunk,
+    OctreeChunkGeom,
+    OctreeLocation,
+)
+
+
+def _add_tile(tiles: TileSet, index: int, level: int, page: int = 0):
+    """Add a tile whose quad is filled with its index."""
+    location = OctreeLocation(None, 0, level, 0, index)
+    geom = OctreeChunkGeom(np.array([index, 0]), np.array([1, 1]))
+    chunk = OctreeChunk(np.zeros((4, 4)), location, geom)
+    quad = np.full((6, 2), index, dtype=np.float32)
+    tiles.add(chunk, AtlasTile(index, quad, quad, page))
+    return chunk
+
+
+def test_vertex_arrays():
+    """The quad of each tile is stored at its index."""
+    tiles = TileSet()
+    _add_tile(tiles, 0, 0)
+    _add_tile(tiles, 5, 0)
+    assert tiles.arrays_changed
+
+    verts, tex_coords = tiles.vertex_arrays
+    assert len(verts) >= 6 * 6
+    np.testing.assert_array_equal(verts[30:36], 5)
+    np.testing.assert_array_equal(tex_coords[:6], 0)
+    np.testing.assert_array_equal(tiles.draw_order(), [0, 5])
+
+
+def test_draw_order():
+    """Tiles are drawn coarse levels first, then by page."""
+    tiles = TileSet()
+    _add_tile(tiles, 0, level=0, page=0)
+    _add_tile(tiles, 1, level=1, page=0)
+    _add_tile(tiles, 2, level=0, page=1)
+    _add_tile(tiles, 3, level=1, page=1)
+    _add_tile(tiles, 4, level=0, page=0)
+    np.testing.assert_array_equal(tiles.draw_order(), [1, 3, 0, 4, 2])
+    assert [
+        tile_data.atlas_tile.index for tile_data in tiles.tile_data_sorted
+    ] == [1, 3, 0, 4, 2]
+
+    # Removed tiles are not drawn
+    tiles.remove(3)
+    np.testing.assert_array_equal(tiles.draw_order(), [1, 0, 4, 2])
+    tiles.clear()
+    assert len(tiles.draw_order()) == 0
@@ -0,0 +1,88 @@
+import numpy as np
+import pytest
+
+from napari._vispy.experimental import tiled_image_visual
+from napari._vispy.experimental.tiled_image_visual import (
+    TiledImageVisual,
+    UploadBudget,
+)
+from napari._vispy.experimental.vispy_tiled_image_layer import (
+    _sort_by_priority,
+)
+from napari.layers.image.experimental.octree_chunk import (
+    OctreeChunk,
+    OctreeChunkGeom,
+    OctreeLocation,
+)
+from napari.layers.image.experimental.octree_intersection import OctreeView
+
+
+def _create_chunk(level: int, row: int, col: int) -> OctreeChunk:
+    """Return a (16, 16) float32 chunk, of 1 kilobyte."""
+    location = OctreeLocation(None, 0, level, row, col)
+    size = np.array([16, 16]) * 2 ** level
+    geom = OctreeChunkGeom(np.array([col, row]) * size, size)
+    return OctreeChunk(np.zeros((16, 16), np.float32), location, geom)
+
+
+@pytest.fixture
+def visual(monkeypatch):
+    """A TiledImageVisual of (16, 16) tiles, without asking the card."""
+    monkeypatch.setattr(
+        tiled_image_visual, 'get_max_texture_sizes', lambda: (64, 64)
+    )
+    return TiledImageVisual(tile_shape=(16, 16))
+
+
+def test_one_upload_without_budget(visual):
+    """Without a budget one chunk is uploaded each frame."""
+    chunks = [_create_chunk(0, 0, col) for col in range(3)]
+    assert visual.add_chunks(chunks) == 2
+    assert visual.add_chunks(chunks) == 2
+    assert visual.num_tiles == 1
+
+    visual.start_frame()
+    assert visual.add_chunks(chunks) == 1
+    assert visual.num_tiles == 2
+
+
+def test_upload_budget(visual):
+    """Chunks are uploaded until the budget of the frame is spent."""
+    chunks = [_create_chunk(0, 0, col) for col in range(5)]
+    budget = UploadBudget(nbytes=2 * 1024, ms=1000)
+    assert visual.add_chunks(chunks, budget) == 3
+    assert visual.add_chunks(chunks, budget) == 3
+
+    visual.start_frame()
+    assert visual.add_chunks(chunks, budget) == 1
+
+    # Chunks still in the atlas do not use the budget
+    visual.prune_tiles(set(chunks[2:]))
+    assert visual.num_tiles == 2
+    assert visual.add_chunks(chunks, budget) == 1
+    assert visual.num_tiles == 4
+
+
+def test_draw_starts_frame(visual):
+    """The upload budget is only available again once the canvas draws."""
+    chunks = [_create_chunk(0, 0, col) for col in range(3)]
+    assert visual.add_chunks(chunks) == 2
+    assert visual.add_chunks(chunks) == 2
+
+    # Hidden, so that drawing does not need an OpenGL context
+    visual.visible = False
+    visual.draw()
+    assert visual.add_chunks(chunks) == 1
+
+
+def test_sort_by_priority():
+    """Coarse chunks first, then the chunks near the center of the view."""
+    chunks = [
+        _create_chunk(0, 0, 0),
+        _create_chunk(0, 0, 3),
+        _create_chunk(1, 0, 0),
+        _create_chunk(0, 0, 2),
+    ]
+    view = OctreeView(np.array([[0, 32], [16, 64]]), None, None)
+    sorted_chunks = _sort_by_priority(chunks, view)
+    assert sorted_chunks == [chunks[2], chunks[1], chunks[3], chunks[0]]
@@ -0,0 +1,152 @@
+"""SlotAllocator class.
+
+Allocates the slots of a texture atlas, without any OpenGL.
+"""
+import heapq
+from collections import OrderedDict
+from typing import List, Optional
+
+
+class SlotAllocator:
+    """Allocate slots, reusing the least recently used idle slots.
+
+    Every slot is in one of three states:
+
+    free
+        Nothing was ever stored in the slot, or it was explicitly freed.
+    used
+        The slot holds a tile being drawn.
+    idle
+        The slot holds a tile that is not drawn anymore. The tile is kept
+        so it can be drawn again without uploading it again, until its
+        slot is needed for another tile.
+
+    allocate() returns the lowest free slot, so that slots are used in
+    order and the tiles are packed in as few atlas pages as possible. Once
+    no slot is free, it takes the idle slot which has been idle the
+    longest.
+
+    Parameters
+    ----------
+    num_slots : int
+        The total number of slots.
+    """
+
+    def __init__(self, num_slots: int):
+        self.num_slots = num_slots
+
+        # A heap, so allocate() always returns the lowest free slot.
+        self._free: List[int] = list(range(num_slots))
+
+        # Idle slots ordered from the least to the most recently used.
+        self._idle: OrderedDict = OrderedDict()
+
+    @property
+    def num_free(self) -> int:
+        """The number of free slots.
+
+        Returns
+        -------
+        int
+            The number of free slots.
+        """
+        return len(self._free)
+
+    @property
+    def num_idle(self) -> int:
+        """The number of idle slots.
+
+        Returns
+        -------
+        int
+            The number of idle slots.
+        """
+        return len(self._idle)
+
+    @property
+    def num_used(self) -> int:
+        """The number of used slots.
+
+        Returns
+        -------
+        int
+            The number of used slots.
+        """
+        return self.num_slots - self.num_free - self.num_idle
+
+    def is_idle(self, slot: int) -> bool:
+        """Return True if the slot is idle.
+
+        Parameters
+        ----------
+        slot : int
+            The slot to check.
+
+        Returns
+        -------
+        bool
+            True if the slot is idle.
+        """
+        return slot in self._idle
+
+    def allocate(self) -> Optional[int]:
+        """Return a slot to store a new tile in, now used.
+
+        If the slot was idle, the tile it was holding is lost. Check with
+        is_idle() first to know which tile that is.
+
+        Returns
+        -------
+        Optional[int]
+            The slot, or None if every slot is used.
+        """
+        if self._free:
+            return heapq.heappop(self._free)
+        if self._idle:
+            slot, _ = self._idle.popitem(last=False)
+            return slot
+        return None
+
+    def peek_evicted(self) -> Optional[int]:
+        """Return the idle slot allocate() would reuse, if any.
+
+        Returns
+        -------
+        Optional[int]
+            The idle slot allocate() would reuse, None if it would return a
+            free slot or no slot.
+        """
+        if self._free or not self._idle:
+            return None
+        return next(iter(self._idle))
+
+    def release(self, slot: int) -> None:
+        """A used slot is now idle, its tile is kept for reuse.
+
+        Parameters
+        ----------
+        slot : int
+            The slot whose tile is not drawn anymore.
+        """
+        self._idle[slot] = None
+
+    def reuse(self, slot: int) -> None:
+        """An idle slot is used again, for the tile it is holding.
+
+        Parameters
+        ----------
+        slot : int
+            The idle slot whose tile is drawn again.
+        """
+        del self._idle[slot]
+
+    def free(self, slot: int) -> None:
+        """A used or idle slot is now free, its tile is discarded.
+
+        Parameters
+        ----------
+        slot : int
+            The slot to free.
+        """
+        self._idle.pop(slot, None)
+        heapq.heappush(self._free, slot)
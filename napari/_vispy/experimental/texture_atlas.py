@@ -1,13 +1,15 @@
-"""TextureAtlas2D class.
+"""TextureAtlas2D and TextureAtlasPool classes.
 
 A texture atlas is a large texture that stores many smaller tile textures.
+A pool of atlases stores more tiles than fit in a single texture.
 """
-from typing import NamedTuple, Optional, Tuple
+from typing import Dict, List, NamedTuple, Optional, Tuple
 
 import numpy as np
 from vispy.gloo import Texture2D
 
 from ...layers.image.experimental import OctreeChunk
+from .slot_allocator import SlotAllocator
 
 # Two triangles which cover a [0..1, 0..1] quad.
 _QUAD = np.array(
@@ -64,11 +66,14 @@ class AtlasTile(NamedTuple):
         The vertices of this tile.
     tex_coords : np.ndarray
         The texture coordinates of this tile.
+    page : int
+        The index of the atlas page of a TextureAtlasPool the tile is in.
     """
 
     index: int
     verts: np.ndarray
     tex_coords: np.ndarray
+    page: int = 0
 
 
 class TileSpec(NamedTuple):
@@ -131,6 +136,38 @@ class TileSpec(NamedTuple):
         return True
 
 
+def _get_tile_data(spec: TileSpec, octree_chunk: OctreeChunk) -> np.ndarray:
+    """Return the data of the chunk, ready to be stored in a tile.
+
+    Parameters
+    ----------
+    spec : TileSpec
+        The tiles the data will be stored in.
+    octree_chunk : OctreeChunk
+        The chunk with the data.
+
+    Returns
+    -------
+    np.ndarray
+        The data of the chunk, as float32 if it was float64.
+    """
+    data = octree_chunk.data
+
+    if data.dtype == np.float64:
+        data = data.astype(np.float32)
+
+    assert isinstance(data, np.ndarray)
+
+    if not spec.is_compatible(data):
+        # It will be not compatible of number of dimensions or depth
+        # are wrong. Or if the data is too big to fit in one tile.
+        raise ValueError(
+            f"Data with shape {octree_chunk.data.shape} is not compatible "
+            f"with this TextureAtlas2D which has tile shape {spec.shape}"
+        )
+    return data
+
+
 class TextureAtlas2D(Texture2D):
     """A two-dimensional texture atlas.
 
@@ -160,15 +197,12 @@ class TextureAtlas2D(Texture2D):
         height = self.spec.height * self.shape_in_tiles[0]
         width = self.spec.width * self.shape_in_tiles[1]
         self.full_shape = np.array(
-            [width, height, self.spec.depth], dtype=np.int32
+            [height, width, self.spec.depth], dtype=np.int32
         )
 
         # Total number of texture slots in the atlas.
         self.num_slots_total = shape_in_tiles[0] * shape_in_tiles[1]
 
-        # Every index is free initially.
-        self._free_indices = set(range(0, self.num_slots_total))
-
         # Pre-compute the texture coords for every tile. Otherwise we'd be
         # calculating these over and over as tiles are added. These are for
         # full tiles only. Edge and corner tiles will need custom texture
@@ -181,28 +215,6 @@ class TextureAtlas2D(Texture2D):
 
         super().__init__(shape=tuple(self.full_shape), **kwargs)
 
-    @property
-    def num_slots_free(self) -> int:
-        """The number of available texture slots.
-
-        Returns
-        -------
-        int
-            The number of available texture slots.
-        """
-        return len(self._free_indices)
-
-    @property
-    def num_slots_used(self) -> int:
-        """The number of texture slots currently in use.
-
-        Returns
-        -------
-        int
-            The number of texture slots currently in use.
-        """
-        return self.num_slots_total - self.num_slots_free
-
     def _offset(self, tile_index: int) -> Tuple[int, int]:
         """Return the (row, col) offset into the full atlas texture.
 
@@ -253,38 +265,27 @@ class TextureAtlas2D(Texture2D):
 
         return _quad(shape, pos)
 
-    def add_tile(self, octree_chunk: OctreeChunk) -> Optional[AtlasTile]:
-        """Add one tile to the atlas.
+    def set_tile(
+        self, tile_index: int, octree_chunk: OctreeChunk
+    ) -> AtlasTile:
+        """Store one tile in a slot of the atlas.
+
+        Whatever tile was in the slot before is overwritten. The caller
+        decides which slots are free, see TextureAtlasPool.
 
         Parameters
         ----------
-        octree_chunk : np.ndarray
+        tile_index : int
+            The slot to store the tile in.
+        octree_chunk : OctreeChunk
             The image data for this one tile.
 
         Returns
         -------
-        Optional[AtlasTile]
-            The AtlasTile if the tile was successfully added.
+        AtlasTile
+            The tile that was stored.
         """
-        data = octree_chunk.data
-
-        if data.dtype == np.float64:
-            data = data.astype(np.float32)
-
-        assert isinstance(data, np.ndarray)
-
-        if not self.spec.is_compatible(data):
-            # It will be not compatible of number of dimensions or depth
-            # are wrong. Or if the data is too big to fit in one tile.
-            raise ValueError(
-                f"Data with shape {octree_chunk.data.shape} is not compatible "
-                f"with this TextureAtlas2D which has tile shape {self.spec.shape}"
-            )
-
-        try:
-            tile_index = self._free_indices.pop()
-        except KeyError:
-            return None  # No available texture slots.
+        data = _get_tile_data(self.spec, octree_chunk)
 
         # Upload the texture data for this one tile.
         self._set_tile_data(tile_index, data)
@@ -318,16 +319,6 @@ class TextureAtlas2D(Texture2D):
         # Edge or corner tile, compute exact coords.
         return self._calc_tex_coords(tile_index, data.shape)
 
-    def remove_tile(self, tile_index: int) -> None:
-        """Remove a tile from the texture atlas.
-
-        Parameters
-        ----------
-        tile_index : int
-            The index of the tile to remove.
-        """
-        self._free_indices.add(tile_index)  # This tile_index is now available.
-
     def _set_tile_data(self, tile_index: int, data: np.ndarray) -> None:
         """Upload the texture data for this one tile.
 
@@ -350,3 +341,182 @@ class TextureAtlas2D(Texture2D):
         # only write into the tile's portion of the larger texture. This is
         # a big reason adding tiles to TextureAtlas2D is fast.
         self.set_data(data, offset=offset, copy=True)
+
+
+class TextureAtlasPool:
+    """Texture atlas pages that together store many tiles.
+
+    The pages are TextureAtlas2D textures of the same shape, created when
+    a tile is first stored in them. Tiles are numbered across the pages,
+    the tiles of page 0 first.
+
+    When the caller stops drawing a tile it calls release_tile(). The tile
+    stays in its slot, so if its chunk is drawn again add_tile() returns
+    it without uploading it again. Once every slot is taken, the slot of
+    the tile that was released the longest time ago is reused.
+
+    Parameters
+    ----------
+    tile_shape : tuple
+        The (height, width) of one tile in texels.
+    shape_in_tiles : Tuple[int, int]
+        The (height, width) of each page in terms of tiles.
+    num_pages : int
+        The maximum number of pages.
+    **kwargs
+        Passed to each TextureAtlas2D, for example the interpolation.
+    """
+
+    def __init__(
+        self,
+        tile_shape: tuple,
+        shape_in_tiles: Tuple[int, int],
+        num_pages: int,
+        **kwargs,
+    ):
+        self.spec = TileSpec.from_shape(tile_shape)
+        self.shape_in_tiles = shape_in_tiles
+        self.num_pages = num_pages
+        self.slots_per_page = shape_in_tiles[0] * shape_in_tiles[1]
+        self.num_slots_total = self.slots_per_page * num_pages
+        self._kwargs = kwargs
+
+        self._pages: List[Optional[TextureAtlas2D]] = [None] * num_pages
+        self._slots = SlotAllocator(self.num_slots_total)
+
+        # The released tiles still in the atlas, by chunk and by index.
+        self._idle_tiles: Dict[OctreeChunk, AtlasTile] = {}
+        self._idle_chunks: Dict[int, OctreeChunk] = {}
+
+    @property
+    def num_slots_used(self) -> int:
+        """The number of slots holding a tile being drawn.
+
+        Returns
+        -------
+        int
+            The number of slots holding a tile being drawn.
+        """
+        return self._slots.num_used
+
+    @property
+    def num_slots_idle(self) -> int:
+        """The number of slots holding a released tile.
+
+        Returns
+        -------
+        int
+            The number of slots holding a released tile.
+        """
+        return self._slots.num_idle
+
+    @property
+    def num_pages_created(self) -> int:
+        """The number of pages created so far.
+
+        Returns
+        -------
+        int
+            The number of pages created so far.
+        """
+        return sum(page is not None for page in self._pages)
+
+    def page(self, page_index: int) -> TextureAtlas2D:
+        """Return a page of the atlas, creating it if needed.
+
+        Parameters
+        ----------
+        page_index : int
+            The index of the page.
+
+        Returns
+        -------
+        TextureAtlas2D
+            The page.
+        """
+        if self._pages[page_index] is None:
+            self._pages[page_index] = TextureAtlas2D(
+                self.spec.shape, self.shape_in_tiles, **self._kwargs
+            )
+        return self._pages[page_index]
+
+    def is_cached(self, octree_chunk: OctreeChunk) -> bool:
+        """Return True if a released tile of this chunk is in the atlas.
+
+        Parameters
+        ----------
+        octree_chunk : OctreeChunk
+            The chunk to check.
+
+        Returns
+        -------
+        bool
+            True if add_tile() would not need to upload the chunk.
+        """
+        return octree_chunk in self._idle_tiles
+
+    def add_tile(self, octree_chunk: OctreeChunk) -> Optional[AtlasTile]:
+        """Add one tile to the atlas.
+
+        Parameters
+        ----------
+        octree_chunk : OctreeChunk
+            The image data for this one tile.
+
+        Returns
+        -------
+        Optional[AtlasTile]
+            The AtlasTile, or None if every slot holds a tile being drawn.
+        """
+        atlas_tile = self._idle_tiles.pop(octree_chunk, None)
+        if atlas_tile is not None:
+            # The tile is still in the atlas, no upload needed.
+            del self._idle_chunks[atlas_tile.index]
+            self._slots.reuse(atlas_tile.index)
+            return atlas_tile
+
+        evicted = self._slots.peek_evicted()
+        tile_index = self._slots.allocate()
+        if tile_index is None:
+            return None  # Every slot holds a tile being drawn.
+
+        if evicted is not None:
+            # Forget the released tile whose slot we are reusing.
+            del self._idle_tiles[self._idle_chunks.pop(evicted)]
+
+        page_index, slot = divmod(tile_index, self.slots_per_page)
+        try:
+            tile = self.page(page_index).set_tile(slot, octree_chunk)
+        except ValueError:
+            self._slots.free(tile_index)  # The data is not compatible.
+            raise
+        return AtlasTile(tile_index, tile.verts, tile.tex_coords, page_index)
+
+    def release_tile(
+        self, octree_chunk: OctreeChunk, atlas_tile: AtlasTile
+    ) -> None:
+        """Stop drawing a tile, but keep it in the atlas for reuse.
+
+        Parameters
+        ----------
+        octree_chunk : OctreeChunk
+            The chunk of the tile.
+        atlas_tile : AtlasTile
+            The tile returned by add_tile() for the chunk.
+        """
+        self._slots.release(atlas_tile.index)
+        self._idle_tiles[octree_chunk] = atlas_tile
+        self._idle_chunks[atlas_tile.index] = octree_chunk
+
+    def remove_tile(self, tile_index: int) -> None:
+        """Remove a tile from the texture atlas.
+
+        Parameters
+        ----------
+        tile_index : int
+            The index of the tile to remove.
+        """
+        octree_chunk = self._idle_chunks.pop(tile_index, None)
+        if octree_chunk is not None:
+            del self._idle_tiles[octree_chunk]
+        self._slots.free(tile_index)
@@ -2,7 +2,9 @@
 
 TiledImageVisual uses this class to track the tiles it's drawing.
 """
-from typing import Dict, List, NamedTuple, Set
+from typing import Dict, List, NamedTuple, Set, Tuple
+
+import numpy as np
 
 from ...layers.image.experimental import OctreeChunk
 from .texture_atlas import AtlasTile
@@ -29,18 +31,42 @@ class TileSet:
 
     Maintain a dict and a set for fast membership tests in both directions.
 
+    The quad of each tile is also stored in arrays indexed by tile_index,
+    which can be used as the vertex buffers as they are. Adding a tile
+    only writes its row, and removing one only clears its drawn flag. The
+    order the quads are drawn in is computed with draw_order().
+
     Attributes
     ----------
     _tiles : Dict[int, TileData]
         Maps tile_index to the the TileData we have for that tile.
     _chunks : Set[OctreeChunk]
         The chunks we have in the set, for fast membership tests.
+    _verts : np.ndarray
+        The (6, 2) quad vertices of each tile_index.
+    _tex_coords : np.ndarray
+        The (6, 2) quad texture coordinates of each tile_index.
+    _levels : np.ndarray
+        The octree level of each tile_index.
+    _pages : np.ndarray
+        The atlas page of each tile_index.
+    _drawn : np.ndarray
+        True for each tile_index in the set.
+    arrays_changed : bool
+        True if the vertex arrays changed since they were last uploaded.
     """
 
     def __init__(self):
         self._tiles: Dict[int, TileData] = {}
         self._chunks: Set[OctreeChunk] = set()
 
+        self._verts = np.zeros((0, 6, 2), dtype=np.float32)
+        self._tex_coords = np.zeros((0, 6, 2), dtype=np.float32)
+        self._levels = np.zeros(0, dtype=int)
+        self._pages = np.zeros(0, dtype=int)
+        self._drawn = np.zeros(0, dtype=bool)
+        self.arrays_changed = False
+
     def __len__(self) -> int:
         """Return the number of tiles in the set.
 
@@ -55,6 +81,7 @@ class TileSet:
         """Clear out all our tiles and chunks. Forget everything."""
         self._tiles.clear()
         self._chunks.clear()
+        self._drawn[:] = False
 
     def add(self, octree_chunk: OctreeChunk, atlas_tile: AtlasTile) -> None:
         """Add this TiledData to the set.
@@ -71,6 +98,39 @@ class TileSet:
         self._tiles[tile_index] = TileData(octree_chunk, atlas_tile)
         self._chunks.add(octree_chunk)
 
+        if tile_index >= len(self._drawn):
+            self._grow(tile_index + 1)
+        self._verts[tile_index] = atlas_tile.verts
+        self._tex_coords[tile_index] = atlas_tile.tex_coords
+        self._levels[tile_index] = octree_chunk.location.level_index
+        self._pages[tile_index] = atlas_tile.page
+        self._drawn[tile_index] = True
+        self.arrays_changed = True
+
+    def _grow(self, size: int) -> None:
+        """Grow the per-tile arrays to hold at least size tiles.
+
+        The arrays at least double, so growing is rare.
+
+        Parameters
+        ----------
+        size : int
+            The number of tiles the arrays must hold.
+        """
+        size = max(size, 2 * len(self._drawn))
+        old = len(self._drawn)
+
+        def _grown(array):
+            grown = np.zeros((size,) + array.shape[1:], dtype=array.dtype)
+            grown[:old] = array
+            return grown
+
+        self._verts = _grown(self._verts)
+        self._tex_coords = _grown(self._tex_coords)
+        self._levels = _grown(self._levels)
+        self._pages = _grown(self._pages)
+        self._drawn = _grown(self._drawn)
+
     def remove(self, tile_index: int) -> None:
         """Remove the TileData at this index from the set.
 
@@ -80,6 +140,7 @@ class TileSet:
         octree_chunk = self._tiles[tile_index].octree_chunk
         self._chunks.remove(octree_chunk)
         del self._tiles[tile_index]
+        self._drawn[tile_index] = False
 
     @property
     def chunk_set(self) -> Set[OctreeChunk]:
@@ -123,16 +184,56 @@ class TileSet:
         smaller higher resolution tiles are drawn in front. This sorting
         allows us to show the "best available" data in all locations.
 
+        Within a level the tiles are sorted by atlas page, so that the
+        tiles of one page can be drawn together.
+
         Returns
         -------
         List[TileData]
             The data for all the tiles in the set sorted back to front.
         """
-        return sorted(
-            self._tiles.values(),
-            key=lambda x: x.octree_chunk.location.level_index,
-            reverse=True,
+        return [self._tiles[index] for index in self.draw_order()]
+
+    def draw_order(self) -> np.ndarray:
+        """The tile_index of the tiles in the set, sorted back to front.
+
+        The tiles are sorted like tile_data_sorted.
+
+        Returns
+        -------
+        np.ndarray
+            The sorted tile_index of the tiles in the set.
+        """
+        indices = np.flatnonzero(self._drawn)
+        order = np.lexsort(
+            (indices, self._pages[indices], -self._levels[indices])
         )
+        return indices[order]
+
+    @property
+    def pages(self) -> np.ndarray:
+        """The atlas page of each tile_index.
+
+        Returns
+        -------
+        np.ndarray
+            The atlas page of each tile_index.
+        """
+        return self._pages
+
+    @property
+    def vertex_arrays(self) -> Tuple[np.ndarray, np.ndarray]:
+        """The vertices and texture coordinates of every tile_index.
+
+        Both are (N * 6, 2) arrays, with the quad of tile_index i at rows
+        6 * i to 6 * i + 5. Rows of tiles not in the set are not drawn.
+
+        Returns
+        -------
+        Tuple[np.ndarray, np.ndarray]
+            The vertices and the texture coordinates.
+        """
+        return self._verts.reshape(-1, 2), self._tex_coords.reshape(-1, 2)
 
     def contains_octree_chunk(self, octree_chunk: OctreeChunk) -> bool:
         """Return True if the set contains this chunk.
@@ -10,28 +10,53 @@ Instead, we'll probably just have a function signature that takes things
 like the pos, size and depth of each tile as separate arguments. But
 for now the visual and Octree both depend on OctreeChunk.
 """
-from typing import List, Set
+from collections import deque
+from time import perf_counter
+from typing import List, NamedTuple, Optional, Set, Tuple
 
 import numpy as np
+from vispy.gloo import IndexBuffer
 
 from ...layers.image.experimental import OctreeChunk
+from ...utils.perf import add_counter_event
+from ..utils_gl import get_max_texture_sizes
 from ..vendored import ImageVisual
 from ..vendored.image import _build_color_transform
-from .texture_atlas import TextureAtlas2D
-from .tile_set import TileSet
+from .texture_atlas import TextureAtlasPool
+from .tile_set import TileData, TileSet
 
-# Shape of she whole texture in tiles. Hardcode for now. We hope to make
-# TiledImageVisuals support multiple texture sizes and multiple tile
-# sizes in the future.
-SHAPE_IN_TILES = (16, 16)
+# Maximum size of one page of the texture atlas in texels. Pages are
+# smaller if the card's maximum texture size is smaller.
+MAX_PAGE_SIZE = 4096
+
+# Number of tiles the atlas pages can hold in total, at least.
+MAX_TILES = 1024
+
+# Offsets of the six vertices of a quad from its first vertex.
+_QUAD_VERTS = np.arange(6, dtype=np.uint32)
+
+
+class UploadBudget(NamedTuple):
+    """How much tile data can be uploaded to the card in one frame.
+
+    Attributes
+    ----------
+    nbytes : int
+        The number of bytes of tile data.
+    ms : float
+        The time spent adding tiles, in milliseconds.
+    """
+
+    nbytes: int
+    ms: float
 
 
 class TiledImageVisual(ImageVisual):
     """An image that is drawn using one or more tiles.
 
     A regular ImageVisual is a single image drawn as a single rectangle
-    with a single texture. A tiled TiledImageVisual also has a single
-    texture, but that texture is a TextureAtlas2D instead of Texture2D.
+    with a single texture. A tiled TiledImageVisual instead stores its
+    tiles in the pages of a TextureAtlasPool, each a TextureAtlas2D.
 
     A texture atlas is basically a single texture that contains smaller
     textures within it, arranged in a grid like a quilt. In our case the
@@ -40,7 +65,8 @@ class TiledImageVisual(ImageVisual):
 
     When the TiledImageVisual is drawn, it draws a single list of quads.
     Each quad's texture coordinates potentially refers to a different
-    texture in the atlas.
+    texture in the atlas. The quads are drawn with one draw call for each
+    run of quads whose tiles are on the same page.
 
     The quads can be located anywhere, even in 3D. TiledImageVisual does
     not know if it's drawing an octree or a grid, or just a scatter of tiles.
@@ -72,6 +98,10 @@ class TiledImageVisual(ImageVisual):
     in a shader build today. If that were fixed TiledImageVisual would
     still be faster, but the speed gap would be smaller.
 
+    Tiles which are no longer drawable are kept in the atlas until their
+    slot is needed, least recently drawn first. So panning back and forth
+    does not upload the same tiles again.
+
     Parameters
     ----------
     tile_shape : np.ndarray
@@ -83,6 +113,15 @@ class TiledImageVisual(ImageVisual):
 
         self._tiles: TileSet = TileSet()  # The tiles we are drawing.
 
+        # What was uploaded this frame, see start_frame().
+        self._frame_uploads = 0
+        self._frame_nbytes = 0
+        self._frame_ms = 0.0
+
+        # The page and index buffer of each draw call, see draw().
+        self._page_draws: List[Tuple[int, IndexBuffer]] = []
+        self._index_buffers: List[IndexBuffer] = []
+
         self._clim = np.array([0, 1])  # TOOD_OCTREE: need to support clim
 
         # Initialize our parent ImageVisual.
@@ -99,9 +138,15 @@ class TiledImageVisual(ImageVisual):
         self._texture_atlas = self._create_texture_atlas(tile_shape)
         self.freeze()
 
-    def _create_texture_atlas(self, tile_shape: np.ndarray) -> TextureAtlas2D:
+    def _create_texture_atlas(
+        self, tile_shape: np.ndarray
+    ) -> TextureAtlasPool:
         """Create texture atlas up front or if we change texture shape.
 
+        The pages are as large as the card allows, up to MAX_PAGE_SIZE, and
+        there are enough of them to hold MAX_TILES tiles. Pages are only
+        allocated once tiles are stored in them.
+
         Attributes
         ----------
         tile_shape : np.ndarray
@@ -109,11 +154,21 @@ class TiledImageVisual(ImageVisual):
 
         Returns
         -------
-        TextureAtlas2D
+        TextureAtlasPool
             The newly created texture atlas.
         """
+        max_size = get_max_texture_sizes()[0] or MAX_PAGE_SIZE
+        page_size = min(max_size, MAX_PAGE_SIZE)
+        shape_in_tiles = tuple(
+            max(page_size // size, 1) for size in tile_shape[:2]
+        )
+        slots_per_page = shape_in_tiles[0] * shape_in_tiles[1]
+        num_pages = -(-MAX_TILES // slots_per_page)
+
         interp = 'linear' if self._interpolation == 'bilinear' else 'nearest'
-        return TextureAtlas2D(tile_shape, SHAPE_IN_TILES, interpolation=interp)
+        return TextureAtlasPool(
+            tile_shape, shape_in_tiles, num_pages, interpolation=interp
+        )
 
     def set_data(self, image) -> None:
         """Set data of the ImageVisual.
@@ -140,11 +195,12 @@ class TiledImageVisual(ImageVisual):
 
         # Clear all our previous tile information and set the new shape.
         self._tiles.clear()
+        self._page_draws = []
         self.tile_shape = tile_shape
 
         # Create the new atlas and tell the shader about it.
         self._texture_atlas = self._create_texture_atlas(tile_shape)
-        self._data_lookup_fn['texture'] = self._texture_atlas
+        self._data_lookup_fn['texture'] = self._texture_atlas.page(0)
 
     @property
     def size(self):
@@ -168,7 +224,7 @@ class TiledImageVisual(ImageVisual):
         int
             The number of tiles currently being drawn.
         """
-        return self._texture_atlas.num_slots_used
+        return len(self._tiles)
 
     @property
     def octree_chunks(self) -> List[OctreeChunk]:
@@ -179,13 +235,60 @@ class TiledImageVisual(ImageVisual):
         """
         return self._tiles.chunks
 
-    def add_chunks(self, chunks: List[OctreeChunk]) -> int:
+    def start_frame(self) -> None:
+        """Start a new frame, so the upload budget is available again.
+
+        Called on each draw of the canvas, see draw().
+        """
+        self._frame_uploads = 0
+        self._frame_nbytes = 0
+        self._frame_ms = 0.0
+
+    def _budget_spent(self, budget: Optional[UploadBudget]) -> bool:
+        """Return True if no more tiles can be uploaded this frame.
+
+        At least one tile is uploaded each frame, however big it is, so
+        that the tiles are always eventually added.
+
+        Parameters
+        ----------
+        budget : Optional[UploadBudget]
+            How much can be uploaded each frame, only one tile if None.
+
+        Returns
+        -------
+        bool
+            True if no more tiles can be uploaded this frame.
+        """
+        if self._frame_uploads == 0:
+            return False
+        if budget is None:
+            return True
+        return (
+            self._frame_nbytes >= budget.nbytes or self._frame_ms >= budget.ms
+        )
+
+    def add_chunks(
+        self,
+        chunks: List[OctreeChunk],
+        budget: Optional[UploadBudget] = None,
+    ) -> int:
         """Add one or more chunks that we are not already drawing.
 
+        The chunks are added in order, so the caller should list the most
+        important chunks first. Chunks still in the atlas are added without
+        an upload, so we add all of those. New chunks are uploaded until
+        the budget of this frame is spent, the others have to wait for the
+        next frames.
+
         Parameters
         ----------
         chunks : List[OctreeChunk]
             Chunks that we may or may not already be drawing.
+        budget : Optional[UploadBudget]
+            How much can be uploaded each frame. If None only one chunk is
+            uploaded each frame, because we were seeing adding taking 40ms
+            for one (256, 256) tile!
 
         Returns
         -------
@@ -193,31 +296,39 @@ class TiledImageVisual(ImageVisual):
             The number of chunks that still need to be added.
         """
         # Get only the new chunks, the ones we are not currently drawing.
-        new_chunks = [
+        new_chunks = deque(
             octree_chunk
             for octree_chunk in chunks
             if not self._tiles.contains_octree_chunk(octree_chunk)
-        ]
+        )
 
-        # Add one or more of the new chunks.
         while new_chunks:
-            self.add_one_chunk(new_chunks.pop(0))  # Add the first one.
-
-            # In the future we might add several chunks here. We want
-            # to add as many as we can without tanking the framerate
-            # too much. But for now we just add one, because we
-            # were seeing adding taking 40ms for one (256, 256) tile!
-            #
-            # But if that improves, we might want to multiple tiles here,
-            # up to some budget limit. Although not the cost of adding
-            # most happens later when glFlush() is called.
-            break
+            octree_chunk = new_chunks[0]
+            cached = self._texture_atlas.is_cached(octree_chunk)
+            if not cached and self._budget_spent(budget):
+                break
+            new_chunks.popleft()
+
+            # Not the cost of adding, most happens later when glFlush() is
+            # called. But this counts the conversion and copy of the data.
+            start = perf_counter()
+            if self.add_one_chunk(octree_chunk):
+                self._frame_uploads += 1
+                self._frame_nbytes += octree_chunk.data.nbytes
+                self._frame_ms += (perf_counter() - start) * 1000
+
+        add_counter_event(
+            "tile_uploads",
+            uploads=self._frame_uploads,
+            kilobytes=self._frame_nbytes / 1024,
+            pending=len(new_chunks),
+        )
 
         # Return how many chunks we did NOT add. The system should continue
         # to poll and draw until we return 0.
         return len(new_chunks)
 
-    def add_one_chunk(self, octree_chunk: OctreeChunk) -> None:
+    def add_one_chunk(self, octree_chunk: OctreeChunk) -> bool:
         """Add one chunk to the tiled image.
 
         Parameters
@@ -227,16 +338,18 @@ class TiledImageVisual(ImageVisual):
 
         Returns
         -------
-        int
-            The newly added chunk's index.
+        bool
+            True if the chunk's data was uploaded to the atlas.
         """
+        uploaded = not self._texture_atlas.is_cached(octree_chunk)
+
         # Add to the texture atlas.
         atlas_tile = self._texture_atlas.add_tile(octree_chunk)
 
         if atlas_tile is None:
-            # TODO_OCTREE: No slot was available in the atlas. That's bad,
-            # but not sure what we should do in this case.
-            return
+            # Every slot of every page holds a tile we are drawing. The
+            # chunk will be added once some tiles are no longer drawable.
+            return False
 
         # Add our mapping between chunks and atlas tiles.
         self._tiles.add(octree_chunk, atlas_tile)
@@ -244,6 +357,7 @@ class TiledImageVisual(ImageVisual):
         # Call self._build_vertex_data() the next time we are drawn, so
         # can update things to draw this new chunk.
         self._need_vertex_update = True
+        return uploaded
 
     @property
     def chunk_set(self) -> Set[OctreeChunk]:
@@ -257,28 +371,32 @@ class TiledImageVisual(ImageVisual):
         return self._tiles.chunk_set
 
     def prune_tiles(self, drawable_set: Set[OctreeChunk]) -> None:
-        """Remove tiles that are not part of the drawable set.
+        """Stop drawing tiles that are not part of the drawable set.
+
+        The tiles stay in the atlas until their slot is needed, in case
+        their chunk becomes drawable again.
 
         drawable_set : Set[OctreeChunk]
             The set of currently drawable chunks.
         """
         for tile_data in list(self._tiles.tile_data):
             if tile_data.octree_chunk not in drawable_set:
-                # print(f"REMOVE: {tile_data.octree_chunk}")
-                tile_index = tile_data.atlas_tile.index
-                self._remove_tile(tile_index)
+                self._release_tile(tile_data)
 
-    def _remove_tile(self, tile_index: int) -> None:
-        """Remove one tile from the tiled image.
+    def _release_tile(self, tile_data: TileData) -> None:
+        """Stop drawing one tile, keeping it in the atlas.
 
         Parameters
         ----------
-        tile_index : int
-            The tile to remove.
+        tile_data : TileData
+            The tile to stop drawing.
         """
+        tile_index = tile_data.atlas_tile.index
         try:
             self._tiles.remove(tile_index)
-            self._texture_atlas.remove_tile(tile_index)
+            self._texture_atlas.release_tile(
+                tile_data.octree_chunk, tile_data.atlas_tile
+            )
 
             # Must rebuild to remove this from what we are drawing.
             self._need_vertex_update = True
@@ -301,31 +419,82 @@ class TiledImageVisual(ImageVisual):
         As the card draws the tiles, the locations it samples from the
         texture will hop around in the atlas texture.
 
-        Today we only have one atlas texture, but in the future we might
-        have multiple atlas textures. If so, we'll want to sort the quads
-        to minimize the number of texture swaps. Sample from different
-        tiles in one atlas texture is fast, but switching texture is
-        slower.
+        The tiles can be on different pages of the atlas. The quads are
+        sorted by page within each level, so that the quads of one page
+        are next to each other. Each run of quads on the same page is drawn
+        with one draw call, see draw(). Sample from different tiles in one
+        atlas texture is fast, but switching texture is slower.
         """
         if len(self._tiles) == 0:
+            self._page_draws = []
             return  # Nothing to draw.
 
-        verts = np.zeros((0, 2), dtype=np.float32)
-        tex_coords = np.zeros((0, 2), dtype=np.float32)
-
-        for tile_data in self._tiles.tile_data_sorted:
-            atlas_tile = tile_data.atlas_tile
-            verts = np.vstack((verts, atlas_tile.verts))
-            tex_coords = np.vstack((tex_coords, atlas_tile.tex_coords))
-
         # Set the base ImageVisual's _subdiv_ buffers. ImageVisual has two
         # modes: imposter and subdivision. So far TiledImageVisual
         # implicitly is always in subdivision mode. Not sure if we'd ever
         # support imposter, or if that even makes sense with tiles?
-        self._subdiv_position.set_data(verts)
-        self._subdiv_texcoord.set_data(tex_coords)
+        #
+        # The buffers hold the quad of every slot, drawn or not, so they
+        # only change when a tile is added. Which quads are drawn, and in
+        # what order, is set by the index buffers.
+        if self._tiles.arrays_changed:
+            verts, tex_coords = self._tiles.vertex_arrays
+            self._subdiv_position.set_data(verts)
+            self._subdiv_texcoord.set_data(tex_coords)
+            self._tiles.arrays_changed = False
+
+        # The six vertices of the quad of each tile, back to front.
+        order = self._tiles.draw_order()
+        indices = (order[:, np.newaxis] * 6 + _QUAD_VERTS).ravel()
+
+        # Split the tiles into runs of tiles on the same page.
+        pages = self._tiles.pages[order]
+        starts = np.flatnonzero(np.diff(pages)) + 1
+        run_pages = pages[np.concatenate(([0], starts))]
+        self._set_page_draws(
+            list(zip(run_pages, np.split(indices, starts * 6)))
+        )
         self._need_vertex_update = False
 
+    def _set_page_draws(self, runs: List[Tuple[int, np.ndarray]]) -> None:
+        """Set the draw calls which draw the runs of tiles of each page.
+
+        Parameters
+        ----------
+        runs : List[Tuple[int, np.ndarray]]
+            The page and vertex indices of each run of tiles on the same
+            page.
+        """
+        # Reuse the index buffers of the previous draws.
+        while len(self._index_buffers) < len(runs):
+            self._index_buffers.append(IndexBuffer())
+
+        self._page_draws = []
+        for (page, indices), index_buffer in zip(runs, self._index_buffers):
+            index_buffer.set_data(indices.astype(np.uint32, copy=False))
+            self._page_draws.append((page, index_buffer))
+
+    def draw(self):
+        """Override of Visual.draw() to draw the tiles of each page.
+
+        Visual.draw() makes a single draw call with a single texture. We
+        make one draw call for each run of tiles on the same page, with
+        that page as the texture.
+
+        Each draw also starts a new frame, so the upload budget is available
+        again for the tiles added before the next draw.
+        """
+        self.start_frame()
+        if not self.visible:
+            return
+        self._configure_gl_state()
+        if self._prepare_draw(view=self) is False:
+            return
+
+        for page, index_buffer in self._page_draws:
+            self._data_lookup_fn['texture'] = self._texture_atlas.page(page)
+            self._program.draw(self._vshare.draw_mode, index_buffer)
+
     def _build_texture(self) -> None:
         """Override of ImageVisual._build_texture()."""
 
@@ -343,7 +512,7 @@ class TiledImageVisual(ImageVisual):
             self._build_interpolation()
 
             # But override to use our texture atlas.
-            self._data_lookup_fn['texture'] = self._texture_atlas
+            self._data_lookup_fn['texture'] = self._texture_atlas.page(0)
 
         # We call our own _build_texture
         if self._need_texture_upload:
@@ -4,17 +4,19 @@ A tiled image layer that uses TiledImageVisual and TextureAtlas2D.
 """
 import logging
 from dataclasses import dataclass
-from typing import List
+from typing import List, Optional
 
+import numpy as np
 from vispy.scene.visuals import create_visual_node
 
 from ...layers.image.experimental import OctreeChunk
 from ...layers.image.experimental.octree_image import OctreeImage
+from ...layers.image.experimental.octree_intersection import OctreeView
 from ...utils.events import EmitterGroup
 from ...utils.perf import block_timer
 from ..vispy_image_layer import VispyImageLayer
 from .tile_grid import TileGrid
-from .tiled_image_visual import TiledImageVisual
+from .tiled_image_visual import TiledImageVisual, UploadBudget
 
 # Create the scene graph Node version of this visual. Visuals are a mix of
 # the visual itself and a scene graph node. The scene graph node is what
@@ -24,6 +26,44 @@ TiledImageNode = create_visual_node(TiledImageVisual)
 LOGGER = logging.getLogger("napari.octree.visual")
 
 
+def _sort_by_priority(
+    chunks: List[OctreeChunk], view: Optional[OctreeView]
+) -> List[OctreeChunk]:
+    """Sort chunks by the order in which we should add them.
+
+    Chunks from higher octree levels are first, and within a level the
+    chunks nearest to the center of the view are first.
+
+    Parameters
+    ----------
+    chunks : List[OctreeChunk]
+        The chunks to sort.
+    view : Optional[OctreeView]
+        The current view, if any.
+
+    Returns
+    -------
+    List[OctreeChunk]
+        The sorted chunks.
+    """
+    if not chunks:
+        return chunks
+
+    levels = np.array([chunk.location.level_index for chunk in chunks])
+    if view is None:
+        distances = np.zeros(len(chunks))
+    else:
+        # Corners are (row, col) but the geometry is (x, y).
+        center = np.mean(view.corners, axis=0)[::-1]
+        centers = np.array(
+            [chunk.geom.pos + chunk.geom.size / 2 for chunk in chunks]
+        )
+        distances = np.linalg.norm(centers - center, axis=1)
+
+    order = np.lexsort((distances, -levels))
+    return [chunks[index] for index in order]
+
+
 @dataclass
 class ChunkStats:
     """Statistics about chunks during the update process."""
@@ -281,7 +321,16 @@ class VispyTiledImageLayer(VispyImageLayer):
         # drawable chunks every frame. We don't want to queue up and add
         # chunks which might no longer be needed. The camera might move
         # every frame.
-        return self.node.add_chunks(drawable_chunks)
+        #
+        # Coarse chunks cover the most area, and the user looks at the
+        # center of the view, so we add those first.
+        display = self.layer.display
+        budget = UploadBudget(
+            display.upload_budget_kb * 1024, display.upload_budget_ms
+        )
+        return self.node.add_chunks(
+            _sort_by_priority(drawable_chunks, self.layer._view), budget
+        )
 
     def _on_loaded(self, _event) -> None:
         """The layer loaded new data, so update our view."""
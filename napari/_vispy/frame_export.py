@@ -0,0 +1,244 @@
+"""Render the frames of an axis offscreen and write them to a movie.
+
+Scripts can export a movie without a display, for example:
+
+    viewer = ViewerModel()
+    viewer.add_image(data)
+    export_frames(viewer, 'movie.gif', axis=0, fps=10)
+
+Three things happen at once during the export. While frame N is rendered
+in the calling thread, the slices of the next frames are loaded in the
+background by the LayerSlicer, and frame N - 1 is written by a writer
+thread.
+"""
+import os
+import threading
+from contextlib import nullcontext
+from pathlib import Path
+from queue import Queue
+from typing import Callable, Iterator, Optional, Sequence, Tuple
+
+import numpy as np
+
+from ..components.experimental.chunk import synchronous_loading
+from ..utils import config
+from ..utils.perf import record_timer
+
+# File extensions written as a movie, any other path is a directory of images
+MOVIE_EXTENSIONS = ('.gif', '.mp4', '.mov', '.avi', '.mkv', '.webm')
+
+# Number of frames loaded ahead of the one being rendered
+N_PREFETCH = 2
+
+# Number of rendered frames that can wait to be written
+MAX_PENDING = 4
+
+
+def iter_frames(
+    viewer,
+    render: Callable[[], np.ndarray],
+    axis: int = 0,
+    steps: Optional[Sequence[int]] = None,
+) -> Iterator[np.ndarray]:
+    """Step the dims along an axis and render each frame.
+
+    The slices of the next frames are loaded in the background while the
+    current frame is rendered. The dims are moved back to where they were
+    once the iteration ends.
+
+    Parameters
+    ----------
+    viewer : napari.components.ViewerModel
+        The viewer to step.
+    render : callable
+        Called without arguments to render the current view of the viewer,
+        such as VispyOffscreenCanvas.render.
+    axis : int
+        Axis of the dims to step along.
+    steps : sequence of int, optional
+        Steps of the axis to render, in order. If not provided every step
+        of the axis is rendered.
+
+    Yields
+    ------
+    frame : np.ndarray
+        The frame rendered at each step.
+    """
+    if steps is None:
+        steps = range(viewer.dims.nsteps[axis])
+    steps = list(steps)
+    current_step = viewer.dims.current_step[axis]
+
+    # Rendering must see the loaded data, not a placeholder of an async load
+    if config.async_loading:
+        loading = synchronous_loading(True)
+    else:
+        loading = nullcontext()
+
+    with loading:
+        try:
+            for index, step in enumerate(steps):
+                viewer.dims.set_current_step(axis, step)
+                next_steps = steps[index + 1 : index + 1 + N_PREFETCH]
+                viewer._prefetch_steps(axis, next_steps)
+                yield render()
+        finally:
+            viewer._prefetch_steps(axis, [])
+            viewer.dims.set_current_step(axis, current_step)
+
+
+def write_frames(
+    frames: Iterator[np.ndarray], path: str, fps: float = 10
+) -> int:
+    """Write frames to a movie or to a directory of images.
+
+    The frames are written in a background thread, so that the next frame
+    can be produced while the previous one is encoded.
+
+    Parameters
+    ----------
+    frames : iterator of np.ndarray
+        The frames to write.
+    path : str
+        Path of the movie if its extension is one of MOVIE_EXTENSIONS, such
+        as 'movie.mp4', otherwise the directory where each frame is saved
+        as 'frame_00000.png', 'frame_00001.png'...
+    fps : float
+        Frames per second of the movie.
+
+    Returns
+    -------
+    int
+        The number of frames written.
+    """
+    path = str(path)
+    if Path(path).suffix.lower() in MOVIE_EXTENSIONS:
+        import imageio
+
+        writer = imageio.get_writer(path, fps=fps)
+        write_frame, close = writer.append_data, writer.close
+    else:
+        write_frame, close = _ImageSequence(path).write, None
+
+    background = _BackgroundWriter(write_frame)
+    n_frames = 0
+    try:
+        for frame in frames:
+            background.put(frame)
+            n_frames += 1
+    finally:
+        try:
+            background.close()
+        finally:
+            if close is not None:
+                close()
+    return n_frames
+
+
+def export_frames(
+    viewer,
+    path: str,
+    axis: int = 0,
+    steps: Optional[Sequence[int]] = None,
+    fps: float = 10,
+    size: Optional[Tuple[int, int]] = None,
+) -> int:
+    """Render the steps of an axis offscreen and write them as a movie.
+
+    No window is shown, so this can be used from scripts. The view is
+    rendered with the current camera of the viewer.
+
+    Parameters
+    ----------
+    viewer : napari.components.ViewerModel
+        The viewer to render.
+    path : str
+        Path of the movie if its extension is one of MOVIE_EXTENSIONS, such
+        as 'movie.mp4', otherwise the directory where each frame is saved
+        as 'frame_00000.png', 'frame_00001.png'...
+    axis : int
+        Axis of the dims to step along.
+    steps : sequence of int, optional
+        Steps of the axis to render, in order. If not provided every step
+        of the axis is rendered.
+    fps : float
+        Frames per second of the movie.
+    size : tuple of int, optional
+        Size of the frames as (height, width). If not provided, the canvas
+        size of the viewer is used.
+
+    Returns
+    -------
+    int
+        The number of frames written.
+    """
+    from .vispy_offscreen_canvas import VispyOffscreenCanvas
+
+    canvas = VispyOffscreenCanvas(viewer, size=size)
+    try:
+        frames = iter_frames(viewer, canvas.render, axis=axis, steps=steps)
+        return write_frames(frames, path, fps=fps)
+    finally:
+        canvas.close()
+
+
+class _ImageSequence:
+    """Write each frame as a numbered image in a directory."""
+
+    def __init__(self, directory: str):
+        os.makedirs(directory, exist_ok=True)
+        self.directory = directory
+        self.count = 0
+
+    def write(self, frame: np.ndarray):
+        from ..utils.io import imsave
+
+        filename = os.path.join(self.directory, f'frame_{self.count:05d}.png')
+        imsave(filename, frame)
+        self.count += 1
+
+
+class _BackgroundWriter:
+    """Write frames in a thread, with a bounded number of pending frames.
+
+    Parameters
+    ----------
+    write : callable
+        Called with each frame in the writer thread.
+    max_pending : int
+        Number of frames that can wait to be written before put() blocks.
+    """
+
+    def __init__(self, write: Callable, max_pending: int = MAX_PENDING):
+        self._write = write
+        self._queue = Queue(maxsize=max_pending)
+        self._error = None
+        self._thread = threading.Thread(
+            target=self._run, name="napari-frame-writer", daemon=True
+        )
+        self._thread.start()
+
+    def put(self, frame: np.ndarray):
+        """Queue a frame to be written, raising any error of the writer."""
+        if self._error is not None:
+            raise self._error
+        self._queue.put(frame)
+
+    def _run(self):
+        while True:
+            frame = self._queue.get()
+            if frame is None:
+                return
+            if self._error is None:
+                try:
+                    with record_timer("write_frames.write"):
+                        self._write(frame)
+                except Exception as error:
+                    self._error = error
+
+    def close(self):
+        """Wait for the pending frames to be written."""
+        self._queue.put(None)
+        self._thread.join()
+        if self._error is not None:
+            raise self._error
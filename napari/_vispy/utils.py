@@ -1,3 +1,5 @@
+import numpy as np
+
 from ..layers import Image, Layer, Points, Shapes, Surface, Tracks, Vectors
 from ..utils.config import async_octree
 from .vispy_base_layer import VispyBaseLayer
@@ -48,3 +50,43 @@ def create_vispy_visual(layer: Layer) -> VispyBaseLayer:
     raise TypeError(
         f'Could not find VispyLayer for layer of type {type(layer)}'
     )
+
+
+def view_bounds_in_world(view, dims) -> np.ndarray:
+    """Bounds of the part of the world in view of a 3D camera.
+
+    The corners of the canvas are mapped into the scene at the near and far
+    planes of the camera, so the bounds are those of the camera frustum.
+    Along axes the camera looks along, they extend far beyond any data.
+
+    Parameters
+    ----------
+    view : vispy.scene.widgets.viewbox.ViewBox
+        Viewbox of the scene.
+    dims : napari.components.Dims
+        Dims of the viewer.
+
+    Returns
+    -------
+    bounds : array, shape (2, D)
+        Minimum and maximum world coordinates in view. The coordinates of
+        the dimensions not displayed are those of the current dims point.
+    """
+    transform = view.canvas.scene.node_transform(view.scene)
+    width, height = view.canvas.size
+    corners = np.array(
+        [
+            transform.map([x, y, z, 1])
+            for x in (0, width)
+            for y in (0, height)
+            for z in (-1, 1)
+        ]
+    )
+    corners = corners[:, :3] / corners[:, 3:]
+    displayed = np.array([corners.min(axis=0), corners.max(axis=0)])
+    bounds = np.tile(np.asarray(dims.point, dtype=float), (2, 1))
+    # Switch from VisPy ordering to NumPy ordering, there can be fewer
+    # displayed dimensions than ndisplay when the layers have fewer
+    n_displayed = len(dims.displayed)
+    bounds[:, list(dims.displayed)] = displayed[:, :n_displayed][:, ::-1]
+    return bounds
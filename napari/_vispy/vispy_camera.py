@@ -1,6 +1,7 @@
 import numpy as np
 from vispy.scene import ArcballCamera, PanZoomCamera
 
+from ..utils.events import disconnect_events
 from .quaternion import quaternion2euler
 
 
@@ -42,6 +43,11 @@ class VispyCamera:
 
         self._on_ndisplay_change(None)
 
+    def close(self):
+        """Disconnect from the napari camera and dims models."""
+        disconnect_events(self._camera.events, self)
+        disconnect_events(self._dims.events, self)
+
     @property
     def angles(self):
         """3-tuple: Euler angles of camera in 3D viewing, in degrees."""
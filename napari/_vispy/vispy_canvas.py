@@ -2,6 +2,7 @@
 """
 from vispy.scene import SceneCanvas
 
+from ..utils.perf import record_timer
 from .utils_gl import get_max_texture_sizes
 
 
@@ -32,6 +33,11 @@ class VispyCanvas(SceneCanvas):
         # using an lru_cache.
         self.max_texture_sizes = get_max_texture_sizes()
 
+    def on_draw(self, event):
+        """Draw the scene, recording how long it took."""
+        with record_timer("VispyCanvas.on_draw"):
+            super().on_draw(event)
+
     def _process_mouse_event(self, event):
         """Ignore mouse wheel events which have modifiers."""
         if event.type == 'mouse_wheel' and len(event.modifiers) > 0:
@@ -47,6 +47,9 @@ class VispyImageLayer(VispyBaseLayer):
 
         self._array_like = True
 
+        # Multiscale images pick a level whose volume fits in a 3D texture
+        self.layer._max_volume_shape = self.MAX_TEXTURE_SIZE_3D
+
         self.layer.events.rendering.connect(self._on_rendering_change)
         self.layer.events.interpolation.connect(self._on_interpolation_change)
         self.layer.events.colormap.connect(self._on_colormap_change)
@@ -0,0 +1,111 @@
+"""VispyOffscreenCanvas class.
+"""
+from typing import Optional, Tuple
+
+import numpy as np
+
+from ..utils.perf import record_timer
+from ..utils.theme import get_theme
+from .utils import create_vispy_visual, view_bounds_in_world
+from .vispy_camera import VispyCamera
+from .vispy_canvas import VispyCanvas
+
+
+class VispyOffscreenCanvas:
+    """Render the layers of a viewer without showing a window.
+
+    The canvas is never shown, each frame is drawn into a framebuffer by
+    render(). It draws the layers of the viewer at the time it is created,
+    with the same dims and camera as the viewer.
+
+    The canvas is hidden, not headless. It uses the default vispy backend,
+    Qt, so it needs a QApplication and an OpenGL context from a display, or
+    from an offscreen Qt platform such as ``QT_QPA_PLATFORM=offscreen``
+    where that provides OpenGL.
+
+    Parameters
+    ----------
+    viewer : napari.components.ViewerModel
+        The viewer to render.
+    size : tuple of int, optional
+        Size of the rendered frames as (height, width). If not provided, the
+        canvas size of the viewer is used.
+
+    Attributes
+    ----------
+    canvas : VispyCanvas
+        The hidden canvas.
+    view : vispy.scene.widgets.viewbox.ViewBox
+        Viewbox of the layers.
+    layer_to_visual : dict
+        Vispy layer of each layer of the viewer.
+    """
+
+    def __init__(self, viewer, size: Optional[Tuple[int, int]] = None):
+        self.viewer = viewer
+        if size is None:
+            size = viewer._canvas_size
+
+        self.canvas = VispyCanvas(
+            keys=None, size=tuple(size)[::-1], show=False
+        )
+        self.canvas.bgcolor = get_theme(viewer.theme)['canvas']
+        self.canvas.context.set_depth_func('lequal')
+
+        self.view = self.canvas.central_widget.add_view()
+        self.camera = VispyCamera(self.view, viewer.camera, viewer.dims)
+
+        self.layer_to_visual = {}
+        for order, layer in enumerate(viewer.layers):
+            vispy_layer = create_vispy_visual(layer)
+            vispy_layer.node.parent = self.view.scene
+            vispy_layer.order = order
+            self.layer_to_visual[layer] = vispy_layer
+
+    def render(self) -> np.ndarray:
+        """Render the current view of the viewer.
+
+        Returns
+        -------
+        image : array
+            Numpy array of type ubyte and shape (h, w, 4). Index [0, 0] is the
+            upper-left corner of the rendered region.
+        """
+        self._update_draw()
+        with record_timer("VispyOffscreenCanvas.render"):
+            return self.canvas.render()
+
+    def _update_draw(self):
+        """Update the layers for the view, as QtViewer.on_draw does."""
+        corners = self._canvas_corners_in_world()
+        for layer in self.viewer.layers:
+            if layer in self.layer_to_visual:
+                if layer.ndim <= self.viewer.dims.ndim:
+                    layer._update_draw(
+                        scale_factor=1 / self.viewer.camera.zoom,
+                        corner_pixels=corners[:, -layer.ndim :],
+                        shape_threshold=self.canvas.size,
+                    )
+
+    def _canvas_corners_in_world(self) -> np.ndarray:
+        """Location of the corners of canvas in world coordinates."""
+        nd = self.viewer.dims.ndisplay
+        if nd == 3:
+            return view_bounds_in_world(self.view, self.viewer.dims)
+        transform = self.view.camera.transform.inverse
+        corners = []
+        for position in ([0, 0], self.canvas.size):
+            mapped_position = transform.map(list(position))[:nd]
+            position_world = list(self.viewer.dims.point)
+            for i, d in enumerate(self.viewer.dims.displayed):
+                position_world[d] = mapped_position[::-1][i]
+            corners.append(position_world)
+        return np.array(corners)
+
+    def close(self):
+        """Close the vispy layers, the camera and the canvas."""
+        for vispy_layer in self.layer_to_visual.values():
+            vispy_layer.close()
+        self.layer_to_visual = {}
+        self.camera.close()
+        self.canvas.close()
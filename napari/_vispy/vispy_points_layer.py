@@ -13,11 +13,14 @@ class VispyPointsLayer(VispyBaseLayer):
     _highlight_width = 2
 
     def __init__(self, layer):
-        # Create a compound visual with the following four subvisuals:
-        # Lines: The lines of the interaction box used for highlights.
-        # Markers: The the outlines for each point used for highlights.
+        # Create a compound visual with the following five subvisuals:
         # Markers: The actual markers of each point.
-        node = Compound([Markers(), Markers(), Line(), Text()])
+        # Markers: The the outlines for each selected point used for
+        # highlights.
+        # Lines: The lines of the interaction box used for highlights.
+        # Markers: The outline of the hovered point used for highlights.
+        # Text: The text of each point.
+        node = Compound([Markers(), Markers(), Line(), Markers(), Text()])
 
         super().__init__(layer, node)
 
@@ -69,17 +72,35 @@ class VispyPointsLayer(VispyBaseLayer):
         self._on_matrix_change()
 
     def _on_highlight_change(self, event=None):
-        if len(self.layer._highlight_index) > 0:
+        # Only the hovered point changes as the mouse moves, the selected
+        # points are only sent again when the selection changes
+        if getattr(event, 'selection_changed', True):
+            self._set_highlight_markers(self.layer._highlight_index, 1)
+            self._on_highlight_box_change()
+        self._set_highlight_markers(self.layer._hover_index, 3)
+        self.node.update()
+
+    def _set_highlight_markers(self, index, subvisual):
+        """Outline some points in view with a markers subvisual.
+
+        Parameters
+        ----------
+        index : sequence of int
+            Indices within the points in view of the points to outline.
+        subvisual : int
+            Index of the markers subvisual.
+        """
+        if len(index) > 0:
             # Color the hovered or selected points
-            data = self.layer._view_data[self.layer._highlight_index]
+            data = self.layer._view_data[index]
             if data.ndim == 1:
                 data = np.expand_dims(data, axis=0)
-            size = self.layer._view_size[self.layer._highlight_index]
+            size = self.layer._view_size[index]
         else:
             data = np.zeros((1, self.layer._ndisplay))
             size = 0
 
-        self.node._subvisuals[1].set_data(
+        self.node._subvisuals[subvisual].set_data(
             data[:, ::-1],
             size=size,
             edge_width=self._highlight_width,
@@ -89,6 +110,7 @@ class VispyPointsLayer(VispyBaseLayer):
             scaling=True,
         )
 
+    def _on_highlight_box_change(self):
         # only draw a box in 2D
         if self.layer._ndisplay == 2:
             if (
@@ -112,8 +134,6 @@ class VispyPointsLayer(VispyBaseLayer):
                 width=0,
             )
 
-        self.node.update()
-
     def _on_text_change(self, update_node=True):
         """Function to update the text node properties
 
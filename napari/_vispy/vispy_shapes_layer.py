@@ -8,13 +8,17 @@ from .vispy_base_layer import VispyBaseLayer
 
 class VispyShapesLayer(VispyBaseLayer):
     def __init__(self, layer):
-        # Create a compound visual with the following four subvisuals:
+        # Create a compound visual with the following six subvisuals:
+        # Mesh: The actual meshes of the shape faces and edges
+        # Mesh: The mesh of the outlines for each selected shape used for
+        # highlights.
+        # Lines: The lines of the interaction box used for highlights.
         # Markers: corresponding to the vertices of the interaction box or the
         # shapes that are used for highlights.
-        # Lines: The lines of the interaction box used for highlights.
-        # Mesh: The mesh of the outlines for each shape used for highlights.
-        # Mesh: The actual meshes of the shape faces and edges
-        node = Compound([Mesh(), Mesh(), Line(), Markers(), Text()])
+        # Mesh: The mesh of the outline of the hovered shape used for
+        # highlights.
+        # Text: The text of each shape.
+        node = Compound([Mesh(), Mesh(), Line(), Markers(), Mesh(), Text()])
 
         super().__init__(layer, node)
 
@@ -58,16 +62,12 @@ class VispyShapesLayer(VispyBaseLayer):
         self.node.update()
 
     def _on_highlight_change(self, event=None):
-        # Compute the vertices and faces of any shape outlines
-        vertices, faces = self.layer._outline_shapes()
-
-        if vertices is None or len(vertices) == 0 or len(faces) == 0:
-            vertices = np.zeros((3, self.layer._ndisplay))
-            faces = np.array([[0, 1, 2]])
-
-        self.node._subvisuals[1].set_data(
-            vertices=vertices, faces=faces, color=self.layer._highlight_color
-        )
+        # Only the outline of the hovered shape changes as the mouse moves,
+        # the outlines of the selected shapes are only computed again when
+        # the selection changes
+        if getattr(event, 'selection_changed', True):
+            self._set_outline(self.layer._outline_shapes(), 1)
+        self._set_outline(self.layer._outline_hovered_shape(), 4)
 
         # Compute the location and properties of the vertices and box that
         # need to get rendered
@@ -103,6 +103,26 @@ class VispyShapesLayer(VispyBaseLayer):
             pos=pos, color=edge_color, width=width
         )
 
+    def _set_outline(self, outline, subvisual):
+        """Set the mesh of shape outlines of a mesh subvisual.
+
+        Parameters
+        ----------
+        outline : tuple of np.ndarray or None
+            Vertices and triangles of the outlines, or None if there is no
+            outline.
+        subvisual : int
+            Index of the mesh subvisual.
+        """
+        vertices, faces = outline
+        if vertices is None or len(vertices) == 0 or len(faces) == 0:
+            vertices = np.zeros((3, self.layer._ndisplay))
+            faces = np.array([[0, 1, 2]])
+
+        self.node._subvisuals[subvisual].set_data(
+            vertices=vertices, faces=faces, color=self.layer._highlight_color
+        )
+
     def _on_text_change(self, update_node=True):
         """Function to update the text node properties
 
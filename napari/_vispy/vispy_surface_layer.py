@@ -28,7 +28,13 @@ class VispySurfaceLayer(VispyBaseLayer):
         self._on_data_change()
 
     def _on_data_change(self, event=None):
-        if len(self.layer._data_view) == 0 or len(self.layer._view_faces) == 0:
+        if (
+            len(self.layer._data_view) == 0
+            or len(self.layer._view_faces) == 0
+            or len(self.layer._view_vertex_values)
+            != len(self.layer._data_view)
+        ):
+            # Nothing to show, or the vertex values are still being loaded
             vertices = None
             faces = None
             vertex_values = np.array([0])
@@ -0,0 +1,40 @@
+# See "Writing benchmarks" in the asv docs for more information.
+# https://asv.readthedocs.io/en/latest/writing_benchmarks.html
+# or the napari documentation on benchmarking
+# https://github.com/napari/napari/blob/master/docs/BENCHMARKS.md
+from napari.utils.events import EmitterGroup, EventEmitter
+
+
+class _Listener:
+    def on_event(self, event):
+        pass
+
+
+class EmitSuite:
+    """Benchmarks for emitting events to a number of listeners."""
+
+    params = [0, 1, 10]
+    param_names = ['n_listeners']
+
+    def setup(self, n):
+        self.listeners = [_Listener() for _ in range(n)]
+        self.emitter = EventEmitter(type='test')
+        for listener in self.listeners:
+            self.emitter.connect(listener.on_event)
+
+        self.group = EmitterGroup(source=_Listener(), test=None)
+        for listener in self.listeners:
+            self.group.test.connect(listener.on_event)
+
+    def time_emit(self, n):
+        """Time to emit an event."""
+        self.emitter(value=1)
+
+    def time_emit_auto_connected(self, n):
+        """Time to emit an event of an auto connected emitter group."""
+        self.group.test(value=1)
+
+    def time_emit_1000(self, n):
+        """Time to emit 1000 events."""
+        for _ in range(1000):
+            self.emitter(value=1)
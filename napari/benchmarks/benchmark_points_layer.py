@@ -101,3 +101,64 @@ class PointsSlicingSuite:
     def time_slice_points(self, flatten_slice_axis):
         """Time to take one slice of points"""
         self.layer._slice_data(self.slice)
+
+
+class PointsLargeViewSuite:
+    """Benchmarks for refreshing a Points layer with many points in view."""
+
+    params = [2 ** i for i in range(16, 22, 2)]
+
+    def setup(self, n):
+        np.random.seed(0)
+        self.data = np.random.random((n, 3))
+        self.data[:, 0] = 0
+        self.layer = Points(self.data, face_color='red')
+
+    def time_refresh(self, n):
+        """Time to refresh view."""
+        self.layer.refresh()
+
+    def time_view_arrays(self, n):
+        """Time to get the arrays of the points in view after a refresh."""
+        self.layer.refresh()
+        for _ in range(5):
+            self.layer._view_data
+            self.layer._view_size
+            self.layer._view_face_color
+            self.layer._view_edge_color
+
+    def time_set_face_color(self, n):
+        """Time to set the face color and get the colors in view."""
+        self.layer.current_face_color = 'blue'
+        self.layer.face_color = 'blue'
+        self.layer._view_face_color
+
+
+class PointsTextSuite:
+    """Benchmarks for the text of a Points layer with 3D data."""
+
+    params = [2 ** i for i in range(4, 18, 2)]
+
+    def setup(self, n):
+        np.random.seed(0)
+        self.data = np.random.random((n, 3))
+        self.data[:, 0] = np.round(10 * self.data[:, 0])
+        self.properties = {'confidence': np.random.random(n)}
+        self.layer = Points(
+            self.data,
+            properties=self.properties,
+            text='confidence: {confidence:.2f}',
+        )
+
+    def time_create_layer(self, n):
+        """Time to create layer with text."""
+        Points(
+            self.data,
+            properties=self.properties,
+            text='confidence: {confidence:.2f}',
+        )
+
+    def time_refresh_text(self, n):
+        """Time to set new properties and get the text in view."""
+        self.layer.properties = self.properties
+        self.layer._view_text
@@ -158,3 +158,48 @@ class ShapesInteractionSuite:
         mouse_release_callbacks(self.layer, self.release_event)
 
     time_select_shape.param_names = ['n_shapes']
+
+
+class ShapesRasterizeSuite:
+    """Benchmarks for rasterizing the Shapes layer with 2D data"""
+
+    params = [2 ** i for i in range(4, 12, 2)]
+
+    def setup(self, n):
+        np.random.seed(0)
+        centers = 1000 * np.random.random((n, 1, 2))
+        self.data = list(centers + 20 * np.random.random((n, 6, 2)))
+        self.layer = Shapes(self.data, shape_type='polygon')
+        self.layer.add(
+            [centers[0, 0] + 20 * np.random.random((6, 2))],
+            shape_type='path',
+        )
+
+    def time_to_masks(self, n):
+        """Time to rasterize one mask per shape."""
+        self.layer.to_masks((256, 256))
+
+    def time_to_labels(self, n):
+        """Time to rasterize all shapes to a labels image."""
+        self.layer.to_labels((1024, 1024))
+
+    def time_to_colors(self, n):
+        """Time to rasterize all shapes to an RGBA image."""
+        self.layer._data_view.to_colors((1024, 1024))
+
+
+class ShapesRemoveSuite:
+    """Benchmarks for removing shapes from the Shapes layer"""
+
+    params = [2 ** i for i in range(8, 14, 2)]
+    number = 1
+
+    def setup(self, n):
+        np.random.seed(0)
+        self.data = 50 * np.random.random((n, 4, 2))
+        self.layer = Shapes(self.data, shape_type='rectangle')
+        self.layer.selected_data = set(range(0, n, 10))
+
+    def time_remove_selected(self, n):
+        """Time to remove a tenth of the shapes."""
+        self.layer.remove_selected()
@@ -91,3 +91,37 @@ class Surface3DSuite:
     def mem_data(self, n):
         """Memory used by raw data."""
         return self.data
+
+
+class Surface4DSuite:
+    """Benchmarks for the Surface layer with 4D data."""
+
+    params = [2 ** i for i in range(4, 18, 2)]
+
+    def setup(self, n):
+        np.random.seed(0)
+        vertices = np.random.random((n, 4))
+        vertices[:, :2] = np.random.randint(16, size=(n, 2))
+        self.data = (
+            vertices,
+            np.random.randint(n, size=(n, 3)),
+            np.random.random(n),
+        )
+        self.layer = Surface(self.data)
+
+    def time_create_layer(self, n):
+        """Time to create a layer."""
+        Surface(self.data)
+
+    def time_set_view_slice(self, n):
+        """Time to set view slice."""
+        self.layer._set_view_slice()
+
+    def time_slice_dims(self, n):
+        """Time to slice the layer at a new step."""
+        self.layer._slice_dims(point=(1, 1, 0, 0))
+        self.layer._slice_dims(point=(0, 0, 0, 0))
+
+    def mem_layer(self, n):
+        """Memory used by layer."""
+        return self.layer
@@ -0,0 +1,236 @@
+"""LayerSlicer class.
+
+Slices the layers of a viewer when the dims change.
+"""
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Dict, List, Optional, Sequence
+
+from ..utils.perf import record_timer
+
+
+class LayerSlicer:
+    """Slices layers, loading the data of their slices concurrently.
+
+    If layers backed by Dask or zarr arrays are sliced in the GUI thread one
+    after the other, the latency of a dims change is the sum of their
+    loads. Instead slicing happens in three steps:
+
+    1. The slice dims of each layer are updated, in the GUI thread, and
+       the layers that have slow data return a function loading their
+       slice, see Layer._slice_loader.
+    2. These functions are called in a worker pool. This step does not use
+       the layers, so it cannot see them change.
+    3. Each layer is refreshed in the GUI thread with the data loaded in
+       step 2, so that the layers and their visuals are all updated
+       together once every load finished.
+
+    The latency is then about the one of the slowest layer.
+
+    The slices the dims are expected to move to next, for example during
+    playback, can also be loaded ahead with prefetch(). Step 2 then uses
+    the prefetched data instead of loading it again. The prefetched slices
+    of a layer must be dropped with drop() when its data changes or when it
+    is removed.
+
+    Parameters
+    ----------
+    max_workers : int, optional
+        Maximum number of worker threads. If not provided the default of
+        ThreadPoolExecutor is used.
+    """
+
+    def __init__(self, max_workers: Optional[int] = None):
+        self._max_workers = max_workers
+        self._executor = None
+        self._prefetch_executor = None
+        # Prefetched slice data, keyed by layer, data and dims
+        self._prefetched: Dict[tuple, Future] = {}
+
+    @property
+    def executor(self) -> ThreadPoolExecutor:
+        """ThreadPoolExecutor: The worker pool, created on first use."""
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self._max_workers,
+                thread_name_prefix="napari-slicer",
+            )
+        return self._executor
+
+    def slice_layers(self, layers: List, point, ndisplay: int, order) -> None:
+        """Slice the layers at the given dims.
+
+        Parameters
+        ----------
+        layers : list of napari.layers.Layer
+            The layers to slice.
+        point : list
+            Values of data to slice at in world coordinates.
+        ndisplay : int
+            Number of dimensions to be displayed.
+        order : list of int
+            Order of dimensions, where last `ndisplay` will be
+            rendered in canvas.
+        """
+        layers = [
+            layer
+            for layer in layers
+            if layer._update_slice_dims(point, ndisplay, order)
+        ]
+
+        keys = [_slice_key(layer, point, ndisplay, order) for layer in layers]
+        prefetched = [self._prefetched.pop(key, None) for key in keys]
+        loaders = [
+            layer._slice_loader()
+            if future is None or future.cancelled()
+            else None
+            for layer, future in zip(layers, prefetched)
+        ]
+
+        with record_timer("LayerSlicer.load"):
+            slice_data = self._load(loaders, prefetched)
+
+        # The layers whose load failed are not refreshed, the first error is
+        # raised once the other layers are.
+        errors = []
+        for layer, (data, error) in zip(layers, slice_data):
+            if error is not None:
+                errors.append(error)
+                continue
+            layer._loaded_slice_data = data
+            layer._refresh_slice_dims()
+        if errors:
+            raise errors[0]
+
+    def prefetch(
+        self, layers: List, points: Sequence, ndisplay: int, order
+    ) -> None:
+        """Load the slices at the given dims ahead, in the background.
+
+        The slices that were prefetched before and are not requested again
+        are dropped.
+
+        Parameters
+        ----------
+        layers : list of napari.layers.Layer
+            The layers to prefetch.
+        points : list of list
+            Values of data to slice at in world coordinates, for each slice
+            to prefetch, in the order they are expected to be needed.
+        ndisplay : int
+            Number of dimensions to be displayed.
+        order : list of int
+            Order of dimensions, where last `ndisplay` will be
+            rendered in canvas.
+        """
+        prefetched = {}
+        for point in points:
+            for layer in layers:
+                if len(point) < layer.ndim or layer._ndisplay != ndisplay:
+                    continue
+                key = _slice_key(layer, point, ndisplay, order)
+                future = self._prefetched.pop(key, None)
+                if future is None:
+                    dims_point = list(point)[len(point) - layer.ndim :]
+                    loader = layer._slice_loader(dims_point)
+                    if loader is None:
+                        continue
+                    future = self.prefetch_executor.submit(loader)
+                prefetched[key] = future
+
+        for future in self._prefetched.values():
+            future.cancel()
+        self._prefetched = prefetched
+
+    def drop(self, layer) -> None:
+        """Cancel and drop the prefetched slices of a layer.
+
+        Call this when the data of the layer changes, so that slices of the
+        previous data are not shown, and when the layer is removed, so that
+        pending loads do not keep it alive.
+
+        Parameters
+        ----------
+        layer : napari.layers.Layer
+            The layer whose slices are dropped.
+        """
+        for key in [k for k in self._prefetched if k[0] == id(layer)]:
+            self._prefetched.pop(key).cancel()
+
+    @property
+    def prefetch_executor(self) -> ThreadPoolExecutor:
+        """ThreadPoolExecutor: The prefetch pool, created on first use.
+
+        Prefetching has its own pool, so that it never delays slicing.
+        """
+        if self._prefetch_executor is None:
+            self._prefetch_executor = ThreadPoolExecutor(
+                max_workers=2, thread_name_prefix="napari-prefetch"
+            )
+        return self._prefetch_executor
+
+    def _load(self, loaders: List, prefetched: List[Future]) -> list:
+        """Load the slice data of the layers, concurrently if there are many.
+
+        Parameters
+        ----------
+        loaders : list of callable
+            The function loading the slice data of each layer, or None.
+        prefetched : list of Future
+            The prefetch of the slice data of each layer, or None.
+
+        Returns
+        -------
+        list of tuple
+            The loaded data of each layer and the exception raised while
+            loading it. The data is None for layers that slice their data in
+            set_view_slice or whose load failed, the exception is None if
+            the load did not fail.
+        """
+        to_load = [loader for loader in loaders if loader is not None]
+        if len(to_load) < 2:
+            loaded = [_load(loader) for loader in to_load]
+        else:
+            loaded = list(self.executor.map(_load, to_load))
+
+        loaded = iter(loaded)
+        slice_data = []
+        for loader, future in zip(loaders, prefetched):
+            if loader is not None:
+                slice_data.append(next(loaded))
+            elif future is None or future.cancelled():
+                slice_data.append((None, None))
+            elif future.exception() is not None:
+                slice_data.append((None, future.exception()))
+            else:
+                slice_data.append((future.result(), None))
+        return slice_data
+
+    def shutdown(self, wait: bool = True) -> None:
+        """Shut down the worker pools.
+
+        Parameters
+        ----------
+        wait : bool
+            If True, wait for the loads in progress to finish.
+        """
+        for future in self._prefetched.values():
+            future.cancel()
+        self._prefetched = {}
+        for executor in (self._executor, self._prefetch_executor):
+            if executor is not None:
+                executor.shutdown(wait=wait)
+        self._executor = None
+        self._prefetch_executor = None
+
+
+def _slice_key(layer, point, ndisplay: int, order) -> tuple:
+    """Key of the slice of a layer and its data at the given dims."""
+    return (id(layer), id(layer.data), tuple(point), ndisplay, tuple(order))
+
+
+def _load(loader) -> tuple:
+    """Call the loader of a slice, return its data and the error raised."""
+    try:
+        return loader(), None
+    except Exception as error:
+        return None, error
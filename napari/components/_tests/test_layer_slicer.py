@@ -0,0 +1,159 @@
+import threading
+
+import dask.array as da
+import numpy as np
+import pytest
+
+from napari.components import ViewerModel
+from napari.components._layer_slicer import LayerSlicer
+
+
+def _barrier_array(barrier, active, value, shape=(4, 8, 8)):
+    """Dask array whose chunks, once active, can only load while the
+    barrier is reached by another thread."""
+
+    def load_chunk(block):
+        if active.is_set():
+            barrier.wait(timeout=10)
+        return block
+
+    return da.map_blocks(
+        load_chunk,
+        da.full(shape, value, chunks=(1,) + shape[1:]),
+        dtype=float,
+    )
+
+
+@pytest.mark.sync_only
+def test_layers_load_concurrently():
+    """Each layer loads its slice in a different worker thread."""
+    barrier = threading.Barrier(2)
+    active = threading.Event()
+    viewer = ViewerModel()
+    viewer._slicer = LayerSlicer(max_workers=2)
+    viewer.add_image(np.zeros((4, 8, 8)))
+    layers = [
+        viewer.add_image(
+            _barrier_array(barrier, active, value), contrast_limits=[0, 2]
+        )
+        for value in range(2)
+    ]
+
+    # With serial loads the barrier would time out and break
+    active.set()
+    viewer.dims.set_current_step(0, 2)
+    assert not barrier.broken
+    for value, layer in enumerate(layers):
+        np.testing.assert_array_equal(layer._slice.image.raw, value)
+        assert layer._loaded_slice_data is None
+    viewer._slicer.shutdown()
+
+
+def test_slice_layers():
+    """The layers show the same slice as when sliced one by one."""
+    np.random.seed(0)
+    data = np.random.random((5, 8, 8))
+    slicer = LayerSlicer()
+    viewer = ViewerModel()
+    image = viewer.add_image(da.from_array(data, chunks=(1, 8, 8)))
+    labels = viewer.add_labels((data * 10).astype(int))
+    points = viewer.add_points(np.array([[1, 2, 3], [3, 4, 5]]))
+
+    slicer.slice_layers(viewer.layers, [3, 0, 0], 2, [0, 1, 2])
+    np.testing.assert_array_equal(image._slice.image.raw, data[3])
+    np.testing.assert_array_equal(
+        labels._slice.image.raw, (data[3] * 10).astype(int)
+    )
+    np.testing.assert_array_equal(points._indices_view, [1])
+    slicer.shutdown()
+
+
+def test_failed_load_raised(monkeypatch):
+    """A failed load is raised once, after the other layers are sliced."""
+    data = np.random.random((5, 8, 8))
+    slicer = LayerSlicer()
+    viewer = ViewerModel()
+    failing = viewer.add_image(da.from_array(data, chunks=(1, 8, 8)))
+    image = viewer.add_image(da.from_array(data, chunks=(1, 8, 8)))
+    failures = []
+
+    def load_slice():
+        failures.append(None)
+        raise RuntimeError('load failed')
+
+    monkeypatch.setattr(failing, '_slice_loader', lambda: load_slice)
+    with pytest.raises(RuntimeError, match='load failed'):
+        slicer.slice_layers(viewer.layers, [3, 0, 0], 2, [0, 1, 2])
+    # the load is not tried again in the GUI thread
+    assert len(failures) == 1
+    np.testing.assert_array_equal(image._slice.image.raw, data[3])
+    assert failing._slice_indices[0] == 3
+    slicer.shutdown()
+
+
+@pytest.mark.sync_only
+def test_prefetch():
+    """Prefetched slices are not loaded again when the dims move there."""
+    np.random.seed(0)
+    data = np.random.random((5, 8, 8))
+    viewer = ViewerModel()
+    image = viewer.add_image(da.from_array(data, chunks=(1, 8, 8)))
+
+    loaded = []
+    slice_loader = image._slice_loader
+
+    def counting_loader(dims_point=None):
+        loaded.append(dims_point)
+        return slice_loader(dims_point)
+
+    image._slice_loader = counting_loader
+    viewer._prefetch_steps(0, [2, 3])
+    assert len(viewer._slicer._prefetched) == 2
+    for future in viewer._slicer._prefetched.values():
+        future.result()
+    assert len(loaded) == 2
+
+    viewer.dims.set_current_step(0, 2)
+    assert len(loaded) == 2
+    np.testing.assert_array_equal(image._slice.image.raw, data[2])
+
+    # Prefetches that are not requested anymore are dropped
+    viewer._prefetch_steps(0, [4])
+    assert len(viewer._slicer._prefetched) == 1
+    viewer._slicer.shutdown()
+
+
+@pytest.mark.sync_only
+def test_prefetch_dropped():
+    """Prefetched slices are dropped when the data changes or the layer is
+    removed."""
+    np.random.seed(0)
+    data = np.random.random((5, 8, 8))
+    viewer = ViewerModel()
+    image = viewer.add_image(da.from_array(data, chunks=(1, 8, 8)))
+    viewer._prefetch_steps(0, [2, 3])
+    assert len(viewer._slicer._prefetched) == 2
+
+    new_data = np.random.random((5, 8, 8))
+    image.data = new_data
+    assert viewer._slicer._prefetched == {}
+    viewer.dims.set_current_step(0, 2)
+    np.testing.assert_array_equal(image._slice.image.raw, new_data[2])
+
+    viewer._prefetch_steps(0, [3, 4])
+    assert len(viewer._slicer._prefetched) == 2
+    viewer.layers.remove(image)
+    assert viewer._slicer._prefetched == {}
+    viewer._slicer.shutdown()
+
+
+@pytest.mark.sync_only
+def test_slice_loader_snapshot():
+    """Slice loaders do not see the layer change after they are created."""
+    data = np.arange(5)[:, None, None] * np.ones((5, 8, 8))
+    viewer = ViewerModel()
+    image = viewer.add_image(data)
+    viewer.dims.set_current_step(0, 1)
+    loader = image._slice_loader()
+    viewer.dims.set_current_step(0, 3)
+    np.testing.assert_array_equal(loader().image, 1)
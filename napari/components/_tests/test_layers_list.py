@@ -594,3 +594,28 @@ def test_name_uniqueness():
     layers.append(Image(np.random.random((10, 15)), name="Image"))
     layers.append(Image(np.random.random((10, 15)), name="Image"))
     assert [x.name for x in layers] == ['Image [1]', 'Image', 'Image [2]']
+
+
+def test_batch():
+    """Test that layers are refreshed once at the end of a batch."""
+    np.random.seed(0)
+    layers = LayerList([Image(np.random.random((10, 10))) for _ in range(2)])
+    refreshes = []
+    for layer in layers:
+        layer.events.set_data.connect(lambda e: refreshes.append(e.source))
+
+    with layers.batch():
+        for layer in layers:
+            layer.scale = (2, 2)
+            layer.translate = (1, 1)
+            layer.opacity = 0.5
+        # layers added in the batch are not batched
+        layers.append(Image(np.random.random((10, 10))))
+        assert refreshes == []
+    assert len(refreshes) == 2
+    assert set(refreshes) == set(layers[:2])
+    np.testing.assert_array_equal(layers[0].scale, (2, 2))
+
+    # refreshes are not deferred after the batch
+    layers[0].scale = (3, 3)
+    assert len(refreshes) == 3
@@ -536,6 +536,25 @@ def test_active_layer_status_update():
     )
 
 
+def test_inactive_layer_value_on_activation():
+    """Test only the active layer looks up its value on cursor move."""
+    viewer = ViewerModel()
+    data = np.arange(16).reshape((4, 4))
+    first = viewer.add_image(data)
+    second = viewer.add_image(data * 10)
+    assert viewer.active_layer == second
+
+    viewer.cursor.position = [1, 2]
+    assert first.position == (1, 2)
+    assert second.position == (1, 2)
+    assert second._value == 60
+
+    first.selected = True
+    second.selected = False
+    assert viewer.active_layer == first
+    assert first._value == 6
+
+
 def test_active_layer_cursor_size():
     """Test cursor size update on active layer."""
     viewer = ViewerModel()
@@ -683,3 +702,52 @@ def test_add_remove_layer_external_callbacks(Layer, data, ndim):
     assert len(layer.events.callbacks) == 1
     for em in layer.events.emitters.values():
         assert len(em.callbacks) == 1
+
+
+def test_batch():
+    """Test that a batch of viewer updates refreshes each layer once."""
+    viewer = ViewerModel()
+    np.random.seed(0)
+    for _ in range(3):
+        viewer.add_image(np.random.random((5, 10, 10)))
+    refreshes = []
+    steps = []
+    for layer in viewer.layers:
+        layer.events.set_data.connect(lambda e: refreshes.append(e.source))
+    viewer.dims.events.current_step.connect(lambda e: steps.append(e.value))
+
+    with viewer.batch():
+        for layer in viewer.layers:
+            layer.contrast_limits = (0, 0.5)
+            layer.scale = (1, 2, 2)
+        for step in range(4):
+            viewer.dims.set_current_step(0, step)
+    assert len(refreshes) == 3
+    assert steps == [(3, 0, 0)]
+    assert viewer.layers[0]._slice_indices[0] == 3
+
+
+def test_batch_add_remove_layers():
+    """Test that layers added or removed in a batch are all handled."""
+    viewer = ViewerModel()
+    inserted = []
+    removed = []
+    viewer.layers.events.inserted.connect(lambda e: inserted.append(e.value))
+    viewer.layers.events.removed.connect(lambda e: removed.append(e.value))
+
+    with viewer.batch():
+        layer_a = viewer.add_image(np.random.random((5, 10, 10)), name='a')
+        layer_b = viewer.add_points(np.zeros((1, 2)), name='b')
+    assert inserted == [layer_a, layer_b]
+    assert viewer.dims.ndim == 3
+    # the viewer connected to both layers when they were inserted
+    layer_a.name = 'c'
+    assert viewer.layers[0] is layer_a and layer_a.name == 'c'
+    assert viewer.active_layer is layer_b
+
+    with viewer.batch():
+        viewer.layers.remove('c')
+        viewer.layers.remove('b')
+    assert removed == [layer_a, layer_b]
+    assert viewer.dims.ndim == 2
+    assert viewer.active_layer is None
@@ -9,7 +9,7 @@ from typing import NamedTuple, Optional, Tuple
 import numpy as np
 
 from ....types import ArrayLike, Dict
-from ....utils.perf import PerfEvent, block_timer
+from ....utils.perf import PerfEvent, block_timer, record_timer
 
 LOGGER = logging.getLogger("napari.loader")
 
@@ -188,10 +188,11 @@ class ChunkRequest:
         We time the overall load with the special name "load_chunks" and then
         we time each chunk as it loads, using it's array name as the key.
         """
-        for key, array in self.chunks.items():
-            with self._chunk_timer(key):
-                loaded_array = np.asarray(array)
-                self.chunks[key] = loaded_array
+        with record_timer("ChunkRequest.load_chunks"):
+            for key, array in self.chunks.items():
+                with self._chunk_timer(key):
+                    loaded_array = np.asarray(array)
+                    self.chunks[key] = loaded_array
 
     def transpose_chunks(self, order: tuple) -> None:
         """Transpose all our chunks.
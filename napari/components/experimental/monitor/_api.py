@@ -7,6 +7,7 @@ from threading import Event
 from typing import NamedTuple
 
 from ....utils.events import EmitterGroup
+from ._shared_arrays import SharedArrays
 
 LOGGER = logging.getLogger("napari.monitor")
 
@@ -49,7 +50,9 @@ class MonitorApi:
     Shared Resources
     ----------------
     napari_data : dict
-        Napari shares data in this dict for clients to read.
+        Napari shares data in this dict for clients to read. Its
+        "shared_arrays" entry describes the arrays napari publishes in
+        shared memory blocks, see SharedArrays.
 
     napari_messages : Queue
         Napari puts messages in here for clients to read.
@@ -146,6 +149,9 @@ class MonitorApi:
             self._manager.client_messages(),
         )
 
+        # Arrays published in shared memory blocks, outside the manager.
+        self._arrays = SharedArrays()
+
     @property
     def manager(self) -> SharedMemoryManager:
         """Our shared memory manager.
@@ -171,6 +177,7 @@ class MonitorApi:
         this event was set.
         """
         self._remote.napari_shutdown.set()
+        self._arrays.close()
 
     def poll(self):
         """Poll client_messages for new messages."""
@@ -207,6 +214,44 @@ class MonitorApi:
         """
         self._remote.napari_data.update(data)
 
+    def publish_array(self, key, array) -> None:
+        """Publish an array in shared memory for clients to read.
+
+        Only the array is written when its shape and dtype did not change,
+        the napari_data dict is only updated otherwise.
+
+        Parameters
+        ----------
+        key : hashable
+            Key of the array in the "shared_arrays" metadata.
+        array : np.ndarray
+            The array to publish.
+        """
+        if self._arrays.publish(key, array):
+            self._update_array_metadata()
+
+    def remove_array(self, key) -> None:
+        """Remove a published array.
+
+        Parameters
+        ----------
+        key : hashable
+            Key of the array.
+        """
+        self._arrays.remove(key)
+        self._update_array_metadata()
+
+    @property
+    def published_arrays(self) -> set:
+        """set: Keys of the arrays published."""
+        return set(self._arrays.keys())
+
+    def _update_array_metadata(self) -> None:
+        """Tell clients about the arrays published."""
+        self._remote.napari_data.update(
+            {"shared_arrays": self._arrays.metadata}
+        )
+
     def send_napari_message(self, message: dict) -> None:
         """Send a message to shared memory clients.
 
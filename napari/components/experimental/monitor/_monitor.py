@@ -132,6 +132,7 @@ class Monitor:
         # a parseable config file, have Python 3.9, etc.
         self._service = None
         self._api = None
+        self._config = None
         self._running = False
 
     def __nonzero__(self) -> bool:
@@ -144,6 +145,14 @@ class Monitor:
         """
         return self._running
 
+    @property
+    def share_canvas(self) -> bool:
+        """True if the rendered canvas should be published in shared memory.
+
+        Set with "share_canvas": true in the config file.
+        """
+        return self._running and bool(self._config.get('share_canvas'))
+
     @property
     def run_command_event(self):
         """The MonitorAPI fires this event for commands from clients."""
@@ -166,6 +175,7 @@ class Monitor:
             return False  # Can't start without config.
 
         _setup_logging(config)
+        self._config = config
 
         # Late imports so no multiprocessing modules are even
         # imported unless we are going to start the service.
@@ -232,5 +242,37 @@ class Monitor:
         if self._running:
             self._api.send_napari_message(message)
 
+    def publish_array(self, key, array) -> None:
+        """Publish an array in shared memory for clients to read.
+
+        Clients map the array without copying it. See SharedArrays for how
+        clients find and read it.
+
+        Parameters
+        ----------
+        key : hashable
+            Key of the array, for example a layer id.
+        array : np.ndarray
+            The array to publish.
+        """
+        if self._running:
+            self._api.publish_array(key, array)
+
+    def remove_array(self, key) -> None:
+        """Remove a published array.
+
+        Parameters
+        ----------
+        key : hashable
+            Key of the array.
+        """
+        if self._running:
+            self._api.remove_array(key)
+
+    @property
+    def published_arrays(self) -> set:
+        """set: Keys of the arrays published."""
+        return self._api.published_arrays if self._running else set()
+
 
 monitor = Monitor()
@@ -87,10 +87,21 @@ The client can access data['tiled_image_layer']. Clients should be
 resilient to missing data. Nn case the napari version is different than
 expected, or is just not producing that data for some reason.
 
-Future Work
------------
-We plan to investigate the use of numpy shared memory buffers for bulk
-binary data. Possibly using recarray to organized things.
+Passing Arrays From Napari To The Client
+----------------------------------------
+Bulk binary data is not put in the data dict, which pickles it. Instead
+napari publishes arrays in named shared memory blocks:
+
+    if monitor:
+        monitor.publish_array(key, array)
+
+The current slice of each image layer is published like this, by the
+id of the layer, on each set_data event of the layer, so whenever the
+slice changes. The rendered canvas is published each time it is drawn,
+with the key "canvas", if the config file has "share_canvas": true.
+
+The client finds the blocks in data['shared_arrays'] and maps them
+without copying, see SharedArrays for the layout of the blocks.
 """
 import copy
 import logging
@@ -0,0 +1,280 @@
+"""SharedArrays class.
+
+Publishes numpy arrays in named shared memory blocks, so that clients on
+the same machine can read them without pickling or copying.
+
+Block Layout
+------------
+Each array is in its own block. The block starts with a header of
+HEADER_SIZE bytes, whose first 8 bytes are the version of the array as a
+little-endian uint64. The data of the array follows, C-contiguous, at
+offset HEADER_SIZE. The block can be larger than the array, so that it can
+be reused for arrays of slightly different sizes.
+
+The version is a sequence lock. It is odd while napari writes the array
+and even otherwise. A client reads the version, reads or uses the data,
+then reads the version again. The data is consistent if both versions are
+the same even number, otherwise the client tries again.
+
+Metadata
+--------
+The name of the block, the shape and the dtype of each array are in the
+"shared_arrays" entry of the napari_data dict of the MonitorApi:
+
+    {
+        "shared_arrays": {
+            "<key>": {
+                "name": "psm_21f9c3f8",
+                "shape": [512, 512],
+                "dtype": "<f4",
+                "offset": 64,
+            }
+        }
+    }
+
+The metadata only changes when an array moves to another block, because
+it does not fit its current block anymore. Clients do not need to check
+the metadata every frame, they can check the version of the block, and
+the metadata once the block they have is unlinked.
+
+Python clients can use SharedArrayReader to map a block.
+"""
+import logging
+from multiprocessing import resource_tracker, shared_memory
+from typing import Dict, Optional, Tuple
+
+import numpy as np
+
+LOGGER = logging.getLogger("napari.monitor")
+
+# The data starts after the header, aligned for any dtype.
+HEADER_SIZE = 64
+
+# Blocks are allocated this much bigger than the array that needs them.
+GROWTH_FACTOR = 1.5
+
+
+class SharedArray:
+    """An array in a named shared memory block.
+
+    Parameters
+    ----------
+    shape : tuple of int
+        Shape of the array.
+    dtype : np.dtype
+        Data type of the array.
+    capacity : int, optional
+        Size in bytes reserved for the data. If not provided, the size of
+        the array.
+    """
+
+    def __init__(self, shape, dtype, capacity: Optional[int] = None):
+        self.shape = tuple(int(s) for s in shape)
+        self.dtype = np.dtype(dtype)
+        nbytes = _nbytes(self.shape, self.dtype)
+        self.capacity = nbytes if capacity is None else max(capacity, nbytes)
+        self._shm = shared_memory.SharedMemory(
+            create=True, size=HEADER_SIZE + max(self.capacity, 1)
+        )
+        self._version = np.ndarray((1,), '<u8', buffer=self._shm.buf)
+        self._version[0] = 0
+
+    @property
+    def name(self) -> str:
+        """str: Name of the shared memory block."""
+        return self._shm.name
+
+    @property
+    def version(self) -> int:
+        """int: Version of the array, even when not being written."""
+        return int(self._version[0])
+
+    @property
+    def metadata(self) -> dict:
+        """dict: What clients need to map the array."""
+        return {
+            "name": self.name,
+            "shape": list(self.shape),
+            "dtype": self.dtype.str,
+            "offset": HEADER_SIZE,
+        }
+
+    def fits(self, shape, dtype) -> bool:
+        """Return True if an array of this shape and dtype fits the block.
+
+        Parameters
+        ----------
+        shape : tuple of int
+            Shape of the array.
+        dtype : np.dtype
+            Data type of the array.
+
+        Returns
+        -------
+        bool
+            True if the array fits.
+        """
+        return _nbytes(shape, dtype) <= self.capacity
+
+    def write(self, array: np.ndarray) -> None:
+        """Write an array that fits the block, its version is incremented.
+
+        Parameters
+        ----------
+        array : np.ndarray
+            The array to write. It does not need to be contiguous.
+        """
+        self.shape = array.shape
+        self.dtype = array.dtype
+        data = np.ndarray(
+            array.shape, array.dtype, buffer=self._shm.buf, offset=HEADER_SIZE
+        )
+        self._version[0] += 1
+        np.copyto(data, array)
+        self._version[0] += 1
+
+    def close(self) -> None:
+        """Close and unlink the block, clients can no longer open it."""
+        # The views of the buffer must be released first.
+        self._version = None
+        self._shm.close()
+        self._shm.unlink()
+
+
+class SharedArrays:
+    """Publish arrays by key, each in its own shared memory block.
+
+    An array is written in the block of its key while it fits, otherwise a
+    bigger block is allocated and the previous block is unlinked.
+    """
+
+    def __init__(self):
+        self._arrays: Dict[object, SharedArray] = {}
+
+    @property
+    def metadata(self) -> Dict[object, dict]:
+        """dict: The metadata of the arrays, by key."""
+        return {key: array.metadata for key, array in self._arrays.items()}
+
+    def keys(self):
+        """Return the keys of the published arrays."""
+        return self._arrays.keys()
+
+    def publish(self, key, array: np.ndarray) -> bool:
+        """Write the array of this key.
+
+        Parameters
+        ----------
+        key : hashable
+            Key of the array, for example a layer id.
+        array : np.ndarray
+            The array to write.
+
+        Returns
+        -------
+        bool
+            True if the metadata of the array changed, so clients must be
+            told.
+        """
+        array = np.asarray(array)
+        shared = self._arrays.get(key)
+        changed = (
+            shared is None
+            or shared.shape != array.shape
+            or shared.dtype != array.dtype
+        )
+        if shared is None or not shared.fits(array.shape, array.dtype):
+            capacity = int(array.nbytes * GROWTH_FACTOR)
+            new_shared = SharedArray(array.shape, array.dtype, capacity)
+            LOGGER.debug(
+                "SharedArrays: %s in %s (%d bytes)",
+                key,
+                new_shared.name,
+                new_shared.capacity,
+            )
+            if shared is not None:
+                shared.close()
+            shared = self._arrays[key] = new_shared
+        shared.write(array)
+        return changed
+
+    def remove(self, key) -> None:
+        """Unlink the block of this key.
+
+        Parameters
+        ----------
+        key : hashable
+            Key of the array.
+        """
+        self._arrays.pop(key).close()
+
+    def close(self) -> None:
+        """Unlink every block."""
+        for array in self._arrays.values():
+            array.close()
+        self._arrays = {}
+
+
+class SharedArrayReader:
+    """Map an array published by SharedArrays, for Python clients.
+
+    Parameters
+    ----------
+    metadata : dict
+        The metadata of the array, see the module docstring.
+
+    Attributes
+    ----------
+    array : np.ndarray
+        The array, mapped on the block without copying it. It changes when
+        napari writes it, use read() for a consistent copy.
+    """
+
+    def __init__(self, metadata: dict):
+        self._shm = shared_memory.SharedMemory(name=metadata['name'])
+        # Only napari unlinks the block, not the tracker of this process.
+        resource_tracker.unregister(self._shm._name, 'shared_memory')
+        self._version = np.ndarray((1,), '<u8', buffer=self._shm.buf)
+        self.array = np.ndarray(
+            metadata['shape'],
+            metadata['dtype'],
+            buffer=self._shm.buf,
+            offset=metadata['offset'],
+        )
+
+    @property
+    def version(self) -> int:
+        """int: Version of the array, odd while napari writes it."""
+        return int(self._version[0])
+
+    def read(self, max_tries: int = 100) -> Tuple[np.ndarray, int]:
+        """Return a consistent copy of the array and its version.
+
+        Parameters
+        ----------
+        max_tries : int
+            Number of times to try before giving up.
+
+        Returns
+        -------
+        Tuple[np.ndarray, int]
+            The copy of the array and its version.
+        """
+        for _ in range(max_tries):
+            version = self.version
+            if version % 2 == 0:
+                copy = self.array.copy()
+                if self.version == version:
+                    return copy, version
+        raise RuntimeError("SharedArrayReader: array is always being written")
+
+    def close(self) -> None:
+        """Close the block, without unlinking it."""
+        self._version = None
+        self.array = None
+        self._shm.close()
+
+
+def _nbytes(shape, dtype) -> int:
+    """Return the size in bytes of an array of this shape and dtype."""
+    return int(np.prod(shape, dtype=np.int64)) * np.dtype(dtype).itemsize
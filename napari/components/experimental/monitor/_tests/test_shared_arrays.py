@@ -0,0 +1,56 @@
+import numpy as np
+import pytest
+
+# multiprocessing.shared_memory is new in Python 3.8
+pytest.importorskip("multiprocessing.shared_memory")
+
+from napari.components.experimental.monitor._shared_arrays import (  # noqa
+    SharedArrayReader,
+    SharedArrays,
+)
+
+
+@pytest.fixture
+def arrays():
+    arrays = SharedArrays()
+    yield arrays
+    arrays.close()
+
+
+def test_publish_and_read(arrays):
+    """Clients map the published array and see it change."""
+    data = np.arange(12, dtype=np.float32).reshape(3, 4)
+    assert arrays.publish('layer', data)
+    metadata = arrays.metadata['layer']
+    assert metadata['shape'] == [3, 4]
+    assert metadata['dtype'] == '<f4'
+
+    reader = SharedArrayReader(metadata)
+    try:
+        np.testing.assert_array_equal(reader.array, data)
+        assert reader.version == 2
+
+        # Writing again only changes the version, not the metadata
+        assert not arrays.publish('layer', data[::-1])
+        np.testing.assert_array_equal(reader.array, data[::-1])
+        copy, version = reader.read()
+        np.testing.assert_array_equal(copy, data[::-1])
+        assert version == 4
+    finally:
+        reader.close()
+
+
+def test_publish_reallocates(arrays):
+    """An array that does not fit its block moves to a bigger block."""
+    arrays.publish('layer', np.zeros((10, 10), np.uint8))
+    name = arrays.metadata['layer']['name']
+
+    # A smaller array fits the same block
+    assert arrays.publish('layer', np.zeros((5, 10), np.uint8))
+    assert arrays.metadata['layer']['name'] == name
+
+    assert arrays.publish('layer', np.zeros((10, 10), np.float64))
+    assert arrays.metadata['layer']['name'] != name
+
+    arrays.remove('layer')
+    assert 'layer' not in arrays.metadata
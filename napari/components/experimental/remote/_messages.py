@@ -4,9 +4,10 @@ Sends messages to remote clients.
 """
 import logging
 import time
-from typing import Dict
+from typing import Dict, Set
 
 from ....layers.image.experimental.octree_image import OctreeImage
+from ....layers.image.image import Image
 from ...layerlist import LayerList
 from ..monitor import monitor
 
@@ -26,6 +27,15 @@ class RemoteMessages:
         self.layers = layers
         self._frame_number = 0
         self._last_time = None
+        # The ids of the layers whose slice is published.
+        self._published: Set[int] = set()
+
+        # Slices are published as soon as they change, so that changes of
+        # the dims and playback reach clients, not only when polled.
+        layers.events.inserted.connect(self._on_layer_inserted)
+        layers.events.removed.connect(self._on_layer_removed)
+        for layer in layers:
+            self._connect_layer(layer)
 
     def on_poll(self) -> None:
         """Send messages to clients.
@@ -46,6 +56,10 @@ class RemoteMessages:
                 }
             }
         }
+
+        The current slice of each image layer is not in the message, it is
+        published in shared memory by the id of the layer, see
+        _publish_slice().
         """
         self._frame_number += 1
 
@@ -58,6 +72,44 @@ class RemoteMessages:
         monitor.add_data({"poll": {"layers": layers}})
         self._send_frame_time()
 
+    @staticmethod
+    def _is_published(layer) -> bool:
+        """Return True if the slices of this layer are published."""
+        return isinstance(layer, Image) and not isinstance(layer, OctreeImage)
+
+    def _connect_layer(self, layer) -> None:
+        """Publish the slices of this layer, starting with the current one."""
+        if self._is_published(layer):
+            layer.events.set_data.connect(self._on_set_data)
+            self._publish_slice(layer)
+
+    def _on_layer_inserted(self, event) -> None:
+        """Publish the slices of the inserted layer."""
+        self._connect_layer(event.value)
+
+    def _on_layer_removed(self, event) -> None:
+        """Remove the slice of the removed layer."""
+        layer = event.value
+        if self._is_published(layer):
+            layer.events.set_data.disconnect(self._on_set_data)
+        if id(layer) in self._published:
+            self._published.remove(id(layer))
+            monitor.remove_array(id(layer))
+
+    def _on_set_data(self, event) -> None:
+        """Publish the new slice of the layer."""
+        self._publish_slice(event.source)
+
+    def _publish_slice(self, layer: Image) -> None:
+        """Publish the current slice of an image layer in shared memory.
+
+        The slice of a layer is keyed by the id of the layer. It is written
+        again each time the layer emits set_data, even if it is the same
+        array, as it may have been edited in place.
+        """
+        monitor.publish_array(id(layer), layer._slice.image.raw)
+        self._published.add(id(layer))
+
     def _send_frame_time(self) -> None:
         """Send the frame time since last poll."""
         now = time.time()
@@ -0,0 +1,46 @@
+import numpy as np
+import pytest
+
+from napari.components import ViewerModel
+from napari.components.experimental.remote import _messages
+from napari.components.experimental.remote._messages import RemoteMessages
+
+
+class _Monitor:
+    """Records the arrays published, instead of sharing them."""
+
+    def __init__(self):
+        self.arrays = {}
+
+    def publish_array(self, key, array):
+        self.arrays[key] = np.array(array)
+
+    def remove_array(self, key):
+        del self.arrays[key]
+
+
+@pytest.fixture
+def monitor(monkeypatch):
+    monitor = _Monitor()
+    monkeypatch.setattr(_messages, 'monitor', monitor)
+    return monitor
+
+
+def test_publish_slices(monitor):
+    """Slices are published when they change, without polling."""
+    viewer = ViewerModel()
+    data = np.arange(4 * 5 * 6).reshape((4, 5, 6))
+    layer = viewer.add_image(data)
+    viewer.add_points(np.zeros((1, 3)))
+    # kept alive, the events only hold weak references to its methods
+    messages = RemoteMessages(viewer.layers)
+    assert list(monitor.arrays) == [id(layer)]
+
+    viewer.dims.set_current_step(0, 3)
+    np.testing.assert_array_equal(monitor.arrays[id(layer)], data[3])
+
+    new_layer = viewer.add_image(-data)
+    viewer.layers.remove(layer)
+    assert list(monitor.arrays) == [id(new_layer)]
+    np.testing.assert_array_equal(monitor.arrays[id(new_layer)], -data[3])
+    del messages
@@ -1,6 +1,7 @@
 import itertools
 import warnings
 from collections import namedtuple
+from contextlib import ExitStack, contextmanager
 from typing import List, Optional
 
 import numpy as np
@@ -31,6 +32,20 @@ class LayerList(EventedList):
     def __newlike__(self, data):
         return LayerList(data)
 
+    @contextmanager
+    def batch(self):
+        """Defer the events and refreshes of the layers of the list.
+
+        See Layer.batch, each layer in the list when the block starts is
+        refreshed once on exit. The events of the list itself, such as
+        ``inserted`` and ``removed``, are not deferred: each of them tells
+        about a different change, so they cannot be coalesced.
+        """
+        with ExitStack() as stack:
+            for layer in self:
+                stack.enter_context(layer.batch())
+            yield
+
     def _coerce_name(self, name, layer=None):
         """Coerce a name into a unique equivalent.
 
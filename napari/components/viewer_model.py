@@ -2,6 +2,7 @@ import inspect
 import itertools
 import os
 import warnings
+from contextlib import ExitStack, contextmanager
 from functools import lru_cache
 from typing import (
     TYPE_CHECKING,
@@ -29,6 +30,7 @@ from ..utils.mouse_bindings import MousemapProvider
 
 # Private _themes import needed until viewer.palette is dropped
 from ..utils.theme import _themes, available_themes, get_theme
+from ._layer_slicer import LayerSlicer
 from ._viewer_mouse_bindings import dims_scroll
 from .axes import Axes
 from .camera import Camera
@@ -102,6 +104,7 @@ class ViewerModel(KeymapProvider, MousemapProvider):
         self._theme = DEFAULT_THEME
 
         self._active_layer = None
+        self._slicer = LayerSlicer()
         self.grid = GridCanvas()
         # 2-tuple indicating height and width
         self._canvas_size = (600, 800)
@@ -252,6 +255,10 @@ class ViewerModel(KeymapProvider, MousemapProvider):
             return
 
         self._active_layer = active_layer
+        if active_layer is not None:
+            # Only the active layer looks up its value on cursor moves, see
+            # _on_cursor_position_change
+            active_layer._update_value()
         self.events.active_layer(value=self._active_layer)
 
     @property
@@ -274,6 +281,39 @@ class ViewerModel(KeymapProvider, MousemapProvider):
         else:
             return self.layers.extent.world[:, self.dims.displayed]
 
+    @contextmanager
+    def batch(self):
+        """Defer the events of the viewer and the refreshes of its layers.
+
+        Events of the viewer, of its dims, camera and other components and
+        of the layers are emitted once on exit, with their last value, and
+        each layer is refreshed once. Layers are still added and removed
+        right away, see LayerList.batch.
+
+        Examples
+        --------
+        >>> with viewer.batch():
+        ...     for layer in viewer.layers:
+        ...         layer.contrast_limits = (0, 100)
+        ...         layer.opacity = 0.5
+        ...     viewer.dims.set_current_step(0, 10)
+        """
+        with ExitStack() as stack:
+            # The layers are refreshed last, after the events of the other
+            # components, such as a new step of the dims, ask for it
+            stack.enter_context(self.layers.batch())
+            for events in (
+                self.events,
+                self.dims.events,
+                self.camera.events,
+                self.cursor.events,
+                self.axes.events,
+                self.scale_bar.events,
+                self.grid.events,
+            ):
+                stack.enter_context(events.batch_all())
+            yield
+
     def reset_view(self, event=None):
         """Reset the camera view."""
 
@@ -328,10 +368,34 @@ class ViewerModel(KeymapProvider, MousemapProvider):
             List of layers to update. If none provided updates all.
         """
         layers = layers or self.layers
-        for layer in layers:
-            layer._slice_dims(
-                self.dims.point, self.dims.ndisplay, self.dims.order
-            )
+        self._slicer.slice_layers(
+            layers, self.dims.point, self.dims.ndisplay, self.dims.order
+        )
+
+    def _prefetch_steps(self, axis: int, steps):
+        """Load the slices of the layers at other steps of an axis ahead.
+
+        Parameters
+        ----------
+        axis : int
+            Axis of the dims.
+        steps : sequence of int
+            Steps along the axis that are expected to be shown next, such
+            as the next frames during playback.
+        """
+        min_val, _, step_size = self.dims.range[axis]
+        points = []
+        for step in steps:
+            point = list(self.dims.point)
+            point[axis] = min_val + step_size * step
+            points.append(point)
+        self._slicer.prefetch(
+            self.layers, points, self.dims.ndisplay, self.dims.order
+        )
+
+    def _drop_prefetched(self, event):
+        """Drop the slices prefetched from the previous data of a layer."""
+        self._slicer.drop(event.source)
 
     def _toggle_theme(self):
         """Switch to next theme in list of themes"""
@@ -401,8 +465,14 @@ class ViewerModel(KeymapProvider, MousemapProvider):
 
     def _on_cursor_position_change(self, event):
         """Set the layer cursor position."""
+        position = self.cursor.position
         for layer in self.layers:
-            layer.position = self.cursor.position
+            if layer is self.active_layer:
+                layer.position = position
+            else:
+                # Looking up the value under the cursor can be costly, so
+                # the other layers only do it once they become active
+                layer._set_position(position, update_value=False)
 
         # Update status and help bar based on active layer
         if self.active_layer is not None:
@@ -464,6 +534,7 @@ class ViewerModel(KeymapProvider, MousemapProvider):
         layer.events.cursor.connect(self._update_cursor)
         layer.events.cursor_size.connect(self._update_cursor_size)
         layer.events.data.connect(self._on_layers_change)
+        layer.events.data.connect(self._drop_prefetched)
         layer.events.scale.connect(self._on_layers_change)
         layer.events.translate.connect(self._on_layers_change)
         layer.events.rotate.connect(self._on_layers_change)
@@ -512,6 +583,8 @@ class ViewerModel(KeymapProvider, MousemapProvider):
         disconnect_events(layer.events, self)
         disconnect_events(layer.events, self.layers)
 
+        self._slicer.drop(layer)
+
         # For the labels layer disconnect history resets
         if hasattr(layer, '_reset_history'):
             self.dims.events.ndisplay.disconnect(layer._reset_history)
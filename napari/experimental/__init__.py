@@ -1 +1,2 @@
+from .._vispy.frame_export import export_frames
 from ..components.experimental.chunk import chunk_loader, synchronous_loading
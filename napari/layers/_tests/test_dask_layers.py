@@ -1,3 +1,4 @@
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import contextmanager
 from distutils.version import LooseVersion
 
@@ -7,6 +8,8 @@ import numpy as np
 import pytest
 
 from napari import layers, utils, viewer
+from napari.utils import dask_utils
+from napari.utils.dask_utils import concurrent_dask_loader
 
 
 def test_dask_array_creates_cache():
@@ -227,3 +230,42 @@ def test_prevent_dask_cache(delayed_dask_stack):
     for i in range(3):
         v.dims.set_point(0, i)
     assert len(utils.dask_cache.cache.heap.heap) == 0
+
+
+def test_concurrent_dask_loader(delayed_dask_stack):
+    """Test that concurrent loads keep using the dask cache"""
+    utils.dask_cache = None
+    utils.resize_dask_cache(1e5)
+    dask_stack = delayed_dask_stack['stack']
+    config = dict(dask.config.config)
+
+    # each thread computes the same timepoints
+    load = concurrent_dask_loader()
+    with ThreadPoolExecutor(4) as executor:
+        loaded = list(executor.map(load, [dask_stack[:3]] * 4))
+    assert all(isinstance(a, np.ndarray) for a in loaded)
+    assert loaded[0].shape == dask_stack[:3].shape
+    assert utils.dask_cache._callback in dask.callbacks.Callback.active
+    assert len(utils.dask_cache.cache.heap.heap) > 0
+    assert utils.dask_cache.cache.total_bytes == sum(
+        utils.dask_cache.cache.nbytes.values()
+    )
+    # the global dask configuration is never changed
+    assert dask.config.config == config
+
+    # the cached timepoints are not computed again
+    calls = delayed_dask_stack['calls']
+    concurrent_dask_loader()(dask_stack[:3])
+    assert delayed_dask_stack['calls'] == calls
+    utils.dask_cache = None
+
+
+def test_concurrent_dask_loader_old_dask(monkeypatch):
+    """Test that arrays are loaded without the optimizations of newer dask"""
+    monkeypatch.setattr(dask_utils, '_optimize_without_fusion', lambda a: None)
+    data = np.arange(24).reshape((2, 3, 4))
+    array = da.from_array(data, chunks=(1, 3, 4))
+    np.testing.assert_array_equal(concurrent_dask_loader()(array[1]), data[1])
+    with dask.config.set(scheduler='sync'):
+        load = concurrent_dask_loader()
+    np.testing.assert_array_equal(load(array[0]), data[0])
@@ -8,10 +8,12 @@ import numpy as np
 
 from ...utils.dask_utils import configure_dask
 from ...utils.events import EmitterGroup, Event
+from ...utils.events.event import EventBatch
 from ...utils.key_bindings import KeymapProvider
 from ...utils.misc import ROOT_DIR
 from ...utils.mouse_bindings import MousemapProvider
 from ...utils.naming import magic_name
+from ...utils.perf import record_timer
 from ...utils.status_messages import generate_layer_status
 from ...utils.transforms import Affine, TransformChain
 from ..utils.layer_utils import (
@@ -22,6 +24,9 @@ from ._base_constants import Blending
 
 Extent = namedtuple('Extent', 'data world step')
 
+# Events that describe a change rather than a state, which a batch would lose
+_UNBATCHED_EVENTS = {'highlight'}
+
 
 class Layer(KeymapProvider, MousemapProvider, ABC):
     """Base layer class.
@@ -181,12 +186,17 @@ class Layer(KeymapProvider, MousemapProvider, ABC):
         self._visible = visible
         self._selected = True
         self._freeze = False
+        # Depth of nested batch() blocks, and whether a refresh was deferred
+        self._batch_depth = 0
+        self._refresh_pending = False
         self._status = 'Ready'
         self._help = ''
         self._cursor = 'standard'
         self._cursor_size = 1
         self._interactive = True
         self._value = None
+        # Slice data loaded ahead by _slice_loader, see LayerSlicer
+        self._loaded_slice_data = None
         self.scale_factor = 1
         self.multiscale = multiscale
 
@@ -250,6 +260,7 @@ class Layer(KeymapProvider, MousemapProvider, ABC):
 
         self._thumbnail_shape = (32, 32, 4)
         self._thumbnail = np.zeros(self._thumbnail_shape, dtype=np.uint8)
+        self._thumbnail_outdated = False
         self._update_properties = True
         self._name = ''
         self.events = EmitterGroup(
@@ -329,7 +340,7 @@ class Layer(KeymapProvider, MousemapProvider, ABC):
             )
 
         self._opacity = opacity
-        self._update_thumbnail()
+        self._invalidate_thumbnail()
         self.events.opacity()
 
     @property
@@ -468,10 +479,31 @@ class Layer(KeymapProvider, MousemapProvider, ABC):
 
     @position.setter
     def position(self, position):
+        self._set_position(position)
+
+    def _set_position(self, position, update_value=True):
+        """Set the cursor position, optionally without looking up its value.
+
+        Parameters
+        ----------
+        position : tuple
+            Cursor position in world coordinates. Only its last `ndim`
+            values are used.
+        update_value : bool
+            If True, look up the value of the data at the new position, as
+            setting `position` does. Looking up the value can be costly, so
+            a layer whose value is not shown can skip it and look it up
+            later with `_update_value`.
+        """
         _position = position[-self.ndim :]
         if self._position == _position:
             return
         self._position = _position
+        if update_value:
+            self._update_value()
+
+    def _update_value(self):
+        """Look up the value of the data at the cursor position."""
         self._value = self.get_value(self.position, world=True)
 
     @property
@@ -596,6 +628,21 @@ class Layer(KeymapProvider, MousemapProvider, ABC):
     @property
     def _slice_indices(self):
         """(D, ) array: Slice indices in data coordinates."""
+        return self._get_slice_indices(self._dims_point)
+
+    def _get_slice_indices(self, dims_point) -> tuple:
+        """Slice indices in data coordinates of a point of the layer dims.
+
+        Parameters
+        ----------
+        dims_point : list
+            Values of the layer dims in world coordinates.
+
+        Returns
+        -------
+        tuple
+            The slice indices.
+        """
         inv_transform = self._transforms['data2world'].inverse
 
         if self.ndim > self._ndisplay:
@@ -622,7 +669,7 @@ class Layer(KeymapProvider, MousemapProvider, ABC):
 
         slice_inv_transform = inv_transform.set_slice(self._dims_not_displayed)
 
-        world_pts = [self._dims_point[ax] for ax in self._dims_not_displayed]
+        world_pts = [dims_point[ax] for ax in self._dims_not_displayed]
         data_pts = slice_inv_transform(world_pts)
         if not hasattr(self, "_round_index") or self._round_index:
             # A round is taken to convert these values to slicing integers
@@ -679,6 +726,9 @@ class Layer(KeymapProvider, MousemapProvider, ABC):
     @property
     def thumbnail(self):
         """array: Integer array of thumbnail for the layer"""
+        if self._thumbnail_outdated:
+            self._thumbnail_outdated = False
+            self._update_thumbnail()
         return self._thumbnail
 
     @thumbnail.setter
@@ -703,8 +753,20 @@ class Layer(KeymapProvider, MousemapProvider, ABC):
         thumbnail = thumbnail * f_dest + background * f_source
 
         self._thumbnail = thumbnail.astype(np.uint8)
+        self._thumbnail_outdated = False
         self.events.thumbnail()
 
+    def _invalidate_thumbnail(self):
+        """Mark the thumbnail as outdated, to compute it when next needed.
+
+        Refreshes can come many times per second while scrubbing or painting,
+        so the thumbnail is only computed again once it is read. The
+        thumbnail event is emitted once until then.
+        """
+        if not self._thumbnail_outdated:
+            self._thumbnail_outdated = True
+            self.events.thumbnail()
+
     @property
     def ndim(self):
         """int: Number of dimensions in the data."""
@@ -796,13 +858,42 @@ class Layer(KeymapProvider, MousemapProvider, ABC):
         self._cursor_size = cursor_size
 
     def set_view_slice(self):
-        with self.dask_optimized_slicing():
-            self._set_view_slice()
+        with record_timer(f"{type(self).__name__}.set_view_slice"):
+            with self.dask_optimized_slicing():
+                self._set_view_slice()
+        self._loaded_slice_data = None
 
     @abstractmethod
     def _set_view_slice(self):
         raise NotImplementedError()
 
+    def _slice_loader(self, dims_point=None):
+        """Return a function loading the data of a slice ahead of
+        set_view_slice.
+
+        This is called in the GUI thread and reads from the layer everything
+        the load needs, such as the slice indices. The returned function is
+        then called in a worker thread, so that the slow part of slicing
+        several layers can happen concurrently, and it must not use the
+        layer. Its result is set as _loaded_slice_data before the layer is
+        refreshed in the GUI thread.
+
+        Parameters
+        ----------
+        dims_point : list, optional
+            Values of the layer dims in world coordinates of the slice to
+            load, with the current displayed dims. If not provided, the
+            current slice is loaded.
+
+        Returns
+        -------
+        loader : callable or None
+            Function without arguments returning the loaded data, or None
+            if the layer slices its data in set_view_slice, which is the
+            default.
+        """
+        return None
+
     def _slice_dims(self, point=None, ndisplay=2, order=None):
         """Slice data with values from a global dims model.
 
@@ -818,6 +909,28 @@ class Layer(KeymapProvider, MousemapProvider, ABC):
             Order of dimensions, where last `ndisplay` will be
             rendered in canvas.
         """
+        if self._update_slice_dims(point, ndisplay, order):
+            self._refresh_slice_dims()
+
+    def _update_slice_dims(self, point=None, ndisplay=2, order=None) -> bool:
+        """Update the slice dims of the layer without slicing its data.
+
+        Parameters
+        ----------
+        point : list
+            Values of data to slice at in world coordinates.
+        ndisplay : int
+            Number of dimensions to be displayed.
+        order : list of int
+            Order of dimensions, where last `ndisplay` will be
+            rendered in canvas.
+
+        Returns
+        -------
+        bool
+            True if the slice dims changed, and the data must be sliced
+            again with _refresh_slice_dims.
+        """
         if point is None:
             ndim = self.ndim
         else:
@@ -853,7 +966,7 @@ class Layer(KeymapProvider, MousemapProvider, ABC):
             and ndisplay == self._ndisplay
             and np.all(point[offset:] == self._dims_point)
         ):
-            return
+            return False
 
         self._dims_order = order
         if self._ndisplay != ndisplay:
@@ -862,6 +975,10 @@ class Layer(KeymapProvider, MousemapProvider, ABC):
 
         # Update the point values
         self._dims_point = point[offset:]
+        return True
+
+    def _refresh_slice_dims(self):
+        """Slice the data after the slice dims changed."""
         self._update_dims()
         self._set_editable()
 
@@ -934,12 +1051,45 @@ class Layer(KeymapProvider, MousemapProvider, ABC):
         """
         pass
 
+    @contextmanager
+    def batch(self):
+        """Defer the events and refreshes of the layer to the end of a block.
+
+        Each event is emitted once on exit, with its last value, and the
+        layer is refreshed once if anything asked for a refresh. The view of
+        the layer is not updated until then.
+
+        Examples
+        --------
+        >>> with layer.batch():
+        ...     layer.scale = (2, 2)
+        ...     layer.translate = (10, 10)
+        ...     layer.opacity = 0.5
+        """
+        emitters = [
+            emitter
+            for name, emitter in self.events._emitters.items()
+            if name not in _UNBATCHED_EVENTS
+        ]
+        with EventBatch(emitters):
+            self._batch_depth += 1
+            try:
+                yield
+            finally:
+                self._batch_depth -= 1
+                if self._batch_depth == 0 and self._refresh_pending:
+                    self._refresh_pending = False
+                    self.refresh()
+
     def refresh(self, event=None):
         """Refresh all layer data based on current view slice."""
+        if self._batch_depth > 0:
+            self._refresh_pending = True
+            return
         if self.visible:
             self.set_view_slice()
             self.events.set_data()
-            self._update_thumbnail()
+            self._invalidate_thumbnail()
             self._value = self.get_value(self.position, world=True)
             self._set_highlight(force=True)
 
@@ -986,18 +1136,8 @@ class Layer(KeymapProvider, MousemapProvider, ABC):
         shape_threshold : tuple
             Requested shape of field of view in data coordinates.
         """
-        # Note we ignore the first transform which is tile2data
-        data_corners = self._transforms[1:].simplified.inverse(corner_pixels)
-
         self.scale_factor = scale_factor
-
-        # Round and clip data corners
-        data_corners = np.array(
-            [np.floor(data_corners[0]), np.ceil(data_corners[1])]
-        ).astype(int)
-        data_corners = np.clip(
-            data_corners, self.extent.data[0], self.extent.data[1]
-        )
+        data_corners = self._data_corners(corner_pixels)
 
         if self._ndisplay == 2 and self.multiscale:
             level, displayed_corners = compute_multiscale_level_and_corners(
@@ -1018,6 +1158,30 @@ class Layer(KeymapProvider, MousemapProvider, ABC):
         else:
             self.corner_pixels = data_corners
 
+    def _data_corners(self, corner_pixels):
+        """Corners in data coordinates of a region in world coordinates.
+
+        Parameters
+        ----------
+        corner_pixels : array
+            Coordinates of the top-left and bottom-right canvas pixels in the
+            world coordinates.
+
+        Returns
+        -------
+        data_corners : (2, D) array
+            The corners rounded outwards to integers and clipped to the
+            extent of the data.
+        """
+        # Note we ignore the first transform which is tile2data
+        data_corners = self._transforms[1:].simplified.inverse(corner_pixels)
+
+        # Round and clip data corners
+        data_corners = np.array(
+            [np.floor(data_corners[0]), np.ceil(data_corners[1])]
+        ).astype(int)
+        return np.clip(data_corners, self.extent.data[0], self.extent.data[1])
+
     @property
     def displayed_coordinates(self):
         """list: List of currently displayed coordinates."""
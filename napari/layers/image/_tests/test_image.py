@@ -419,6 +419,39 @@ def test_set_contrast_limits_range():
     assert layer.contrast_limits == [60, 60]
 
 
+def test_reset_contrast_limits_slice_percentiles():
+    """Test resetting contrast limits to the slice or to percentiles."""
+    data = np.zeros((2, 10, 10))
+    data[0] = np.arange(100).reshape(10, 10)
+    data[1] = 200
+    data[1, 0, 0] = 100
+    layer = Image(data)
+    layer._slice_dims(point=(0, 0, 0))
+    assert layer.contrast_limits == [0, 200]
+
+    layer.reset_contrast_limits(mode='slice')
+    assert layer.contrast_limits == [0, 99]
+
+    layer.reset_contrast_limits(percentiles=(1, 99))
+    np.testing.assert_allclose(
+        layer.contrast_limits, np.percentile(data, (1, 99))
+    )
+
+
+def test_refine_contrast_limits():
+    """Test that the contrast limits are refined until all data is loaded."""
+    data = np.zeros((20, 500, 500), dtype=np.float32)
+    data[7, 0, 0] = 2
+    data = da.from_array(data, chunks=(1, 500, 500))
+    layer = Image(data)
+
+    done = False
+    while not done:
+        done = layer.refine_contrast_limits(max_time=0)
+    assert layer.contrast_limits == [0, 2]
+    assert layer.contrast_limits_range == [0, 2]
+
+
 def test_gamma():
     """Test setting gamma."""
     np.random.seed(0)
@@ -515,6 +548,20 @@ def test_value():
     assert value == data[0, 0]
 
 
+def test_set_position_without_value():
+    """Test the position can be set without looking up the value."""
+    data = np.arange(16).reshape((4, 4))
+    layer = Image(data)
+    layer.position = (1, 2)
+    assert layer._value == 6
+
+    layer._set_position((0, 3, 1), update_value=False)
+    assert layer.position == (3, 1)
+    assert layer._value == 6
+    layer._update_value()
+    assert layer._value == 13
+
+
 def test_message():
     """Test converting value and coords to message."""
     np.random.seed(0)
@@ -549,6 +596,39 @@ def test_narrow_thumbnail():
     assert np.mean(thumbnail[middle_row - 1 : middle_row + 1]) > 0
 
 
+def test_thumbnail_computed_when_read():
+    """Refreshes only mark the thumbnail as outdated."""
+    np.random.seed(0)
+    layer = Image(np.random.random((3, 30, 30)))
+    layer.thumbnail
+    events = []
+    layer.events.thumbnail.connect(events.append)
+
+    for step in range(3):
+        layer._slice_dims([step, 0, 0])
+    layer.opacity = 0.5
+    assert layer._thumbnail_outdated
+    assert len(events) == 1
+
+    thumbnail = layer.thumbnail
+    assert not layer._thumbnail_outdated
+    layer._update_thumbnail()
+    np.testing.assert_array_equal(thumbnail, layer.thumbnail)
+
+
+def test_strided_thumbnail():
+    """Large slices are strided down before computing the thumbnail."""
+    data = np.zeros((4, 1000, 2000))
+    data[2, :, ::2] = 1
+    layer = Image(data, contrast_limits=[0, 1])
+    layer._slice_dims(ndisplay=3)
+    thumbnail = layer.thumbnail
+    assert thumbnail.shape == layer._thumbnail_shape
+    # the max projection is taken over the strided volume
+    middle_row = thumbnail.shape[0] // 2
+    assert np.all(thumbnail[middle_row, :, :3] == 255)
+
+
 @pytest.mark.parametrize('dtype', [np.float32, np.float64])
 def test_out_of_range_image(dtype):
     data = -1.7 - 0.001 * np.random.random((10, 15)).astype(dtype)
@@ -3,7 +3,7 @@ from skimage.transform import pyramid_gaussian
 
 from napari._tests.utils import check_layer_world_data_extent
 from napari.layers import Image
-from napari.utils import Colormap
+from napari.utils import Colormap, config
 
 
 def test_random_multiscale():
@@ -375,6 +375,37 @@ def test_thumbnail():
     assert layer.thumbnail.shape == layer._thumbnail_shape
 
 
+def test_3D_multiscale_level(monkeypatch):
+    """In 3D the coarsest level is shown until a draw selects a level."""
+    shapes = [(40, 40, 40), (20, 20, 20), (10, 10, 10)]
+    np.random.seed(0)
+    data = [np.random.random(s) for s in shapes]
+    layer = Image(data, multiscale=True)
+    layer._slice_dims(ndisplay=3)
+    assert layer.data_level == 2
+    assert layer._slice.image.raw.shape == shapes[2]
+
+    # The whole volume at level 0 is over the budget, level 1 fits
+    monkeypatch.setattr(config, 'volume_budget', 21 ** 3 * 8)
+    corners = np.array([[0, 0, 0], [39, 39, 39]])
+    layer._update_draw(1, corners, (100, 100))
+    assert layer.data_level == 1
+    assert layer._slice.image.raw.shape == (20, 20, 20)
+
+    # A smaller part in view fits at level 0 and is cropped
+    corners = np.array([[0, 10, 10], [39, 22, 22]])
+    layer._update_draw(1, corners, (100, 100))
+    assert layer.data_level == 0
+    assert layer._slice.image.raw.shape == (40, 13, 13)
+    np.testing.assert_array_equal(
+        layer._transforms['tile2data'].translate, (0, 10, 10)
+    )
+
+    # Back in 2D, the level is selected from the canvas again
+    layer._slice_dims(ndisplay=2)
+    assert layer._slice.image.raw.ndim == 2
+
+
 def test_not_create_random_multiscale():
     """Test instantiating Image layer with random 2D data."""
     shape = (20_000, 20)
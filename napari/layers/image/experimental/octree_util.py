@@ -1,7 +1,7 @@
 """OctreeDisplayOptions, NormalNoise and OctreeMetadata classes.
 """
 from dataclasses import dataclass
-from typing import NamedTuple
+from typing import NamedTuple, Tuple
 
 import numpy as np
 
@@ -20,6 +20,21 @@ def _get_tile_size() -> int:
     return octree_config['octree']['tile_size'] if octree_config else 256
 
 
+def _get_upload_budget() -> Tuple[int, float]:
+    """Return the default upload budget of each frame.
+
+    Returns
+    -------
+    Tuple[int, float]
+        The kilobytes and the milliseconds of the budget.
+    """
+    octree = octree_config['octree'] if octree_config else {}
+    return (
+        octree.get('upload_budget_kb', 1024),
+        octree.get('upload_budget_ms', 5),
+    )
+
+
 @dataclass
 class OctreeDisplayOptions:
     """Options for how to display the octree.
@@ -34,6 +49,10 @@ class OctreeDisplayOptions:
         If True the displayed tiles track the view, the normal mode.
     show_grid : bool
         If True draw a grid around the tiles for debugging or demos.
+    upload_budget_kb : int
+        Kilobytes of tiles uploaded to the card each frame, at most.
+    upload_budget_ms : float
+        Milliseconds spent uploading tiles each frame, at most.
     """
 
     def __init__(self):
@@ -69,6 +88,8 @@ class OctreeDisplayOptions:
     tile_size: int = _get_tile_size()
     freeze_level: bool = False
     track_view: bool = True
+    upload_budget_kb: int = _get_upload_budget()[0]
+    upload_budget_ms: float = _get_upload_budget()[1]
 
 
 class NormalNoise(NamedTuple):
@@ -8,10 +8,12 @@ from scipy import ndimage as ndi
 
 from ...utils import config
 from ...utils.colormaps import AVAILABLE_COLORMAPS
+from ...utils.dask_utils import concurrent_dask_loader
 from ...utils.events import Event
 from ..base import Layer
 from ..intensity_mixin import IntensityVisualizationMixin
-from ..utils.layer_utils import calc_data_range
+from ..utils.contrast_estimator import ContrastEstimator
+from ..utils.layer_utils import calc_data_range, compute_multiscale_level_3d
 from ._image_constants import Interpolation, Interpolation3D, Rendering
 from ._image_slice import ImageSlice
 from ._image_slice_data import ImageSliceData
@@ -197,6 +199,11 @@ class Image(IntensityVisualizationMixin, Layer):
         # Determine if rgb
         if rgb is None:
             rgb = guess_rgb(init_shape)
+        elif rgb and init_shape[-1] not in (3, 4):
+            raise ValueError(
+                "rgb data must have a last dimension of size 3 or 4; "
+                f"got shape {tuple(init_shape)}"
+            )
 
         # Determine dimensionality of the data
         if rgb:
@@ -247,6 +254,12 @@ class Image(IntensityVisualizationMixin, Layer):
             self._data_level = 0
             self._thumbnail_level = 0
         self.corner_pixels[1] = self.level_shapes[self._data_level]
+        # Number of displayed dimensions the corner pixels were computed for
+        self._corners_ndisplay = None
+        # Maximum size of a volume along any axis, set by the vispy layer
+        self._max_volume_shape = None
+        # Estimator of refine_contrast_limits, created on first use
+        self._contrast_estimator = None
 
         self._new_empty_slice()
 
@@ -311,17 +324,62 @@ class Image(IntensityVisualizationMixin, Layer):
         """Raw image for the current slice. (compatibility)"""
         return self._slice.image.raw
 
-    def _calc_data_range(self):
+    def _calc_data_range(self, mode='data', percentiles=None):
+        if mode == 'slice':
+            return calc_data_range(self._slice.image.raw, percentiles)
         if self.multiscale:
             input_data = self.data[-1]
         else:
             input_data = self.data
-        return calc_data_range(input_data)
+        return calc_data_range(input_data, percentiles)
+
+    def refine_contrast_limits(self, percentiles=None, max_time=0.1):
+        """Refine the contrast limits from more of the data.
+
+        The contrast limits of data with more than a million values are
+        estimated at creation from the part of the data that can be loaded
+        quickly. Each call loads more chunks of the data, sampled across all
+        of it, for up to max_time seconds, and sets the contrast limits and
+        their range from all the chunks loaded so far. Calling it
+        repeatedly, for example from a timer, progressively refines the
+        contrast limits until the whole data was loaded.
+
+        Parameters
+        ----------
+        percentiles : 2-tuple of float, optional
+            Percentiles of the values to use as contrast limits, between 0
+            and 100. If not provided, the minimum and maximum values are
+            used.
+        max_time : float
+            Seconds spent loading chunks of the data.
+
+        Returns
+        -------
+        bool
+            True once the whole data was loaded, the contrast limits are
+            then exact.
+        """
+        if self._contrast_estimator is None:
+            data = self.data[-1] if self.multiscale else self.data
+            self._contrast_estimator = ContrastEstimator(data)
+        estimator = self._contrast_estimator
+        done = estimator.refine(max_time=max_time)
+        self.contrast_limits_range = estimator.contrast_limits()
+        self.contrast_limits = estimator.contrast_limits(percentiles)
+        return done
 
     @property
     def dtype(self):
         return self.data[0].dtype if self.multiscale else self.data.dtype
 
+    @property
+    def _voxel_nbytes(self) -> int:
+        """int: Number of bytes of each voxel of the data."""
+        nbytes = np.dtype(self.dtype).itemsize
+        if self.rgb:
+            nbytes *= self.level_shapes[0][-1]
+        return nbytes
+
     @property
     def data(self):
         """array: Image data."""
@@ -330,6 +388,7 @@ class Image(IntensityVisualizationMixin, Layer):
     @data.setter
     def data(self, data):
         self._data = data
+        self._contrast_estimator = None
         self._update_dims()
         self.events.data(value=self.data)
         self._set_editable()
@@ -389,7 +448,7 @@ class Image(IntensityVisualizationMixin, Layer):
     @iso_threshold.setter
     def iso_threshold(self, value):
         self._iso_threshold = value
-        self._update_thumbnail()
+        self._invalidate_thumbnail()
         self.events.iso_threshold()
 
     @property
@@ -400,7 +459,7 @@ class Image(IntensityVisualizationMixin, Layer):
     @attenuation.setter
     def attenuation(self, value):
         self._attenuation = value
-        self._update_thumbnail()
+        self._invalidate_thumbnail()
         self.events.attenuation()
 
     @property
@@ -521,15 +580,20 @@ class Image(IntensityVisualizationMixin, Layer):
         image = raw
         return image
 
-    def _set_view_slice(self):
-        """Set the view given the indices to slice with."""
-        self._new_empty_slice()
-        not_disp = self._dims_not_displayed
+    def _slice_outside_extent(self, indices=None) -> bool:
+        """Return True if the slice is outside of the data range.
 
-        # Check if requested slice outside of data range
-        indices = np.array(self._slice_indices)
+        Parameters
+        ----------
+        indices : tuple, optional
+            Indices of the slice, the current slice if not provided.
+        """
+        not_disp = self._dims_not_displayed
+        if indices is None:
+            indices = self._slice_indices
+        indices = np.array(indices)
         extent = self._extent_data
-        if np.any(
+        return np.any(
             np.less(
                 [indices[ax] for ax in not_disp],
                 [extent[0, ax] for ax in not_disp],
@@ -539,14 +603,110 @@ class Image(IntensityVisualizationMixin, Layer):
                 [indices[ax] for ax in not_disp],
                 [extent[1, ax] for ax in not_disp],
             )
+        )
+
+    def _update_draw(self, scale_factor, corner_pixels, shape_threshold):
+        """Update canvas scale and corner values on draw.
+
+        In 3D, a multiscale image shows the finest level whose part in view
+        fits in ``config.volume_budget`` and in the maximum 3D texture size,
+        cropped to the part in view, see compute_multiscale_level_3d.
+        Otherwise the level is selected as in Layer._update_draw.
+
+        Parameters
+        ----------
+        scale_factor : float
+            Scale factor going from canvas to world coordinates.
+        corner_pixels : array
+            Coordinates of the top-left and bottom-right canvas pixels in the
+            world coordinates. In 3D, the bounds of the part of the world in
+            view.
+        shape_threshold : tuple
+            Requested shape of field of view in data coordinates.
+        """
+        if not (self.multiscale and self._ndisplay == 3):
+            self._corners_ndisplay = self._ndisplay
+            super()._update_draw(scale_factor, corner_pixels, shape_threshold)
+            return
+
+        self.scale_factor = scale_factor
+        data_corners = self._data_corners(corner_pixels)
+        level, displayed_corners = compute_multiscale_level_3d(
+            data_corners[:, self._dims_displayed],
+            self.downsample_factors[:, self._dims_displayed],
+            self._voxel_nbytes,
+            config.volume_budget,
+            self._max_volume_shape,
+        )
+        corners = np.zeros((2, self.ndim), dtype=int)
+        corners[:, self._dims_displayed] = displayed_corners
+        if (
+            self.data_level != level
+            or not np.all(self.corner_pixels == corners)
+            or self._corners_ndisplay != 3
         ):
+            self._data_level = level
+            self.corner_pixels = corners
+            self._corners_ndisplay = 3
+            self.refresh()
+
+    def _slice_loader(self, dims_point=None):
+        """Return a function loading the image of a slice in a worker thread.
+
+        Only single scale images are loaded ahead, and only when loading is
+        synchronous, since the ChunkLoader already loads in worker threads.
+
+        Parameters
+        ----------
+        dims_point : list, optional
+            Values of the layer dims in world coordinates of the slice to
+            load. If not provided, the current slice is loaded.
+
+        Returns
+        -------
+        loader : callable or None
+            Function returning the loaded ImageSliceData, or None if there
+            is nothing to load ahead.
+        """
+        if config.async_loading or self.multiscale or not self.visible:
+            return None
+        if dims_point is None:
+            dims_point = self._dims_point
+        indices = self._get_slice_indices(dims_point)
+        if self._slice_outside_extent(indices):
+            return None
+        data = ImageSliceData(self, indices, None, None)
+        image = self.data
+        load = concurrent_dask_loader()
+
+        def load_slice():
+            data.image = load(image[indices])
+            return data
+
+        return load_slice
+
+    def _set_view_slice(self):
+        """Set the view given the indices to slice with."""
+        self._new_empty_slice()
+        not_disp = self._dims_not_displayed
+
+        # Check if requested slice outside of data range
+        if self._slice_outside_extent():
             return
         self._empty = False
 
         if self.multiscale:
-            # If 3d redering just show lowest level of multiscale
-            if self._ndisplay == 3:
-                self.data_level = len(self.data) - 1
+            if self._ndisplay == 3 and self._corners_ndisplay != 3:
+                # Until a draw tells which part of the volume is in view,
+                # show all of the coarsest level. The draw then picks the
+                # finest level whose part in view fits the volume budget.
+                self._data_level = len(self.data) - 1
+                self.corner_pixels = np.array(
+                    [
+                        np.zeros(self.ndim, dtype=int),
+                        self.level_shapes[self._data_level] - 1,
+                    ]
+                )
 
             # Slice currently viewed level
             level = self.data_level
@@ -567,16 +727,15 @@ class Image(IntensityVisualizationMixin, Layer):
                 scale[d] = self.downsample_factors[self.data_level][d]
             self._transforms['tile2data'].scale = scale
 
-            if self._ndisplay == 2:
-                for d in self._dims_displayed:
-                    indices[d] = slice(
-                        self.corner_pixels[0, d],
-                        self.corner_pixels[1, d] + 1,
-                        1,
-                    )
-                self._transforms['tile2data'].translate = (
-                    self.corner_pixels[0] * self._transforms['tile2data'].scale
+            for d in self._dims_displayed:
+                indices[d] = slice(
+                    self.corner_pixels[0, d],
+                    self.corner_pixels[1, d] + 1,
+                    1,
                 )
+            self._transforms['tile2data'].translate = (
+                self.corner_pixels[0] * self._transforms['tile2data'].scale
+            )
             image = self.data[level][tuple(indices)]
             image_indices = indices
 
@@ -600,7 +759,12 @@ class Image(IntensityVisualizationMixin, Layer):
         else:
             self._transforms['tile2data'].scale = np.ones(self.ndim)
             image_indices = self._slice_indices
-            image = self.data[image_indices]
+            loaded = self._loaded_slice_data
+            if loaded is not None and loaded.indices == image_indices:
+                # The image was already loaded by the LayerSlicer
+                image = loaded.image
+            else:
+                image = self.data[image_indices]
 
             # For single-scale we don't request a separate thumbnail_source
             # from the ChunkLoader because in ImageSlice.chunk_loaded we
@@ -664,7 +828,7 @@ class Image(IntensityVisualizationMixin, Layer):
             # set_view_slice()" method that we can call?
 
             self.events.set_data()  # update vispy
-            self._update_thumbnail()
+            self._invalidate_thumbnail()
 
     def _update_thumbnail(self):
         """Update thumbnail with current image data and colormap."""
@@ -675,6 +839,18 @@ class Image(IntensityVisualizationMixin, Layer):
 
         image = self._slice.thumbnail.view
 
+        # The thumbnail only needs about as many pixels as it has, so stride
+        # through the slice before projecting and zooming it
+        yx_axes = (
+            range(image.ndim)[-3:-1] if self.rgb else range(image.ndim)[-2:]
+        )
+        strided = [slice(None)] * image.ndim
+        for axis, size in zip(yx_axes, self._thumbnail_shape[:2]):
+            strided[axis] = slice(
+                None, None, max(image.shape[axis] // size, 1)
+            )
+        image = image[tuple(strided)]
+
         if self._ndisplay == 3 and self.ndim > 2:
             image = np.max(image, axis=0)
 
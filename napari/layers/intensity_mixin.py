@@ -28,9 +28,20 @@ class IntensityVisualizationMixin:
         self._contrast_limits = [None, None]
         self._contrast_limits_range = [None, None]
 
-    def reset_contrast_limits(self):
-        """Scale contrast limits to data range"""
-        data_range = self._calc_data_range()
+    def reset_contrast_limits(self, mode='data', percentiles=None):
+        """Scale contrast limits to data range.
+
+        Parameters
+        ----------
+        mode : {'data', 'slice'}
+            Whether to use the range of the whole data, or the range of the
+            data of the current slice only, which is cheap to compute.
+        percentiles : 2-tuple of float, optional
+            Percentiles of the values to use as limits, between 0 and 100,
+            for example (1, 99) to ignore outliers. If not provided, the
+            minimum and maximum values are used.
+        """
+        data_range = self._calc_data_range(mode=mode, percentiles=percentiles)
         self.contrast_limits = data_range
 
     def reset_contrast_limits_range(self):
@@ -51,7 +62,7 @@ class IntensityVisualizationMixin:
     @colormap.setter
     def colormap(self, colormap):
         self._colormap = ensure_colormap(colormap)
-        self._update_thumbnail()
+        self._invalidate_thumbnail()
         self.events.colormap()
 
     @property
@@ -78,7 +89,7 @@ class IntensityVisualizationMixin:
         newrange[0] = min(newrange[0], contrast_limits[0])
         newrange[1] = max(newrange[1], contrast_limits[1])
         self.contrast_limits_range = newrange
-        self._update_thumbnail()
+        self._invalidate_thumbnail()
         self.events.contrast_limits()
 
     @property
@@ -117,5 +128,5 @@ class IntensityVisualizationMixin:
     @gamma.setter
     def gamma(self, value):
         self._gamma = value
-        self._update_thumbnail()
+        self._invalidate_thumbnail()
         self.events.gamma()
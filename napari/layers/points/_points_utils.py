@@ -76,3 +76,130 @@ def points_in_box(corners, points, sizes):
     # Determine indices of points which have at least one corner inside box
     inside = np.unique(point_corners_in_box % len(points))
     return list(inside)
+
+
+def compact_sizes(size, shape):
+    """Store the sizes of points in their most compact form.
+
+    Parameters
+    ----------
+    size : float or array
+        Sizes broadcastable to ``shape``, or to its transpose so that an
+        (N,) array gives the size of each point.
+    shape : tuple of int
+        Shape (N, D) of the data of the points.
+
+    Returns
+    -------
+    sizes : np.ndarray
+        A 0-d array if all points have the same size in every dimension,
+        an (N,) array if each point has the same size in every dimension,
+        otherwise an (N, D) array.
+    """
+    size = np.asarray(size)
+    per_point = False
+    try:
+        sizes = np.broadcast_to(size, shape)
+    except ValueError:
+        try:
+            sizes = np.broadcast_to(size, shape[::-1]).T
+        except ValueError:
+            raise ValueError("Size is not compatible for broadcasting")
+        per_point = size.ndim == 1
+
+    if size.ndim == 0:
+        return size.copy()
+    if per_point:
+        isotropic = size
+    elif np.all(sizes == sizes[:, :1]):
+        isotropic = sizes[:, 0]
+    else:
+        return sizes.copy()
+    if len(isotropic) > 0 and np.all(isotropic == isotropic[0]):
+        return np.array(isotropic[0])
+    return np.array(isotropic)
+
+
+def expand_sizes(sizes, shape):
+    """Broadcast compact sizes of points to their full shape.
+
+    Parameters
+    ----------
+    sizes : np.ndarray
+        Sizes as returned by ``compact_sizes``.
+    shape : tuple of int
+        Shape (N, D) of the data of the points.
+
+    Returns
+    -------
+    sizes : (N, D) np.ndarray
+        Read-only view of the size of each point in each dimension.
+    """
+    if sizes.ndim == 1:
+        sizes = sizes[:, np.newaxis]
+    return np.broadcast_to(sizes, shape)
+
+
+class ExpandedSizes(np.ndarray):
+    """Sizes of points expanded to their full shape, written back on edit.
+
+    A copy of the sizes of a layer, whose item assignments set the sizes of
+    the layer, so that they can be edited in place while the layer keeps
+    them compact. Views and results of operations are plain copies, they
+    do not write back.
+    """
+
+    def __new__(cls, sizes, layer):
+        array = np.array(sizes).view(cls)
+        array._layer = layer
+        return array
+
+    def __array_finalize__(self, obj):
+        self._layer = None
+
+    def __setitem__(self, index, value):
+        super().__setitem__(index, value)
+        if self._layer is not None:
+            self._layer.size = self.view(np.ndarray)
+
+
+def concatenate_sizes(sizes, n_points, new_sizes, n_new):
+    """Append the compact sizes of new points to the ones of other points.
+
+    Parameters
+    ----------
+    sizes : np.ndarray
+        Compact sizes of the points.
+    n_points : int
+        Number of points.
+    new_sizes : np.ndarray
+        Compact sizes of the new points.
+    n_new : int
+        Number of new points.
+
+    Returns
+    -------
+    sizes : np.ndarray
+        Compact sizes of all the points, in the least compact form of the
+        two.
+    """
+    if n_new == 0:
+        return sizes
+    if n_points == 0:
+        return new_sizes
+    if sizes.ndim == 0 and new_sizes.ndim == 0 and sizes == new_sizes:
+        return sizes
+    if sizes.ndim <= 1 and new_sizes.ndim <= 1:
+        return np.concatenate(
+            [
+                np.broadcast_to(sizes, (n_points,)),
+                np.broadcast_to(new_sizes, (n_new,)),
+            ]
+        )
+    ndim = sizes.shape[-1] if sizes.ndim == 2 else new_sizes.shape[-1]
+    return np.concatenate(
+        [
+            expand_sizes(sizes, (n_points, ndim)),
+            expand_sizes(new_sizes, (n_new, ndim)),
+        ]
+    )
@@ -8,7 +8,7 @@ from vispy.color import get_colormap
 
 from napari._tests.utils import check_layer_world_data_extent
 from napari.layers import Points
-from napari.layers.points._points_utils import points_to_squares
+from napari.layers.points._points_utils import expand_sizes, points_to_squares
 from napari.utils.colormaps.standardize_color import transform_color
 
 
@@ -473,6 +473,51 @@ def test_properties(properties):
     assert np.all(layer.properties['point_type'] == paste_annotations)
 
 
+def test_remove_keeps_given_properties():
+    """Removing points does not change the properties given to the layer."""
+    properties = {'label': np.array(['a', 'b', 'c', 'd'])}
+    layer = Points(np.random.random((4, 2)), properties=properties)
+    layer.selected_data = {0}
+    layer.remove_selected()
+    np.testing.assert_equal(properties['label'], ['a', 'b', 'c', 'd'])
+    np.testing.assert_equal(layer.properties['label'], ['b', 'c', 'd'])
+
+    state = layer._get_state()
+    state.pop('text')
+    new_layer = Points(**state)
+    assert len(new_layer.data) == 3
+    np.testing.assert_equal(new_layer.properties['label'], ['b', 'c', 'd'])
+
+
+def test_remove_without_properties():
+    """Points without properties can be removed after a state round trip."""
+    np.random.seed(0)
+    layer = Points(**Points(np.random.random((5, 2)))._get_state())
+    layer.selected_data = {0, 1}
+    layer.remove_selected()
+    assert len(layer.data) == 3
+
+    layer = Points(np.random.random((5, 2)), properties={})
+    layer.add([10, 10])
+    layer.selected_data = {0, 5}
+    layer.remove_selected()
+    assert len(layer.data) == 4
+    assert layer.properties == {}
+
+
+def test_set_property_in_dict():
+    """Adding a key to the properties adds a property to the points."""
+    np.random.seed(0)
+    layer = Points(np.random.random((3, 2)))
+    values = np.array(['a', 'b', 'c'])
+    layer.properties['label'] = values
+    assert layer.properties == {'label': values}
+
+    layer.selected_data = {0}
+    layer.remove_selected()
+    np.testing.assert_equal(layer.properties['label'], ['b', 'c'])
+
+
 @pytest.mark.parametrize("attribute", ['edge', 'face'])
 def test_adding_properties(attribute):
     """Test adding properties to an existing layer"""
@@ -650,6 +695,33 @@ def test_refresh_text():
     np.testing.assert_equal(layer.text.values, new_properties['point_type'])
 
 
+def test_declutter_text():
+    """Test only drawing one text element per text sized cell"""
+    data = np.array([[0, 0], [1, 1], [50, 50], [50, 51]])
+    properties = {'point_type': ['A', 'B', 'C', 'D']}
+    layer = Points(
+        data,
+        properties=copy(properties),
+        text={'text': 'point_type', 'size': 10, 'declutter': True},
+    )
+    layer._update_draw(
+        scale_factor=1,
+        corner_pixels=np.array([[0, 0], [100, 100]]),
+        shape_threshold=(100, 100),
+    )
+    np.testing.assert_equal(layer._view_text, ['A', 'C'])
+    text_coords, _, _ = layer._view_text_coords
+    np.testing.assert_equal(text_coords, [[0, 0], [50, 50]])
+
+    # Zooming in separates the text elements
+    layer._update_draw(
+        scale_factor=0.1,
+        corner_pixels=np.array([[0, 0], [100, 100]]),
+        shape_threshold=(100, 100),
+    )
+    np.testing.assert_equal(layer._view_text, ['A', 'B', 'C', 'D'])
+
+
 def test_points_errors():
     shape = (3, 2)
     np.random.seed(0)
@@ -1300,6 +1372,101 @@ def test_size_with_3D_arrays():
     assert np.all(layer.size[0] == [0, 16, 16])
 
 
+def test_size_compact():
+    """Test that sizes are stored in their most compact form."""
+    shape = (10, 3)
+    np.random.seed(0)
+    data = 20 * np.random.random(shape)
+    data[:5, 0] = 0
+    layer = Points(data, size=5)
+    assert layer._size.ndim == 0
+
+    sizes = 5 * np.random.random(shape[0])
+    layer.size = sizes
+    assert layer._size.shape == (10,)
+    np.testing.assert_array_equal(
+        expand_sizes(layer._size, shape), np.tile(sizes, (3, 1)).T
+    )
+
+    layer.size = [1, 5, 5]
+    assert layer._size.shape == shape
+
+    # Isotropic sizes broadcast to the data are compacted too
+    layer.size = np.full(shape, 3)
+    assert layer._size.ndim == 0
+
+    # Adding a point with the current size keeps the sizes compact
+    layer.current_size = 3
+    layer.add([0, 18, 18])
+    assert layer._size.ndim == 0
+    layer.selected_data = set()
+    layer.current_size = 13
+    layer.add([0, 19, 19])
+    assert layer._size.ndim == 2
+    np.testing.assert_array_equal(layer.size[-1], [3, 13, 13])
+
+    # Changing the size of selected points gives one size per point
+    layer.size = 3
+    layer.selected_data = {0, 1}
+    layer.current_size = 7
+    assert layer._size.shape == (12,)
+    np.testing.assert_array_equal(layer._size[:3], [7, 7, 3])
+
+    # Sizes are sliced and saved in their compact form
+    layer._slice_dims([0, slice(None), slice(None)])
+    np.testing.assert_array_equal(layer._view_size[:3], [7, 7, 3])
+    layer.n_dimensional = True
+    assert len(layer._view_size) == len(layer._indices_view)
+    state = layer._get_state()
+    assert state['size'].shape == (12, 3)
+    new_layer = Points(**state)
+    assert new_layer._size.shape == (12,)
+    np.testing.assert_array_equal(new_layer._size, layer._size)
+
+    # Pasted points keep their sizes
+    layer.selected_data = {0, 2}
+    layer._copy_data()
+    layer._paste_data()
+    assert layer._size.shape == (14,)
+    np.testing.assert_array_equal(layer._size[-2:], [7, 3])
+
+    layer.selected_data = {0, 1}
+    layer.remove_selected()
+    assert layer._size.shape == (12,)
+
+
+def test_size_edit_in_place():
+    """Test editing compact sizes in place, which keeps them compact."""
+    shape = (10, 3)
+    np.random.seed(0)
+    data = 20 * np.random.random(shape)
+    layer = Points(data, size=5)
+    assert layer._size.ndim == 0
+
+    # reading the sizes does not expand them
+    sizes = layer.size
+    assert sizes.shape == shape
+    assert layer._size.ndim == 0
+
+    layer.size[0, :] = 9
+    assert layer._size.shape == (10,)
+    np.testing.assert_array_equal(layer.size[0], [9, 9, 9])
+    np.testing.assert_array_equal(layer.size[1:], 5)
+    layer.size[1, 2] = 3
+    assert layer._size.shape == shape
+    np.testing.assert_array_equal(layer.size[:2], [[9, 9, 9], [5, 5, 3]])
+
+    # copies and views of compact sizes do not write back
+    layer.size = 5
+    state = layer._get_state()
+    state['size'][1] = 7
+    row = layer.size[2]
+    row[:] = 7
+    (layer.size + 1)[3] = 7
+    np.testing.assert_array_equal(layer.size, 5)
+    assert layer._size.ndim == 0
+
+
 def test_copy_and_paste():
     """Test copying and pasting selected points."""
     shape = (10, 2)
@@ -1464,6 +1631,81 @@ def test_view_colors():
     assert len(layer._view_edge_color) == 0
 
 
+def test_view_arrays_cached():
+    """The arrays in view are kept until the data, sizes or colors change."""
+    coords = np.array([[0, 1, 1], [0, 2, 2], [1, 3, 3]])
+    layer = Points(coords, size=2, face_color='red')
+    layer._slice_dims([0, slice(None), slice(None)])
+    view_data = layer._view_data
+    assert layer._view_data is view_data
+    assert not view_data.flags.writeable
+
+    layer.face_color = 'blue'
+    np.testing.assert_array_equal(
+        layer._view_face_color, transform_color(['blue'] * 2)
+    )
+
+    layer.size = 4
+    np.testing.assert_array_equal(layer._view_size, [4, 4])
+
+    layer.data = coords + [0, 1, 1]
+    assert layer._view_data is not view_data
+    np.testing.assert_array_equal(layer._view_data, [[2, 2], [3, 3]])
+
+    layer.selected_data = {0}
+    layer.remove_selected()
+    np.testing.assert_array_equal(layer._view_data, [[3, 3]])
+
+
+def test_hover_highlight():
+    """Test that hovering only highlights the hovered point again."""
+    coords = np.array([[0, 21, 21], [1, 22, 22], [0, 23, 23], [0, 24, 24]])
+    layer = Points(coords, size=1)
+    layer.mode = 'select'
+    layer._slice_dims([0, slice(None), slice(None)])
+
+    events = []
+    layer.events.highlight.connect(
+        lambda event: events.append(event.selection_changed)
+    )
+    layer.selected_data = {0, 1, 2}
+    np.testing.assert_array_equal(layer._selected_view, [0, 1])
+    assert events == [True]
+    np.testing.assert_array_equal(layer._highlight_index, [0, 1])
+
+    # the hovered point is at the third position in view
+    layer._value = 3
+    layer._set_highlight()
+    layer._set_highlight()
+    assert events == [True, False]
+    assert layer._hover_index == [2]
+    np.testing.assert_array_equal(layer._highlight_index, [0, 1])
+
+    # selected or out of view points are not highlighted as hovered
+    layer._value = 2
+    layer._set_highlight()
+    assert layer._hover_index == []
+    layer._value = 1
+    layer._set_highlight()
+    assert layer._hover_index == []
+
+
+def test_highlight_in_batch():
+    """Test that a batch does not lose a change of the selection."""
+    layer = Points(np.array([[0, 0], [1, 1], [2, 2], [3, 3]]))
+    layer.mode = 'select'
+    events = []
+    layer.events.highlight.connect(
+        lambda event: events.append(event.selection_changed)
+    )
+    with layer.batch():
+        layer.selected_data = {0, 1}
+        layer._set_highlight()
+        layer._value = 2
+        layer._set_highlight()
+    assert True in events
+
+
 def test_interaction_box():
     """Test the boxes calculated for selected points"""
     data = [[3, 3]]
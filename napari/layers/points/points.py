@@ -23,12 +23,21 @@ from ..utils.color_transformations import (
 from ..utils.layer_utils import (
     dataframe_to_properties,
     guess_continuous,
+    map_color_cycle,
     map_property,
 )
+from ..utils.property_table import PropertyTable
 from ..utils.text import TextManager
 from ._points_constants import SYMBOL_ALIAS, ColorMode, Mode, Symbol
 from ._points_mouse_bindings import add, highlight, select
-from ._points_utils import create_box, points_to_squares
+from ._points_utils import (
+    ExpandedSizes,
+    compact_sizes,
+    concatenate_sizes,
+    create_box,
+    expand_sizes,
+    points_to_squares,
+)
 
 DEFAULT_COLOR_CYCLE = np.array([[1, 0, 1, 1], [0, 1, 0, 1]])
 
@@ -60,7 +69,8 @@ class Points(Layer):
     size : float, array
         Size of the point marker. If given as a scalar, all points are made
         the same size. If given as an array, size must be the same
-        broadcastable to the same shape as the data.
+        broadcastable to the same shape as the data. An (N,) array gives
+        the size of each point in every dimension.
     edge_width : float
         Width of the symbol edge in pixels.
     edge_color : str, array-like
@@ -138,7 +148,8 @@ class Points(Layer):
         Symbol used for all point markers.
     size : array (N, D)
         Array of sizes for each point in each dimension. Must have the same
-        shape as the layer `data`.
+        shape as the layer `data`. Unless the sizes differ between
+        dimensions, this is a read-only view of more compact sizes.
     edge_width : float
         Width of the marker edges in pixels for all points
     edge_color : Nx4 numpy array
@@ -212,13 +223,23 @@ class Points(Layer):
         If properties is not provided, it will be {} (empty dictionary).
     _view_data : array (M, 2)
         2D coordinates of points in the currently viewed slice.
+    _size : array (), (N,) or (N, D)
+        Sizes of the points, stored as a scalar if all points have the same
+        size, as one size per point if each point has the same size in
+        every dimension, and for each point in each dimension otherwise.
     _view_size : array (M, )
         Size of the point markers in the currently viewed slice.
     _indices_view : array (M, )
         Integer indices of the points in the currently viewed slice.
-    _selected_view :
-        Integer indices of selected points in the currently viewed slice within
-        the `_view_data` array.
+    _selected_view : array (K, )
+        Sorted integer indices of selected points in the currently viewed
+        slice within the `_view_data` array.
+    _highlight_index : array (K, )
+        Sorted integer indices within the `_view_data` array of the selected
+        points to highlight.
+    _hover_index : list
+        Index within the `_view_data` array of the hovered point to
+        highlight, if it is not already highlighted as a selected point.
     _selected_box : array (4, 2) or None
         Four corners of any box either around currently selected points or
         being created during a drag action. Starting in the top left and
@@ -305,16 +326,21 @@ class Points(Layer):
 
         self._colors = get_color_namelist()
 
+        # Arrays of the points in view, computed when first needed
+        self._view_cache = {}
+
         # Save the point coordinates
         self._data = np.asarray(data)
 
         # Save the properties
         if properties is None:
-            self._properties = {}
+            self._property_table = PropertyTable(n_rows=len(data))
             self._property_choices = {}
         elif len(data) > 0:
             properties, _ = dataframe_to_properties(properties)
-            self._properties = self._validate_properties(properties)
+            self._property_table = PropertyTable(
+                self._validate_properties(properties), n_rows=len(data)
+            )
             self._property_choices = {
                 k: np.unique(v) for k, v in properties.items()
             }
@@ -326,7 +352,7 @@ class Points(Layer):
                 k: np.empty(0, dtype=v.dtype)
                 for k, v in self._property_choices.items()
             }
-            self._properties = empty_properties
+            self._property_table = PropertyTable(empty_properties, n_rows=0)
 
         # make the text
         if text is None or isinstance(text, (list, np.ndarray, str)):
@@ -355,10 +381,12 @@ class Points(Layer):
 
         # Indices of selected points
         self._selected_data = set()
-        self._selected_data_stored = set()
+        # Set whenever the selected points in view change, so that their
+        # highlight is only updated when needed
+        self._selection_changed = True
         self._selected_data_history = set()
         # Indices of selected points within the currently viewed slice
-        self._selected_view = []
+        self._selected_view = np.empty(0, dtype=int)
         # Index of hovered point
         self._value = None
         self._value_stored = None
@@ -366,6 +394,7 @@ class Points(Layer):
         self._mode_history = self._mode
         self._status = self.mode
         self._highlight_index = []
+        self._hover_index = []
         self._highlight_box = None
 
         self._drag_start = None
@@ -480,6 +509,7 @@ class Points(Layer):
     def data(self, data: np.ndarray):
         cur_npoints = len(self._data)
         self._data = data
+        self._invalidate_view_cache()
 
         # Adjust the size array when the number of points has changed
         if len(data) < cur_npoints:
@@ -488,34 +518,31 @@ class Points(Layer):
             with self.events.set_data.blocker():
                 self._edge_color = self.edge_color[: len(data)]
                 self._face_color = self.face_color[: len(data)]
-                self._size = self._size[: len(data)]
-
-                for k in self.properties:
-                    self.properties[k] = self.properties[k][: len(data)]
+                if self._size.ndim > 0:
+                    self._size = self._size[: len(data)]
+                self._property_table.remove_rows(
+                    np.arange(len(data), len(self._property_table))
+                )
 
         elif len(data) > cur_npoints:
             # If there are now more points, add the size and colors of the
             # new ones
             with self.events.set_data.blocker():
                 adding = len(data) - cur_npoints
-                if len(self._size) > 0:
-                    new_size = copy(self._size[-1])
+                if cur_npoints > 0:
+                    new_size = np.array(
+                        expand_sizes(self._size, (cur_npoints, data.shape[1]))[
+                            -1
+                        ]
+                    )
                     for i in self._dims_displayed:
                         new_size[i] = self.current_size
                 else:
                     # Add the default size, with a value for each dimension
-                    new_size = np.repeat(
-                        self.current_size, self._size.shape[1]
-                    )
-                size = np.repeat([new_size], adding, axis=0)
+                    new_size = np.repeat(self.current_size, data.shape[1])
+                size = compact_sizes(new_size, (adding, data.shape[1]))
 
-                for k in self.properties:
-                    new_property = np.repeat(
-                        self.current_properties[k], adding, axis=0
-                    )
-                    self.properties[k] = np.concatenate(
-                        (self.properties[k], new_property), axis=0
-                    )
+                self._property_table.add_rows(self.current_properties, adding)
 
                 # add new edge colors
                 self._add_point_color(adding, 'edge')
@@ -523,7 +550,10 @@ class Points(Layer):
                 # add new face colors
                 self._add_point_color(adding, 'face')
 
-                self.size = np.concatenate((self._size, size), axis=0)
+                self._size = concatenate_sizes(
+                    self._size, cur_npoints, size, adding
+                )
+                self.refresh()
                 self.selected_data = set(np.arange(cur_npoints, len(data)))
 
                 self.text.add(self.current_properties, adding)
@@ -607,15 +637,17 @@ class Points(Layer):
     @property
     def properties(self) -> Dict[str, np.ndarray]:
         """dict {str: np.ndarray (N,)}, DataFrame: Annotations for each point"""
-        return self._properties
+        return self._property_table.columns
 
     @properties.setter
     def properties(self, properties: Dict[str, np.ndarray]):
         if not isinstance(properties, dict):
             properties, _ = dataframe_to_properties(properties)
-        self._properties = self._validate_properties(properties)
+        self._property_table = PropertyTable(
+            self._validate_properties(properties), n_rows=len(self.data)
+        )
         if self._face_color_property and (
-            self._face_color_property not in self._properties
+            self._face_color_property not in self._property_table
         ):
             self._face_color_property = ''
             warnings.warn(
@@ -623,14 +655,14 @@ class Points(Layer):
             )
 
         if self._edge_color_property and (
-            self._edge_color_property not in self._properties
+            self._edge_color_property not in self._property_table
         ):
             self._edge_color_property = ''
             warnings.warn(
                 'property used for edge_color dropped', RuntimeWarning
             )
 
-        if self.text.values is not None:
+        if self.text._values is not None:
             self.refresh_text()
         self.events.properties()
 
@@ -740,20 +772,21 @@ class Points(Layer):
 
     @property
     def size(self) -> Union[int, float, np.ndarray, list]:
-        """(N, D) array: size of all N points in D dimensions."""
-        return self._size
+        """(N, D) array: size of all N points in D dimensions.
+
+        Compact sizes are returned as an ExpandedSizes copy, whose item
+        assignments set the sizes of the layer.
+        """
+        if self._size.ndim == 2:
+            return self._size
+        return ExpandedSizes(
+            expand_sizes(self._size, self.data.shape), layer=self
+        )
 
     @size.setter
     def size(self, size: Union[int, float, np.ndarray, list]) -> None:
-        try:
-            self._size = np.broadcast_to(size, self.data.shape).copy()
-        except Exception:
-            try:
-                self._size = np.broadcast_to(
-                    size, self.data.shape[::-1]
-                ).T.copy()
-            except Exception:
-                raise ValueError("Size is not compatible for broadcasting")
+        self._size = compact_sizes(size, self.data.shape)
+        self._invalidate_view_cache('size')
         self.refresh()
 
     @property
@@ -769,8 +802,16 @@ class Points(Layer):
             and len(self.selected_data) > 0
             and self._mode != Mode.ADD
         ):
-            for i in self.selected_data:
-                self.size[i, :] = (self.size[i, :] > 0) * size
+            index = list(self.selected_data)
+            if self._size.ndim == 2:
+                self._size[index] = (self._size[index] > 0) * size
+            else:
+                sizes = np.broadcast_to(self._size, len(self.data)).copy()
+                sizes[index] = (sizes[index] > 0) * size
+                self._size = compact_sizes(
+                    sizes[:, np.newaxis], self.data.shape
+                )
+            self._invalidate_view_cache('size')
             self.refresh()
             self.events.size()
 
@@ -1036,6 +1077,7 @@ class Points(Layer):
             setattr(self, f'_{attribute}_color', colors)
             setattr(self, f'_{attribute}_color_mode', ColorMode.DIRECT)
 
+            self._invalidate_view_cache(f'{attribute}_color')
             color_event = getattr(self.events, f'{attribute}_color')
             color_event()
 
@@ -1115,57 +1157,29 @@ class Points(Layer):
             if color_mode == ColorMode.CYCLE:
                 color_property = getattr(self, f'_{attribute}_color_property')
                 color_properties = self.properties[color_property]
-                if update_color_mapping:
-                    color_cycle = getattr(self, f'_{attribute}_color_cycle')
-                    if isinstance(color_cycle, dict):
-                        color_cycle_map = color_cycle
-                    else:
-                        color_cycle_map = {
-                            k: np.squeeze(transform_color(c))
-                            for k, c in zip(
-                                np.unique(color_properties), color_cycle
-                            )
-                        }
-                    setattr(
-                        self, f'{attribute}_color_cycle_map', color_cycle_map
-                    )
-
-                else:
-                    # add properties if they are not in the colormap
-                    # and update_color_mapping==False
+                color_cycle = getattr(self, f'_{attribute}_color_cycle')
+                if not update_color_mapping:
+                    # keep the current mapping, categories that are not
+                    # in it yet get the next colors of the cycle
                     color_cycle_map = getattr(
                         self, f'{attribute}_color_cycle_map'
                     )
-                    color_cycle_keys = [*color_cycle_map]
-                    props_in_map = np.in1d(color_properties, color_cycle_keys)
-                    if not np.all(props_in_map):
-                        props_to_add = np.unique(
-                            color_properties[np.logical_not(props_in_map)]
-                        )
-                        color_cycle = getattr(
-                            self, f'_{attribute}_color_cycle'
-                        )
-                        for prop in props_to_add:
-                            color_cycle_map[prop] = np.squeeze(
-                                transform_color(
-                                    color_cycle[prop]
-                                    if isinstance(color_cycle, dict)
-                                    and prop in color_cycle
-                                    else color_cycle[None]
-                                    if isinstance(color_cycle, dict)
-                                    else next(color_cycle)
-                                )
-                            )
-                        setattr(
-                            self,
-                            f'{attribute}_color_cycle_map',
-                            color_cycle_map,
-                        )
-                colors = np.array(
-                    [color_cycle_map[x] for x in color_properties]
+                elif isinstance(color_cycle, dict):
+                    color_cycle_map = color_cycle
+                else:
+                    color_cycle_map = {}
+
+                def new_color(prop):
+                    if isinstance(color_cycle, dict):
+                        color = color_cycle.get(prop, color_cycle[None])
+                    else:
+                        color = next(color_cycle)
+                    return np.squeeze(transform_color(color))
+
+                colors = map_color_cycle(
+                    color_properties, color_cycle_map, new_color
                 )
-                if len(colors) == 0:
-                    colors = np.empty((0, 4))
+                setattr(self, f'{attribute}_color_cycle_map', color_cycle_map)
                 setattr(self, f'_{attribute}_color', colors)
 
             elif color_mode == ColorMode.COLORMAP:
@@ -1197,6 +1211,7 @@ class Points(Layer):
                     colors = np.empty((0, 4))
                 setattr(self, f'_{attribute}_color', colors)
 
+            self._invalidate_view_cache(f'{attribute}_color')
             color_event = getattr(self.events, f'{attribute}_color')
             color_event()
 
@@ -1240,7 +1255,7 @@ class Points(Layer):
                 'properties': self.properties,
                 'text': self.text._get_state(),
                 'n_dimensional': self.n_dimensional,
-                'size': self.size,
+                'size': np.array(expand_sizes(self._size, self.data.shape)),
                 'ndim': self.ndim,
                 'data': self.data,
             }
@@ -1255,13 +1270,8 @@ class Points(Layer):
     @selected_data.setter
     def selected_data(self, selected_data):
         self._selected_data = set(selected_data)
-        self._selected_view = list(
-            np.intersect1d(
-                np.array(list(self._selected_data)),
-                self._indices_view,
-                return_indices=True,
-            )[2]
-        )
+        self._selected_view = self._view_positions(self._selected_data)
+        self._selection_changed = True
 
         # Update properties based on selected points
         if len(self._selected_data) == 0:
@@ -1280,7 +1290,8 @@ class Points(Layer):
             with self.block_update_properties():
                 self.current_face_color = face_color
 
-        size = list({self.size[i, self._dims_displayed].mean() for i in index})
+        sizes = expand_sizes(self._size, self.data.shape)
+        size = list({sizes[i, self._dims_displayed].mean() for i in index})
         if len(size) == 1:
             size = size[0]
             with self.block_update_properties():
@@ -1374,7 +1385,7 @@ class Points(Layer):
             raise ValueError("Mode not recognized")
 
         if not (mode == Mode.SELECT and old_mode == Mode.SELECT):
-            self._selected_data_stored = set()
+            self._selection_changed = True
 
         self._mode = mode
         self._set_highlight()
@@ -1390,14 +1401,16 @@ class Points(Layer):
         view_data : (N x D) np.ndarray
             Array of coordinates for the N points in view
         """
-        if len(self._indices_view) > 0:
-
-            data = self.data[np.ix_(self._indices_view, self._dims_displayed)]
-
-        else:
-            # if no points in this slice send dummy data
-            data = np.zeros((0, self._ndisplay))
-
+        data = self._view_cache.get('data')
+        if data is None:
+            if len(self._indices_view) > 0:
+                data = self.data[
+                    np.ix_(self._indices_view, self._dims_displayed)
+                ]
+            else:
+                # if no points in this slice send dummy data
+                data = np.zeros((0, self._ndisplay))
+            data = self._cache_view_array('data', data)
         return data
 
     @property
@@ -1409,7 +1422,8 @@ class Points(Layer):
         text : (N x 1) np.ndarray
             Array of text strings for the N text elements in view
         """
-        return self.text.view_text(self._indices_view)
+        indices_view = np.asarray(self._indices_view, dtype=int)
+        return self.text.view_text(indices_view[self._view_text_positions])
 
     @property
     def _view_text_coords(self) -> np.ndarray:
@@ -1420,7 +1434,45 @@ class Points(Layer):
         text_coords : (N x D) np.ndarray
             Array of coordindates for the N text elements in view
         """
-        return self.text.compute_text_coords(self._view_data, self._ndisplay)
+        text_coords, anchor_x, anchor_y = self.text.compute_text_coords(
+            self._view_data, self._ndisplay
+        )
+        return text_coords[self._view_text_positions], anchor_x, anchor_y
+
+    @property
+    def _view_text_positions(self):
+        """Positions among the points in view of the text elements to draw.
+
+        Returns
+        -------
+        positions : slice or np.ndarray
+            All the points in view, unless the text is decluttered.
+        """
+        if not self.text.declutter or self._ndisplay != 2:
+            return slice(None)
+        text_coords, _, _ = self.text.compute_text_coords(
+            self._view_data, self._ndisplay
+        )
+        scale = np.abs(self.scale)
+        cell_size = (
+            self.text.size * self.scale_factor / scale[self._dims_displayed]
+        )
+        return self.text.declutter_positions(
+            text_coords,
+            cell_size,
+            self.corner_pixels[:, self._dims_displayed],
+        )
+
+    def _update_draw(self, scale_factor, corner_pixels, shape_threshold):
+        old_scale_factor = self.scale_factor
+        old_corners = self.corner_pixels
+        super()._update_draw(scale_factor, corner_pixels, shape_threshold)
+        # Decluttered text depends on the zoom and on the canvas corners
+        if self.text.declutter and (
+            self.scale_factor != old_scale_factor
+            or not np.array_equal(self.corner_pixels, old_corners)
+        ):
+            self.text.events.text()
 
     @property
     def _view_size(self) -> np.ndarray:
@@ -1431,18 +1483,23 @@ class Points(Layer):
         view_size : (N x D) np.ndarray
             Array of sizes for the N points in view
         """
-        if len(self._indices_view) > 0:
-            # Get the point sizes and scale for ndim display
-            sizes = (
-                self.size[
-                    np.ix_(self._indices_view, self._dims_displayed)
-                ].mean(axis=1)
-                * self._view_size_scale
-            )
-
-        else:
-            # if no points, return an empty list
-            sizes = np.array([])
+        sizes = self._view_cache.get('size')
+        if sizes is None:
+            if len(self._indices_view) > 0:
+                # Get the point sizes and scale for ndim display
+                if self._size.ndim == 0:
+                    sizes = np.full(len(self._indices_view), float(self._size))
+                elif self._size.ndim == 1:
+                    sizes = self._size[self._indices_view].astype(float)
+                else:
+                    sizes = self._size[
+                        np.ix_(self._indices_view, self._dims_displayed)
+                    ].mean(axis=1)
+                sizes = sizes * self._view_size_scale
+            else:
+                # if no points, return an empty list
+                sizes = np.array([])
+            sizes = self._cache_view_array('size', sizes)
         return sizes
 
     @property
@@ -1455,7 +1512,12 @@ class Points(Layer):
             RGBA color array for the face colors of the N points in view.
             If there are no points in view, returns array of length 0.
         """
-        return self.face_color[self._indices_view]
+        colors = self._view_cache.get('face_color')
+        if colors is None:
+            colors = self._cache_view_array(
+                'face_color', self.face_color[self._indices_view]
+            )
+        return colors
 
     @property
     def _view_edge_color(self) -> np.ndarray:
@@ -1467,7 +1529,52 @@ class Points(Layer):
             RGBA color array for the edge colors of the N points in view.
             If there are no points in view, returns array of length 0.
         """
-        return self.edge_color[self._indices_view]
+        colors = self._view_cache.get('edge_color')
+        if colors is None:
+            colors = self._cache_view_array(
+                'edge_color', self.edge_color[self._indices_view]
+            )
+        return colors
+
+    def _cache_view_array(self, key: str, array: np.ndarray) -> np.ndarray:
+        """Keep an array of the points in view until it is invalidated.
+
+        The array is made read-only since it is shared by every caller.
+
+        Parameters
+        ----------
+        key : str
+            Name of the array, one of 'data', 'size', 'face_color' or
+            'edge_color'.
+        array : np.ndarray
+            The array of the points in view.
+
+        Returns
+        -------
+        array : np.ndarray
+            The cached array.
+        """
+        array.flags.writeable = False
+        self._view_cache[key] = array
+        return array
+
+    def _invalidate_view_cache(self, *keys: str):
+        """Drop the cached arrays of the points in view.
+
+        This must be called whenever the data, sizes or colors change,
+        before the events that make the view read these arrays.
+
+        Parameters
+        ----------
+        *keys : str
+            Names of the arrays to drop. If none are given every array is
+            dropped.
+        """
+        if keys:
+            for key in keys:
+                self._view_cache.pop(key, None)
+        else:
+            self._view_cache.clear()
 
     def _set_editable(self, editable=None):
         """Set editable mode based on layer properties."""
@@ -1505,7 +1612,9 @@ class Points(Layer):
         if len(self.data) > 0:
             if self.n_dimensional is True and self.ndim > 2:
                 distances = abs(self.data[:, not_disp] - indices[not_disp])
-                sizes = self.size[:, not_disp] / 2
+                sizes = (
+                    expand_sizes(self._size, self.data.shape)[:, not_disp] / 2
+                )
                 matches = np.all(distances <= sizes, axis=1)
                 size_match = sizes[matches]
                 size_match[size_match == 0] = 1
@@ -1561,14 +1670,10 @@ class Points(Layer):
         indices, scale = self._slice_data(self._slice_indices)
         self._view_size_scale = scale
         self._indices_view = indices
+        self._invalidate_view_cache()
         # get the selected points that are in view
-        self._selected_view = list(
-            np.intersect1d(
-                np.array(list(self._selected_data)),
-                self._indices_view,
-                return_indices=True,
-            )[2]
-        )
+        self._selected_view = self._view_positions(self._selected_data)
+        self._selection_changed = True
         with self.events.highlight.blocker():
             self._set_highlight(force=True)
 
@@ -1582,67 +1687,70 @@ class Points(Layer):
         force : bool
             Bool that forces a redraw to occur when `True`
         """
-        # Check if any point ids have changed since last call
+        # Check if the selection or the hovered point changed since last call
         if self.selected:
-            if (
-                self.selected_data == self._selected_data_stored
-                and self._value == self._value_stored
-                and np.all(self._drag_box == self._drag_box_stored)
-            ) and not force:
+            selection_changed = (
+                force
+                or self._selection_changed
+                or not np.all(self._drag_box == self._drag_box_stored)
+            )
+            if not selection_changed and self._value == self._value_stored:
                 return
-            self._selected_data_stored = copy(self.selected_data)
             self._value_stored = copy(self._value)
-            self._drag_box_stored = copy(self._drag_box)
-
-            if self._value is not None or len(self._selected_view) > 0:
-                if len(self._selected_view) > 0:
-                    index = copy(self._selected_view)
-                    # highlight the hovered point if not in adding mode
-                    if (
-                        self._value in self._indices_view
-                        and self._mode == Mode.SELECT
-                        and not self._is_selecting
-                    ):
-                        hover_point = list(self._indices_view).index(
-                            self._value
-                        )
-                        if hover_point in index:
-                            pass
-                        else:
-                            index.append(hover_point)
-                    index.sort()
-                else:
-                    # only highlight hovered points in select mode
-                    if (
-                        self._value in self._indices_view
-                        and self._mode == Mode.SELECT
-                        and not self._is_selecting
-                    ):
-                        hover_point = list(self._indices_view).index(
-                            self._value
-                        )
-                        index = [hover_point]
-                    else:
-                        index = []
-
-                self._highlight_index = index
-            else:
-                self._highlight_index = []
 
-            # only display dragging selection box in 2D
-            if self._ndisplay == 2 and self._is_selecting:
-                pos = create_box(self._drag_box)
-                pos = pos[list(range(4)) + [0]]
-            else:
-                pos = None
+            # only highlight hovered points in select mode
+            hover_index = []
+            if (
+                self._value is not None
+                and self._mode == Mode.SELECT
+                and not self._is_selecting
+                and self._value not in self._selected_data
+            ):
+                hover_index = list(self._view_positions([self._value]))
+            self._hover_index = hover_index
+
+            if selection_changed:
+                self._selection_changed = False
+                self._drag_box_stored = copy(self._drag_box)
+                self._highlight_index = self._selected_view
+
+                # only display dragging selection box in 2D
+                if self._ndisplay == 2 and self._is_selecting:
+                    pos = create_box(self._drag_box)
+                    pos = pos[list(range(4)) + [0]]
+                else:
+                    pos = None
 
-            self._highlight_box = pos
-            self.events.highlight()
+                self._highlight_box = pos
+            self.events.highlight(selection_changed=selection_changed)
         else:
+            self._selection_changed = True
             self._highlight_box = None
             self._highlight_index = []
+            self._hover_index = []
             self.events.highlight()
 
+    def _view_positions(self, indices) -> np.ndarray:
+        """Positions in view of the points at some indices.
+
+        Parameters
+        ----------
+        indices : iterable of int
+            Indices of points in the data.
+
+        Returns
+        -------
+        positions : np.ndarray
+            Sorted positions within the `_view_data` array of the points that
+            are in view, the other points are left out.
+        """
+        indices_view = np.asarray(self._indices_view, dtype=int)
+        indices = np.fromiter(indices, dtype=int)
+        positions = np.searchsorted(indices_view, indices)
+        in_view = positions < len(indices_view)
+        in_view[in_view] = indices_view[positions[in_view]] == indices[in_view]
+        return np.sort(positions[in_view])
+
     def _update_thumbnail(self):
         """Update thumbnail with current points and colors."""
         colormapped = np.zeros(self._thumbnail_shape)
@@ -1691,13 +1799,12 @@ class Points(Layer):
         index = list(self.selected_data)
         index.sort()
         if len(index) > 0:
-            self._size = np.delete(self._size, index, axis=0)
+            if self._size.ndim > 0:
+                self._size = np.delete(self._size, index, axis=0)
             self._edge_color = np.delete(self.edge_color, index, axis=0)
             self._face_color = np.delete(self.face_color, index, axis=0)
-            for k in self.properties:
-                self.properties[k] = np.delete(
-                    self.properties[k], index, axis=0
-                )
+            self._invalidate_view_cache()
+            self._property_table.remove_rows(index)
             self.text.remove(index)
             if self._value in self.selected_data:
                 self._value = None
@@ -1741,8 +1848,11 @@ class Points(Layer):
             ]
             data[:, not_disp] = data[:, not_disp] + np.array(offset)
             self._data = np.append(self.data, data, axis=0)
-            self._size = np.append(
-                self.size, deepcopy(self._clipboard['size']), axis=0
+            self._size = concatenate_sizes(
+                self._size,
+                totpoints,
+                deepcopy(self._clipboard['size']),
+                len(self._clipboard['data']),
             )
             self._edge_color = np.vstack(
                 (
@@ -1756,21 +1866,21 @@ class Points(Layer):
                     transform_color(deepcopy(self._clipboard['face_color'])),
                 )
             )
-            for k in self.properties:
-                self.properties[k] = np.concatenate(
-                    (self.properties[k], self._clipboard['properties'][k]),
-                    axis=0,
-                )
-            self._selected_view = list(
-                range(npoints, npoints + len(self._clipboard['data']))
+            self._invalidate_view_cache()
+            self._property_table.add_rows(
+                self._clipboard['properties'], len(self._clipboard['data'])
+            )
+            self._selected_view = np.arange(
+                npoints, npoints + len(self._clipboard['data'])
             )
+            self._selection_changed = True
             self._selected_data = set(
                 range(totpoints, totpoints + len(self._clipboard['data']))
             )
 
             if self._clipboard['text'] is not None:
-                self.text._values = np.concatenate(
-                    (self.text.values, self._clipboard['text']), axis=0
+                self.text._paste(
+                    self._clipboard['properties'], self._clipboard['text']
                 )
 
             self.refresh()
@@ -1783,18 +1893,20 @@ class Points(Layer):
                 'data': deepcopy(self.data[index]),
                 'edge_color': deepcopy(self.edge_color[index]),
                 'face_color': deepcopy(self.face_color[index]),
-                'size': deepcopy(self.size[index]),
+                'size': deepcopy(
+                    self._size[index] if self._size.ndim > 0 else self._size
+                ),
                 'properties': {
                     k: deepcopy(v[index]) for k, v in self.properties.items()
                 },
                 'indices': self._slice_indices,
             }
 
-            if self.text.values is None:
+            if self.text._values is None:
                 self._clipboard['text'] = None
 
             else:
-                self._clipboard['text'] = deepcopy(self.text.values[index])
+                self._clipboard['text'] = self.text._get_values(index)
 
         else:
             self._clipboard = {}
@@ -4,6 +4,7 @@ from ._mesh import Mesh
 from ._shapes_constants import ShapeType, shape_classes
 from ._shapes_models import Line, Path, Shape
 from ._shapes_utils import inside_triangles, triangles_intersect_box
+from ._spatial_index import GridIndex
 
 
 class ShapeList:
@@ -56,6 +57,18 @@ class ShapeList:
     _mesh : Mesh
         Mesh object containing all the mesh information that will ultimately
         be rendered.
+    _displayed_triangles_order : np.ndarray
+        Location in the mesh of each displayed triangle.
+    _displayed_vertices_order : np.ndarray
+        Location in `_vertices` of each displayed vertex.
+    _triangles_grid : GridIndex | None
+        Spatial index of the displayed triangles, built on first use after the
+        displayed shapes change. Shapes changed in place only update their
+        own triangles.
+    _vertices_grid : GridIndex | None
+        Spatial index of the displayed vertices, built on first use after the
+        displayed shapes change. Shapes changed in place only update their
+        own vertices.
     """
 
     def __init__(self, data=[], ndisplay=2):
@@ -72,6 +85,10 @@ class ShapeList:
         self._z_order = np.empty((0), dtype=int)
 
         self._mesh = Mesh(ndisplay=self.ndisplay)
+        self._displayed_triangles_order = np.empty((0), dtype=int)
+        self._displayed_vertices_order = np.empty((0), dtype=int)
+        self._triangles_grid = None
+        self._vertices_grid = None
 
         self._edge_color = np.empty((0, 4))
         self._face_color = np.empty((0, 4))
@@ -155,7 +172,7 @@ class ShapeList:
 
         for i, col in enumerate(colors):
             update_method(i, col, update=False)
-        self._update_displayed()
+        self._update_displayed_colors()
 
     @property
     def edge_widths(self):
@@ -197,19 +214,142 @@ class ShapeList:
         disp_tri = np.isin(
             self._mesh.triangles_index[z_order, 0], disp_indices
         )
-        self._mesh.displayed_triangles = self._mesh.triangles[z_order][
-            disp_tri
-        ]
+        order = z_order[disp_tri]
+        self._displayed_triangles_order = order
+        self._mesh.displayed_triangles = self._mesh.triangles[order]
         self._mesh.displayed_triangles_index = self._mesh.triangles_index[
-            z_order
-        ][disp_tri]
+            order
+        ]
         self._mesh.displayed_triangles_colors = self._mesh.triangles_colors[
-            z_order
-        ][disp_tri]
+            order
+        ]
+
+        order = np.where(np.isin(self._index, disp_indices))[0]
+        self._displayed_vertices_order = order
+        self.displayed_vertices = self._vertices[order]
+        self.displayed_index = self._index[order]
+
+        # Spatial indices are rebuilt on the next query
+        self._triangles_grid = None
+        self._vertices_grid = None
+
+    def _update_displayed_colors(self):
+        """Update the colors of the displayed triangles."""
+        self._mesh.displayed_triangles_colors = self._mesh.triangles_colors[
+            self._displayed_triangles_order
+        ]
+
+    def _update_displayed_shape(self, index):
+        """Update the displayed data of a single shape changed in place.
+
+        The shape must still have the same number of vertices and triangles
+        and the same slice key, so the displayed shapes are the same and only
+        the spatial index entries of this shape are updated.
+
+        Parameters
+        ----------
+        index : int
+            Location in list of the shape that changed.
+        """
+        mesh = self._mesh
+        tri = np.where(mesh.displayed_triangles_index[:, 0] == index)[0]
+        if len(tri) > 0:
+            mesh.displayed_triangles[tri] = mesh.triangles[
+                self._displayed_triangles_order[tri]
+            ]
+            if self._triangles_grid is not None:
+                triangles = mesh.vertices[mesh.displayed_triangles[tri]]
+                self._triangles_grid.update(
+                    tri, triangles.min(axis=1), triangles.max(axis=1)
+                )
+
+        vert = np.where(self.displayed_index == index)[0]
+        if len(vert) > 0:
+            self.displayed_vertices[vert] = self._vertices[
+                self._displayed_vertices_order[vert]
+            ]
+            if self._vertices_grid is not None:
+                vertices = self.displayed_vertices[vert]
+                self._vertices_grid.update(vert, vertices, vertices)
+
+    def _replace_in_place(self, index, shape, slice_key):
+        """Replace the mesh of a shape without moving any other shape.
+
+        This is only possible when the new shape has as many vertices and
+        triangles as the current one, at the same z index and slice key.
+
+        Parameters
+        ----------
+        index : int
+            Location in list of the shape to be replaced.
+        shape : subclass Shape
+            The new shape, or the current one once changed.
+        slice_key : np.ndarray
+            Slice key of the shape before it changed.
 
-        disp_vert = np.isin(self._index, disp_indices)
-        self.displayed_vertices = self._vertices[disp_vert]
-        self.displayed_index = self._index[disp_vert]
+        Returns
+        -------
+        bool
+            True if the shape was replaced, otherwise nothing was changed.
+        """
+        mesh = self._mesh
+        face_vert = np.all(mesh.vertices_index == [index, 0], axis=1)
+        edge_vert = np.all(mesh.vertices_index == [index, 1], axis=1)
+        face_tri = np.all(mesh.triangles_index == [index, 0], axis=1)
+        edge_tri = np.all(mesh.triangles_index == [index, 1], axis=1)
+        vert = self._index == index
+        if not (
+            shape.z_index == self._z_index[index]
+            and np.array_equal(shape.slice_key, slice_key)
+            and np.count_nonzero(vert) == len(shape.data)
+            and np.count_nonzero(face_vert) == len(shape._face_vertices)
+            and np.count_nonzero(edge_vert) == len(shape._edge_vertices)
+            and np.count_nonzero(face_tri) == len(shape._face_triangles)
+            and np.count_nonzero(edge_tri) == len(shape._edge_triangles)
+        ):
+            return False
+
+        self.shapes[index] = shape
+        self._vertices[vert] = shape.data_displayed
+
+        face_vert = np.where(face_vert)[0]
+        mesh.vertices[face_vert] = shape._face_vertices
+        mesh.vertices_centers[face_vert] = shape._face_vertices
+        mesh.vertices_offsets[face_vert] = 0
+        if len(face_vert) > 0:
+            mesh.triangles[face_tri] = shape._face_triangles + face_vert[0]
+
+        edge_vert = np.where(edge_vert)[0]
+        mesh.vertices[edge_vert] = (
+            shape._edge_vertices + shape.edge_width * shape._edge_offsets
+        )
+        mesh.vertices_centers[edge_vert] = shape._edge_vertices
+        mesh.vertices_offsets[edge_vert] = shape._edge_offsets
+        if len(edge_vert) > 0:
+            mesh.triangles[edge_tri] = shape._edge_triangles + edge_vert[0]
+
+        self._update_displayed_shape(index)
+        return True
+
+    @property
+    def triangles_grid(self):
+        """GridIndex: spatial index of the bounding boxes of the displayed
+        triangles."""
+        if self._triangles_grid is None:
+            triangles = self._mesh.vertices[self._mesh.displayed_triangles]
+            self._triangles_grid = GridIndex(
+                triangles.min(axis=1, initial=np.inf),
+                triangles.max(axis=1, initial=-np.inf),
+            )
+        return self._triangles_grid
+
+    @property
+    def vertices_grid(self):
+        """GridIndex: spatial index of the displayed vertices."""
+        if self._vertices_grid is None:
+            vertices = np.reshape(self.displayed_vertices, (-1, self.ndisplay))
+            self._vertices_grid = GridIndex(vertices, vertices)
+        return self._vertices_grid
 
     def add(
         self,
@@ -359,6 +499,10 @@ class ShapeList:
             expectation is that this shape is being immediately added back to the
             list using `add_shape`.
         """
+        if renumber:
+            self.remove_many([index])
+            return
+
         indices = self._index != index
         self._vertices = self._vertices[indices]
         self._index = self._index[indices]
@@ -383,20 +527,55 @@ class ShapeList:
                 self._mesh.triangles[indices] - num_indices
             )
 
-        if renumber:
-            del self.shapes[index]
-            indices = self._index > index
-            self._index[indices] = self._index[indices] - 1
-            self._z_index = np.delete(self._z_index, index)
-            indices = self._mesh.triangles_index[:, 0] > index
-            self._mesh.triangles_index[indices, 0] = (
-                self._mesh.triangles_index[indices, 0] - 1
-            )
-            indices = self._mesh.vertices_index[:, 0] > index
-            self._mesh.vertices_index[indices, 0] = (
-                self._mesh.vertices_index[indices, 0] - 1
-            )
-            self._update_z_order()
+    def remove_many(self, indices):
+        """Removes the shapes located at indices and renumbers the rest.
+
+        All the shapes are removed in a single pass over the vertex and mesh
+        arrays, so the cost does not depend on the number of shapes removed.
+
+        Parameters
+        ----------
+        indices : sequence of int
+            Locations in list of the shapes to be removed.
+        """
+        indices = np.unique(np.asarray(indices, dtype=int))
+        if len(indices) == 0:
+            return
+
+        removed = np.zeros(len(self.shapes), dtype=bool)
+        removed[indices] = True
+        # New location of each shape that is kept
+        new_index = np.cumsum(~removed) - 1
+
+        keep = ~removed[self._index]
+        self._vertices = self._vertices[keep]
+        self._index = new_index[self._index[keep]]
+
+        # Remove vertices, and renumber the vertices of the kept triangles
+        keep = ~removed[self._mesh.vertices_index[:, 0]]
+        new_vertex = np.cumsum(keep) - 1
+        self._mesh.vertices = self._mesh.vertices[keep]
+        self._mesh.vertices_centers = self._mesh.vertices_centers[keep]
+        self._mesh.vertices_offsets = self._mesh.vertices_offsets[keep]
+        self._mesh.vertices_index = self._mesh.vertices_index[keep]
+        self._mesh.vertices_index[:, 0] = new_index[
+            self._mesh.vertices_index[:, 0]
+        ]
+
+        # Remove triangles
+        keep = ~removed[self._mesh.triangles_index[:, 0]]
+        self._mesh.triangles = new_vertex[self._mesh.triangles[keep]].astype(
+            self._mesh.triangles.dtype
+        )
+        self._mesh.triangles_colors = self._mesh.triangles_colors[keep]
+        self._mesh.triangles_index = self._mesh.triangles_index[keep]
+        self._mesh.triangles_index[:, 0] = new_index[
+            self._mesh.triangles_index[:, 0]
+        ]
+
+        self.shapes = [s for s, r in zip(self.shapes, removed) if not r]
+        self._z_index = self._z_index[~removed]
+        self._update_z_order()
 
     def _update_mesh_vertices(self, index, edge=False, face=False):
         """Updates the mesh vertex data and vertex data for a single shape
@@ -421,7 +600,6 @@ class ShapeList:
             )
             self._mesh.vertices_centers[indices] = shape._edge_vertices
             self._mesh.vertices_offsets[indices] = shape._edge_offsets
-            self._update_displayed()
 
         if face:
             indices = np.all(self._mesh.vertices_index == [index, 0], axis=1)
@@ -429,7 +607,9 @@ class ShapeList:
             self._mesh.vertices_centers[indices] = shape._face_vertices
             indices = self._index == index
             self._vertices[indices] = shape.data_displayed
-            self._update_displayed()
+
+        if edge or face:
+            self._update_displayed_shape(index)
 
     def _update_z_order(self):
         """Updates the z order of the triangles given the z_index list"""
@@ -464,6 +644,7 @@ class ShapeList:
             If string , must be one of "{'line', 'rectangle', 'ellipse',
             'path', 'polygon'}".
         """
+        slice_key = self.shapes[index].slice_key
         if new_type is not None:
             cur_shape = self.shapes[index]
             if type(new_type) == str:
@@ -486,6 +667,13 @@ class ShapeList:
             shape = self.shapes[index]
             shape.data = data
 
+        if self._replace_in_place(index, shape, slice_key):
+            if face_color is not None:
+                self.update_face_color(index, face_color)
+            if edge_color is not None:
+                self.update_edge_color(index, edge_color)
+            return
+
         if face_color is not None:
             self._face_color[index] = face_color
         if edge_color is not None:
@@ -527,7 +715,7 @@ class ShapeList:
         indices = np.all(self._mesh.triangles_index == [index, 1], axis=1)
         self._mesh.triangles_colors[indices] = self._edge_color[index]
         if update:
-            self._update_displayed()
+            self._update_displayed_colors()
 
     def update_face_color(self, index, face_color, update=True):
         """Updates the face color of a single shape located at index.
@@ -548,7 +736,7 @@ class ShapeList:
         indices = np.all(self._mesh.triangles_index == [index, 0], axis=1)
         self._mesh.triangles_colors[indices] = self._face_color[index]
         if update:
-            self._update_displayed()
+            self._update_displayed_colors()
 
     def update_dims_order(self, dims_order):
         """Updates dimensions order for all shapes.
@@ -606,8 +794,11 @@ class ShapeList:
         center : list
             length 2 list specifying coordinate of center of scaling.
         """
-        self.shapes[index].scale(scale, center=center)
         shape = self.shapes[index]
+        slice_key = shape.slice_key
+        shape.scale(scale, center=center)
+        if self._replace_in_place(index, shape, slice_key):
+            return
         self.remove(index, renumber=False)
         self.add(shape, shape_index=index)
         self._update_z_order()
@@ -653,8 +844,11 @@ class ShapeList:
         transform : np.ndarray
             2x2 array specifying linear transform.
         """
-        self.shapes[index].transform(transform)
         shape = self.shapes[index]
+        slice_key = shape.slice_key
+        shape.transform(transform)
+        if self._replace_in_place(index, shape, slice_key):
+            return
         self.remove(index, renumber=False)
         self.add(shape, shape_index=index)
         self._update_z_order()
@@ -679,17 +873,13 @@ class ShapeList:
         """
         if type(indices) is list:
             meshes = self._mesh.triangles_index
-            triangle_indices = [
-                i
-                for i, x in enumerate(meshes)
-                if x[0] in indices and x[1] == 1
-            ]
+            triangle_indices = np.where(
+                np.isin(meshes[:, 0], indices) & (meshes[:, 1] == 1)
+            )[0]
             meshes = self._mesh.vertices_index
-            vertices_indices = [
-                i
-                for i, x in enumerate(meshes)
-                if x[0] in indices and x[1] == 1
-            ]
+            vertices_indices = np.where(
+                np.isin(meshes[:, 0], indices) & (meshes[:, 1] == 1)
+            )[0]
         else:
             triangle_indices = np.all(
                 self._mesh.triangles_index == [indices, 1], axis=1
@@ -705,13 +895,16 @@ class ShapeList:
         triangles = self._mesh.triangles[triangle_indices]
 
         if type(indices) is list:
+            # The vertices of each shape are contiguous, shift the triangles
+            # of each shape by the offset of its first vertex
             t_ind = self._mesh.triangles_index[triangle_indices][:, 0]
             inds = self._mesh.vertices_index[vertices_indices][:, 0]
-            starts = np.unique(inds, return_index=True)[1]
-            for i, ind in enumerate(indices):
-                inds = t_ind == ind
-                adjust_index = starts[i] - vertices_indices[starts[i]]
-                triangles[inds] = triangles[inds] + adjust_index
+            shapes, starts = np.unique(inds, return_index=True)
+            adjust_index = starts - vertices_indices[starts]
+            triangles = (
+                triangles
+                + adjust_index[np.searchsorted(shapes, t_ind)][:, np.newaxis]
+            )
         else:
             triangles = triangles - vertices_indices[0]
 
@@ -734,13 +927,42 @@ class ShapeList:
             List of shapes that are inside the box.
         """
 
-        triangles = self._mesh.vertices[self._mesh.displayed_triangles]
+        candidates = self.triangles_grid.query_box(corners)
+        triangles = self._mesh.vertices[
+            self._mesh.displayed_triangles[candidates]
+        ]
         intersects = triangles_intersect_box(triangles, corners)
-        shapes = self._mesh.displayed_triangles_index[intersects, 0]
+        shapes = self._mesh.displayed_triangles_index[
+            candidates[intersects], 0
+        ]
         shapes = np.unique(shapes).tolist()
 
         return shapes
 
+    def vertices_in_box(self, corners):
+        """Determines which displayed vertices are inside an axis aligned box.
+
+        Parameters
+        ----------
+        corners : np.ndarray
+            2xD array of two corners that will be used to create an axis
+            aligned box.
+
+        Returns
+        -------
+        indices : np.ndarray
+            Sorted indices into `displayed_vertices` of the vertices inside
+            the box.
+        """
+        candidates = self.vertices_grid.query_box(corners)
+        vertices = self.displayed_vertices[candidates]
+        inside = np.all(
+            (vertices >= np.min(corners, axis=0))
+            & (vertices <= np.max(corners, axis=0)),
+            axis=1,
+        )
+        return candidates[inside]
+
     def inside(self, coord):
         """Determines if any shape at given coord by looking inside triangle
         meshes. Looks only at displayed shapes
@@ -756,15 +978,17 @@ class ShapeList:
             Index of shape if any that is at the coordinates. Returns `None`
             if no shape is found.
         """
-        triangles = self._mesh.vertices[self._mesh.displayed_triangles]
+        candidates = self.triangles_grid.query_point(coord)
+        triangles = self._mesh.vertices[
+            self._mesh.displayed_triangles[candidates]
+        ]
         indices = inside_triangles(triangles - coord)
-        shapes = self._mesh.displayed_triangles_index[indices, 0]
+        shapes = self._mesh.displayed_triangles_index[candidates[indices], 0]
 
         if len(shapes) > 0:
-            z_list = self._z_order.tolist()
-            order_indices = np.array([z_list.index(m) for m in shapes])
-            ordered_shapes = shapes[np.argsort(order_indices)]
-            return ordered_shapes[0]
+            z_rank = np.empty(len(self._z_order), dtype=int)
+            z_rank[self._z_order] = np.arange(len(self._z_order))
+            return shapes[np.argmin(z_rank[shapes])]
         else:
             return None
 
@@ -793,12 +1017,16 @@ class ShapeList:
         if mask_shape is None:
             mask_shape = self.displayed_vertices.max(axis=0).astype('int')
 
-        masks = np.array(
-            [
-                s.to_mask(mask_shape, zoom_factor=zoom_factor, offset=offset)
-                for s in self.shapes
-            ]
-        )
+        masks = np.zeros((len(self.shapes),) + tuple(mask_shape), dtype=bool)
+        for ind in range(len(self.shapes)):
+            self._paint_shape(
+                masks[ind],
+                mask_shape,
+                ind,
+                True,
+                zoom_factor=zoom_factor,
+                offset=offset,
+            )
 
         return masks
 
@@ -832,10 +1060,14 @@ class ShapeList:
         labels = np.zeros(labels_shape, dtype=int)
 
         for ind in self._z_order[::-1]:
-            mask = self.shapes[ind].to_mask(
-                labels_shape, zoom_factor=zoom_factor, offset=offset
+            self._paint_shape(
+                labels,
+                labels_shape,
+                ind,
+                ind + 1,
+                zoom_factor=zoom_factor,
+                offset=offset,
             )
-            labels[mask] = ind + 1
 
         return labels
 
@@ -888,13 +1120,48 @@ class ShapeList:
             z_order_in_view = z_order_in_view[0:max_shapes]
 
         for ind in z_order_in_view:
-            mask = self.shapes[ind].to_mask(
-                colors_shape, zoom_factor=zoom_factor, offset=offset
-            )
             if type(self.shapes[ind]) in [Path, Line]:
                 col = self._edge_color[ind]
             else:
                 col = self._face_color[ind]
-            colors[mask, :] = col
+            self._paint_shape(
+                colors,
+                colors_shape,
+                ind,
+                col,
+                zoom_factor=zoom_factor,
+                offset=offset,
+            )
 
         return colors
+
+    def _paint_shape(
+        self, canvas, mask_shape, index, value, zoom_factor=1, offset=[0, 0]
+    ):
+        """Write a value into an array at the points of one shape.
+
+        Only the bounding box of the shape is rasterized and written, so the
+        cost of painting a shape does not depend on the size of the array.
+
+        Parameters
+        ----------
+        canvas : np.ndarray
+            Array to paint the shape into. Any axes after the first
+            `len(mask_shape)`, such as RGBA channels, hold the value.
+        mask_shape : tuple
+            Shape of the mask of the shape, the leading axes of `canvas`.
+        index : int
+            Index of the shape.
+        value : scalar or array
+            Value written at the points of the shape.
+        zoom_factor : float
+            Premultiplier applied to coordinates before generating mask.
+        offset : 2-tuple
+            Offset subtracted from coordinates before multiplying by the
+            zoom_factor.
+        """
+        key, mask = self.shapes[index].to_region_mask(
+            mask_shape, zoom_factor=zoom_factor, offset=offset
+        )
+        region = canvas[key]
+        region[np.broadcast_to(mask, region.shape[: len(mask_shape)])] = value
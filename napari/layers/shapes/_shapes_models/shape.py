@@ -5,8 +5,8 @@ import numpy as np
 
 from .._shapes_utils import (
     is_collinear,
-    path_to_mask,
-    poly_to_mask,
+    path_to_bbox_mask,
+    poly_to_bbox_mask,
     triangulate_edge,
     triangulate_face,
 )
@@ -382,6 +382,42 @@ class Shape(ABC):
                 'int'
             )
 
+        key, region_mask = self.to_region_mask(
+            mask_shape, zoom_factor=zoom_factor, offset=offset
+        )
+        mask = np.zeros(mask_shape, dtype=bool)
+        mask[key] = region_mask
+
+        return mask
+
+    def to_region_mask(self, mask_shape, zoom_factor=1, offset=[0, 0]):
+        """Convert the shape vertices to a boolean mask of its bounding box.
+
+        The mask only covers the bounding box of the shape, so shapes that
+        are small compared to `mask_shape` can be written into a larger
+        array without computing a mask of the full array.
+
+        Parameters
+        ----------
+        mask_shape : (D,) array
+            Shape of the full mask. Either 2 or the dimensionality of the
+            shape.
+        zoom_factor : float
+            Premultiplier applied to coordinates before generating mask. Used
+            for generating as downsampled mask.
+        offset : 2-tuple
+            Offset subtracted from coordinates before multiplying by the
+            zoom_factor. Used for putting negative coordinates into the mask.
+
+        Returns
+        -------
+        key : tuple of slice
+            Region of an array of shape `mask_shape` that holds the shape.
+        mask : np.ndarray
+            Boolean array with `True` for points inside the shape. It has one
+            axis per axis of `mask_shape`, of length 1 along the axes that
+            are not displayed, so it broadcasts to the region.
+        """
         if len(mask_shape) == 2:
             embedded = False
             shape_plane = mask_shape
@@ -403,30 +439,39 @@ class Shape(ABC):
         data = data[:, -len(shape_plane) :]
 
         if self._filled:
-            mask_p = poly_to_mask(shape_plane, (data - offset) * zoom_factor)
-        else:
-            mask_p = path_to_mask(shape_plane, (data - offset) * zoom_factor)
-
-        # If the mask is to be embedded in a larger array, compute array
-        # and embed as a slice.
-        if embedded:
-            mask = np.zeros(mask_shape, dtype=bool)
-            slice_key = [0] * len(mask_shape)
-            j = 0
-            for i in range(len(mask_shape)):
-                if i in self.dims_displayed:
-                    slice_key[i] = slice(None)
-                else:
-                    slice_key[i] = slice(
-                        self.slice_key[0, j], self.slice_key[1, j] + 1
-                    )
-                j += 1
-            displayed_order = np.array(copy(self.dims_displayed))
-            displayed_order[np.argsort(displayed_order)] = list(
-                range(len(displayed_order))
+            bottom, mask_p = poly_to_bbox_mask(
+                shape_plane, (data - offset) * zoom_factor
             )
-            mask[tuple(slice_key)] = mask_p.transpose(displayed_order)
         else:
-            mask = mask_p
+            bottom, mask_p = path_to_bbox_mask(
+                shape_plane, (data - offset) * zoom_factor
+            )
+        plane_key = [
+            slice(b, b + n) for b, n in zip(bottom.tolist(), mask_p.shape)
+        ]
+
+        if not embedded:
+            return tuple(plane_key), mask_p
+
+        # If the mask is to be embedded in a larger array, compute the
+        # region as a slice.
+        slice_key = [0] * len(mask_shape)
+        j = 0
+        for i in range(len(mask_shape)):
+            if i in self.dims_displayed:
+                slice_key[i] = plane_key[list(self.dims_displayed).index(i)]
+            else:
+                slice_key[i] = slice(
+                    self.slice_key[0, j], self.slice_key[1, j] + 1
+                )
+            j += 1
+        displayed_order = np.array(copy(self.dims_displayed))
+        displayed_order[np.argsort(displayed_order)] = list(
+            range(len(displayed_order))
+        )
+        mask_p = mask_p.transpose(displayed_order)
+        region_shape = [1] * len(mask_shape)
+        for i, d in enumerate(sorted(self.dims_displayed)):
+            region_shape[d] = mask_p.shape[i]
 
-        return mask
+        return tuple(slice_key), mask_p.reshape(region_shape)
@@ -70,7 +70,7 @@ def select(layer, event):
     layer._set_highlight()
 
     if update_thumbnail:
-        layer._update_thumbnail()
+        layer._invalidate_thumbnail()
 
 
 def add_line(layer, event):
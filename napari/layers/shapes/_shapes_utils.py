@@ -866,18 +866,65 @@ def path_to_mask(mask_shape, vertices):
         Boolean array with `True` for points along the path
     """
     mask = np.zeros(mask_shape, dtype=bool)
+    bottom, bb_mask = path_to_bbox_mask(mask_shape, vertices)
+    top = bottom + bb_mask.shape
+    mask[bottom[0] : top[0], bottom[1] : top[1]] = bb_mask
+    return mask
+
+
+def path_to_bbox_mask(mask_shape, vertices):
+    """Converts a path to a boolean mask of its bounding box with `True` for
+    points lying along each edge.
+
+    Every edge is sampled at once, rather than one point at a time, so the
+    cost is a handful of array operations whatever the number of edges.
+
+    Parameters
+    ----------
+    mask_shape : array (2,)
+        Shape of the full mask the path is clipped to.
+    vertices : array (N, 2)
+        Vertices of the path.
+
+    Returns
+    -------
+    bottom : np.ndarray
+        Length 2 array with the position of the bounding box in the full
+        mask.
+    mask : np.ndarray
+        Boolean array, the size of the bounding box, with `True` for points
+        along the path
+    """
     vertices = np.round(
         np.clip(vertices, 0, np.subtract(mask_shape, 1))
     ).astype(int)
-    for i in range(len(vertices) - 1):
-        start = vertices[i]
-        stop = vertices[i + 1]
-        step = np.ceil(np.max(abs(stop - start))).astype(int)
-        x_vals = np.linspace(start[0], stop[0], step)
-        y_vals = np.linspace(start[1], stop[1], step)
-        for x, y in zip(x_vals, y_vals):
-            mask[int(x), int(y)] = 1
-    return mask
+    starts = vertices[:-1]
+    deltas = vertices[1:] - starts
+    steps = np.abs(deltas).max(axis=1, initial=0)
+    if steps.sum() == 0:
+        return np.zeros(2, dtype=int), np.zeros((0, 0), dtype=bool)
+
+    # Sample each edge at the same positions as np.linspace(start, stop, step)
+    edges = np.repeat(np.arange(len(steps)), steps)
+    k = np.arange(len(edges)) - np.repeat(np.cumsum(steps) - steps, steps)
+    k = k[:, np.newaxis]
+    div = np.maximum(steps - 1, 1)[edges, np.newaxis]
+    deltas = deltas[edges]
+    points = np.where(
+        np.any(deltas == 0, axis=1, keepdims=True),
+        k / div * deltas,
+        k * (deltas / div),
+    )
+    points += starts[edges]
+    last = (k[:, 0] == steps[edges] - 1) & (steps[edges] > 1)
+    points[last] = starts[edges][last] + deltas[last]
+    points = points.astype(int)
+
+    bottom = points.min(axis=0)
+    points -= bottom
+    mask = np.zeros(points.max(axis=0) + 1, dtype=bool)
+    mask[points[:, 0], points[:, 1]] = True
+    return bottom, mask
 
 
 def poly_to_mask(mask_shape, vertices):
@@ -898,20 +945,49 @@ def poly_to_mask(mask_shape, vertices):
         Boolean array with `True` for points inside the polygon
     """
     mask = np.zeros(mask_shape, dtype=bool)
+    bottom, bb_mask = poly_to_bbox_mask(mask_shape, vertices)
+    top = bottom + bb_mask.shape
+    mask[bottom[0] : top[0], bottom[1] : top[1]] = bb_mask
+    return mask
+
+
+def poly_to_bbox_mask(mask_shape, vertices):
+    """Converts a polygon to a boolean mask of its bounding box with `True`
+    for points lying inside the shape.
+
+    Parameters
+    ----------
+    mask_shape : np.ndarray | tuple
+        1x2 array of shape of the full mask the polygon is clipped to.
+    vertices : np.ndarray
+        Nx2 array of the vertices of the polygon.
+
+    Returns
+    -------
+    bottom : np.ndarray
+        Length 2 array with the position of the bounding box in the full
+        mask.
+    mask : np.ndarray
+        Boolean array, the size of the bounding box, with `True` for points
+        inside the polygon
+    """
     bottom = vertices.min(axis=0).astype('int')
     bottom = np.clip(bottom, 0, np.subtract(mask_shape, 1))
     top = np.ceil(vertices.max(axis=0)).astype('int')
-    # top = np.append([top], [mask_shape], axis=0).min(axis=0)
     top = np.clip(top, 0, np.subtract(mask_shape, 1))
     if np.all(top > bottom):
-        bb_mask = grid_points_in_poly(top - bottom, vertices - bottom)
-        mask[bottom[0] : top[0], bottom[1] : top[1]] = bb_mask
-    return mask
+        return bottom, grid_points_in_poly(top - bottom, vertices - bottom)
+    return bottom, np.zeros((0, 0), dtype=bool)
 
 
 def grid_points_in_poly(shape, vertices):
     """Converts a polygon to a boolean mask with `True` for points
-    lying inside the shape. Loops through all indices in the grid
+    lying inside the shape.
+
+    Uses a scanline fill with the same crossing rule as `points_in_poly`.
+    The crossings of every edge with every grid column are computed at once
+    from an edge table, and a cumulative parity along each column then gives
+    the points inside the polygon.
 
     Parameters
     ----------
@@ -925,12 +1001,40 @@ def grid_points_in_poly(shape, vertices):
     mask : np.ndarray
         Boolean array with `True` for points inside the polygon
     """
-    points = np.array(
-        [(x, y) for x in range(shape[0]) for y in range(shape[1])], dtype=int
+    n_rows, n_cols = int(shape[0]), int(shape[1])
+
+    # Edge table, each edge goes from vertices[i - 1] to vertices[i], and
+    # crosses the columns y with low <= y < high.
+    v_i = vertices
+    d = np.roll(vertices, 1, axis=0) - vertices
+    v_i, d = v_i[d[:, 1] != 0], d[d[:, 1] != 0]
+    low = np.minimum(v_i[:, 1], v_i[:, 1] + d[:, 1])
+    high = np.maximum(v_i[:, 1], v_i[:, 1] + d[:, 1])
+    y_start = np.clip(np.ceil(low), 0, n_cols).astype(int)
+    n_crossings = np.clip(np.ceil(high), 0, n_cols).astype(int) - y_start
+    n_crossings = np.maximum(n_crossings, 0)
+
+    # One row per crossing of an edge with a column
+    edges = np.repeat(np.arange(len(v_i)), n_crossings)
+    y = np.arange(len(edges)) - np.repeat(
+        np.cumsum(n_crossings) - n_crossings, n_crossings
     )
-    inside = points_in_poly(points, vertices)
-    mask = inside.reshape(shape)
-    return mask
+    y += y_start[edges]
+    v_i, d = v_i[edges], d[edges]
+    x_cross = d[:, 0] * (y - v_i[:, 1]) / d[:, 1] + v_i[:, 0]
+
+    # A point x of a column is toggled by every crossing with x < x_cross,
+    # i.e. by crossings in rows above ceil(x_cross).
+    rows = np.clip(np.ceil(x_cross), 0, n_rows).astype(int)
+    flat, counts = np.unique(rows * n_cols + y, return_counts=True)
+    toggles = np.zeros((n_rows + 1) * n_cols, dtype=bool)
+    toggles[flat[counts % 2 == 1]] = True
+    toggles = toggles.reshape(n_rows + 1, n_cols)
+    parity = np.logical_xor.accumulate(toggles[::-1], axis=0)[::-1]
+
+    # If the number of crossings is even then the point is outside the polygon,
+    # if the number of crossings is odd then the point is inside the polygon
+    return parity[1:]
 
 
 def points_in_poly(points, vertices):
@@ -0,0 +1,186 @@
+import numpy as np
+
+
+class GridIndex:
+    """Uniform grid spatial index of axis aligned bounding boxes.
+
+    Space is divided into cells of equal size and each box is listed in every
+    cell it overlaps, so the boxes near a point or a region are found by
+    looking up a few cells instead of testing every box. The cell lists are
+    stored in a single sorted array with the start of each cell, in the
+    style of a sparse matrix, so building the index is a few array
+    operations. Moving a few boxes with update() only changes the cells of
+    these boxes.
+
+    Parameters
+    ----------
+    mins : (N, D) array
+        Minimum corner of each box.
+    maxs : (N, D) array
+        Maximum corner of each box.
+    cell_size : float, optional
+        Size of the cells of the grid. If not provided, it is chosen so that
+        cells are about the size of a typical box, with no more cells than
+        boxes.
+
+    Attributes
+    ----------
+    cell_size : float
+        Size of the cells of the grid.
+    shape : tuple of int
+        Number of cells of the grid along each dimension.
+    """
+
+    def __init__(self, mins, maxs, cell_size=None):
+        mins = np.asarray(mins, dtype=float)
+        maxs = np.asarray(maxs, dtype=float)
+        n_boxes, ndim = mins.shape
+
+        if n_boxes == 0:
+            self._origin = np.zeros(ndim)
+            span = np.zeros(ndim)
+        else:
+            self._origin = mins.min(axis=0)
+            span = maxs.max(axis=0) - self._origin
+
+        if cell_size is None:
+            cell_size = 0
+            if n_boxes > 0:
+                cell_size = np.median((maxs - mins).max(axis=1))
+                # Keep the number of cells at most about the number of boxes
+                cell_size = max(
+                    cell_size,
+                    (np.prod(span) / n_boxes) ** (1 / ndim),
+                    span.max() / n_boxes,
+                )
+            if cell_size <= 0:
+                cell_size = 1
+        self.cell_size = float(cell_size)
+        self.shape = tuple((span // self.cell_size).astype(int) + 1)
+        n_cells = int(np.prod(self.shape))
+
+        self._n_boxes = n_boxes
+        # Queries outside of these bounds cannot find any box
+        self._lower = self._origin.copy()
+        self._upper = self._origin + span
+
+        # Sort the listings by cell, then by box, so the boxes of a cell are
+        # sorted and updated listings can be inserted in place.
+        keys = np.sort(self._listings(np.arange(n_boxes), mins, maxs))
+        self._keys = keys
+        self._boxes = keys % max(n_boxes, 1)
+        self._starts = np.searchsorted(
+            keys, np.arange(n_cells + 1, dtype=np.int64) * n_boxes
+        )
+
+    def _listings(self, boxes, mins, maxs):
+        """Key of each listing of the boxes in a cell, cell * N + box."""
+        ndim = len(self.shape)
+        low = self._cell_of(mins)
+        n_spanned = self._cell_of(maxs) - low + 1
+        counts = np.prod(n_spanned, axis=1)
+        listed = np.repeat(np.arange(len(boxes)), counts)
+        k = np.arange(len(listed)) - np.repeat(
+            np.cumsum(counts) - counts, counts
+        )
+        cells = np.empty((len(listed), ndim), dtype=int)
+        for d in reversed(range(ndim)):
+            size = n_spanned[listed, d]
+            cells[:, d] = low[listed, d] + k % size
+            k = k // size
+        flat = np.ravel_multi_index(cells.T, self.shape).astype(np.int64)
+        return flat * self._n_boxes + boxes[listed]
+
+    def update(self, boxes, mins, maxs):
+        """Move boxes to new bounds.
+
+        Only the listings of these boxes change, the other cells and the
+        size of the grid stay the same. Boxes moved outside of the grid are
+        listed in its border cells.
+
+        Parameters
+        ----------
+        boxes : (M,) array
+            Indices of the boxes to move.
+        mins : (M, D) array
+            New minimum corner of each box.
+        maxs : (M, D) array
+            New maximum corner of each box.
+        """
+        boxes = np.asarray(boxes, dtype=np.int64)
+        mins = np.asarray(mins, dtype=float)
+        maxs = np.asarray(maxs, dtype=float)
+        if len(boxes) == 0:
+            return
+
+        moved = np.zeros(self._n_boxes, dtype=bool)
+        moved[boxes] = True
+        keys = self._keys[~moved[self._boxes]]
+        new_keys = np.sort(self._listings(boxes, mins, maxs))
+        self._keys = np.insert(keys, np.searchsorted(keys, new_keys), new_keys)
+        self._boxes = self._keys % self._n_boxes
+        self._starts = np.searchsorted(
+            self._keys,
+            np.arange(len(self._starts), dtype=np.int64) * self._n_boxes,
+        )
+        self._lower = np.minimum(self._lower, mins.min(axis=0))
+        self._upper = np.maximum(self._upper, maxs.max(axis=0))
+
+    def _cell_of(self, points):
+        """Cell of each point, clipped to the grid."""
+        cells = np.floor((points - self._origin) / self.cell_size)
+        return np.clip(cells, 0, np.subtract(self.shape, 1)).astype(int)
+
+    def query_point(self, point):
+        """Boxes that may contain a point.
+
+        Parameters
+        ----------
+        point : (D,) array
+            Coordinates of the point.
+
+        Returns
+        -------
+        boxes : np.ndarray
+            Sorted indices of the boxes listed in the cell of the point. These
+            include every box that contains the point.
+        """
+        point = np.asarray(point, dtype=float)
+        if np.any(point < self._lower) or np.any(point > self._upper):
+            return np.empty(0, dtype=int)
+        flat = np.ravel_multi_index(self._cell_of(point), self.shape)
+        return self._boxes[self._starts[flat] : self._starts[flat + 1]]
+
+    def query_box(self, corners):
+        """Boxes that may intersect an axis aligned box.
+
+        Parameters
+        ----------
+        corners : (2, D) array
+            Two opposite corners of the box.
+
+        Returns
+        -------
+        boxes : np.ndarray
+            Sorted indices of the boxes listed in the cells the box overlaps.
+            These include every box that intersects it.
+        """
+        corners = np.asarray(corners, dtype=float)
+        if np.any(corners.max(axis=0) < self._lower) or np.any(
+            corners.min(axis=0) > self._upper
+        ):
+            return np.empty(0, dtype=int)
+        low = self._cell_of(corners.min(axis=0))
+        high = self._cell_of(corners.max(axis=0))
+
+        ranges = [np.arange(lo, hi + 1) for lo, hi in zip(low, high)]
+        cells = np.stack(np.meshgrid(*ranges, indexing='ij')).reshape(
+            len(ranges), -1
+        )
+        flat = np.ravel_multi_index(cells, self.shape)
+        starts = self._starts[flat]
+        counts = self._starts[flat + 1] - starts
+        positions = np.arange(counts.sum()) + np.repeat(
+            starts - (np.cumsum(counts) - counts), counts
+        )
+        return np.unique(self._boxes[positions])
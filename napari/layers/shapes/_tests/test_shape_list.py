@@ -63,3 +63,120 @@ def test_bad_color_array(attribute):
     bad_color_array = np.array([[0, 0, 0, 1], [1, 1, 1, 1]])
     with pytest.raises(ValueError):
         setattr(shape_list, f'{attribute}_color', bad_color_array)
+
+
+def test_remove_many():
+    """Test removing several shapes at once."""
+    np.random.seed(0)
+    shapes = [
+        shape_type(20 * np.random.random((4, 2)))
+        for shape_type in [Rectangle, Polygon, Path] * 4
+    ]
+    shape_list = ShapeList(shapes)
+
+    to_remove = [7, 0, 4, 11]
+    shape_list.remove_many(to_remove)
+    kept = [s for i, s in enumerate(shapes) if i not in to_remove]
+    expected = ShapeList(kept)
+
+    assert shape_list.shapes == kept
+    np.testing.assert_array_equal(shape_list._index, expected._index)
+    np.testing.assert_array_equal(shape_list._vertices, expected._vertices)
+    np.testing.assert_array_equal(shape_list._z_order, expected._z_order)
+    for name in [
+        'vertices',
+        'vertices_index',
+        'triangles',
+        'triangles_index',
+        'displayed_triangles',
+    ]:
+        np.testing.assert_array_equal(
+            getattr(shape_list._mesh, name), getattr(expected._mesh, name)
+        )
+
+
+def test_outline_many():
+    """Test that the outline of several shapes joins their outlines."""
+    np.random.seed(0)
+    shapes = [
+        shape_type(20 * np.random.random((4, 2)))
+        for shape_type in [Rectangle, Polygon, Path] * 2
+    ]
+    shape_list = ShapeList(shapes)
+
+    centers, offsets, triangles = shape_list.outline([1, 3, 4])
+    n_vertices = 0
+    for index in [1, 3, 4]:
+        shape_centers, _, shape_triangles = shape_list.outline(index)
+        np.testing.assert_array_equal(
+            centers[n_vertices : n_vertices + len(shape_centers)],
+            shape_centers,
+        )
+        assert np.any(np.all(triangles == shape_triangles[0] + n_vertices, 1))
+        n_vertices += len(shape_centers)
+    assert len(centers) == n_vertices
+    assert triangles.max() == n_vertices - 1
+
+
+def test_spatial_index_updated_in_place():
+    """Test editing shapes updates the spatial index of those shapes only."""
+    shape_list = ShapeList()
+    for i in range(5):
+        shape_list.add(Rectangle([[0, 10 * i], [5, 10 * i + 5]]))
+    assert shape_list.inside([2, 2]) == 0
+    grid = shape_list.triangles_grid
+
+    # color changes keep the spatial index
+    shape_list.face_color = np.tile([1, 0, 0, 1], (5, 1))
+    shape_list.update_edge_color(1, [0, 1, 0, 1])
+    assert shape_list.triangles_grid is grid
+    np.testing.assert_array_equal(
+        shape_list._mesh.displayed_triangles_colors[0], [1, 0, 0, 1]
+    )
+
+    # shifted and scaled shapes are found at their new location, even
+    # outside of the area the spatial index was built for
+    shape_list.shift(0, [100, 100])
+    assert shape_list.triangles_grid is grid
+    assert shape_list.inside([2, 2]) is None
+    assert shape_list.inside([102, 102]) == 0
+    shape_list.scale(1, 2, center=np.array([0, 10]))
+    assert shape_list.inside([8, 18]) == 1
+    assert shape_list.triangles_grid is grid
+
+    shape_list.edit(2, np.array([[50, 50], [60, 60]]))
+    assert shape_list.triangles_grid is grid
+    assert shape_list.inside([55, 55]) == 2
+    assert shape_list.inside([2, 22]) is None
+    np.testing.assert_array_equal(
+        shape_list.vertices_in_box([[49, 49], [61, 61]]),
+        np.where(shape_list.displayed_index == 2)[0],
+    )
+    corners = np.array([[-1, -1], [61, 61]])
+    assert shape_list.shapes_in_box(corners) == [1, 2, 3, 4]
+
+    # shapes whose mesh changes size rebuild the spatial index
+    shape_list.edit(3, np.array([[0, 30], [5, 30], [5, 35]]), new_type='path')
+    assert shape_list._triangles_grid is None
+    assert shape_list.inside([2, 2]) is None
+
+
+def test_moved_to_other_slice_not_replaced_in_place():
+    """Test a shape moved to another slice is not replaced in place."""
+
+    def square(z, corner):
+        square = [[0, 0], [0, 5], [5, 5], [5, 0]] + np.array(corner)
+        return np.insert(square, 0, z, axis=1)
+
+    shape_list = ShapeList()
+    shape_list.slice_key = [0]
+    for i in range(2):
+        shape_list.add(Rectangle(square(0, 10 * i), dims_order=[0, 1, 2]))
+    assert list(shape_list._displayed) == [True, True]
+
+    shape_list.edit(1, square(0, 20))
+    assert shape_list.inside([22, 22]) == 1
+    # same number of vertices and triangles, but on another slice
+    shape_list.edit(1, square(3, 20))
+    assert list(shape_list._displayed) == [True, False]
+    assert shape_list.inside([22, 22]) is None
@@ -87,6 +87,23 @@ def test_properties(properties):
     assert updated_properties['shape_type'][0] == 'B'
 
 
+def test_remove_without_properties():
+    """Shapes without properties can be removed after a state round trip."""
+    np.random.seed(0)
+    data = 20 * np.random.random((5, 4, 2))
+    layer = Shapes(**Shapes(data)._get_state())
+    layer.selected_data = {0, 1}
+    layer.remove_selected()
+    assert layer.nshapes == 3
+
+    layer = Shapes(data, properties={})
+    layer.add(20 * np.random.random((4, 2)))
+    layer.selected_data = {0, 5}
+    layer.remove_selected()
+    assert layer.nshapes == 4
+    assert layer.properties == {}
+
+
 @pytest.mark.parametrize("attribute", ['edge', 'face'])
 def test_adding_properties(attribute):
     """Test adding properties to an existing layer"""
@@ -1362,6 +1379,34 @@ def test_value():
     assert value == (None, None)
 
 
+def test_hover_highlight():
+    """Test that hovering only outlines the hovered shape again."""
+    shape = (10, 4, 2)
+    np.random.seed(0)
+    data = 20 * np.random.random(shape)
+    layer = Shapes(data)
+    layer.mode = 'select'
+    layer.selected_data = {0, 1}
+
+    events = []
+    layer.events.highlight.connect(
+        lambda event: events.append(event.selection_changed)
+    )
+    layer._set_highlight()
+    assert events == [True]
+
+    layer._value = (2, None)
+    layer._set_highlight()
+    layer._set_highlight()
+    assert events == [True, False]
+    vertices, _ = layer._outline_hovered_shape()
+    np.testing.assert_array_equal(vertices, layer._outline(2)[0])
+
+    # a selected shape is outlined with the other selected shapes
+    layer._value = (1, None)
+    assert layer._outline_hovered_shape() == (None, None)
+
+
 def test_message():
     """Test converting values and coords to message."""
     shape = (10, 4, 2)
@@ -1,6 +1,11 @@
 import numpy as np
 
-from napari.layers.shapes._shapes_utils import number_of_shapes
+from napari.layers.shapes._shapes_utils import (
+    grid_points_in_poly,
+    number_of_shapes,
+    path_to_mask,
+    points_in_poly,
+)
 
 
 def test_no_shapes():
@@ -17,3 +22,34 @@ def test_one_shape():
 def test_many_shapes():
     """Test many shapes."""
     assert number_of_shapes(np.random.random((8, 4, 2))) == 8
+
+
+def test_grid_points_in_poly():
+    """Test the scanline fill matches ray casting of every grid point."""
+    np.random.seed(0)
+    shape = (30, 40)
+    grid = np.stack(np.indices(shape), axis=-1).reshape(-1, 2)
+    for _ in range(20):
+        vertices = 35 * np.random.random((7, 2)) - 2
+        mask = grid_points_in_poly(shape, vertices)
+        expected = points_in_poly(grid, vertices).reshape(shape)
+        np.testing.assert_array_equal(mask, expected)
+
+    # vertices on the grid, with horizontal and vertical edges
+    vertices = np.array([[2, 2], [2, 10], [8, 10], [8, 6], [5, 6], [5, 2]])
+    mask = grid_points_in_poly(shape, vertices)
+    expected = points_in_poly(grid, vertices).reshape(shape)
+    np.testing.assert_array_equal(mask, expected)
+
+
+def test_path_to_mask():
+    """Test a path is rasterized along each edge."""
+    vertices = np.array([[1, 1], [1, 5], [4, 8]])
+    mask = path_to_mask((6, 10), vertices)
+    assert np.all(mask[vertices[:, 0], vertices[:, 1]])
+    assert np.all(mask[1, 1:4])
+    assert not np.any(mask[:1]) and not np.any(mask[5:])
+    assert not np.any(mask[:, :1]) and not np.any(mask[:, 9:])
+
+    # a single point is not a path
+    assert not np.any(path_to_mask((6, 10), vertices[:1]))
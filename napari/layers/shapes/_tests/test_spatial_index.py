@@ -0,0 +1,70 @@
+import numpy as np
+
+from napari.layers.shapes._spatial_index import GridIndex
+
+
+def test_empty_grid_index():
+    """Test a grid index without boxes."""
+    grid = GridIndex(np.empty((0, 2)), np.empty((0, 2)))
+    assert len(grid.query_point([0, 0])) == 0
+    assert len(grid.query_box([[0, 0], [10, 10]])) == 0
+
+
+def test_grid_index_queries():
+    """Test queries return every box containing or intersecting the query."""
+    np.random.seed(0)
+    mins = 100 * np.random.random((200, 2))
+    maxs = mins + 10 * np.random.random((200, 2))
+    grid = GridIndex(mins, maxs)
+
+    for point in 120 * np.random.random((50, 2)) - 10:
+        candidates = grid.query_point(point)
+        inside = np.all((mins <= point) & (point <= maxs), axis=1)
+        assert set(np.flatnonzero(inside)) <= set(candidates)
+        assert np.all(np.diff(candidates) > 0)
+
+    for corners in 120 * np.random.random((50, 2, 2)) - 10:
+        low, high = corners.min(axis=0), corners.max(axis=0)
+        candidates = grid.query_box(corners)
+        intersects = np.all((mins <= high) & (low <= maxs), axis=1)
+        assert set(np.flatnonzero(intersects)) <= set(candidates)
+
+    # queries outside of the grid find nothing
+    assert len(grid.query_point([-50, 50])) == 0
+    assert len(grid.query_box([[200, 200], [300, 300]])) == 0
+
+
+def test_grid_index_points():
+    """Test a grid index of points, boxes without extent."""
+    points = np.array([[0, 0], [0, 5], [5, 5], [5, 5]])
+    grid = GridIndex(points, points)
+    np.testing.assert_array_equal(grid.query_box([[4, 4], [6, 6]]), [2, 3])
+    assert 1 in grid.query_point([0, 5])
+
+
+def test_grid_index_update():
+    """Test moved boxes are found at their new location only."""
+    np.random.seed(0)
+    mins = 100 * np.random.random((50, 2))
+    maxs = mins + 10 * np.random.random((50, 2))
+    grid = GridIndex(mins, maxs)
+
+    moved = np.array([3, 10, 11])
+    mins[moved] += [[150, 0], [-30, -30], [20, 20]]
+    maxs[moved] += [[150, 0], [-30, -30], [20, 20]]
+    grid.update(moved, mins[moved], maxs[moved])
+
+    for point in 200 * np.random.random((100, 2)) - 50:
+        candidates = grid.query_point(point)
+        inside = np.all((mins <= point) & (point <= maxs), axis=1)
+        assert set(np.flatnonzero(inside)) <= set(candidates)
+        assert np.all(np.diff(candidates) > 0)
+
+    for corners in 200 * np.random.random((50, 2, 2)) - 50:
+        low, high = corners.min(axis=0), corners.max(axis=0)
+        candidates = grid.query_box(corners)
+        intersects = np.all((mins <= high) & (low <= maxs), axis=1)
+        assert set(np.flatnonzero(intersects)) <= set(candidates)
+
+    assert 3 in grid.query_point(mins[3])
+    assert 3 not in grid.query_point(mins[3] - [150, 0])
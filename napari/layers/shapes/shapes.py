@@ -25,8 +25,10 @@ from ..utils.color_transformations import (
 from ..utils.layer_utils import (
     dataframe_to_properties,
     guess_continuous,
+    map_color_cycle,
     map_property,
 )
+from ..utils.property_table import PropertyTable
 from ..utils.text import TextManager
 from ._shape_list import ShapeList
 from ._shapes_constants import (
@@ -368,11 +370,14 @@ class Shapes(Layer):
 
         # Save the properties
         if properties is None:
-            self._properties = {}
+            self._property_table = PropertyTable(n_rows=number_of_shapes(data))
             self._property_choices = {}
         elif len(data) > 0:
             properties, _ = dataframe_to_properties(properties)
-            self._properties = self._validate_properties(properties, len(data))
+            self._property_table = PropertyTable(
+                self._validate_properties(properties, len(data)),
+                n_rows=number_of_shapes(data),
+            )
             self._property_choices = {
                 k: np.unique(v) for k, v in properties.items()
             }
@@ -384,7 +389,7 @@ class Shapes(Layer):
                 k: np.empty(0, dtype=v.dtype)
                 for k, v in self._property_choices.items()
             }
-            self._properties = empty_properties
+            self._property_table = PropertyTable(empty_properties, n_rows=0)
 
         # make the text
         if text is None or isinstance(text, (list, np.ndarray, str)):
@@ -565,15 +570,17 @@ class Shapes(Layer):
     @property
     def properties(self) -> Dict[str, np.ndarray]:
         """dict {str: np.ndarray (N,)}, DataFrame: Annotations for each shape"""
-        return self._properties
+        return self._property_table.columns
 
     @properties.setter
     def properties(self, properties: Dict[str, np.ndarray]):
         if not isinstance(properties, dict):
             properties, _ = dataframe_to_properties(properties)
-        self._properties = self._validate_properties(properties)
+        self._property_table = PropertyTable(
+            self._validate_properties(properties), n_rows=self.nshapes
+        )
         if self._face_color_property and (
-            self._face_color_property not in self._properties
+            self._face_color_property not in self._property_table
         ):
             self._face_color_property = ''
             warnings.warn(
@@ -581,14 +588,14 @@ class Shapes(Layer):
             )
 
         if self._edge_color_property and (
-            self._edge_color_property not in self._properties
+            self._edge_color_property not in self._property_table
         ):
             self._edge_color_property = ''
             warnings.warn(
                 'property used for edge_color dropped', RuntimeWarning
             )
 
-        if self.text.values is not None:
+        if self.text._values is not None:
             self.refresh_text()
         self.events.properties()
 
@@ -647,7 +654,7 @@ class Shapes(Layer):
             for i in self.selected_data:
                 self._data_view.update_edge_color(i, self._current_edge_color)
             self.events.edge_color()
-            self._update_thumbnail()
+            self._invalidate_thumbnail()
         self.events.current_edge_color()
 
     @property
@@ -663,7 +670,7 @@ class Shapes(Layer):
             for i in self.selected_data:
                 self._data_view.update_face_color(i, self._current_face_color)
             self.events.face_color()
-            self._update_thumbnail()
+            self._invalidate_thumbnail()
         self.events.current_face_color()
 
     @property
@@ -702,7 +709,7 @@ class Shapes(Layer):
     def edge_color(self, edge_color):
         self._set_color(edge_color, 'edge')
         self.events.edge_color()
-        self._update_thumbnail()
+        self._invalidate_thumbnail()
 
     @property
     def edge_color_cycle(self) -> np.ndarray:
@@ -769,7 +776,7 @@ class Shapes(Layer):
     def face_color(self, face_color):
         self._set_color(face_color, 'face')
         self.events.face_color()
-        self._update_thumbnail()
+        self._invalidate_thumbnail()
 
     @property
     def face_color_cycle(self) -> np.ndarray:
@@ -1114,36 +1121,18 @@ class Shapes(Layer):
             color_property = getattr(self, f'_{attribute}_color_property')
             color_properties = self.properties[color_property]
             if update_color_mapping:
-                color_cycle = getattr(self, f'_{attribute}_color_cycle')
-                color_cycle_map = {
-                    k: np.squeeze(transform_color(c))
-                    for k, c in zip(np.unique(color_properties), color_cycle)
-                }
-                setattr(self, f'{attribute}_color_cycle_map', color_cycle_map)
-
+                color_cycle_map = {}
             else:
-                # add properties if they are not in the colormap
-                # and update_color_mapping==False
+                # keep the current mapping, categories that are not
+                # in it yet get the next colors of the cycle
                 color_cycle_map = getattr(self, f'{attribute}_color_cycle_map')
-                color_cycle_keys = [*color_cycle_map]
-                props_in_map = np.in1d(color_properties, color_cycle_keys)
-                if not np.all(props_in_map):
-                    props_to_add = np.unique(
-                        color_properties[np.logical_not(props_in_map)]
-                    )
-                    color_cycle = getattr(self, f'_{attribute}_color_cycle')
-                    for prop in props_to_add:
-                        color_cycle_map[prop] = np.squeeze(
-                            transform_color(next(color_cycle))
-                        )
-                    setattr(
-                        self,
-                        f'{attribute}_color_cycle_map',
-                        color_cycle_map,
-                    )
-            colors = np.array([color_cycle_map[x] for x in color_properties])
-            if len(colors) == 0:
-                colors = np.empty((0, 4))
+            color_cycle = getattr(self, f'_{attribute}_color_cycle')
+            colors = map_color_cycle(
+                color_properties,
+                color_cycle_map,
+                lambda prop: np.squeeze(transform_color(next(color_cycle))),
+            )
+            setattr(self, f'{attribute}_color_cycle_map', color_cycle_map)
 
         elif color_mode == ColorMode.COLORMAP:
             color_property = getattr(self, f'_{attribute}_color_property')
@@ -1286,7 +1275,9 @@ class Shapes(Layer):
         text : (N x 1) np.ndarray
             Array of text strings for the N text elements in view
         """
-        return self.text.view_text(self._indices_view)
+        return self.text.view_text(
+            self._indices_view[self._view_text_positions]
+        )
 
     @property
     def _view_text_coords(self) -> np.ndarray:
@@ -1297,10 +1288,59 @@ class Shapes(Layer):
         text_coords : (N x D) np.ndarray
             Array of coordindates for the N text elements in view
         """
+        if self.text.declutter and self._ndisplay == 2:
+            text_coords, anchor_x, anchor_y = self._displayed_text_coords
+            return text_coords[self._view_text_positions], anchor_x, anchor_y
         return self.text.compute_text_coords(
             self._data_view.data, self._ndisplay
         )
 
+    @property
+    def _displayed_text_coords(self):
+        """Coordinates of the text elements of the shapes in view, along the
+        displayed dimensions."""
+        shapes = self._data_view.shapes
+        return self.text.compute_text_coords(
+            [shapes[i].data_displayed for i in self._indices_view],
+            self._ndisplay,
+        )
+
+    @property
+    def _view_text_positions(self):
+        """Positions among the shapes in view of the text elements to draw.
+
+        Returns
+        -------
+        positions : slice or np.ndarray
+            All the shapes in view, unless the text is decluttered.
+        """
+        if not self.text.declutter or self._ndisplay != 2:
+            return slice(None)
+        text_coords, _, _ = self._displayed_text_coords
+        scale = np.abs(self.scale)
+        cell_size = (
+            self.text.size * self.scale_factor / scale[self._dims_displayed]
+        )
+        return self.text.declutter_positions(
+            text_coords,
+            cell_size,
+            self.corner_pixels[:, self._dims_displayed],
+        )
+
+    def _update_draw(self, scale_factor, corner_pixels, shape_threshold):
+        old_scale_factor = self.scale_factor
+        old_corners = self.corner_pixels
+        super()._update_draw(scale_factor, corner_pixels, shape_threshold)
+        # The outlines of the selected shapes are scaled with the zoom
+        if self.scale_factor != old_scale_factor and self.selected_data:
+            self._set_highlight(force=True)
+        # Decluttered text depends on the zoom and on the canvas corners
+        if self.text.declutter and (
+            self.scale_factor != old_scale_factor
+            or not np.array_equal(self.corner_pixels, old_corners)
+        ):
+            self.text.events.text()
+
     @property
     def mode(self):
         """MODE: Interactive mode. The normal, default mode is PAN_ZOOM, which
@@ -1491,13 +1531,9 @@ class Shapes(Layer):
             z_index = z_index or 0
 
         if n_new_shapes > 0:
-            for k in self.properties:
-                new_property = np.repeat(
-                    self.current_properties[k], n_new_shapes, axis=0
-                )
-                self.properties[k] = np.concatenate(
-                    (self.properties[k], new_property), axis=0
-                )
+            self._property_table.add_rows(
+                self.current_properties, n_new_shapes
+            )
             self.text.add(self.current_properties, n_new_shapes)
 
             self._add_shapes(
@@ -1831,7 +1867,22 @@ class Shapes(Layer):
         return box
 
     def _outline_shapes(self):
-        """Find outlines of any selected or hovered shapes.
+        """Find outlines of any selected shapes.
+
+        Returns
+        -------
+        vertices : None | np.ndarray
+            Nx2 array of any vertices of outline or None
+        triangles : None | np.ndarray
+            Mx3 array of any indices of vertices for triangles of outline or
+            None
+        """
+        if len(self.selected_data) > 0:
+            return self._outline(sorted(self.selected_data))
+        return None, None
+
+    def _outline_hovered_shape(self):
+        """Find the outline of the hovered shape, unless it is selected.
 
         Returns
         -------
@@ -1841,30 +1892,35 @@ class Shapes(Layer):
             Mx3 array of any indices of vertices for triangles of outline or
             None
         """
-        if self._value is not None and (
-            self._value[0] is not None or len(self.selected_data) > 0
+        if (
+            self._value is not None
+            and self._value[0] is not None
+            and self._value[0] not in self.selected_data
         ):
-            if len(self.selected_data) > 0:
-                index = list(self.selected_data)
-                if self._value[0] is not None:
-                    if self._value[0] in index:
-                        pass
-                    else:
-                        index.append(self._value[0])
-                index.sort()
-            else:
-                index = self._value[0]
+            return self._outline(self._value[0])
+        return None, None
 
-            centers, offsets, triangles = self._data_view.outline(index)
-            vertices = centers + (
-                self.scale_factor * self._highlight_width * offsets
-            )
-            vertices = vertices[:, ::-1]
-        else:
-            vertices = None
-            triangles = None
+    def _outline(self, index):
+        """Find the outlines of shapes, scaled for the current zoom.
+
+        Parameters
+        ----------
+        index : int | list
+            Index of the shape to outline, or sorted list of indices of the
+            shapes to outline.
 
-        return vertices, triangles
+        Returns
+        -------
+        vertices : np.ndarray
+            Nx2 array of vertices of outline
+        triangles : np.ndarray
+            Mx3 array of indices of vertices for triangles of outline
+        """
+        centers, offsets, triangles = self._data_view.outline(index)
+        vertices = centers + (
+            self.scale_factor * self._highlight_width * offsets
+        )
+        return vertices[:, ::-1], triangles
 
     def _compute_vertices_and_box(self):
         """Compute location of highlight vertices and box for rendering.
@@ -1969,17 +2025,20 @@ class Shapes(Layer):
         force : bool
             Bool that forces a redraw to occur when `True`
         """
-        # Check if any shape or vertex ids have changed since last call
-        if (
-            self.selected_data == self._selected_data_stored
-            and np.all(self._value == self._value_stored)
-            and np.all(self._drag_box == self._drag_box_stored)
-        ) and not force:
+        # Check if any shape or vertex ids have changed since last call.
+        # The selection is only copied when it changed, not while hovering.
+        selection_changed = (
+            force
+            or self.selected_data != self._selected_data_stored
+            or not np.all(self._drag_box == self._drag_box_stored)
+        )
+        if not selection_changed and np.all(self._value == self._value_stored):
             return
-        self._selected_data_stored = copy(self.selected_data)
+        if selection_changed:
+            self._selected_data_stored = copy(self.selected_data)
+            self._drag_box_stored = copy(self._drag_box)
         self._value_stored = copy(self._value)
-        self._drag_box_stored = copy(self._drag_box)
-        self.events.highlight()
+        self.events.highlight(selection_changed=selection_changed)
 
     def _finish_drawing(self, event=None):
         """Reset properties used in shape drawing."""
@@ -2052,15 +2111,9 @@ class Shapes(Layer):
     def remove_selected(self):
         """Remove any selected shapes."""
         index = list(self.selected_data)
-        to_remove = sorted(index, reverse=True)
-        for ind in to_remove:
-            self._data_view.remove(ind)
-
         if len(index) > 0:
-            for k in self.properties:
-                self.properties[k] = np.delete(
-                    self.properties[k], index, axis=0
-                )
+            self._data_view.remove_many(index)
+            self._property_table.remove_rows(index)
             self.text.remove(index)
             self._data_view._edge_color = np.delete(
                 self._data_view._edge_color, index, axis=0
@@ -2197,24 +2250,22 @@ class Shapes(Layer):
             elif self._mode in (
                 [Mode.DIRECT, Mode.VERTEX_INSERT, Mode.VERTEX_REMOVE]
             ):
-                # Check if inside vertex of shape
-                inds = np.isin(self._data_view.displayed_index, selected_index)
-                vertices = self._data_view.displayed_vertices[inds]
-                distances = abs(vertices - coord)
-
                 # Get the vertex sizes
                 sizes = self._vertex_size * self.scale_factor / 2
 
-                # Check if any matching vertices
-                matches = np.all(distances <= sizes, axis=1).nonzero()[0]
+                # Check if inside vertex of shape
+                matches = self._data_view.vertices_in_box(
+                    [np.subtract(coord, sizes), np.add(coord, sizes)]
+                )
+                displayed_index = self._data_view.displayed_index
+                matches = matches[
+                    np.isin(displayed_index[matches], selected_index)
+                ]
                 if len(matches) > 0:
-                    index = inds.nonzero()[0][matches[-1]]
-                    shape = self._data_view.displayed_index[index]
-                    vals, idx = np.unique(
-                        self._data_view.displayed_index, return_index=True
-                    )
-                    shape_in_list = list(vals).index(shape)
-                    value = (shape, index - idx[shape_in_list])
+                    index = matches[-1]
+                    shape = displayed_index[index]
+                    first = np.flatnonzero(displayed_index == shape)[0]
+                    value = (shape, index - first)
 
         if value is None:
             # Check if mouse inside shape
@@ -2257,10 +2308,10 @@ class Shapes(Layer):
                 },
                 'indices': self._slice_indices,
             }
-            if self.text.values is None:
+            if self.text._values is None:
                 self._clipboard['text'] = None
             else:
-                self._clipboard['text'] = deepcopy(self.text.values[index])
+                self._clipboard['text'] = self.text._get_values(index)
         else:
             self._clipboard = {}
 
@@ -2274,11 +2325,9 @@ class Shapes(Layer):
                 for i in self._dims_not_displayed
             ]
 
-            for k in self.properties:
-                self.properties[k] = np.concatenate(
-                    (self.properties[k], self._clipboard['properties'][k]),
-                    axis=0,
-                )
+            self._property_table.add_rows(
+                self._clipboard['properties'], len(self._clipboard['data'])
+            )
 
             # Add new shape data
             for i, s in enumerate(self._clipboard['data']):
@@ -2295,8 +2344,8 @@ class Shapes(Layer):
                 )
 
             if self._clipboard['text'] is not None:
-                self.text._values = np.concatenate(
-                    (self.text.values, self._clipboard['text']), axis=0
+                self.text._paste(
+                    self._clipboard['properties'], self._clipboard['text']
                 )
 
             self.selected_data = set(
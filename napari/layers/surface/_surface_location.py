@@ -0,0 +1,45 @@
+"""SurfaceLocation class.
+
+SurfaceLocation is the Surface layer's ChunkLocation. When we request that
+the ChunkLoader load the vertex values of a slice, we use this ChunkLocation
+to identify the values we are requesting and once they are loaded.
+"""
+from ...components.experimental.chunk import ChunkLocation, LayerRef
+
+
+class SurfaceLocation(ChunkLocation):
+    """The hashable location of the vertex values of a surface slice.
+
+    Attributes
+    ----------
+    data_id : int
+        The id of the vertex values of the layer.
+    indices : tuple of int
+        The indices of the slice into the leading dims of the vertex values.
+    """
+
+    def __init__(self, layer, indices):
+        super().__init__(LayerRef.from_layer(layer))
+        self.data_id: int = id(layer.vertex_values)
+        self.indices = tuple(int(i) for i in indices)
+
+    def __str__(self):
+        return f"location=({self.data_id}, {self.indices}) "
+
+    def __eq__(self, other) -> bool:
+        return (
+            isinstance(other, SurfaceLocation)
+            and super().__eq__(other)
+            and self.data_id == other.data_id
+            and self.indices == other.indices
+        )
+
+    def __hash__(self) -> int:
+        """Return hash of this location.
+
+        Returns
+        -------
+        int
+            The hash of the location.
+        """
+        return hash((self.layer_ref.layer_id, self.data_id, self.indices))
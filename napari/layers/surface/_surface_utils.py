@@ -0,0 +1,65 @@
+import numpy as np
+
+from ..utils.layer_utils import calc_data_range
+
+
+def calculate_face_slice_index(vertices, faces, dims):
+    """Group mesh faces by the integer coordinates of their vertices.
+
+    Only faces whose three vertices share the same integer coordinates along
+    ``dims`` can be in a slice, so these are grouped by those coordinates.
+    Slicing the mesh is then a single dictionary lookup rather than a test of
+    every face.
+
+    Parameters
+    ----------
+    vertices : (N, D) array
+        Vertices of the mesh.
+    faces : (M, 3) array of int
+        Indices of the vertices of each triangle of the mesh.
+    dims : list of int
+        Dimensions of the vertices that are sliced, i.e. not displayed.
+
+    Returns
+    -------
+    face_slice_index : dict {tuple: (K, 3) array}
+        Faces of the mesh in each slice, keyed by the coordinates of the
+        slice along ``dims``.
+    """
+    coords = vertices[:, dims].astype(int)
+    face_coords = coords[faces]
+    in_slice = np.all(face_coords == face_coords[:, :1], axis=(1, 2))
+    face_indices = np.flatnonzero(in_slice)
+    if len(face_indices) == 0:
+        return {}
+
+    keys, inverse = np.unique(
+        face_coords[face_indices, 0], axis=0, return_inverse=True
+    )
+    inverse = inverse.ravel()
+    order = np.argsort(inverse, kind='stable')
+    splits = np.cumsum(np.bincount(inverse))[:-1]
+    groups = np.split(faces[face_indices[order]], splits)
+
+    return {tuple(key): group for key, group in zip(keys.tolist(), groups)}
+
+
+def calc_vertex_values_range(vertex_values):
+    """Calculate the range of vertex values.
+
+    Vertex values with leading dimensions, such as a time series, can be too
+    large to load in full, e.g. when they are a Dask or zarr array. The
+    range of large values is then estimated from vertex values evenly spaced
+    over the leading dimensions, as calc_data_range does for images.
+
+    Parameters
+    ----------
+    vertex_values : (K0, ..., KL, N) array
+        Values used to color the vertices.
+
+    Returns
+    -------
+    values : list of float
+        Range of values.
+    """
+    return calc_data_range(vertex_values, plane_ndim=1)
@@ -1,3 +1,4 @@
+import dask.array as da
 import numpy as np
 import pytest
 
@@ -58,6 +59,39 @@ def test_random_4D_surface():
     assert layer._view_vertex_values.ndim == 1
 
 
+def test_4D_surface_slicing():
+    """Test slicing faces of a 4D surface along the non-displayed dims."""
+    np.random.seed(0)
+    vertices = np.random.randint(3, size=(200, 4)).astype(float)
+    vertices[:, 2:] += np.random.random((200, 2))
+    faces = np.random.randint(200, size=(5000, 3))
+    values = np.random.random(200)
+    layer = Surface((vertices, faces, values))
+
+    for step in [(0, 0), (1, 2), (2, 1)]:
+        layer._slice_dims(point=step + (0, 0))
+        in_slice = np.all(
+            vertices[faces][:, :, :2].astype(int) == step, axis=(1, 2)
+        )
+        expected = faces[in_slice]
+        assert len(layer._view_faces) == len(expected)
+        np.testing.assert_array_equal(
+            np.sort(layer._view_faces, axis=0), np.sort(expected, axis=0)
+        )
+
+    # slices without any faces in them are empty
+    layer._slice_dims(point=(5, 5, 0, 0))
+    assert layer._view_faces.shape == (0, 3)
+
+    # changing the displayed dims changes the sliced dims
+    layer._slice_dims(point=(1, 0, 2, 0), order=(0, 2, 1, 3))
+    in_slice = np.all(
+        vertices[faces][:, :, [0, 2]].astype(int) == (1, 2), axis=(1, 2)
+    )
+    assert np.count_nonzero(in_slice) > 0
+    assert len(layer._view_faces) == np.count_nonzero(in_slice)
+
+
 def test_random_3D_timeseries_surface():
     """Test instantiating Surface layer with random 3D timeseries data."""
     np.random.seed(0)
@@ -103,6 +137,72 @@ def test_random_3D_multitimeseries_surface():
     assert layer._view_vertex_values.ndim == 1
 
 
+@pytest.mark.sync_only
+def test_dask_timeseries_surface():
+    """Test a Surface layer with lazy time series vertex values."""
+    np.random.seed(0)
+    vertices = np.random.random((10, 3))
+    faces = np.random.randint(10, size=(6, 3))
+    values = da.random.random((100, 10), chunks=(1, 10))
+    layer = Surface((vertices, faces, values))
+    assert layer.ndim == 4
+    assert layer.extent.data[1][0] == 100
+
+    # only the values of the current slice are loaded
+    layer._slice_dims(point=(42, 0, 0, 0))
+    assert isinstance(layer._view_vertex_values, np.ndarray)
+    np.testing.assert_array_equal(
+        layer._view_vertex_values, values[42].compute()
+    )
+
+    # contrast limits are estimated from a sample of the slices
+    low, high = layer.contrast_limits
+    assert 0 <= low < high <= 1
+
+
+@pytest.mark.async_only
+def test_dask_timeseries_surface_async():
+    """Test the vertex values of a slice are loaded by the ChunkLoader."""
+    from napari.components.experimental.chunk import ChunkRequest
+
+    np.random.seed(0)
+    vertices = np.random.random((10, 3))
+    faces = np.random.randint(10, size=(6, 3))
+    values = da.random.random((100, 10), chunks=(1, 10))
+    layer = Surface((vertices, faces, values))
+
+    layer._slice_dims(point=(42, 0, 0, 0))
+    assert not layer.loaded
+
+    # simulate the ChunkLoader finishing the load of an earlier slice
+    location = layer._values_location
+    request = ChunkRequest(location, {'vertex_values': values[42]})
+    request.load_chunks()
+    layer._slice_dims(point=(7, 0, 0, 0))
+    layer.on_chunk_loaded(request)
+    assert not layer.loaded
+
+    request = ChunkRequest(
+        layer._values_location, {'vertex_values': values[7]}
+    )
+    request.load_chunks()
+    layer.on_chunk_loaded(request)
+    assert layer.loaded
+    np.testing.assert_array_equal(
+        layer._view_vertex_values, values[7].compute()
+    )
+
+
+def test_surface_contrast_limits_sample():
+    """Test the contrast limits range of long vertex values time series."""
+    vertices = np.random.random((10, 3))
+    faces = np.random.randint(10, size=(6, 3))
+    values = np.tile(np.arange(1000, dtype=float)[:, np.newaxis], (1, 10))
+    layer = Surface((vertices, faces, values))
+    # the first and last slices are always part of the sample
+    assert layer.contrast_limits == [0, 999]
+
+
 def test_visiblity():
     """Test setting layer visibility."""
     np.random.seed(0)
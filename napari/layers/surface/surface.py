@@ -2,11 +2,20 @@ import warnings
 
 import numpy as np
 
+from ...utils import config
 from ...utils.colormaps import AVAILABLE_COLORMAPS
 from ...utils.events import Event
 from ..base import Layer
 from ..intensity_mixin import IntensityVisualizationMixin
 from ..utils.layer_utils import calc_data_range
+from ._surface_utils import (
+    calc_vertex_values_range,
+    calculate_face_slice_index,
+)
+
+if config.async_loading:
+    from ...components.experimental.chunk import ChunkRequest, chunk_loader
+    from ._surface_location import SurfaceLocation
 
 
 # Mixin must come before Layer
@@ -22,6 +31,8 @@ class Surface(IntensityVisualizationMixin, Layer):
         of the mesh triangles. The third element is the (K0, ..., KL, N)
         array of values used to color vertices where the additional L
         dimensions are used to color the same mesh with different values.
+        The values can be a lazy array, such as a Dask or zarr array, in
+        which case only the values of the current slice are loaded.
     colormap : str, napari.utils.Colormap, tuple, dict
         Colormap to use for luminance images. If a string must be the name
         of a supported colormap from vispy or matplotlib. If a tuple the
@@ -32,7 +43,8 @@ class Surface(IntensityVisualizationMixin, Layer):
     contrast_limits : list (2,)
         Color limits to be used for determining the colormap bounds for
         luminance images. If not passed is calculated as the min and max of
-        the image.
+        the vertex values, estimated from a sample of their slices when the
+        vertex values have many leading dimensions.
     gamma : float
         Gamma correction for determining colormap linearity. Defaults to 1.
     name : str
@@ -149,7 +161,7 @@ class Surface(IntensityVisualizationMixin, Layer):
         # Set contrast_limits and colormaps
         self._gamma = gamma
         if contrast_limits is None:
-            self._contrast_limits_range = calc_data_range(data[2])
+            self._contrast_limits_range = calc_vertex_values_range(data[2])
         else:
             self._contrast_limits_range = contrast_limits
         self._contrast_limits = tuple(self._contrast_limits_range)
@@ -161,6 +173,14 @@ class Surface(IntensityVisualizationMixin, Layer):
         self._view_faces = np.zeros((0, 3))
         self._view_vertex_values = []
 
+        # Location of the vertex values being shown or loaded
+        self._values_location = None
+        self._values_loaded = True
+
+        # Faces grouped by slice, for the dims that are not displayed
+        self._face_slice_index = None
+        self._face_slice_dims = None
+
         # assign mesh data and establish default behavior
         self._vertices = data[0]
         self._faces = data[1]
@@ -169,8 +189,15 @@ class Surface(IntensityVisualizationMixin, Layer):
         # Trigger generation of view slice and thumbnail
         self._update_dims()
 
-    def _calc_data_range(self):
-        return calc_data_range(self.vertex_values)
+    def _calc_data_range(self, mode='data', percentiles=None):
+        if mode == 'slice':
+            values = np.asarray(self._view_vertex_values)
+            if values.size == 0:
+                return [0, 1]
+            return calc_data_range(values, percentiles)
+        if percentiles is not None:
+            return calc_data_range(self.vertex_values, percentiles)
+        return calc_vertex_values_range(self.vertex_values)
 
     @property
     def dtype(self):
@@ -189,6 +216,7 @@ class Surface(IntensityVisualizationMixin, Layer):
         """Array of vertices of mesh triangles."""
 
         self._vertices = vertices
+        self._face_slice_index = None
 
         self._update_dims()
         self.refresh()
@@ -217,12 +245,18 @@ class Surface(IntensityVisualizationMixin, Layer):
     def faces(self, faces: np.ndarray):
         """Array of indices of mesh triangles.."""
 
-        self.faces = faces
+        self._faces = faces
+        self._face_slice_index = None
 
         self.refresh()
         self.events.data(value=self.data)
         self._set_editable()
 
+    @property
+    def loaded(self) -> bool:
+        """bool: True if the vertex values of the slice have been loaded."""
+        return self._values_loaded
+
     def _get_ndim(self):
         """Determine number of dimensions of the layer."""
         return self.vertices.shape[1] + (self.vertex_values.ndim - 1)
@@ -292,7 +326,7 @@ class Surface(IntensityVisualizationMixin, Layer):
                 self._view_vertex_values = []
                 return
 
-            self._view_vertex_values = values
+            self._load_vertex_values(values, values_indices)
             # Determine which axes of the vertices data are being displayed
             # and not displayed, ignoring the additional dimensions
             # corresponding to the vertex_values.
@@ -308,7 +342,7 @@ class Surface(IntensityVisualizationMixin, Layer):
                 if d >= 0
             ]
         else:
-            self._view_vertex_values = self.vertex_values
+            self._load_vertex_values(self.vertex_values, ())
             indices = np.array(self._slice_indices)
             not_disp = list(self._dims_not_displayed)
             disp = list(self._dims_displayed)
@@ -317,17 +351,81 @@ class Surface(IntensityVisualizationMixin, Layer):
         if len(self.vertices) == 0:
             self._view_faces = np.zeros((0, 3))
         elif vertex_ndim > self._ndisplay:
-            vertices = self.vertices[:, not_disp].astype('int')
-            triangles = vertices[self.faces]
-            matches = np.all(triangles == indices[not_disp], axis=(1, 2))
-            matches = np.where(matches)[0]
-            if len(matches) == 0:
-                self._view_faces = np.zeros((0, 3))
-            else:
-                self._view_faces = self.faces[matches]
+            if (
+                self._face_slice_index is None
+                or self._face_slice_dims != not_disp
+            ):
+                self._face_slice_index = calculate_face_slice_index(
+                    self.vertices, self.faces, not_disp
+                )
+                self._face_slice_dims = not_disp
+            self._view_faces = self._face_slice_index.get(
+                tuple(indices[not_disp]), np.zeros((0, 3))
+            )
         else:
             self._view_faces = self.faces
 
+    def _load_vertex_values(self, values, indices):
+        """Load the vertex values of the current slice, sync or async.
+
+        With async loading enabled values that are not in memory, such as a
+        slice of a Dask array, are loaded by the ChunkLoader in a worker
+        thread. The values of the previous slice are shown until then.
+
+        Parameters
+        ----------
+        values : (N,) array
+            Vertex values of the current slice.
+        indices : tuple of int
+            Indices of the slice into the leading dims of the vertex values.
+        """
+        if not config.async_loading or isinstance(values, np.ndarray):
+            self._values_location = None
+            self._values_loaded = True
+            self._view_vertex_values = np.asarray(values)
+            return
+
+        location = SurfaceLocation(self, indices)
+        if location == self._values_location:
+            return  # Already showing or loading these values.
+        self._values_location = location
+
+        def _should_cancel(chunk_request: ChunkRequest) -> bool:
+            """Cancel requests for other slices of these vertex values."""
+            return chunk_request.location.data_id == location.data_id
+
+        chunk_loader.cancel_requests(_should_cancel)
+
+        request = ChunkRequest(location, {'vertex_values': values})
+        satisfied_request = chunk_loader.load_request(request)
+        if satisfied_request is None:
+            # The load is async, signal that we are no longer loaded.
+            self._values_loaded = False
+            self.events.loaded()
+            return
+
+        self._values_loaded = True
+        self._view_vertex_values = satisfied_request.chunks['vertex_values']
+
+    # For async we add an on_chunk_loaded() method.
+    if config.async_loading:
+
+        def on_chunk_loaded(self, request: ChunkRequest) -> None:
+            """An asynchronous ChunkRequest was loaded.
+
+            Parameters
+            ----------
+            request : ChunkRequest
+                This request was loaded.
+            """
+            if request.location != self._values_location:
+                return  # Values for a slice we are no longer showing.
+
+            self._view_vertex_values = request.chunks['vertex_values']
+            self._values_loaded = True
+            self.events.loaded()
+            self.events.set_data()  # update vispy
+
     def _update_thumbnail(self):
         """Update thumbnail with current surface."""
         pass
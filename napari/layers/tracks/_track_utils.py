@@ -5,6 +5,7 @@ from scipy.sparse import coo_matrix
 from scipy.spatial import cKDTree
 
 from ..utils.layer_utils import dataframe_to_properties
+from ..utils.property_table import PropertyTable
 
 
 def connex(vertices: np.ndarray) -> list:
@@ -69,7 +70,7 @@ class TrackManager:
 
         # store the raw data here
         self._data = None
-        self._properties = None
+        self._property_table = PropertyTable(n_rows=0)
         self._order = None
 
         # use a kdtree to help with fast lookup of the nearest track
@@ -144,7 +145,7 @@ class TrackManager:
     @property
     def properties(self) -> Dict[str, np.ndarray]:
         """dict {str: np.ndarray (N,)}, DataFrame: Properties for each track."""
-        return self._properties
+        return self._property_table.columns
 
     @properties.setter
     def properties(self, properties: Dict[str, np.ndarray]):
@@ -166,7 +167,9 @@ class TrackManager:
             properties[prop] = arr
 
         # check the formatting of incoming properties data
-        self._properties = self._validate_track_properties(properties)
+        self._property_table = PropertyTable(
+            self._validate_track_properties(properties), n_rows=len(self.data)
+        )
 
     @property
     def graph(self) -> Dict[int, Union[int, List[int]]]:
@@ -0,0 +1,74 @@
+import dask.array as da
+import numpy as np
+
+from napari.layers.utils.contrast_estimator import (
+    ContrastEstimator,
+    DataHistogram,
+)
+
+
+def test_histogram_percentiles():
+    """Percentiles are close to the exact ones, extremes are exact."""
+    np.random.seed(0)
+    data = np.random.normal(size=100_000)
+    histogram = DataHistogram()
+    # sorted batches extend the range of the histogram each time
+    for batch in np.array_split(np.sort(data), 10):
+        histogram.add(batch)
+
+    assert histogram.n_values == data.size
+    assert histogram.counts.sum() == data.size
+    np.testing.assert_allclose(
+        histogram.percentile([1, 50, 99]),
+        np.percentile(data, [1, 50, 99]),
+        atol=0.05,
+    )
+    assert histogram.percentile(0) == data.min()
+    assert histogram.percentile(100) == data.max()
+
+
+def test_histogram_constant_values():
+    """Equal values added first are kept once the range grows."""
+    histogram = DataHistogram(n_bins=10)
+    histogram.add(np.full(10, 5.0))
+    assert histogram.percentile(50) == 5
+    histogram.add([0, 10, np.nan])
+    assert histogram.n_values == 12
+    # within the bin of 5
+    assert 5 <= histogram.percentile(50) <= 6
+
+
+def test_estimator_samples_whole_array():
+    """Chunks are sampled across the array, until all were loaded."""
+    data = np.zeros((100, 8, 8))
+    data[73, 0, 0] = 1
+    data = da.from_array(data, chunks=(1, 8, 8))
+    estimator = ContrastEstimator(data)
+    assert estimator.n_chunks == 100
+
+    estimator.refine(max_time=None, max_bytes=10 * 8 * 8 * 8)
+    assert estimator.n_loaded == 10
+    loaded = sorted(estimator._loaded)
+    # spread across the whole array
+    assert loaded[0] < 10 and loaded[-1] >= 90
+    assert max(np.diff(loaded)) < 20
+
+    estimates = list(estimator.iter_refine())
+    assert estimator.done
+    assert estimator.n_loaded == 100
+    assert estimates[-1] == [0, 1]
+
+
+def test_estimator_zarr_like_chunks():
+    """Arrays with a chunks attribute are loaded by their chunks."""
+
+    class Chunked(np.ndarray):
+        chunks = (5, 5)
+
+    data = np.arange(100.0).reshape(10, 10).view(Chunked)
+    estimator = ContrastEstimator(data)
+    assert estimator.n_chunks == 4
+    estimator.refine(max_time=None, max_bytes=1)
+    assert estimator.n_loaded == 1
+    estimator.refine(max_time=None)
+    assert estimator.contrast_limits() == [0, 99]
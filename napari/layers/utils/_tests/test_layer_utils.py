@@ -4,9 +4,12 @@ import pytest
 from dask import array as da
 
 from napari.layers.utils.layer_utils import (
+    _sample_planes,
     calc_data_range,
+    compute_multiscale_level_3d,
     dataframe_to_properties,
     guess_continuous,
+    map_color_cycle,
     segment_normal,
 )
 
@@ -72,6 +75,67 @@ def test_calc_data_range_fast_big():
     assert len(val) > 0
 
 
+@pytest.mark.timeout(2)
+def test_calc_data_range_one_chunk():
+    """Only some planes of data in a single big chunk are loaded."""
+    data = np.zeros((400, 512, 512), dtype=np.float32)
+    data[0, 0, 0] = -1
+    data[200, 0, 0] = 2
+    data[1, 0, 0] = 3
+    data = da.from_array(data, chunks=data.shape)
+    assert calc_data_range(data) == [-1, 2]
+    assert calc_data_range(data) == [-1, 2]
+
+
+def test_sample_planes():
+    """The first, middle and last planes are sampled, within a budget."""
+    data = np.arange(9 * 4 * 2 * 2).reshape((9, 4, 2, 2))
+    planes = _sample_planes(data)
+    assert planes.shape == (17, 2, 2)
+    np.testing.assert_array_equal(planes[[0, 8, 16], 0, 0], [0, 72, 140])
+
+    # big planes, at least three of them
+    planes = _sample_planes(np.zeros((10, 2000, 2000)))
+    assert planes.shape == (3, 2000, 2000)
+
+    assert _sample_planes(np.zeros((3000, 1000))).shape == (1, 3000, 1000)
+
+    # vertex values are sampled along their last axis only
+    planes = _sample_planes(np.arange(9 * 4 * 2).reshape((9, 4, 2)), ndim=1)
+    assert planes.shape == (17, 2)
+    np.testing.assert_array_equal(planes[[0, 8, 16], 0], [0, 36, 70])
+
+
+def test_compute_multiscale_level_3d():
+    """The finest level whose view fits the budget is selected."""
+    downsample_factors = np.array([[1, 1, 1], [2, 2, 2], [4, 4, 4]])
+    corner_pixels = np.array([[0, 0, 0], [63, 63, 63]])
+
+    level, corners = compute_multiscale_level_3d(
+        corner_pixels, downsample_factors, 1, 64 ** 3
+    )
+    assert level == 0
+    np.testing.assert_array_equal(corners, corner_pixels)
+
+    level, corners = compute_multiscale_level_3d(
+        corner_pixels, downsample_factors, 2, 64 ** 3
+    )
+    assert level == 1
+    np.testing.assert_array_equal(corners, [[0, 0, 0], [32, 32, 32]])
+
+    # The texture size limits the level too
+    level, _ = compute_multiscale_level_3d(
+        corner_pixels, downsample_factors, 1, 64 ** 3, max_shape=20
+    )
+    assert level == 2
+
+    # The coarsest level is used when none fits
+    level, _ = compute_multiscale_level_3d(
+        corner_pixels, downsample_factors, 1, 10
+    )
+    assert level == 2
+
+
 def test_segment_normal_2d():
     a = np.array([1, 1])
     b = np.array([1, 10])
@@ -105,3 +169,25 @@ def test_guess_continuous():
 
     categorical_annotation_2 = np.array([1, 2, 3], dtype=np.int)
     assert not guess_continuous(categorical_annotation_2)
+
+
+def test_map_color_cycle():
+    prop = np.array(['b', 'a', 'b', 'c', 'a'])
+    color_cycle_map = {'a': np.array([1, 0, 0, 1])}
+    new_colors = iter([[0, 1, 0, 1], [0, 0, 1, 1]])
+
+    colors = map_color_cycle(
+        prop, color_cycle_map, lambda p: np.array(next(new_colors))
+    )
+
+    # new categories are added to the map in sorted order
+    assert list(color_cycle_map) == ['a', 'b', 'c']
+    np.testing.assert_equal(color_cycle_map['b'], [0, 1, 0, 1])
+    np.testing.assert_equal(color_cycle_map['c'], [0, 0, 1, 1])
+    expected = np.array([color_cycle_map[p] for p in prop])
+    np.testing.assert_equal(colors, expected)
+
+
+def test_map_color_cycle_empty():
+    colors = map_color_cycle(np.array([]), {}, None)
+    assert colors.shape == (0, 4)
@@ -0,0 +1,126 @@
+import numpy as np
+import pytest
+
+from napari.layers.utils.property_table import PropertyTable
+
+
+def test_empty_property_table():
+    table = PropertyTable(n_rows=0)
+    assert len(table) == 0
+    assert table.columns == {}
+
+    table = PropertyTable(n_rows=3)
+    assert len(table) == 3
+    table = PropertyTable({}, n_rows=3)
+    assert len(table) == 3
+
+    # the number of rows cannot be told from an empty dict
+    with pytest.raises(ValueError):
+        PropertyTable({})
+
+
+def test_property_table_mismatched_lengths():
+    with pytest.raises(ValueError):
+        PropertyTable({'a': [1, 2, 3], 'b': [1, 2]})
+
+    with pytest.raises(ValueError):
+        PropertyTable({'a': [1, 2, 3]}, n_rows=2)
+
+
+def test_add_rows():
+    table = PropertyTable({'a': np.array([1, 2]), 'b': np.array(['x', 'y'])})
+    table.add_rows({'a': [3], 'b': ['z']}, 3)
+    assert len(table) == 5
+    np.testing.assert_equal(table['a'], [1, 2, 3, 3, 3])
+    np.testing.assert_equal(table['b'], ['x', 'y', 'z', 'z', 'z'])
+
+    table.add_rows({'a': [4, 5], 'b': ['long_label', 'w']})
+    np.testing.assert_equal(table['a'], [1, 2, 3, 3, 3, 4, 5])
+    # string columns are promoted to fit the new values
+    np.testing.assert_equal(table['b'][-2:], ['long_label', 'w'])
+
+    with pytest.raises(KeyError):
+        table.add_rows({'a': [1]})
+
+
+def test_add_rows_grows_capacity():
+    table = PropertyTable({'a': np.arange(4)})
+    capacities = set()
+    for i in range(100):
+        table.add_rows({'a': [i]})
+        capacities.add(table.capacity)
+    assert len(table) == 104
+    np.testing.assert_equal(table['a'], np.concatenate([range(4), range(100)]))
+    # the buffers are only reallocated when their capacity doubles
+    assert capacities == {8, 16, 32, 64, 128}
+
+
+def test_remove_rows():
+    table = PropertyTable({'a': np.arange(10), 'b': np.arange(10) * 2})
+    table.remove_rows([0, 5])
+    assert len(table) == 8
+    # indices refer to the remaining rows, even before compaction
+    table.remove_rows([0])
+    assert len(table) == 7
+    np.testing.assert_equal(table['a'], [2, 3, 4, 6, 7, 8, 9])
+    np.testing.assert_equal(table['b'], [4, 6, 8, 12, 14, 16, 18])
+
+    table.add_rows({'a': [10], 'b': [20]})
+    np.testing.assert_equal(table['a'], [2, 3, 4, 6, 7, 8, 9, 10])
+
+
+def test_columns_are_editable_in_place():
+    table = PropertyTable({'a': np.zeros(3)})
+    table.add_rows({'a': [0]})
+    table.columns['a'][1] = 5
+    np.testing.assert_equal(table['a'], [0, 5, 0, 0])
+
+
+def test_categorical_column():
+    labels = np.array(['cat', 'dog', 'cat', 'bird'])
+    table = PropertyTable({'label': labels}, categorical=['label'])
+    np.testing.assert_equal(table['label'], labels)
+    np.testing.assert_equal(table.categories('label'), ['bird', 'cat', 'dog'])
+
+    table.add_rows({'label': ['fish', 'cat']})
+    table.remove_rows([1])
+    np.testing.assert_equal(
+        table['label'], ['cat', 'cat', 'bird', 'fish', 'cat']
+    )
+    np.testing.assert_equal(
+        table.categories('label'), ['bird', 'cat', 'dog', 'fish']
+    )
+
+
+def test_columns_not_changed_by_removal():
+    """Arrays given to or read from the table keep their values."""
+    values = np.array(['a', 'b', 'c', 'd'])
+    table = PropertyTable({'label': values})
+    columns = table.columns
+    table.remove_rows([0])
+    np.testing.assert_equal(table['label'], ['b', 'c', 'd'])
+    np.testing.assert_equal(values, ['a', 'b', 'c', 'd'])
+    np.testing.assert_equal(columns['label'], ['a', 'b', 'c', 'd'])
+
+
+def test_columns_write_through():
+    """Changing the dict of columns changes the table."""
+    values = np.array(['a', 'b', 'c'])
+    table = PropertyTable({'label': values})
+    assert table.columns == {'label': values}
+    assert table['label'] is values
+
+    table.columns['other'] = [1, 2, 3]
+    assert 'other' in table
+    np.testing.assert_equal(table['other'], [1, 2, 3])
+    table.columns.update(third=np.zeros(3))
+    assert list(table) == ['label', 'other', 'third']
+
+    del table.columns['label']
+    table.columns.pop('other')
+    assert list(table) == ['third']
+
+    # copies are detached from the table
+    columns = table.columns.copy()
+    columns['fourth'] = values
+    assert 'fourth' not in table
@@ -118,3 +118,96 @@ def test_blending_modes():
     with pytest.warns(RuntimeWarning):
         text_manager.blending = 'opaque'
         assert text_manager.blending == 'translucent'
+
+
+def test_lazy_text_formatting():
+    n_text = 4
+    text = 'confidence: {confidence:.2f}'
+    properties = {'confidence': np.array([0.5, 0.3, 1, 0.1])}
+    text_manager = TextManager(text=text, n_text=n_text, properties=properties)
+
+    # Only the text elements in view are formatted
+    np.testing.assert_equal(
+        text_manager.view_text([1, 3]),
+        ['confidence: 0.30', 'confidence: 0.10'],
+    )
+    assert list(text_manager._values) == [
+        None,
+        'confidence: 0.30',
+        None,
+        'confidence: 0.10',
+    ]
+
+    # Refreshing the properties invalidates the formatted text
+    new_properties = {'confidence': np.array([0.2, 0.4, 0.6, 0.8])}
+    text_manager.refresh_text(new_properties)
+    np.testing.assert_equal(text_manager.view_text([3]), ['confidence: 0.80'])
+
+    # Text that was not formatted yet is still correct after a removal
+    text_manager.remove({0})
+    np.testing.assert_equal(
+        text_manager.values,
+        ['confidence: 0.40', 'confidence: 0.60', 'confidence: 0.80'],
+    )
+
+
+def test_lazy_text_after_properties_change_in_place():
+    """Unformatted text does not follow later in place property changes."""
+    labels = np.array(['a', 'b', 'c', 'd'])
+    text_manager = TextManager(
+        text='label', n_text=4, properties={'label': labels}
+    )
+    text_manager.add({'label': np.array(['e'])}, 1)
+
+    # the layer compacts its properties after a removal
+    labels[:3] = labels[1:]
+    text_manager.remove([0])
+    np.testing.assert_equal(text_manager.values, ['b', 'c', 'd', 'e'])
+
+
+def test_refresh_text_only_changed_rows():
+    """Refreshing marks stale the text whose own properties changed only."""
+    properties = {
+        'confidence': np.array([0.5, 0.3, 1, 0.1]),
+        'unused': np.arange(4),
+    }
+    text_manager = TextManager(
+        text='{confidence:.1f}', n_text=4, properties=properties
+    )
+    assert list(text_manager._properties) == ['confidence']
+    text_manager.view_text([0, 1, 2, 3])
+    snapshot = text_manager._properties['confidence']
+
+    # unchanged properties are not copied again
+    properties['unused'] = np.zeros(4)
+    text_manager.refresh_text(properties)
+    assert text_manager._properties['confidence'] is snapshot
+    assert not text_manager._stale.any()
+
+    properties['confidence'] = np.array([0.5, 0.7, 1, 0.1])
+    text_manager.refresh_text(properties)
+    np.testing.assert_equal(text_manager._stale, [False, True, False, False])
+    np.testing.assert_equal(text_manager.values, ['0.5', '0.7', '1.0', '0.1'])
+
+
+def test_declutter_positions():
+    text_manager = TextManager(
+        text='class',
+        n_text=4,
+        properties={'class': np.array(['A', 'B', 'C', 'D'])},
+        declutter=True,
+    )
+    text_coords = np.array([[0, 0], [1, 1], [20, 20], [200, 200]])
+    corners = np.array([[0, 0], [100, 100]])
+
+    # Only the first text element of each cell inside the canvas is drawn
+    positions = text_manager.declutter_positions(
+        text_coords, np.array([10, 10]), corners
+    )
+    np.testing.assert_equal(positions, [0, 2])
+
+    text_manager.declutter = False
+    positions = text_manager.declutter_positions(
+        text_coords, np.array([10, 10]), corners
+    )
+    assert positions == slice(None)
@@ -146,11 +146,17 @@ TEXT_ANCHOR_CALCULATION = {
 }
 
 
-def format_text_properties(text: str, n_text: int, properties: dict = {}):
-
+def format_text_properties(
+    text: str, n_text: int, properties: dict = {}, indices=None
+):
+    """Format the text from the properties, only for the elements at indices
+    if they are given."""
     # If the text value is a property key, the text is the property values
     if text in properties:
-        formatted_text = np.array([str(v) for v in properties[text]])
+        values = properties[text]
+        if indices is not None:
+            values = np.asarray(values)[indices]
+        formatted_text = np.array([str(v) for v in values])
         text_mode = TextMode.PROPERTY
     elif ('{' in text) and ('}' in text):
         format_keys = _get_format_keys(text, properties)
@@ -159,6 +165,7 @@ def format_text_properties(text: str, n_text: int, properties: dict = {}):
             n_text=n_text,
             format_keys=format_keys,
             properties=properties,
+            indices=indices,
         )
         text_mode = TextMode.FORMATTED
 
@@ -201,24 +208,29 @@ def _get_format_keys(text: str, properties: dict):
 
 
 def _format_text_f_string(
-    text: str, n_text: int, format_keys: list, properties: dict
+    text: str, n_text: int, format_keys: list, properties: dict, indices=None
 ):
+    if indices is None:
+        indices = range(n_text)
+
+    # The replacement for each format key only depends on the value
+    replacements = []
+    for format_key in format_keys:
+        string_template = '{' + ':' + format_key[1] + '}'
+        if len(format_key[1]) == 0:
+            original_value = '{' + format_key[0] + '}'
+        else:
+            original_value = '{' + format_key[0] + ':' + format_key[1] + '}'
+        replacements.append(
+            (original_value, string_template.format, properties[format_key[0]])
+        )
 
     all_formatted_text = []
-    for i in range(n_text):
+    for i in indices:
         formatted_text = text
-        for format_key in format_keys:
-            prop_value = properties[format_key[0]][i]
-            string_template = '{' + ':' + format_key[1] + '}'
-            formatted_prop_value = string_template.format(prop_value)
-            if len(format_key[1]) == 0:
-                original_value = '{' + format_key[0] + '}'
-            else:
-                original_value = (
-                    '{' + format_key[0] + ':' + format_key[1] + '}'
-                )
+        for original_value, format_value, prop_values in replacements:
             formatted_text = formatted_text.replace(
-                original_value, formatted_prop_value
+                original_value, format_value(prop_values[i])
             )
         all_formatted_text.append(formatted_text)
 
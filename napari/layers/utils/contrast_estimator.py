@@ -0,0 +1,315 @@
+import time
+from typing import Iterator, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+# Fractional part of the golden ratio, see ContrastEstimator._next_chunk
+_GOLDEN_FRACTION = (np.sqrt(5) - 1) / 2
+
+
+class DataHistogram:
+    """Approximate histogram of values added in batches.
+
+    The bins always span the smallest and largest values added so far.
+    When a batch extends that range, the counts of the current bins are
+    redistributed into bins spanning the new range, as if all the values of
+    a bin were at its center. The minimum and maximum are exact, the
+    percentiles are approximate to about the width of a bin.
+
+    Non-finite values are ignored.
+
+    Parameters
+    ----------
+    n_bins : int
+        Number of bins of the histogram.
+    """
+
+    def __init__(self, n_bins: int = 1024):
+        self.n_bins = n_bins
+        self.counts = np.zeros(n_bins, dtype=np.int64)
+        # None until two different values were added
+        self.edges = None
+        self.min = None
+        self.max = None
+        self.n_values = 0
+
+    def add(self, values) -> None:
+        """Add values to the histogram.
+
+        Parameters
+        ----------
+        values : array
+            Values to add, of any shape.
+        """
+        values = np.asarray(values).ravel()
+        if values.dtype == bool:
+            values = values.view(np.uint8)
+        if not np.issubdtype(values.dtype, np.integer):
+            values = values[np.isfinite(values)]
+        if values.size == 0:
+            return
+
+        low, high = values.min(), values.max()
+        if self.n_values == 0:
+            self.min, self.max = low, high
+        else:
+            # all the values so far are equal if there are no bins yet
+            constant = self.min
+            self.min, self.max = min(self.min, low), max(self.max, high)
+
+        if self.min == self.max:
+            # a single value so far, counted in the first bin
+            self.counts[0] += values.size
+        else:
+            if self.edges is None:
+                self._set_edges()
+                if self.n_values:
+                    self.counts[:] = 0
+                    self.counts[self._bin(constant)] = self.n_values
+            elif self.min < self.edges[0] or self.max > self.edges[-1]:
+                self._set_edges()
+            self.counts += np.histogram(values, bins=self.edges)[0]
+        self.n_values += values.size
+
+    def _set_edges(self) -> None:
+        """Span the bins from the current minimum to maximum."""
+        edges = np.linspace(float(self.min), float(self.max), self.n_bins + 1)
+        if self.edges is not None:
+            centers = (self.edges[:-1] + self.edges[1:]) / 2
+            self.counts = np.histogram(
+                centers, bins=edges, weights=self.counts
+            )[0].astype(np.int64)
+        self.edges = edges
+
+    def _bin(self, value) -> int:
+        """Return the index of the bin of a value within the range."""
+        index = np.searchsorted(self.edges, value, side='right') - 1
+        return int(np.clip(index, 0, self.n_bins - 1))
+
+    def percentile(self, q):
+        """Return the approximate percentiles of the values.
+
+        Parameters
+        ----------
+        q : float or sequence of float
+            Percentiles to compute, between 0 and 100.
+
+        Returns
+        -------
+        float or np.ndarray
+            The percentiles, None if no value was added yet.
+        """
+        if self.n_values == 0:
+            return None
+        q = np.asarray(q, dtype=float)
+        if self.edges is None:
+            return np.full(q.shape, float(self.min))[()]
+
+        cumulative = np.cumsum(self.counts)
+        target = q / 100 * cumulative[-1]
+        index = np.searchsorted(cumulative, target, side='left')
+        index = np.clip(index, 0, self.n_bins - 1)
+        # interpolate within the bin of each percentile
+        before = cumulative[index] - self.counts[index]
+        fraction = (target - before) / np.maximum(self.counts[index], 1)
+        width = self.edges[1] - self.edges[0]
+        values = self.edges[index] + np.clip(fraction, 0, 1) * width
+        values = np.clip(values, float(self.min), float(self.max))
+        values = np.where(q <= 0, float(self.min), values)
+        values = np.where(q >= 100, float(self.max), values)
+        return values[()]
+
+
+class ContrastEstimator:
+    """Estimate contrast limits from chunks sampled across an array.
+
+    The array is split into chunks, the chunks of Dask arrays or of arrays
+    with a ``chunks`` attribute such as zarr arrays, otherwise its planes
+    along the last two axes. refine() loads chunks within a time and a
+    size budget and adds them to a DataHistogram, so each call refines the
+    estimate. The chunks are sampled in an order that spreads them evenly
+    across the whole array, so that a few chunks already represent all of
+    it, then every chunk is eventually loaded once.
+
+    Data is only loaded in refine() and iter_refine(). They can run in a
+    background thread, for example with ``napari.qt.threading``::
+
+        @thread_worker(connect={'yielded': set_contrast_limits})
+        def estimate():
+            yield from ContrastEstimator(data).iter_refine((1, 99))
+
+    Parameters
+    ----------
+    data : array
+        The array whose contrast limits are estimated.
+    n_bins : int
+        Number of bins of the histogram of the sampled values.
+
+    Attributes
+    ----------
+    histogram : DataHistogram
+        Histogram of the values of the chunks loaded so far.
+    n_chunks : int
+        Total number of chunks of the array.
+    """
+
+    def __init__(self, data, n_bins: int = 1024):
+        self.data = data
+        self.histogram = DataHistogram(n_bins)
+        self._bounds = _chunk_bounds(data)
+        self._grid_shape = tuple(len(b) - 1 for b in self._bounds)
+        self.n_chunks = int(np.prod(self._grid_shape))
+        self._loaded = set()
+        self._count = 0
+
+    @property
+    def n_loaded(self) -> int:
+        """int: Number of chunks loaded so far."""
+        return len(self._loaded)
+
+    @property
+    def done(self) -> bool:
+        """bool: True once every chunk was loaded, the estimate is exact."""
+        return self.n_loaded == self.n_chunks
+
+    def _next_chunk(self) -> Tuple[slice, ...]:
+        """Return the selection of the next chunk to load.
+
+        Chunks are taken at the multiples of the golden ratio, modulo the
+        number of chunks, so that the chunks loaded so far are always about
+        evenly spread across the array. A chunk already loaded is replaced
+        by the next one not loaded yet.
+        """
+        position = (self._count * _GOLDEN_FRACTION) % 1
+        index = int(position * self.n_chunks)
+        self._count += 1
+        while index in self._loaded:
+            index = (index + 1) % self.n_chunks
+        self._loaded.add(index)
+
+        grid_index = np.unravel_index(index, self._grid_shape)
+        return tuple(
+            slice(b[i], b[i + 1]) for b, i in zip(self._bounds, grid_index)
+        )
+
+    def refine(
+        self, max_time: Optional[float] = 0.1, max_bytes: Optional[int] = None
+    ) -> bool:
+        """Load more chunks into the histogram, within a budget.
+
+        At least one chunk is loaded, unless all of them were loaded.
+
+        Parameters
+        ----------
+        max_time : float, optional
+            Seconds after which no more chunk is loaded. No limit if None.
+        max_bytes : int, optional
+            Number of bytes after which no more chunk is loaded. No limit if
+            None.
+
+        Returns
+        -------
+        bool
+            True if every chunk has been loaded.
+        """
+        start = time.perf_counter()
+        n_bytes = 0
+        while not self.done:
+            chunk = np.asarray(self.data[self._next_chunk()])
+            self.histogram.add(chunk)
+            n_bytes += chunk.nbytes
+            if max_time is not None:
+                if time.perf_counter() - start >= max_time:
+                    break
+            if max_bytes is not None and n_bytes >= max_bytes:
+                break
+        return self.done
+
+    def contrast_limits(
+        self, percentiles: Optional[Sequence[float]] = None
+    ) -> List[float]:
+        """Return the contrast limits estimated from the chunks loaded.
+
+        Parameters
+        ----------
+        percentiles : 2-tuple of float, optional
+            Percentiles of the values to use as limits, between 0 and 100.
+            If not provided, the minimum and the maximum.
+
+        Returns
+        -------
+        list of float
+            The limits, [0, 1] if they would be equal.
+        """
+        histogram = self.histogram
+        if histogram.n_values == 0:
+            return [0, 1]
+        if percentiles is None:
+            limits = [float(histogram.min), float(histogram.max)]
+        else:
+            limits = [float(v) for v in histogram.percentile(percentiles)]
+        if limits[0] == limits[1]:
+            return [0, 1]
+        return limits
+
+    def iter_refine(
+        self,
+        percentiles: Optional[Sequence[float]] = None,
+        max_time: Optional[float] = 0.1,
+    ) -> Iterator[List[float]]:
+        """Refine the estimate until every chunk is loaded.
+
+        Parameters
+        ----------
+        percentiles : 2-tuple of float, optional
+            Percentiles of the values to use as limits, see
+            contrast_limits().
+        max_time : float, optional
+            Seconds spent loading chunks between two estimates.
+
+        Yields
+        ------
+        list of float
+            The contrast limits after each step.
+        """
+        while not self.done:
+            self.refine(max_time=max_time)
+            yield self.contrast_limits(percentiles)
+
+
+def _chunk_bounds(data) -> List[np.ndarray]:
+    """Return the boundaries of the chunks of an array along each axis.
+
+    Parameters
+    ----------
+    data : array
+        A Dask array, an array with a ``chunks`` attribute giving the shape
+        of its chunks such as a zarr array, or any other array, whose chunks
+        are then its planes along the last two axes.
+
+    Returns
+    -------
+    list of np.ndarray
+        For each axis, the start of each chunk followed by the size of the
+        axis.
+    """
+    shape = data.shape
+    chunks = getattr(data, 'chunks', None)
+    if (
+        isinstance(chunks, tuple)
+        and len(chunks) == len(shape)
+        and all(isinstance(c, tuple) for c in chunks)
+    ):
+        # Dask, sizes of each chunk along each axis
+        return [np.cumsum((0,) + c) for c in chunks]
+
+    if not (
+        isinstance(chunks, tuple)
+        and len(chunks) == len(shape)
+        and all(isinstance(c, (int, np.integer)) and c > 0 for c in chunks)
+    ):
+        chunks = (1,) * (len(shape) - 2) + tuple(shape[-2:])
+    return [
+        np.append(np.arange(0, max(s, 1), max(c, 1)), s)
+        for s, c in zip(shape, chunks)
+    ]
@@ -1,18 +1,30 @@
-from typing import Dict, Tuple, Union
+from typing import Any, Callable, Dict, Tuple, Union
 
 import dask
 import numpy as np
 
 from ...utils.colormaps import Colormap
+from ...utils.perf import record_timer
 
+# Number of planes sampled by calc_data_range, at least the first, middle
+# and last ones, then more as long as they fit the byte budget.
+_SAMPLE_PLANES = (3, 17)
+_SAMPLE_BYTES = 32 * 1024 ** 2
 
-def calc_data_range(data):
+
+def calc_data_range(data, percentiles=None, plane_ndim=2):
     """Calculate range of data values. If all values are equal return [0, 1].
 
     Parameters
     ----------
     data : array
         Data to calculate range of values over.
+    percentiles : 2-tuple of float, optional
+        Percentiles of the values to return, between 0 and 100. If not
+        provided, the minimum and maximum values are returned.
+    plane_ndim : int
+        Number of trailing axes of the planes sampled from large data, e.g.
+        1 for vertex values with leading time dimensions.
 
     Returns
     -------
@@ -21,29 +33,26 @@ def calc_data_range(data):
 
     Notes
     -----
-    If the data type is uint8, no calculation is performed, and 0-255 is
-    returned.
+    If the data type is uint8 and no percentiles are requested, no
+    calculation is performed, and 0-255 is returned.
+
+    If the data has more than a million values, the range is estimated from
+    planes along the last plane_ndim axes evenly spread across the data, see
+    _sample_planes. The range may then be narrower than the actual range of
+    the data. Image.refine_contrast_limits refines it from the whole data.
     """
-    if data.dtype == np.uint8:
+    if data.dtype == np.uint8 and percentiles is None:
         return [0, 255]
     if np.prod(data.shape) > 1e6:
-        # If data is very large take the average of the top, bottom, and
-        # middle slices
-        bottom_plane_idx = (0,) * (data.ndim - 2)
-        middle_plane_idx = tuple(s // 2 for s in data.shape[:-2])
-        top_plane_idx = tuple(s - 1 for s in data.shape[:-2])
-        idxs = [bottom_plane_idx, middle_plane_idx, top_plane_idx]
-        reduced_data = [
-            [np.max(data[idx]) for idx in idxs],
-            [np.min(data[idx]) for idx in idxs],
-        ]
-        # compute everything in one go
-        reduced_data = dask.compute(*reduced_data)
-    else:
-        reduced_data = data
+        with record_timer("calc_data_range.sample"):
+            data = _sample_planes(data, plane_ndim)
 
-    min_val = np.min(reduced_data)
-    max_val = np.max(reduced_data)
+    data = np.asarray(data)
+    if percentiles is None:
+        min_val = np.min(data)
+        max_val = np.max(data)
+    else:
+        min_val, max_val = np.nanpercentile(data, percentiles)
 
     if min_val == max_val:
         min_val = 0
@@ -51,6 +60,50 @@ def calc_data_range(data):
     return [float(min_val), float(max_val)]
 
 
+def _sample_planes(data, ndim=2) -> np.ndarray:
+    """Return planes evenly spread across data, to estimate its range.
+
+    The first, middle and last planes along the last ``ndim`` axes are
+    always sampled, then up to _SAMPLE_PLANES[1] evenly spaced planes as
+    long as they fit in _SAMPLE_BYTES. The same planes are sampled each
+    time, however long they take to load.
+
+    Parameters
+    ----------
+    data : array
+        Data with at least ``ndim`` dimensions, or fewer, in which case it
+        is returned as is.
+    ndim : int
+        Number of trailing axes of each plane.
+
+    Returns
+    -------
+    np.ndarray
+        The sampled planes, stacked.
+    """
+    if data.ndim < ndim:
+        return np.asarray(data)
+    leading = data.shape[: data.ndim - ndim]
+    n_leading = int(np.prod(leading))
+    plane_nbytes = (
+        np.prod(data.shape[data.ndim - ndim :]) * data.dtype.itemsize
+    )
+    n_planes = int(
+        np.clip(_SAMPLE_BYTES // max(plane_nbytes, 1), *_SAMPLE_PLANES)
+    )
+    # an odd number of evenly spaced planes includes the middle one
+    n_planes -= 1 - n_planes % 2
+    flat_indices = np.unique(
+        np.linspace(0, n_leading - 1, min(n_planes, n_leading)).round()
+    )
+    planes = [
+        data[tuple(int(i) for i in np.unravel_index(int(index), leading))]
+        for index in flat_indices
+    ]
+    # compute everything in one go, chunks shared by planes are loaded once
+    return np.stack(dask.compute(*planes))
+
+
 def segment_normal(a, b, p=(0, 0, 1)):
     """Determines the unit normal of the vector from a to b.
 
@@ -201,6 +254,48 @@ def map_property(
     return mapped_properties, contrast_limits
 
 
+def map_color_cycle(
+    prop: np.ndarray,
+    color_cycle_map: Dict[Any, np.ndarray],
+    new_color: Callable[[Any], np.ndarray],
+) -> np.ndarray:
+    """Apply a color cycle map to a categorical property
+
+    The property is factorized into its unique categories and the resulting
+    integer codes are used to index a table of category colors, so the cost
+    of the mapping is one dictionary lookup per category instead of one per
+    element. Categories that are not yet in ``color_cycle_map`` are added to
+    it, in sorted order, with the color returned by ``new_color``.
+
+    Parameters
+    ----------
+    prop : np.ndarray
+        The categorical property to be mapped.
+    color_cycle_map : dict
+        Mapping from property value to RGBA color. It is updated in place
+        with any categories that are not already present.
+    new_color : callable
+        Called with a property value that is missing from ``color_cycle_map``
+        and returns the RGBA color to use for it.
+
+    Returns
+    -------
+    colors : (N, 4) np.ndarray
+        The RGBA color of each element of ``prop``.
+    """
+    if len(prop) == 0:
+        return np.empty((0, 4))
+
+    with record_timer("map_color_cycle"):
+        categories, codes = np.unique(prop, return_inverse=True)
+        for category in categories:
+            if category not in color_cycle_map:
+                color_cycle_map[category] = new_color(category)
+        color_table = np.array([color_cycle_map[c] for c in categories])
+
+        return color_table[codes]
+
+
 def compute_multiscale_level(
     requested_shape, shape_threshold, downsample_factors
 ):
@@ -276,3 +371,50 @@ def compute_multiscale_level_and_corners(
     corners = np.array([np.floor(corners[0]), np.ceil(corners[1])]).astype(int)
 
     return level, corners
+
+
+def compute_multiscale_level_3d(
+    corner_pixels, downsample_factors, itemsize, budget, max_shape=None
+):
+    """Compute the finest level of a multiscale whose view fits a budget.
+
+    When rendering in 3D the whole sub-volume in view is sent to the GPU, so
+    the level is chosen from the memory the sub-volume needs rather than
+    from the size of the canvas.
+
+    Parameters
+    ----------
+    corner_pixels : array (2, D)
+        Corners of the sub-volume in view at full resolution.
+    downsample_factors : list of tuple
+        Downsampling factors for each level of the multiscale. Must be increasing
+        for each level of the multiscale.
+    itemsize : int
+        Number of bytes of each voxel.
+    budget : int
+        Number of bytes the sub-volume can use.
+    max_shape : int, optional
+        Maximum size of the sub-volume along any axis, such as the maximum
+        3D texture size.
+
+    Returns
+    -------
+    level : int
+        Level of the multiscale to be viewing, the coarsest level if none
+        fits the budget.
+    corners : array (2, D)
+        Needed corner pixels at target resolution.
+    """
+    for level, factors in enumerate(downsample_factors):
+        corners = corner_pixels / factors
+        corners = np.array([np.floor(corners[0]), np.ceil(corners[1])]).astype(
+            int
+        )
+        shape = corners[1] - corners[0] + 1
+        fits = np.prod(shape) * itemsize <= budget
+        if max_shape is not None:
+            fits = fits and np.all(shape <= max_shape)
+        if fits:
+            break
+
+    return level, corners
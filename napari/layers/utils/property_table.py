@@ -0,0 +1,350 @@
+from collections.abc import MutableMapping
+from typing import Dict, Iterable, Optional, Sequence
+
+import numpy as np
+
+
+class PropertyTable:
+    """Columnar store for the per-element properties of a layer.
+
+    Each column is kept in a preallocated buffer whose capacity doubles
+    whenever it fills up, so appending rows costs amortized O(1) per row
+    instead of reallocating every column on every add. Removed rows are
+    marked with tombstones and compacted in a single pass the next time the
+    columns are read or rows are added, so several removals only move the
+    remaining rows once. Compaction copies the remaining rows into new
+    buffers, so the columns read before keep their values.
+
+    Columns listed in ``categorical`` are stored as integer codes into a
+    table of categories, which is compact for columns with few distinct
+    values, such as string labels.
+
+    Parameters
+    ----------
+    properties : dict {str: array (N,)}
+        Initial columns of the table. All columns must have the same length.
+    n_rows : int
+        Number of rows of the table. Required when there are no properties,
+        otherwise it defaults to the length of the columns.
+    categorical : sequence of str
+        Names of the columns to store with categorical encoding.
+
+    Attributes
+    ----------
+    columns : PropertyColumns
+        The columns of the table, see PropertyColumns. Columns without
+        categorical encoding are views into the buffers of the table, so they
+        can be edited in place.
+    """
+
+    def __init__(
+        self,
+        properties: Optional[Dict[str, np.ndarray]] = None,
+        n_rows: Optional[int] = None,
+        categorical: Sequence[str] = (),
+    ):
+        if properties is None:
+            properties = {}
+        lengths = {len(v) for v in properties.values()}
+        if len(lengths) > 1:
+            raise ValueError('all properties must have the same length')
+        if n_rows is None:
+            if not lengths:
+                # an empty dict says nothing about the number of rows
+                raise ValueError('n_rows is required without properties')
+            n_rows = lengths.pop()
+        elif lengths and lengths.pop() != n_rows:
+            raise ValueError(
+                f'the number of properties must equal the number of rows '
+                f'({n_rows})'
+            )
+
+        self._categorical = set(categorical)
+        self._buffers = {}
+        self._categories = {}
+        self._capacity = 0
+        # rows in use in the buffers, including removed rows
+        self._n_rows = 0
+        self._alive = np.empty(0, dtype=bool)
+        self._n_removed = 0
+        self._columns = None
+
+        self._reserve(n_rows)
+        self._n_rows = n_rows
+        self._alive[:n_rows] = True
+        for name, values in properties.items():
+            self.set_column(name, values)
+
+    def __len__(self) -> int:
+        return self._n_rows - self._n_removed
+
+    def __contains__(self, name) -> bool:
+        return name in self._buffers
+
+    def __iter__(self):
+        return iter(self._buffers)
+
+    def __getitem__(self, name: str) -> np.ndarray:
+        return self.columns[name]
+
+    def keys(self):
+        """Names of the columns of the table."""
+        return self._buffers.keys()
+
+    @property
+    def capacity(self) -> int:
+        """int: number of rows that fit in the buffers without reallocating."""
+        return self._capacity
+
+    @property
+    def columns(self) -> 'PropertyColumns':
+        """PropertyColumns: the columns of the table, by name.
+
+        Setting or deleting a key sets or removes the column.
+        """
+        if self._columns is None:
+            self.compact()
+            self._columns = PropertyColumns(self)
+        return self._columns
+
+    def categories(self, name: str) -> np.ndarray:
+        """Categories of a column stored with categorical encoding.
+
+        Parameters
+        ----------
+        name : str
+            Name of the column.
+
+        Returns
+        -------
+        categories : np.ndarray
+            The distinct values of the column, in the order they were
+            added to the table.
+        """
+        return self._categories[name]
+
+    def set_column(self, name: str, values: Iterable):
+        """Add a column or replace the values of an existing column.
+
+        Parameters
+        ----------
+        name : str
+            Name of the column.
+        values : array (N,)
+            Value of the column for each row of the table.
+        """
+        values = np.asarray(values)
+        if len(values) != len(self):
+            raise ValueError(
+                f'the number of values must equal the number of rows '
+                f'({len(self)})'
+            )
+        self.compact()
+        self._columns = None
+        if name not in self._categorical and len(values) == self._capacity:
+            # the buffer is full either way, so keep the array given
+            self._buffers[name] = values
+            return
+        if name in self._categorical:
+            self._categories[name] = np.empty(0, dtype=values.dtype)
+            self._buffers[name] = np.empty(self._capacity, dtype=np.intp)
+        else:
+            self._buffers[name] = np.empty(
+                (self._capacity,) + values.shape[1:], dtype=values.dtype
+            )
+        self._write(name, slice(0, self._n_rows), values)
+
+    def remove_column(self, name: str):
+        """Remove a column from the table.
+
+        Parameters
+        ----------
+        name : str
+            Name of the column.
+        """
+        del self._buffers[name]
+        self._categories.pop(name, None)
+        self._columns = None
+
+    def add_rows(
+        self, values: Dict[str, np.ndarray], n_rows: Optional[int] = None
+    ):
+        """Append rows to the end of the table.
+
+        Parameters
+        ----------
+        values : dict {str: array (M,) or (1,)}
+            Values of the new rows for every column of the table. Values of
+            length 1 are repeated for all the new rows.
+        n_rows : int
+            Number of rows to add. If None, it is the length of the longest
+            array in ``values``.
+        """
+        values = {k: np.atleast_1d(v) for k, v in values.items()}
+        missing = set(self._buffers) - set(values)
+        if missing:
+            raise KeyError(f'values missing for properties: {missing}')
+        if n_rows is None:
+            n_rows = max((len(v) for v in values.values()), default=0)
+        if n_rows == 0:
+            return
+
+        self.compact()
+        start = self._n_rows
+        self._reserve(start + n_rows)
+        rows = slice(start, start + n_rows)
+        for name in self._buffers:
+            new_values = values[name]
+            if len(new_values) == 1:
+                new_values = np.repeat(new_values, n_rows, axis=0)
+            elif len(new_values) != n_rows:
+                raise ValueError(
+                    f'the number of values for {name} must be 1 or {n_rows}'
+                )
+            self._write(name, rows, new_values)
+        self._alive[rows] = True
+        self._n_rows += n_rows
+        self._columns = None
+
+    def remove_rows(self, indices: Iterable[int]):
+        """Remove rows from the table.
+
+        The rows are only marked as removed, the remaining rows are moved
+        into place the next time the table is compacted.
+
+        Parameters
+        ----------
+        indices : sequence of int
+            Indices of the rows to remove.
+        """
+        indices = np.asarray(indices, dtype=np.intp)
+        if len(indices) == 0:
+            return
+        if self._n_removed > 0:
+            rows = np.flatnonzero(self._alive[: self._n_rows])
+        else:
+            rows = np.arange(self._n_rows)
+        indices = np.unique(rows[indices])
+        self._alive[indices] = False
+        self._n_removed += len(indices)
+        self._columns = None
+
+    def compact(self):
+        """Move the remaining rows over the removed ones."""
+        if self._n_removed == 0:
+            return
+        keep = self._alive[: self._n_rows]
+        n_rows = len(self)
+        # into new buffers, the columns handed out before keep their values
+        for name, buffer in self._buffers.items():
+            new_buffer = np.empty_like(buffer)
+            new_buffer[:n_rows] = buffer[: self._n_rows][keep]
+            self._buffers[name] = new_buffer
+        self._alive[:n_rows] = True
+        self._n_rows = n_rows
+        self._n_removed = 0
+
+    def _reserve(self, n_rows: int):
+        """Grow the buffers so that they can hold at least n_rows."""
+        if n_rows <= self._capacity:
+            return
+        capacity = max(n_rows, 2 * self._capacity)
+        for name, buffer in self._buffers.items():
+            new_buffer = np.empty(
+                (capacity,) + buffer.shape[1:], dtype=buffer.dtype
+            )
+            new_buffer[: self._n_rows] = buffer[: self._n_rows]
+            self._buffers[name] = new_buffer
+        alive = np.zeros(capacity, dtype=bool)
+        alive[: self._n_rows] = self._alive[: self._n_rows]
+        self._alive = alive
+        self._capacity = capacity
+
+    def _read(self, name: str, rows: slice) -> np.ndarray:
+        """Get the values of a column for a range of rows."""
+        buffer = self._buffers[name]
+        if name in self._categories:
+            return self._categories[name][buffer[rows]]
+        if rows == slice(0, len(buffer)):
+            return buffer
+        return buffer[rows]
+
+    def _write(self, name: str, rows: slice, values: np.ndarray):
+        """Set the values of a column for a range of rows."""
+        if name in self._categories:
+            categories = self._categories[name]
+            new_categories, inverse = np.unique(values, return_inverse=True)
+            lookup = {c: i for i, c in enumerate(categories)}
+            extra = [c for c in new_categories if c not in lookup]
+            if extra:
+                dtype = np.promote_types(
+                    categories.dtype, new_categories.dtype
+                )
+                categories = np.concatenate(
+                    (categories.astype(dtype), np.asarray(extra, dtype=dtype))
+                )
+                lookup.update(
+                    (c, i) for i, c in enumerate(extra, start=len(lookup))
+                )
+                self._categories[name] = categories
+            codes = np.array([lookup[c] for c in new_categories], np.intp)
+            self._buffers[name][rows] = codes[inverse]
+            return
+
+        buffer = self._buffers[name]
+        dtype = np.promote_types(buffer.dtype, values.dtype)
+        if dtype != buffer.dtype:
+            buffer = buffer.astype(dtype)
+            self._buffers[name] = buffer
+        buffer[rows] = values
+
+
+class PropertyColumns(dict):
+    """The columns of a PropertyTable, by name.
+
+    A dict whose changes are made to the table too: setting a key sets the
+    column, deleting it removes the column. The other methods that change
+    the dict go through these two.
+
+    Parameters
+    ----------
+    table : PropertyTable
+        The table of the columns.
+    """
+
+    def __init__(self, table: PropertyTable):
+        super().__init__(
+            (name, table._read(name, slice(0, table._n_rows)))
+            for name in table._buffers
+        )
+        self._table = table
+
+    def __setitem__(self, name: str, values: Iterable):
+        current = self._table._columns is self
+        self._table.set_column(name, values)
+        super().__setitem__(
+            name, self._table._read(name, slice(0, self._table._n_rows))
+        )
+        if current:
+            self._table._columns = self
+
+    def __delitem__(self, name: str):
+        current = self._table._columns is self
+        self._table.remove_column(name)
+        super().__delitem__(name)
+        if current:
+            self._table._columns = self
+
+    update = MutableMapping.update
+    setdefault = MutableMapping.setdefault
+    pop = MutableMapping.pop
+    popitem = MutableMapping.popitem
+    clear = MutableMapping.clear
+
+    def copy(self) -> Dict[str, np.ndarray]:
+        """Return a plain dict of the columns, detached from the table."""
+        return dict(self)
+
+    def __reduce__(self):
+        # copied or pickled as a plain dict, without the table
+        return dict, (dict(self),)
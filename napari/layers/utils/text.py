@@ -7,7 +7,11 @@ from ...utils.colormaps.standardize_color import transform_color
 from ...utils.events import EmitterGroup, Event
 from ..base._base_constants import Blending
 from ._text_constants import Anchor, TextMode
-from ._text_utils import format_text_properties, get_text_anchors
+from ._text_utils import (
+    _get_format_keys,
+    format_text_properties,
+    get_text_anchors,
+)
 
 
 class TextManager:
@@ -36,6 +40,9 @@ class TextManager:
         The default value is 'translucent'
     visible : bool
         Set to true of the text should be displayed.
+    declutter : bool
+        Set to true to only draw the text elements inside the canvas, and at
+        most one text element per text-sized cell of the canvas.
 
     Attributes
     ----------
@@ -58,6 +65,18 @@ class TextManager:
         is not recommended, as colors the bounding box surrounding the text.
     visible : bool
         Set to true of the text should be displayed.
+    declutter : bool
+        Set to true to only draw the text elements inside the canvas, and at
+        most one text element per text-sized cell of the canvas.
+
+    Notes
+    -----
+    Text made from properties is formatted lazily, only for the elements
+    that are requested, typically the ones in view. The formatted text is
+    cached, with a copy of the property columns used by the text. When the
+    properties are refreshed, only the elements whose values in these
+    columns changed are marked stale, and their text is formatted again the
+    next time it is requested.
     """
 
     def __init__(
@@ -72,6 +91,7 @@ class TextManager:
         size=12,
         blending='translucent',
         visible=True,
+        declutter=False,
     ):
 
         self.events = EmitterGroup(
@@ -85,6 +105,7 @@ class TextManager:
             size=Event,
             blending=Event,
             visible=Event,
+            declutter=Event,
         )
 
         self.events.block_all()
@@ -95,14 +116,24 @@ class TextManager:
         self._size = size
         self._blending = self._check_blending_mode(blending)
         self._visible = visible
-
+        self._declutter = declutter
+
+        self._mode = TextMode.NONE
+        self._text_format_string = ''
+        self._values = None
+        # Whether the text of each element needs to be formatted again
+        self._stale = None
+        # Copy of the property columns used by the text
+        self._properties = {}
         self._set_text(text, n_text, properties)
         self.events.unblock_all()
 
     @property
     def values(self):
         """np.ndarray: the text values to be displayed"""
-        return self._values
+        if self._values is None:
+            return None
+        return self._get_values(np.arange(len(self._values)))
 
     def _set_text(
         self, text: Union[None, str], n_text: int, properties: dict = {}
@@ -112,14 +143,90 @@ class TextManager:
             self._text_format_string = ''
             self._values = None
         else:
+            # Find the text mode without formatting any text element
             formatted_text, text_mode = format_text_properties(
-                text, n_text, properties
+                text, n_text, properties, indices=[]
             )
+            if text_mode in (TextMode.PROPERTY, TextMode.FORMATTED):
+                if (
+                    text != self._text_format_string
+                    or self._mode != text_mode
+                    or self._values is None
+                    or len(self._values) != n_text
+                ):
+                    self._values = np.empty(n_text, dtype=object)
+                    self._stale = np.ones(n_text, dtype=bool)
+                    self._properties = {}
+                if text_mode == TextMode.PROPERTY:
+                    names = [text]
+                else:
+                    names = [k for k, _ in _get_format_keys(text, properties)]
+                self._update_properties({k: properties[k] for k in names})
+            else:
+                self._values = formatted_text
             self._text_format_string = text
-            self._values = formatted_text
             self._mode = text_mode
         self.events.text()
 
+    def _update_properties(self, properties: dict):
+        """Mark stale the text of the elements whose properties changed.
+
+        The columns that changed are copied, as the properties of the layer
+        can change in place. The columns cover the first rows of the text,
+        the text added after them is formatted right away and never stale.
+
+        Parameters
+        ----------
+        properties : dict
+            The property columns used by the text.
+        """
+        for name, values in properties.items():
+            values = np.asarray(values)
+            old = self._properties.get(name)
+            if old is None or len(old) != len(values):
+                changed = np.ones(len(values), dtype=bool)
+                if old is not None and len(old) < len(values):
+                    changed[: len(old)] = _changed(old, values[: len(old)])
+            else:
+                changed = _changed(old, values)
+                if not changed.any():
+                    continue
+            self._stale[: len(values)] |= changed
+            self._properties[name] = np.array(values)
+        for name in self._properties.keys() - properties.keys():
+            del self._properties[name]
+
+    def _get_values(self, indices) -> Union[None, np.ndarray]:
+        """Get the text of the elements at indices, formatting it if needed.
+
+        Parameters
+        ----------
+        indices : array of int
+            Indices of the text elements.
+
+        Returns
+        -------
+        text : np.ndarray
+            The text of the elements.
+        """
+        if self._values is None:
+            return None
+        if self._mode not in (TextMode.PROPERTY, TextMode.FORMATTED):
+            return self._values[indices]
+
+        indices = np.asarray(indices, dtype=int)
+        stale = np.unique(indices[self._stale[indices]])
+        if len(stale) > 0:
+            formatted_text, _ = format_text_properties(
+                self._text_format_string,
+                n_text=len(self._values),
+                properties=self._properties,
+                indices=stale,
+            )
+            self._values[stale] = formatted_text
+            self._stale[stale] = False
+        return self._values[indices].astype(str)
+
     @property
     def anchor(self) -> str:
         """str: The location of the text origin relative to the bounding box.
@@ -218,6 +325,17 @@ class TextManager:
         self._visible = visible
         self.events.visible()
 
+    @property
+    def declutter(self) -> bool:
+        """bool: Set to true to only draw the text elements inside the canvas,
+        and at most one text element per text-sized cell of the canvas."""
+        return self._declutter
+
+    @declutter.setter
+    def declutter(self, declutter):
+        self._declutter = declutter
+        self.events.declutter()
+
     @property
     def mode(self) -> str:
         """str: The current text setting mode."""
@@ -233,7 +351,7 @@ class TextManager:
         """
         self._set_text(
             self._text_format_string,
-            n_text=len(self.values),
+            n_text=len(self._values),
             properties=properties,
         )
 
@@ -252,7 +370,30 @@ class TextManager:
                 self._text_format_string, n_text=n_text, properties=properties
             )
 
-            self._values = np.concatenate((self.values, new_text))
+            # The new text is formatted now, so it is never stale and never
+            # looked up in the properties the rest of the text is formatted
+            # from.
+            new_values = np.empty(n_text, dtype=object)
+            new_values[:] = new_text
+            self._values = np.concatenate((self._values, new_values))
+            self._stale = np.concatenate(
+                (self._stale, np.zeros(n_text, dtype=bool))
+            )
+
+    def _paste(self, properties: dict, text: np.ndarray):
+        """Add the text elements of pasted data
+
+        Parameters
+        ----------
+        properties : dict
+            The properties of the pasted data
+        text : np.ndarray
+            The copied text of the pasted data
+        """
+        if self._mode in (TextMode.PROPERTY, TextMode.FORMATTED):
+            self.add(properties, len(text))
+        else:
+            self._values = np.concatenate((self._values, text), axis=0)
 
     def remove(self, indices_to_remove: Union[set, list, np.ndarray]):
         """Remove the indicated text elements
@@ -265,7 +406,16 @@ class TextManager:
         if self._mode != TextMode.NONE:
             selected_indices = list(indices_to_remove)
             if len(selected_indices) > 0:
-                self._values = np.delete(self.values, selected_indices, axis=0)
+                self._values = np.delete(
+                    self._values, selected_indices, axis=0
+                )
+                if self._mode in (TextMode.PROPERTY, TextMode.FORMATTED):
+                    self._stale = np.delete(self._stale, selected_indices)
+                    for name, values in self._properties.items():
+                        rows = [i for i in selected_indices if i < len(values)]
+                        self._properties[name] = np.delete(
+                            values, rows, axis=0
+                        )
 
     def compute_text_coords(
         self, view_data: np.ndarray, ndisplay: int
@@ -314,7 +464,7 @@ class TextManager:
         """
         if len(indices_view) > 0:
             if self._mode in [TextMode.FORMATTED, TextMode.PROPERTY]:
-                text = self.values[indices_view]
+                text = self._get_values(indices_view)
             else:
                 text = np.array([''])
         else:
@@ -323,6 +473,46 @@ class TextManager:
 
         return text
 
+    def declutter_positions(
+        self, text_coords: np.ndarray, cell_size: np.ndarray, corners
+    ) -> Union[slice, np.ndarray]:
+        """Select the text elements to draw when decluttering.
+
+        Parameters
+        ----------
+        text_coords : (N x D) np.ndarray
+            The coordinates of the text elements in view.
+        cell_size : (D,) np.ndarray
+            The size of the text in data coordinates along each dimension.
+        corners : (2 x D) np.ndarray
+            The corners of the canvas in data coordinates.
+
+        Returns
+        -------
+        positions : slice or np.ndarray
+            Positions in `text_coords` of the text elements to draw.
+        """
+        if not self.declutter or text_coords.shape[1] != len(cell_size):
+            return slice(None)
+
+        positions = np.arange(len(text_coords))
+        corners = np.asarray(corners)
+        if np.all(corners[1] > corners[0]):
+            in_canvas = np.all(
+                (text_coords >= corners[0]) & (text_coords <= corners[1]),
+                axis=1,
+            )
+            positions = positions[in_canvas]
+        if len(positions) == 0:
+            return positions
+
+        # Keep the first text element in each text-sized cell of the canvas
+        cells = np.floor(text_coords[positions] / cell_size).astype(np.int64)
+        cells -= cells.min(axis=0)
+        keys = np.ravel_multi_index(cells.T, cells.max(axis=0) + 1)
+        _, first = np.unique(keys, return_index=True)
+        return positions[np.sort(first)]
+
     def _get_state(self):
 
         state = {
@@ -332,6 +522,7 @@ class TextManager:
             'translation': self.translation,
             'size': self.size,
             'visible': self.visible,
+            'declutter': self.declutter,
         }
 
         return state
@@ -351,6 +542,7 @@ class TextManager:
         self.events.color.connect(text_update_function)
         self.events.size.connect(text_update_function)
         self.events.visible.connect(text_update_function)
+        self.events.declutter.connect(text_update_function)
 
         # connect the function for updating the text node blending
         self.events.blending.connect(blending_update_function)
@@ -360,7 +552,10 @@ class TextManager:
 
         called by: text_manager_1 == text_manager_2
         """
-        if isinstance(other, TextManager):
+        if other is self:
+            # The event emitters compare their source with every emit
+            equal = True
+        elif isinstance(other, TextManager):
             my_state = self._get_state()
             other_state = other._get_state()
             equal = np.all(
@@ -381,3 +576,14 @@ class TextManager:
         called by: text_manager_1 != text_manager_2
         """
         return not (self.__eq__(other))
+
+
+def _changed(old: np.ndarray, new: np.ndarray) -> np.ndarray:
+    """Return which values differ between two columns of the same length."""
+    with warnings.catch_warnings():
+        # comparing arrays of different types warns before returning a bool
+        warnings.simplefilter('ignore')
+        changed = np.asarray(old != new)
+    if changed.shape != old.shape:
+        return np.ones(len(old), dtype=bool)
+    return changed
@@ -15,8 +15,10 @@ from ..utils.color_transformations import (
 from ..utils.layer_utils import (
     dataframe_to_properties,
     guess_continuous,
+    map_color_cycle,
     map_property,
 )
+from ..utils.property_table import PropertyTable
 from ._vector_utils import generate_vector_meshes, vectors_to_coordinates
 from ._vectors_constants import DEFAULT_COLOR_CYCLE, ColorMode
 
@@ -200,11 +202,13 @@ class Vectors(Layer):
 
         # Save the properties
         if properties is None:
-            self._properties = {}
+            self._property_table = PropertyTable(n_rows=len(self.data))
             self._property_choices = {}
         elif len(data) > 0:
             properties, _ = dataframe_to_properties(properties)
-            self._properties = self._validate_properties(properties)
+            self._property_table = PropertyTable(
+                self._validate_properties(properties), n_rows=len(self.data)
+            )
             self._property_choices = {
                 k: np.unique(v) for k, v in properties.items()
             }
@@ -216,7 +220,7 @@ class Vectors(Layer):
                 k: np.empty(0, dtype=v.dtype)
                 for k, v in self._property_choices.items()
             }
-            self._properties = empty_properties
+            self._property_table = PropertyTable(empty_properties, n_rows=0)
 
         with self.block_update_properties():
             self._edge_color_property = ''
@@ -266,15 +270,17 @@ class Vectors(Layer):
     @property
     def properties(self) -> Dict[str, np.ndarray]:
         """dict {str: array (N,)}, DataFrame: Annotations for each point"""
-        return self._properties
+        return self._property_table.columns
 
     @properties.setter
     def properties(self, properties: Dict[str, np.ndarray]):
         if not isinstance(properties, dict):
             properties, _ = dataframe_to_properties(properties)
-        self._properties = self._validate_properties(properties)
+        self._property_table = PropertyTable(
+            self._validate_properties(properties), n_rows=len(self.data)
+        )
         if self._edge_color_property and (
-            self._edge_color_property not in self._properties
+            self._edge_color_property not in self._property_table
         ):
             self._edge_color_property = ''
             warnings.warn('property used for edge_color dropped')
@@ -419,7 +425,7 @@ class Vectors(Layer):
             self.events.edge_color()
 
             if self.visible:
-                self._update_thumbnail()
+                self._invalidate_thumbnail()
         if new_mode != old_mode:
             self.events.edge_color_mode()
 
@@ -443,36 +449,14 @@ class Vectors(Layer):
                     self._edge_color_property
                 ]
                 if update_color_mapping:
-                    self.edge_color_cycle_map = {
-                        k: c
-                        for k, c in zip(
-                            np.unique(edge_color_properties),
-                            self._edge_color_cycle,
-                        )
-                    }
-                else:
-                    # add properties if they are not in the colormap
-                    # and update_color_mapping==False
-                    edge_color_cycle_keys = [*self.edge_color_cycle_map]
-                    props_in_map = np.in1d(
-                        edge_color_properties, edge_color_cycle_keys
-                    )
-                    if not np.all(props_in_map):
-                        props_to_add = np.unique(
-                            edge_color_properties[np.logical_not(props_in_map)]
-                        )
-                        for prop in props_to_add:
-                            self.edge_color_cycle_map[prop] = next(
-                                self._edge_color_cycle
-                            )
-                edge_colors = np.array(
-                    [
-                        self.edge_color_cycle_map[x]
-                        for x in edge_color_properties
-                    ]
+                    self.edge_color_cycle_map = {}
+                # categories that are not in the mapping yet get the next
+                # colors of the cycle
+                edge_colors = map_color_cycle(
+                    edge_color_properties,
+                    self.edge_color_cycle_map,
+                    lambda prop: next(self._edge_color_cycle),
                 )
-                if len(edge_colors) == 0:
-                    edge_colors = np.empty((0, 4))
                 self._edge_color = edge_colors
             elif self._edge_color_mode == ColorMode.COLORMAP:
                 edge_color_properties = self.properties[
@@ -499,7 +483,7 @@ class Vectors(Layer):
                 self._edge_color = edge_colors
             self.events.edge_color()
             if self.visible:
-                self._update_thumbnail()
+                self._invalidate_thumbnail()
 
     def _is_color_mapped(self, color) -> bool:
         """ determines if the new color argument is for directly setting or cycle/colormap"""
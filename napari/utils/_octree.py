@@ -23,6 +23,8 @@ DEFAULT_OCTREE_CONFIG = {
     "octree": {
         "enabled": True,
         "tile_size": 256,
+        "upload_budget_kb": 1024,
+        "upload_budget_ms": 5,
         "log_path": None,
         "loaders": {
             0: {"num_workers": 10, "delay_queue_ms": 100},
@@ -4,6 +4,7 @@ import numpy as np
 
 from ..events.dataclass import Property, evented_dataclass
 from ..misc import StringEnum
+from ..perf import record_timer
 from .colorbars import make_colorbar
 from .standardize_color import transform_color
 
@@ -59,6 +60,10 @@ class Colormap:
         yield from (self.colors, self.controls, self.interpolation)
 
     def map(self, values):
+        with record_timer("Colormap.map"):
+            return self._map(values)
+
+    def _map(self, values):
         values = np.atleast_1d(values)
         if self._interpolation == ColormapInterpolationMode.LINEAR:
             # One color per control point
@@ -25,7 +25,8 @@ Image layers will use the ChunkLoader to load data instead of loading
 the data directly. Image layers will not call np.asarray() in the GUI
 thread. The ChunkLoader will call np.asarray() in a worker thread. That
 means any IO or computation done as part of the load will not block the
-GUI thread.
+GUI thread. Surface layers load the vertex values of the current slice
+the same way when they are not already in memory.
 
 Set NAPARI_ASYNC=1 to turn on async loading with default settings.
 
@@ -69,3 +70,8 @@ Other Config Options
 # Added this temporarily for octree debugging. The welcome visual causes
 # breakpoints to hit in image visual code. It's easier if we don't show it.
 allow_welcome_visual = True
+
+# Memory in bytes that the part in view of a multiscale image can use when
+# rendered in 3D. The finest level whose part in view fits is rendered. Set
+# NAPARI_VOLUME_BUDGET to a number of megabytes to change it.
+volume_budget = int(float(os.getenv("NAPARI_VOLUME_BUDGET", "256")) * 1e6)
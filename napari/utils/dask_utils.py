@@ -1,12 +1,14 @@
 """Dask cache utilities.
 """
+import threading
 import warnings
 from contextlib import contextmanager
 from distutils.version import LooseVersion
-from typing import Callable, ContextManager, Optional
+from typing import Any, Callable, ContextManager, Optional
 
 import dask
 import dask.array as da
+import numpy as np
 from dask.cache import Cache
 
 from .. import utils
@@ -185,3 +187,120 @@ def configure_dask(data) -> Callable[[], ContextManager[dict]]:
             yield {}
 
     return contextmanager(dask_optimized_slicing)
+
+
+class _ConcurrentCache(Cache):
+    """Cache callback of one compute, sharing its cache with other computes.
+
+    A result computed by two concurrent computes is only put in the cache
+    once, as putting a key twice makes the cache count its size twice.
+    """
+
+    _lock = threading.Lock()
+
+    def _posttask(self, key, value, dsk, state, id):
+        with self._lock:
+            if key not in self.cache.data:
+                super()._posttask(key, value, dsk, state, id)
+
+
+def concurrent_dask_loader() -> Callable[[Any], np.ndarray]:
+    """Return a function loading arrays concurrently with other threads.
+
+    Each compute with the default scheduler swaps out the global dask
+    callbacks while it runs, so a compute started meanwhile in another
+    thread runs without them, and may even restore them to an empty set.
+    The dask Cache callback also keeps the timings of the running compute
+    on itself, and the dask configuration is global to all threads.
+
+    The returned function computes dask arrays without using or changing
+    the global dask state. The callbacks active when this function is
+    called are passed explicitly to each compute, with a Cache callback of
+    its own that shares the cache of the active one. The graph is
+    optimized without fusing tasks, as in ``configure_dask``, and the
+    scheduler is called directly. A scheduler that is already configured
+    is used without callbacks. Other arrays are loaded with np.asarray.
+
+    Call this in the thread that starts the loads, such as the GUI thread,
+    and the returned function in the threads that load.
+
+    Returns
+    -------
+    Callable
+        Function taking an array and returning it loaded in a numpy array.
+
+    Examples
+    --------
+    >>> load = concurrent_dask_loader()
+    >>> list(executor.map(load, dask_arrays))
+    """
+    from dask.callbacks import Callback
+
+    scheduler = None
+    if dask.config.get("scheduler", None) is not None:
+        scheduler = dask.base.get_scheduler()
+    callbacks = set(Callback.active)
+
+    def load(array):
+        if not isinstance(array, da.Array):
+            return np.asarray(array)
+        return _concurrent_compute(array, scheduler, callbacks)
+
+    return load
+
+
+def _concurrent_compute(array: da.Array, scheduler, callbacks) -> np.ndarray:
+    """Compute a dask array with a scheduler or the active callbacks."""
+    # The active callbacks are tuples of the methods of each Callback
+    compute_callbacks = set()
+    for callback in callbacks:
+        owner = getattr(callback[0], '__self__', None)
+        if isinstance(owner, Cache):
+            callback = _ConcurrentCache(owner.cache)._callback
+        compute_callbacks.add(callback)
+
+    dsk = _optimize_without_fusion(array)
+    if dsk is None:
+        # the array is computed with its default optimizations instead
+        if scheduler is None:
+            scheduler = 'threads'
+            kwargs = {'callbacks': compute_callbacks}
+        else:
+            kwargs = {}
+        return np.asarray(array.compute(scheduler=scheduler, **kwargs))
+
+    keys = array.__dask_keys__()
+    if scheduler is None:
+        from dask.threaded import get
+
+        results = get(dsk, keys, callbacks=compute_callbacks)
+    else:
+        results = scheduler(dsk, keys)
+    finalize, args = array.__dask_postcompute__()
+    return np.asarray(finalize(results, *args))
+
+
+def _optimize_without_fusion(array: da.Array):
+    """Return the graph of an array optimized without fusing its tasks.
+
+    These are the optimizations of dask.array.optimize, without the fusion
+    of tasks, so that the chunks of the array stay in the cache.
+
+    Returns
+    -------
+    HighLevelGraph or None
+        The optimized graph, or None if the optimizations are not available
+        in this version of dask.
+    """
+    try:
+        from dask.array.optimization import fuse_roots, optimize_blockwise
+        from dask.core import flatten
+    except ImportError:
+        return None
+
+    flat_keys = list(flatten(array.__dask_keys__()))
+    dsk = optimize_blockwise(array.__dask_graph__(), keys=flat_keys)
+    dsk = fuse_roots(dsk, keys=flat_keys)
+    if not hasattr(dsk, 'cull'):
+        return None
+    return dsk.cull(set(flat_keys))
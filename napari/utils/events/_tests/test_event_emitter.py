@@ -1,4 +1,4 @@
-from napari.utils.events import EventEmitter
+from napari.utils.events import EmitterGroup, EventEmitter
 
 
 def test_event_blocker_count_none():
@@ -17,3 +17,102 @@ def test_event_blocker_count():
         e()
         e()
     assert block.count == 3
+
+
+def test_event_batch():
+    """Test that a batch emits the last event of each emitter on exit."""
+    e = EventEmitter(type="test")
+    values = []
+    e.connect(lambda event: values.append(event.value))
+    with e.batch():
+        e(value=1)
+        e(value=2)
+        assert values == []
+    assert values == [2]
+
+    # nothing is emitted without events
+    with e.batch():
+        pass
+    assert values == [2]
+
+
+def test_event_batch_nested():
+    """Test that nested batches emit when the outermost batch exits."""
+    group = EmitterGroup(a=None, b=None)
+    events = []
+    group.connect(lambda event: events.append((event.type, event.value)))
+    with group.batch_all():
+        group.b(value=1)
+        with group.a.batch():
+            group.a(value=1)
+            group.a(value=2)
+        assert events == []
+        group.b(value=2)
+    # events are emitted in the order their emitters first emitted
+    assert events == [('b', 2), ('a', 2)]
+
+
+def test_emit_without_listeners():
+    """Test that no event is created when nothing is listening."""
+    e = EventEmitter(type="test")
+    assert e(value=1) is None
+
+    values = []
+    e.connect(lambda event: values.append(event.value))
+    assert e(value=2).value == 2
+    assert values == [2]
+
+    e.disconnect()
+    assert e(value=3) is None
+    assert values == [2]
+
+
+def test_emit_after_connect_and_disconnect():
+    """Test that emission follows the callbacks connected at the time."""
+
+    class Listener:
+        def __init__(self):
+            self.values = []
+
+        def on_event(self, event):
+            self.values.append(event.value)
+
+    e = EventEmitter(type="test")
+    listener = Listener()
+    e.connect(listener.on_event)
+    e(value=1)
+
+    values = []
+    e.connect(lambda event: values.append(event.value))
+    e(value=2)
+    assert listener.values == [1, 2]
+    assert values == [2]
+
+    # methods replaced on the instance are called
+    listener.on_event = lambda event: values.append(-event.value)
+    e(value=3)
+    assert values == [2, 3, -3]
+
+    e.disconnect((listener, 'on_event'))
+    e(value=4)
+    assert listener.values == [1, 2]
+    assert values == [2, 3, -3, 4]
+
+
+def test_emit_removes_dead_callbacks():
+    """Test that callbacks to deleted objects are disconnected."""
+
+    class Listener:
+        def on_event(self, event):
+            pass
+
+    e = EventEmitter(type="test")
+    listener = Listener()
+    e.connect(listener.on_event)
+    e()
+    assert len(e.callbacks) == 1
+
+    del listener
+    e()
+    assert len(e.callbacks) == 0
+    assert e() is None
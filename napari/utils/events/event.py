@@ -232,10 +232,16 @@ class EventEmitter:
         self._callbacks = []
         self._callback_refs = []
 
+        # callbacks resolved for dispatch, rebuilt when the callbacks change.
+        self._plan = None
+
         # count number of times this emitter is blocked for each callback.
         self._blocked = {None: 0}
         self._block_counter = Counter()
 
+        # open batches deferring the events of this emitter, innermost last.
+        self._batches = []
+
         # used to detect emitter loops
         self.source = source
         self.default_args = {}
@@ -428,6 +434,7 @@ class EventEmitter:
         # actually add the callback
         self._callbacks.insert(idx, callback)
         self._callback_refs.insert(idx, ref)
+        self._plan = None
         return callback  # allows connect to be used as a decorator
 
     def disconnect(self, callback=None):
@@ -445,6 +452,7 @@ class EventEmitter:
                 idx = self._callbacks.index(callback)
                 self._callbacks.pop(idx)
                 self._callback_refs.pop(idx)
+        self._plan = None
 
     def _normalize_cb(self, callback):
         # dereference methods into a (self, method_name) pair so that we can
@@ -480,9 +488,19 @@ class EventEmitter:
         This allows some level of communication between the callbacks
         (notably, via Event.handled) but also requires that callbacks
         be careful not to inadvertently modify the Event.
+
+        If nothing is connected and the emitter is neither blocked nor
+        batched, no event is created and None is returned.
         """
         # This is a VERY highly used method; must be fast!
         blocked = self._blocked
+        plan = self._plan
+        if plan is None:
+            plan = self._build_plan()
+
+        # nothing is listening, don't even create the event
+        if not plan and not self._batches and not blocked[None]:
+            return None
 
         # create / massage event as needed
         event = self._prepare_event(*args, **kwargs)
@@ -491,22 +509,31 @@ class EventEmitter:
         # invoked.
         event._push_source(self.source)
         try:
-            if blocked.get(None, 0) > 0:  # this is the same as self.blocked()
+            if blocked[None] > 0:  # this is the same as self.blocked()
                 self._block_counter.update([None])
                 return event
 
+            if self._batches:
+                self._batches[-1]._defer(self, event)
+                return event
+
+            # only look callbacks up in blocked if some are blocked
+            check_blocked = len(blocked) > 1
             rem = []
-            for cb in self._callbacks[:]:
-                if isinstance(cb, tuple):
-                    obj = cb[0]()
+            for key, ref, name in plan:
+                if ref is None:
+                    cb = key
+                else:
+                    obj = ref()
                     if obj is None:
-                        rem.append(cb)
+                        rem.append(key)
                         continue
-                    cb = getattr(obj, cb[1], None)
+                    # looked up on each call, the method may be replaced
+                    cb = getattr(obj, name, None)
                     if cb is None:
                         continue
 
-                if blocked.get(cb, 0) > 0:
+                if check_blocked and blocked.get(cb, 0) > 0:
                     self._block_counter.update([cb])
                     continue
 
@@ -523,6 +550,31 @@ class EventEmitter:
 
         return event
 
+    def _build_plan(self):
+        """Return the callbacks to invoke on emission, in order.
+
+        Each entry is a ``(callback, ref, name)`` tuple. ``ref`` is None for
+        callbacks invoked as they are, otherwise the method ``name`` of the
+        object of the weak reference ``ref`` is invoked. Callbacks to dead
+        objects and methods the object does not have, such as the unused
+        ``on_<name>`` methods of auto connected emitters, are left out.
+
+        The plan is kept until the callbacks are connected or disconnected.
+        """
+        # remove callbacks to dead objects
+        for cb in self._callbacks[:]:
+            if isinstance(cb, tuple) and cb[0]() is None:
+                self.disconnect(cb)
+
+        plan = []
+        for cb in self._callbacks:
+            if not isinstance(cb, tuple):
+                plan.append((cb, None, None))
+            elif getattr(cb[0](), cb[1], None) is not None:
+                plan.append((cb, cb[0], cb[1]))
+        self._plan = plan
+        return plan
+
     def _invoke_callback(self, cb, event):
         try:
             cb(event)
@@ -599,6 +651,18 @@ class EventEmitter:
         """
         return EventBlocker(self, callback)
 
+    def batch(self):
+        """Return an EventBatch to be used in 'with' statements
+
+        Notes
+        -----
+        For example, one could do::
+
+            with emitter.batch():
+                pass  # ..do stuff; only the last event is emitted, on exit..
+        """
+        return EventBatch([self])
+
 
 class WarningEmitter(EventEmitter):
     """
@@ -862,6 +926,21 @@ class EmitterGroup(EventEmitter):
         """
         return EventBlockerAll(self)
 
+    def batch_all(self):
+        """Return an EventBatch of all emitters, to be used in 'with' statements
+
+        Events of the group itself are not deferred, it emits each of the
+        deferred events of its emitters on exit.
+
+        Notes
+        -----
+        For example, one could do::
+
+            with emitter.batch_all():
+                pass  # ..do stuff; each emitter emits its last event on exit..
+        """
+        return EventBatch(self._emitters.values())
+
 
 class EventBlocker:
 
@@ -901,3 +980,39 @@ class EventBlockerAll:
 
     def __exit__(self, *args):
         self.target.unblock_all()
+
+
+class EventBatch:
+
+    """Defers the events of some EventEmitters to the end of a context
+    manager (i.e. 'with' statement), to emit them once.
+
+    Only the last event of each emitter is kept, so that many updates of the
+    same value only reach the callbacks once, with the final value. On exit,
+    the kept events are emitted in the order their emitters first emitted.
+    Batches can be nested, the events kept by an inner batch are then kept
+    by the outer batch.
+
+    Only emitters whose events carry a whole value or state should be
+    batched. Events describing a change, such as the ``inserted`` and
+    ``removed`` events of evented lists, would be lost but for the last one.
+    """
+
+    def __init__(self, emitters):
+        self.emitters = list(emitters)
+        self._events = {}
+
+    def _defer(self, emitter, event):
+        self._events[emitter] = event
+
+    def __enter__(self):
+        for emitter in self.emitters:
+            emitter._batches.append(self)
+        return self
+
+    def __exit__(self, *args):
+        for emitter in self.emitters:
+            emitter._batches.remove(self)
+        events, self._events = self._events, {}
+        for emitter, event in events.items():
+            emitter(event)
@@ -39,6 +39,15 @@ Add a line to the config file like:
 Perfmon will start tracing on startup. You must quit napari with the Quit
 command for napari to write trace file. See PerfmonConfig docs.
 
+Always-On Recording
+-------------------
+
+Independent of perfmon, record_timer() contexts around slicing, loading,
+color mapping and drawing record their timings into a fixed-size in-memory
+ring buffer. The statistics of each timer are in recorder.summary(), and
+recorder.dump_trace(path, seconds=10) writes the last 10 seconds to a
+Chrome Tracing file. Set NAPARI_PERF_RECORD=0 to turn recording off.
+
 Manual Timing
 -------------
 
@@ -53,6 +62,7 @@ import os
 from ._compat import perf_counter_ns
 from ._config import perf_config
 from ._event import PerfEvent
+from ._recorder import USE_RECORDER, record_timer, recorder
 from ._timers import (
     add_counter_event,
     add_instant_event,
@@ -0,0 +1,244 @@
+"""PerfRecorder class and global instance.
+"""
+import os
+import threading
+from typing import Dict, List, Optional
+
+import numpy as np
+
+from ._compat import perf_counter_ns
+from ._event import PerfEvent
+from ._stat import Stat
+from ._trace_file import PerfTraceFile
+
+# Set NAPARI_PERF_RECORD=0 to turn off recording.
+USE_RECORDER = os.getenv("NAPARI_PERF_RECORD", "1") != "0"
+
+# Number of timings kept in the ring buffer.
+DEFAULT_CAPACITY = 65536
+
+
+class PerfRecorder:
+    """Always-on recorder of recent timings.
+
+    Unlike PerfTimers, which only exist when perfmon is enabled at startup,
+    the recorder is on by default so we can diagnose stalls in any session.
+    Timings are written into preallocated arrays used as a ring buffer, so
+    recording does not allocate and the memory use is fixed. The most recent
+    timings can be written to a chrome://tracing file at any time with
+    dump_trace().
+
+    Parameters
+    ----------
+    capacity : int
+        Number of timings kept in the ring buffer.
+
+    Attributes
+    ----------
+    capacity : int
+        Number of timings kept in the ring buffer.
+    stats : Dict[str, Stat]
+        Statistics on each timer, in milliseconds, since the last clear().
+    """
+
+    def __init__(self, capacity: int = DEFAULT_CAPACITY):
+        self.capacity = capacity
+        self.stats: Dict[str, Stat] = {}
+
+        self._start_ns = np.zeros(capacity, dtype=np.int64)
+        self._end_ns = np.zeros(capacity, dtype=np.int64)
+        self._name_ids = np.zeros(capacity, dtype=np.int32)
+        self._thread_ids = np.zeros(capacity, dtype=np.uint64)
+
+        # Names are stored once, the ring buffer only holds their index.
+        self._names: List[str] = []
+        self._name_lookup: Dict[str, int] = {}
+
+        # Total number of timings recorded, the next slot is count % capacity.
+        self._count = 0
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return min(self._count, self.capacity)
+
+    def record(self, name: str, start_ns: int, end_ns: int) -> None:
+        """Record one timing.
+
+        Parameters
+        ----------
+        name : str
+            The name of the timer like "draw".
+        start_ns : int
+            Start time in nanoseconds.
+        end_ns : int
+            End time in nanoseconds.
+        """
+        thread_id = threading.get_ident()
+        duration_ms = (end_ns - start_ns) / 1e6
+        with self._lock:
+            name_id = self._name_lookup.get(name)
+            if name_id is None:
+                name_id = len(self._names)
+                self._names.append(name)
+                self._name_lookup[name] = name_id
+
+            index = self._count % self.capacity
+            self._start_ns[index] = start_ns
+            self._end_ns[index] = end_ns
+            self._name_ids[index] = name_id
+            self._thread_ids[index] = thread_id
+            self._count += 1
+
+            stat = self.stats.get(name)
+            if stat is None:
+                self.stats[name] = Stat(duration_ms)
+            else:
+                stat.add(duration_ms)
+
+    def summary(self) -> Dict[str, dict]:
+        """Return the count, mean, p95 and max of each timer.
+
+        Returns
+        -------
+        Dict[str, dict]
+            Maps each timer name to its statistics in milliseconds.
+        """
+        with self._lock:
+            return {
+                name: {
+                    "count": stat.count,
+                    "mean": stat.average,
+                    "p95": stat.percentile(95),
+                    "max": stat.max,
+                }
+                for name, stat in self.stats.items()
+            }
+
+    def events(self, seconds: Optional[float] = None) -> List[PerfEvent]:
+        """Return the recorded timings as PerfEvents, oldest first.
+
+        Parameters
+        ----------
+        seconds : Optional[float]
+            Only return timings that ended in the last this many seconds.
+            If None return every timing still in the ring buffer.
+
+        Returns
+        -------
+        List[PerfEvent]
+            The timings.
+        """
+        with self._lock:
+            size = len(self)
+            first = self._count - size
+            order = np.arange(first, self._count) % self.capacity
+            start_ns = self._start_ns[order]
+            end_ns = self._end_ns[order]
+            name_ids = self._name_ids[order]
+            thread_ids = self._thread_ids[order]
+            names = list(self._names)
+
+        if seconds is not None:
+            keep = end_ns >= perf_counter_ns() - int(seconds * 1e9)
+            start_ns = start_ns[keep]
+            end_ns = end_ns[keep]
+            name_ids = name_ids[keep]
+            thread_ids = thread_ids[keep]
+
+        process_id = os.getpid()
+        return [
+            PerfEvent(
+                names[name_id],
+                start,
+                end,
+                process_id=process_id,
+                thread_id=thread_id,
+            )
+            for start, end, name_id, thread_id in zip(
+                start_ns.tolist(),
+                end_ns.tolist(),
+                name_ids.tolist(),
+                thread_ids.tolist(),
+            )
+        ]
+
+    def dump_trace(self, path: str, seconds: Optional[float] = None) -> None:
+        """Write the recent timings to a chrome://tracing file.
+
+        Parameters
+        ----------
+        path : str
+            Write the trace to this path.
+        seconds : Optional[float]
+            Only write timings that ended in the last this many seconds.
+            If None write every timing still in the ring buffer.
+        """
+        trace_file = PerfTraceFile(path)
+        for event in self.events(seconds):
+            trace_file.add_event(event)
+        trace_file.close()
+
+    def clear(self) -> None:
+        """Clear the ring buffer and the statistics."""
+        with self._lock:
+            self._count = 0
+            self.stats.clear()
+
+
+class _RecordTimer:
+    """Context object that records the time spent in its block."""
+
+    __slots__ = ("name", "start_ns")
+
+    def __init__(self, name: str):
+        self.name = name
+
+    def __enter__(self):
+        self.start_ns = perf_counter_ns()
+        return self
+
+    def __exit__(self, *exc_info):
+        recorder.record(self.name, self.start_ns, perf_counter_ns())
+
+
+class _NullTimer:
+    """Context object that does nothing, when recording is disabled."""
+
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        pass
+
+
+_null_timer = _NullTimer()
+
+
+if USE_RECORDER:
+    # The one global instance
+    recorder = PerfRecorder()
+
+    def record_timer(name: str) -> _RecordTimer:
+        """Record the time spent in a block of code.
+
+        Parameters
+        ----------
+        name : str
+            The name of the timer.
+
+        Examples
+        --------
+        with record_timer("draw"):
+            draw_stuff()
+        """
+        return _RecordTimer(name)
+
+
+else:
+    # Make sure no one accesses the recorder when it is disabled.
+    recorder = None
+
+    def record_timer(name: str) -> _NullTimer:
+        return _null_timer
@@ -1,5 +1,9 @@
 """Stat class.
 """
+import numpy as np
+
+# Number of recent values kept to estimate percentiles.
+RECENT_SIZE = 256
 
 
 class Stat:
@@ -20,6 +24,8 @@ class Stat:
         Sum of all values seen.
     count : int
         How many values we've seen.
+    recent : list
+        The last RECENT_SIZE values, used to estimate percentiles.
     """
 
     def __init__(self, value: int):
@@ -34,6 +40,7 @@ class Stat:
         self.max = value
         self.sum = value
         self.count = 1
+        self.recent = [value]
 
     def add(self, value: int) -> None:
         """Add a new value.
@@ -47,6 +54,10 @@ class Stat:
         self.count += 1
         self.max = max(self.max, value)
         self.min = min(self.min, value)
+        if len(self.recent) < RECENT_SIZE:
+            self.recent.append(value)
+        else:
+            self.recent[(self.count - 1) % RECENT_SIZE] = value
 
     @property
     def average(self) -> int:
@@ -59,3 +70,17 @@ class Stat:
         if self.count > 0:
             return self.sum / self.count
         raise ValueError("no values")  # impossible for us
+
+    def percentile(self, q: float) -> float:
+        """Percentile of the recent values.
+
+        Parameters
+        ----------
+        q : float
+            Percentile to compute, between 0 and 100.
+
+        Returns
+        -------
+        percentile value : float
+        """
+        return float(np.percentile(self.recent, q))
@@ -0,0 +1,62 @@
+import json
+
+import numpy as np
+
+from napari.utils.perf._compat import perf_counter_ns
+from napari.utils.perf._recorder import PerfRecorder
+from napari.utils.perf._stat import RECENT_SIZE, Stat
+
+
+def test_stat_percentile():
+    stat = Stat(0)
+    for value in range(1, 100):
+        stat.add(value)
+    assert stat.count == 100
+    assert stat.max == 99
+    assert stat.average == 49.5
+    np.testing.assert_allclose(stat.percentile(95), 94.05)
+
+    # Only the recent values are used for percentiles.
+    for _ in range(RECENT_SIZE):
+        stat.add(1000)
+    assert stat.percentile(5) == 1000
+    assert stat.min == 0
+
+
+def test_recorder_ring_buffer():
+    recorder = PerfRecorder(capacity=8)
+    for i in range(20):
+        recorder.record(f"timer{i % 2}", i * 1_000_000, (i + 1) * 1_000_000)
+
+    # The ring buffer only keeps the most recent timings, oldest first.
+    assert len(recorder) == 8
+    events = recorder.events()
+    assert [event.span.start_ns for event in events] == [
+        i * 1_000_000 for i in range(12, 20)
+    ]
+    assert [event.name for event in events] == ["timer0", "timer1"] * 4
+
+    # Statistics cover every timing, not only those in the ring buffer.
+    summary = recorder.summary()
+    assert summary["timer0"]["count"] == 10
+    assert summary["timer1"]["max"] == 1.0
+
+    recorder.clear()
+    assert len(recorder) == 0
+    assert recorder.events() == []
+
+
+def test_recorder_dump_trace(tmp_path):
+    recorder = PerfRecorder(capacity=16)
+    now = perf_counter_ns()
+    recorder.record("old", now - 60_000_000_000, now - 59_000_000_000)
+    recorder.record("new", now - 1_000_000, now)
+
+    # Only the timings of the last 10 seconds are written.
+    trace_path = tmp_path / "trace.json"
+    recorder.dump_trace(trace_path, seconds=10)
+    with open(trace_path) as infile:
+        data = json.load(infile)
+    assert [event["name"] for event in data] == ["new"]
+    assert data[0]["ph"] == "X"
+    np.testing.assert_allclose(data[0]["dur"], 1000)